@@ -14,16 +14,19 @@ logger = logging.getLogger(__name__)
 analytics_bp = Blueprint('analytics', __name__, url_prefix='/api/analytics')
 
 
-def init_analytics_api(bot_controller, analytics_service):
+def init_analytics_api(bot_controller, analytics_service, broker_manager=None):
     """
     Initialize analytics API with dependencies
     
     Args:
         bot_controller: BotController instance
         analytics_service: AnalyticsService instance
+        broker_manager: Optional BrokerManager; its broker type keeps each
+            broker's trades apart in the ledger
     """
     analytics_bp.bot_controller = bot_controller
     analytics_bp.analytics_service = analytics_service
+    analytics_bp.broker_manager = broker_manager
     
     return analytics_bp
 
@@ -35,6 +38,7 @@ def apply_rate_limits(limiter):
     Args:
         limiter: Flask-Limiter instance
     """
+    limiter.limit(READ_RATE_LIMIT)(get_summary)
     limiter.limit(READ_RATE_LIMIT)(get_performance_metrics)
     limiter.limit(READ_RATE_LIMIT)(get_profit_by_symbol)
     limiter.limit(READ_RATE_LIMIT)(get_win_loss_by_symbol)
@@ -45,6 +49,54 @@ def apply_rate_limits(limiter):
     limiter.limit(READ_RATE_LIMIT)(get_risk_metrics)
 
 
+def _trade_source():
+    """Ledger source for the connected broker (None when unknown)"""
+    broker_manager = analytics_bp.broker_manager
+    return broker_manager.get_broker_type() if broker_manager is not None else None
+
+
+def _get_summary():
+    """All panels for the request's date range from one cached computation"""
+    return analytics_bp.analytics_service.get_summary(
+        analytics_bp.bot_controller.get_trades,
+        request.args.get('from_date'),
+        request.args.get('to_date'),
+        _trade_source()
+    )
+
+
+@analytics_bp.route('/summary', methods=['GET'])
+@validate_query_params({
+    'from_date': {'type': 'string', 'max_length': 20, 'pattern': r'^\d{4}-\d{2}-\d{2}$'},
+    'to_date': {'type': 'string', 'max_length': 20, 'pattern': r'^\d{4}-\d{2}-\d{2}$'}
+})
+def get_summary():
+    """
+    Get every analytics panel in one response
+    
+    Query params:
+        from_date: Start date (YYYY-MM-DD)
+        to_date: End date (YYYY-MM-DD)
+        
+    Returns:
+        JSON with performance, profit_by_symbol, win_loss_by_symbol,
+        daily_profit, hourly_performance, trade_distribution, drawdown
+        and risk_metrics
+    """
+    try:
+        return jsonify({
+            'success': True,
+            'data': _get_summary()
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"Error getting analytics summary: {e}", exc_info=True)
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 @analytics_bp.route('/performance', methods=['GET'])
 @validate_query_params({
     'from_date': {'type': 'string', 'max_length': 20, 'pattern': r'^\d{4}-\d{2}-\d{2}$'},
@@ -62,16 +114,7 @@ def get_performance_metrics():
         JSON with performance metrics
     """
     try:
-        from_date = request.args.get('from_date')
-        to_date = request.args.get('to_date')
-        
-        # Get trades from bot controller
-        trades = analytics_bp.bot_controller.get_trades(from_date, to_date)
-        
-        # Calculate metrics
-        metrics = analytics_bp.analytics_service.get_performance_metrics(
-            trades, from_date, to_date
-        )
+        metrics = _get_summary()['performance']
         
         return jsonify({
             'success': True,
@@ -103,14 +146,7 @@ def get_profit_by_symbol():
         JSON with profit by symbol data
     """
     try:
-        from_date = request.args.get('from_date')
-        to_date = request.args.get('to_date')
-        
-        trades = analytics_bp.bot_controller.get_trades(from_date, to_date)
-        
-        data = analytics_bp.analytics_service.get_profit_by_symbol(
-            trades, from_date, to_date
-        )
+        data = _get_summary()['profit_by_symbol']
         
         return jsonify({
             'success': True,
@@ -142,14 +178,7 @@ def get_win_loss_by_symbol():
         JSON with win/loss by symbol data
     """
     try:
-        from_date = request.args.get('from_date')
-        to_date = request.args.get('to_date')
-        
-        trades = analytics_bp.bot_controller.get_trades(from_date, to_date)
-        
-        data = analytics_bp.analytics_service.get_win_loss_by_symbol(
-            trades, from_date, to_date
-        )
+        data = _get_summary()['win_loss_by_symbol']
         
         return jsonify({
             'success': True,
@@ -181,14 +210,7 @@ def get_daily_profit():
         JSON with daily profit data
     """
     try:
-        from_date = request.args.get('from_date')
-        to_date = request.args.get('to_date')
-        
-        trades = analytics_bp.bot_controller.get_trades(from_date, to_date)
-        
-        data = analytics_bp.analytics_service.get_daily_profit(
-            trades, from_date, to_date
-        )
+        data = _get_summary()['daily_profit']
         
         return jsonify({
             'success': True,
@@ -220,14 +242,7 @@ def get_hourly_performance():
         JSON with hourly performance data
     """
     try:
-        from_date = request.args.get('from_date')
-        to_date = request.args.get('to_date')
-        
-        trades = analytics_bp.bot_controller.get_trades(from_date, to_date)
-        
-        data = analytics_bp.analytics_service.get_hourly_performance(
-            trades, from_date, to_date
-        )
+        data = _get_summary()['hourly_performance']
         
         return jsonify({
             'success': True,
@@ -259,14 +274,7 @@ def get_trade_distribution():
         JSON with trade distribution data
     """
     try:
-        from_date = request.args.get('from_date')
-        to_date = request.args.get('to_date')
-        
-        trades = analytics_bp.bot_controller.get_trades(from_date, to_date)
-        
-        data = analytics_bp.analytics_service.get_trade_distribution(
-            trades, from_date, to_date
-        )
+        data = _get_summary()['trade_distribution']
         
         return jsonify({
             'success': True,
@@ -298,14 +306,7 @@ def get_drawdown_data():
         JSON with drawdown data
     """
     try:
-        from_date = request.args.get('from_date')
-        to_date = request.args.get('to_date')
-        
-        trades = analytics_bp.bot_controller.get_trades(from_date, to_date)
-        
-        data = analytics_bp.analytics_service.get_drawdown_data(
-            trades, from_date, to_date
-        )
+        data = _get_summary()['drawdown']
         
         return jsonify({
             'success': True,
@@ -337,14 +338,7 @@ def get_risk_metrics():
         JSON with risk metrics
     """
     try:
-        from_date = request.args.get('from_date')
-        to_date = request.args.get('to_date')
-        
-        trades = analytics_bp.bot_controller.get_trades(from_date, to_date)
-        
-        data = analytics_bp.analytics_service.get_risk_metrics(
-            trades, from_date, to_date
-        )
+        data = _get_summary()['risk_metrics']
         
         return jsonify({
             'success': True,
@@ -12,6 +12,10 @@ logger = logging.getLogger(__name__)
 
 backtest_bp = Blueprint("backtest", __name__, url_prefix="/api/backtest")
 
+# Equity points and trades sent with a result unless the client asks otherwise
+DEFAULT_CHART_POINTS = 2000
+DEFAULT_TRADE_PAGE = 100
+
 
 def init_backtest_api(backtest_service):
     """Attach the BacktestService to this blueprint."""
@@ -94,7 +98,7 @@ def get_status(run_id: str):
     progress = _svc().get_progress(run_id)
     if progress is None:
         # Maybe already completed — check DB
-        run = _svc().get_result(run_id)
+        run = _svc().get_result(run_id, max_points=2, trade_limit=0)
         if run:
             return jsonify({"success": True, "run_id": run_id,
                             "pct": 100, "status": run.get("status", "completed")}), 200
@@ -112,13 +116,37 @@ def list_results():
 
 @backtest_bp.route("/results/<run_id>", methods=["GET"])
 def get_result(run_id: str):
-    """GET /api/backtest/results/<run_id>  — full detail with trades + metrics"""
-    result = _svc().get_result(run_id)
+    """
+    GET /api/backtest/results/<run_id>?points=2000&trades=100
+    Detail with metrics, a downsampled equity curve and the first page of trades.
+    points=0 / trades=0 skip the downsampling / trade limit.
+    """
+    points = request.args.get("points", DEFAULT_CHART_POINTS, type=int)
+    trades = request.args.get("trades", DEFAULT_TRADE_PAGE, type=int)
+    result = _svc().get_result(run_id, max_points=points or None, trade_limit=trades or None)
     if not result:
         return _err("Run not found", 404)
     return jsonify({"success": True, "result": result}), 200
 
 
+@backtest_bp.route("/results/<run_id>/equity", methods=["GET"])
+def get_equity_curve(run_id: str):
+    """GET /api/backtest/results/<run_id>/equity?points=2000"""
+    points = request.args.get("points", DEFAULT_CHART_POINTS, type=int)
+    curve = _svc().get_equity_curve(run_id, max_points=points or None)
+    if curve is None:
+        return _err("Run not found", 404)
+    return jsonify({"success": True, **curve}), 200
+
+
+@backtest_bp.route("/results/<run_id>/trades", methods=["GET"])
+def get_trades(run_id: str):
+    """GET /api/backtest/results/<run_id>/trades?limit=100&offset=0"""
+    limit = min(max(request.args.get("limit", DEFAULT_TRADE_PAGE, type=int), 1), 1000)
+    offset = max(request.args.get("offset", 0, type=int), 0)
+    return jsonify({"success": True, **_svc().get_trades(run_id, limit=limit, offset=offset)}), 200
+
+
 @backtest_bp.route("/results/<run_id>", methods=["DELETE"])
 def delete_result(run_id: str):
     """DELETE /api/backtest/results/<run_id>"""
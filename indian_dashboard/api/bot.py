@@ -2,7 +2,8 @@
 Bot Control API endpoints
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+import json
 import logging
 import sys
 from pathlib import Path
@@ -26,6 +27,12 @@ logger = logging.getLogger(__name__)
 # Create blueprint
 bot_bp = Blueprint('bot', __name__, url_prefix='/api/bot')
 
+# Seconds an idle stream waits before sending a status event as keepalive
+STREAM_KEEPALIVE_SECONDS = 15
+
+# Activities included in the first snapshot of a new stream
+STREAM_SNAPSHOT_ACTIVITIES = 100
+
 
 def init_bot_api(bot_controller, broker_manager):
     """
@@ -60,6 +67,7 @@ def apply_rate_limits(limiter):
     limiter.limit(READ_RATE_LIMIT)(get_bot_config)
     limiter.limit(READ_RATE_LIMIT)(get_activities)
     limiter.limit(WRITE_RATE_LIMIT)(clear_activities)
+    limiter.limit(STATUS_RATE_LIMIT)(stream_updates)
 
 
 @bot_bp.route('/start', methods=['POST'])
@@ -297,6 +305,37 @@ def get_account_info():
         }), 500
 
 
+def _current_positions():
+    """Positions from the running bot, or from the connected broker when it is stopped"""
+    # Try to get from bot controller first (if bot is running)
+    positions = bot_bp.bot_controller.get_positions()
+    
+    # If bot not running, get directly from broker manager
+    if not positions and bot_bp.broker_manager.is_connected():
+        adapter = bot_bp.broker_manager.get_adapter()
+        if adapter and hasattr(adapter, 'get_positions'):
+            try:
+                positions = adapter.get_positions()
+            except Exception as adapter_error:
+                logger.warning(f"Error getting positions from adapter: {adapter_error}")
+                positions = []
+    
+    return positions or []
+
+
+def _current_account():
+    """Account info from the running bot, or from the connected broker when it is stopped"""
+    account_info = bot_bp.bot_controller.get_account_info()
+    if not account_info and bot_bp.broker_manager.is_connected():
+        adapter = bot_bp.broker_manager.get_adapter()
+        if adapter and hasattr(adapter, 'get_account_info'):
+            try:
+                account_info = adapter.get_account_info()
+            except Exception as adapter_error:
+                logger.warning(f"Error getting account info from adapter: {adapter_error}")
+    return account_info or None
+
+
 @bot_bp.route('/positions', methods=['GET'])
 def get_positions():
     """
@@ -306,20 +345,7 @@ def get_positions():
         JSON response with positions
     """
     try:
-        # Try to get from bot controller first (if bot is running)
-        positions = bot_bp.bot_controller.get_positions()
-        
-        # If bot not running, get directly from broker manager
-        if not positions and bot_bp.broker_manager.is_connected():
-            adapter = bot_bp.broker_manager.get_adapter()
-            if adapter and hasattr(adapter, 'get_positions'):
-                try:
-                    positions = adapter.get_positions()
-                    if not positions:
-                        positions = []
-                except Exception as adapter_error:
-                    logger.warning(f"Error getting positions from adapter: {adapter_error}")
-                    positions = []
+        positions = _current_positions()
         
         return jsonify({
             'success': True,
@@ -444,6 +470,9 @@ def get_bot_config():
 
 
 @bot_bp.route('/activities', methods=['GET'])
+@validate_query_params({
+    'after_id': {'type': 'int', 'min_value': 0}
+})
 def get_activities():
     """
     Get recent bot activities
@@ -451,6 +480,7 @@ def get_activities():
     Query params:
         limit: Maximum number of activities (default 100)
         type: Filter by activity type (optional)
+        after_id: Only activities newer than this id, oldest first (optional)
         
     Returns:
         JSON response with activities
@@ -459,17 +489,26 @@ def get_activities():
         # Get query parameters
         limit = request.args.get('limit', 100, type=int)
         activity_type = request.args.get('type', None, type=str)
+        after_id = request.args.get('after_id', None, type=int)
         
         # Limit to reasonable range
         limit = min(max(limit, 1), 500)
         
-        # Get activities from bot controller
-        activities = bot_bp.bot_controller.get_activities(limit=limit, activity_type=activity_type)
+        activity_logger = bot_bp.bot_controller.activity_logger
+        if after_id is not None:
+            # Only what the caller has not seen yet, oldest first
+            activities = activity_logger.get_since(after_id, limit=limit)
+            if activity_type:
+                activities = [a for a in activities if a['type'] == activity_type]
+        else:
+            # Get activities from bot controller
+            activities = bot_bp.bot_controller.get_activities(limit=limit, activity_type=activity_type)
         
         return jsonify({
             'success': True,
             'activities': activities,
-            'count': len(activities)
+            'count': len(activities),
+            'last_id': activity_logger.last_id
         }), 200
         
     except Exception as e:
@@ -502,3 +541,102 @@ def clear_activities():
             'success': False,
             'error': str(e)
         }), 500
+
+
+def _sse(event, data, event_id=None) -> str:
+    """Format one server-sent event"""
+    message = f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+    return f"id: {event_id}\n{message}" if event_id is not None else message
+
+
+def _stream_snapshot(after_id):
+    """Full state for a new or resyncing stream, and the last activity id it covers"""
+    controller = bot_bp.bot_controller
+    activity_logger = controller.activity_logger
+    last_id = activity_logger.last_id
+    if after_id is None:
+        activities = activity_logger.get_recent(limit=STREAM_SNAPSHOT_ACTIVITIES)[::-1]
+    else:
+        activities = activity_logger.get_since(after_id)
+    
+    snapshot = {
+        'status': controller.get_status(),
+        'positions': _current_positions(),
+        'account': _current_account(),
+        'activities': activities,
+        'resumed': after_id is not None
+    }
+    return snapshot, max([last_id] + [a['id'] for a in activities])
+
+
+def _event_stream(subscription, after_id):
+    """Snapshot first, then pushed events until the client disconnects"""
+    hub = bot_bp.bot_controller.live_updates
+    try:
+        snapshot, last_id = _stream_snapshot(after_id)
+        yield _sse('snapshot', snapshot, last_id)
+        
+        while True:
+            events = subscription.get(timeout=STREAM_KEEPALIVE_SECONDS)
+            
+            if subscription.overflowed:
+                # Too far behind: drop the backlog and start over from current state
+                subscription.overflowed = False
+                hub.reset()
+                snapshot, last_id = _stream_snapshot(last_id)
+                yield _sse('snapshot', snapshot, last_id)
+                continue
+            
+            if not events:
+                yield _sse('status', bot_bp.bot_controller.get_status())
+                continue
+            
+            # Consecutive activities go out as one event carrying the cursor
+            activities = []
+            for event, data in events:
+                if event == 'activity':
+                    if data['id'] > last_id:
+                        activities.append(data)
+                    continue
+                if activities:
+                    last_id = activities[-1]['id']
+                    yield _sse('activities', {'activities': activities}, last_id)
+                    activities = []
+                yield _sse(event, data)
+            if activities:
+                last_id = activities[-1]['id']
+                yield _sse('activities', {'activities': activities}, last_id)
+    finally:
+        hub.unsubscribe(subscription)
+
+
+@bot_bp.route('/stream', methods=['GET'])
+@validate_query_params({
+    'after_id': {'type': 'int', 'min_value': 0}
+})
+def stream_updates():
+    """
+    Server-sent event stream of bot state
+    
+    Opens with a 'snapshot' event (status, positions, account, activities),
+    then pushes 'positions' deltas, 'account' snapshots, 'status' changes
+    and 'activities' batches. Activity events carry their id as the event
+    id, so a reconnecting EventSource resumes from Last-Event-ID.
+    
+    Query params:
+        after_id: Resume after this activity id (optional)
+        
+    Returns:
+        text/event-stream response
+    """
+    after_id = request.args.get('after_id', None, type=int)
+    if after_id is None:
+        last_event_id = request.headers.get('Last-Event-ID', '')
+        after_id = int(last_event_id) if last_event_id.isdigit() else None
+    
+    subscription = bot_bp.bot_controller.live_updates.subscribe()
+    return Response(
+        stream_with_context(_event_stream(subscription, after_id)),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
@@ -44,7 +44,9 @@ def apply_rate_limits(limiter):
 @validate_query_params({
     'timeframe': {'type': 'string', 'max_length': 10},
     'bars': {'type': 'int', 'min_value': 1, 'max_value': 1000},
-    'indicators': {'type': 'string', 'max_length': 200}
+    'indicators': {'type': 'string', 'max_length': 200},
+    'points': {'type': 'int', 'min_value': 10, 'max_value': 10000},
+    'format': {'type': 'enum', 'allowed_values': ['rows', 'columns']}
 })
 def get_price_data(symbol):
     """
@@ -57,6 +59,8 @@ def get_price_data(symbol):
         timeframe: Timeframe (1min, 5min, 15min, 1h, 1d) - default 15min
         bars: Number of bars (1-1000) - default 200
         indicators: Comma-separated list of indicators (ma,macd,rsi,atr,bollinger)
+        points: Chart width in pixels; bars are merged to fit (keeps high/low)
+        format: 'rows' (one object per bar, default) or 'columns' (parallel arrays)
         
     Returns:
         JSON with OHLCV data and indicators
@@ -75,6 +79,8 @@ def get_price_data(symbol):
         timeframe = request.args.get('timeframe', '15min')
         bars = request.args.get('bars', 200, type=int)
         indicators_str = request.args.get('indicators', '')
+        points = request.args.get('points', type=int)
+        columnar = request.args.get('format') == 'columns'
         
         # Parse indicators
         indicators = []
@@ -86,7 +92,9 @@ def get_price_data(symbol):
             symbol=symbol,
             timeframe=timeframe,
             bars=bars,
-            indicators=indicators
+            indicators=indicators,
+            max_points=points,
+            columnar=columnar
         )
         
         if 'error' in data:
@@ -116,7 +124,8 @@ def get_price_data(symbol):
     'fast': {'type': 'int', 'min_value': 1, 'max_value': 100},
     'slow': {'type': 'int', 'min_value': 1, 'max_value': 100},
     'signal': {'type': 'int', 'min_value': 1, 'max_value': 100},
-    'std_dev': {'type': 'int', 'min_value': 1, 'max_value': 5}
+    'std_dev': {'type': 'int', 'min_value': 1, 'max_value': 5},
+    'points': {'type': 'int', 'min_value': 10, 'max_value': 10000}
 })
 def get_indicator_data(symbol, indicator):
     """
@@ -134,6 +143,7 @@ def get_indicator_data(symbol, indicator):
         slow: MACD slow period
         signal: MACD signal period
         std_dev: Bollinger Bands standard deviation
+        points: Chart width in pixels; the series is thinned to fit
         
     Returns:
         JSON with indicator data
@@ -173,7 +183,8 @@ def get_indicator_data(symbol, indicator):
             indicator=indicator,
             timeframe=timeframe,
             bars=bars,
-            params=params
+            params=params,
+            max_points=request.args.get('points', type=int)
         )
         
         if 'error' in data:
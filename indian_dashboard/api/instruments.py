@@ -54,7 +54,9 @@ def apply_rate_limits(limiter):
     'search': {'type': 'string', 'max_length': 100},
     'exchange': {'type': 'string', 'max_length': 100},
     'instrument_type': {'type': 'string', 'max_length': 100},
-    'segment': {'type': 'string', 'max_length': 100}
+    'segment': {'type': 'string', 'max_length': 100},
+    'limit': {'type': 'int', 'min': 1, 'max': 1000},
+    'offset': {'type': 'int', 'min': 0}
 })
 def get_instruments():
     """
@@ -65,9 +67,11 @@ def get_instruments():
         - exchange: Exchange filter (comma-separated)
         - instrument_type: Type filter (comma-separated)
         - segment: Segment filter (comma-separated)
+        - limit: Page size (omit to get every match)
+        - offset: Matches to skip
         
     Returns:
-        JSON response with instruments
+        JSON response with instruments; total is the number of matches
     """
     try:
         # Check if broker is connected
@@ -80,21 +84,14 @@ def get_instruments():
         broker_adapter = instruments_bp.broker_manager.get_adapter()
         broker_type = instruments_bp.broker_manager.get_broker_type()
         
-        # Get instruments (with caching)
-        instruments = instruments_bp.instrument_service.get_instruments(
+        # Get the indexed catalog (with caching)
+        catalog = instruments_bp.instrument_service.get_catalog(
             broker_adapter, 
             broker_type
         )
         
-        # Apply search if provided (sanitized by decorator)
+        # Search and filters (sanitized by decorator)
         search_query = request.args.get('search', '').strip()
-        if search_query:
-            instruments = instruments_bp.instrument_service.search_instruments(
-                instruments, 
-                search_query
-            )
-        
-        # Apply filters if provided (sanitized by decorator)
         filters = {}
         if request.args.get('exchange'):
             # Split and sanitize each value
@@ -107,11 +104,9 @@ def get_instruments():
             segments = [sanitize_string(s.strip(), 20) for s in request.args.get('segment').split(',')]
             filters['segment'] = segments
         
-        if filters:
-            instruments = instruments_bp.instrument_service.filter_instruments(
-                instruments, 
-                filters
-            )
+        limit = request.args.get('limit', None, type=int)
+        offset = request.args.get('offset', 0, type=int)
+        instruments, total = catalog.query(search_query, filters, limit=limit, offset=offset)
         
         # Get cache info
         cache_info = instruments_bp.instrument_service.get_cache_info(broker_type)
@@ -120,6 +115,10 @@ def get_instruments():
             'success': True,
             'instruments': instruments,
             'count': len(instruments),
+            'total': total,
+            'limit': limit,
+            'offset': offset,
+            'has_more': offset + len(instruments) < total,
             'cache_info': cache_info
         }), 200
         
@@ -200,17 +199,12 @@ def get_instrument_by_token(token):
         broker_adapter = instruments_bp.broker_manager.get_adapter()
         broker_type = instruments_bp.broker_manager.get_broker_type()
         
-        # Get all instruments
-        instruments = instruments_bp.instrument_service.get_instruments(
+        # Find by token in the indexed catalog
+        catalog = instruments_bp.instrument_service.get_catalog(
             broker_adapter, 
             broker_type
         )
-        
-        # Find by token
-        instrument = instruments_bp.instrument_service.get_instrument_by_token(
-            instruments, 
-            token
-        )
+        instrument = catalog.get_by_token(token)
         
         if instrument:
             return jsonify({
@@ -5,7 +5,10 @@ Log Management API endpoints
 import csv
 import io
 import logging
-from flask import Blueprint, request, jsonify, send_file
+import sys
+import zlib
+from pathlib import Path
+from flask import Blueprint, Response, request, jsonify, stream_with_context
 from validators import (
     validate_json_request,
     validate_query_params,
@@ -16,8 +19,17 @@ from rate_limiter import (
     WRITE_RATE_LIMIT
 )
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# Column order of LogDatabaseManager.iter_logs rows
+from src.managers.database_manager import EXPORT_COLUMNS
+
 logger = logging.getLogger(__name__)
 
+# Rows encoded per streamed CSV chunk
+EXPORT_CHUNK_ROWS = 500
+
 # Create blueprint
 logs_bp = Blueprint('logs', __name__, url_prefix='/api/logs')
 
@@ -44,6 +56,7 @@ def apply_rate_limits(limiter):
     limiter.limit(WRITE_RATE_LIMIT)(set_log_level)
     limiter.limit(READ_RATE_LIMIT)(download_logs)
     limiter.limit(WRITE_RATE_LIMIT)(clear_logs)
+    limiter.limit(READ_RATE_LIMIT)(list_archives)
 
 
 @logs_bp.route('/', methods=['GET'])
@@ -51,30 +64,60 @@ def apply_rate_limits(limiter):
 @validate_query_params({
     'limit': {'type': 'int', 'min': 1, 'max': 1000},
     'offset': {'type': 'int', 'min': 0},
+    'before_id': {'type': 'int', 'min': 1},
     'level': {'type': 'string', 'max_length': 20},
     'search': {'type': 'string', 'max_length': 100},
-    'symbol': {'type': 'string', 'max_length': 50}
+    'symbol': {'type': 'string', 'max_length': 50},
+    'archive_date': {'type': 'string', 'pattern': r'^\d{4}-\d{2}-\d{2}$'}
 })
 def get_logs():
     """
     Retrieve logs from database
+    
+    Pages are fetched newest first. Pass next_before_id from a response as
+    before_id to get the following page; offset is kept for older clients.
+    total is capped for very large result sets (total_capped is then true).
+    With archive_date the logs come from that day's archive (offset paging only).
     """
     try:
         limit = request.args.get('limit', 100, type=int)
         offset = request.args.get('offset', 0, type=int)
+        before_id = request.args.get('before_id', None, type=int)
         level = request.args.get('level', None)
         search = request.args.get('search', None)
         symbol = request.args.get('symbol', None)
+        archive_date = request.args.get('archive_date', None)
+        
+        if archive_date:
+            archived = logs_bp.db_manager.query_archive(
+                archive_date,
+                limit=limit,
+                offset=offset,
+                level=level,
+                search=search,
+                symbol=symbol
+            )
+            return jsonify({
+                'success': True,
+                'logs': archived['logs'],
+                'total': archived['total'],
+                'total_capped': False,
+                'limit': limit,
+                'offset': offset,
+                'archive_date': archive_date,
+                'next_before_id': None
+            }), 200
         
         logs = logs_bp.db_manager.get_logs(
             limit=limit,
             offset=offset,
             level=level,
             search=search,
-            symbol=symbol
+            symbol=symbol,
+            before_id=before_id
         )
         
-        total_count = logs_bp.db_manager.get_log_count(
+        count = logs_bp.db_manager.count_logs(
             level=level,
             search=search,
             symbol=symbol
@@ -83,9 +126,12 @@ def get_logs():
         return jsonify({
             'success': True,
             'logs': logs,
-            'total': total_count,
+            'total': count['total'],
+            'total_capped': count['capped'],
             'limit': limit,
-            'offset': offset
+            'offset': offset,
+            'before_id': before_id,
+            'next_before_id': logs[-1]['id'] if len(logs) == limit else None
         }), 200
         
     except Exception as e:
@@ -96,6 +142,25 @@ def get_logs():
         }), 500
 
 
+@logs_bp.route('/archives', methods=['GET'])
+def list_archives():
+    """
+    List the archived log days, newest first
+    """
+    try:
+        return jsonify({
+            'success': True,
+            'archives': logs_bp.db_manager.list_archives()
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"Error listing log archives: {e}", exc_info=True)
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 @logs_bp.route('/level', methods=['POST'])
 @validate_json_request(required_fields=['level'])
 def set_log_level():
@@ -133,36 +198,35 @@ def set_log_level():
 
 
 @logs_bp.route('/download', methods=['GET'])
+@validate_query_params({
+    'level': {'type': 'string', 'max_length': 20},
+    'search': {'type': 'string', 'max_length': 100},
+    'symbol': {'type': 'string', 'max_length': 50},
+    'compress': {'type': 'enum', 'allowed_values': ['gzip', 'none']}
+})
 def download_logs():
     """
     Download logs as CSV
+    
+    Every matching row is exported. The CSV is streamed in chunks straight
+    from a database cursor, gzip-compressed when compress=gzip.
     """
     try:
         level = request.args.get('level', None)
         search = request.args.get('search', None)
         symbol = request.args.get('symbol', None)
+        compress = request.args.get('compress') == 'gzip'
         
-        # Fetch a larger limit for download
-        logs = logs_bp.db_manager.get_logs(
-            limit=5000,
-            level=level,
-            search=search,
-            symbol=symbol
-        )
-        
-        # Create CSV in memory
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=['id', 'timestamp', 'level', 'logger_name', 'message', 'symbol', 'level_no'])
-        writer.writeheader()
-        writer.writerows(logs)
-        
-        output.seek(0)
+        rows = logs_bp.db_manager.iter_logs(level=level, search=search, symbol=symbol)
+        chunks = _csv_chunks(rows)
+        if compress:
+            chunks = _gzip_chunks(chunks)
         
-        return send_file(
-            io.BytesIO(output.getvalue().encode('utf-8')),
-            mimetype='text/csv',
-            as_attachment=True,
-            download_name=f"bot_logs_{sanitize_string(level or 'ALL')}.csv"
+        filename = f"bot_logs_{sanitize_string(level or 'ALL')}.csv" + ('.gz' if compress else '')
+        return Response(
+            stream_with_context(chunks),
+            mimetype='application/gzip' if compress else 'text/csv',
+            headers={'Content-Disposition': f'attachment; filename="{filename}"'}
         )
         
     except Exception as e:
@@ -173,6 +237,33 @@ def download_logs():
         }), 500
 
 
+def _csv_chunks(rows, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Encode rows as CSV, yielding about chunk_rows rows of bytes at a time"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue().encode('utf-8')
+
+
+def _gzip_chunks(chunks):
+    """Gzip a stream of byte chunks"""
+    compressor = zlib.compressobj(wbits=31)  # 31 selects the gzip container
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
 @logs_bp.route('/clear', methods=['POST'])
 def clear_logs():
     """
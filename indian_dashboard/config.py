@@ -41,6 +41,16 @@ DASHBOARD_CONFIG = {
     # Logging
     "log_level": os.getenv("LOG_LEVEL", "INFO"),
     "log_file": "dashboard.log",
+    
+    # Log database retention
+    "log_retention_days": int(os.getenv("LOG_RETENTION_DAYS", "30")),
+    "log_max_db_mb": float(os.getenv("LOG_MAX_DB_MB", "500")),
+    "log_retention_interval": int(os.getenv("LOG_RETENTION_INTERVAL", "3600")),  # 1 hour
+    "log_archive_enabled": os.getenv("LOG_ARCHIVE_ENABLED", "True").lower() == "true",
+    "log_archive_dir": BASE_DIR / "logs" / "archive",
+
+    # Trade ledger backing the analytics page
+    "trade_ledger_db": BASE_DIR / "data" / "trade_ledger.db",
 }
 
 # Broker configurations
@@ -79,8 +79,20 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Setup database logging
-db_manager = LogDatabaseManager(str(DASHBOARD_CONFIG['log_dir'] / "logs.db"))
+db_manager = LogDatabaseManager(
+    str(DASHBOARD_CONFIG['log_dir'] / "logs.db"),
+    archive_dir=str(DASHBOARD_CONFIG['log_archive_dir']) if DASHBOARD_CONFIG['log_archive_enabled'] else None
+)
+# One-off conversion of databases created before incremental vacuum, done
+# before retention starts so its rebuild never runs from the hourly thread
+if db_manager.enable_incremental_vacuum():
+    logger.info("Converted log database to incremental auto_vacuum")
 setup_db_logging(str(DASHBOARD_CONFIG['log_dir'] / "logs.db"))
+db_manager.start_retention(
+    interval_seconds=DASHBOARD_CONFIG['log_retention_interval'],
+    max_age_days=DASHBOARD_CONFIG['log_retention_days'],
+    max_size_mb=DASHBOARD_CONFIG['log_max_db_mb']
+)
 
 # Initialize session manager
 session_manager = SessionManager(
@@ -99,7 +111,14 @@ credential_manager = CredentialManager(
     DASHBOARD_CONFIG['credentials_dir'],
     DASHBOARD_CONFIG.get('encryption_key')
 )
-analytics_service = AnalyticsService()
+# Initialize trade ledger and analytics service
+try:
+    from src.managers.trade_ledger_manager import TradeLedgerManager
+    trade_ledger = TradeLedgerManager(str(DASHBOARD_CONFIG['trade_ledger_db']))
+except Exception as _ledger_err:
+    logger.warning(f'Trade ledger init failed: {_ledger_err}')
+    trade_ledger = None
+analytics_service = AnalyticsService(ledger=trade_ledger)
 chart_data_service = ChartDataService(broker_manager)
 
 # Initialize backtest DB and service
@@ -127,7 +146,7 @@ instruments_bp = init_instruments_api(broker_manager, instrument_service)
 config_bp = init_config_api(DASHBOARD_CONFIG['config_dir'], PRESET_CONFIGS)
 bot_bp = init_bot_api(bot_controller, broker_manager)
 session_bp = init_session_api(session_manager)
-analytics_bp = init_analytics_api(bot_controller, analytics_service)
+analytics_bp = init_analytics_api(bot_controller, analytics_service, broker_manager)
 charts_bp = init_charts_api(bot_controller, chart_data_service)
 logs_bp = init_logs_api(db_manager)
 if backtest_service:
@@ -5,6 +5,7 @@ Tracks and stores bot activities for display in dashboard
 
 from datetime import datetime
 from collections import deque
+from itertools import islice, takewhile
 from typing import Dict, List
 import threading
 
@@ -13,17 +14,23 @@ class ActivityLogger:
     """
     Thread-safe activity logger for bot operations
     Stores recent activities in memory for dashboard display
+    
+    Every activity gets an increasing id, so clients can ask for what
+    they have not seen yet instead of re-reading the whole buffer.
     """
     
-    def __init__(self, max_activities: int = 500):
+    def __init__(self, max_activities: int = 500, live_updates=None):
         """
         Initialize activity logger
         
         Args:
             max_activities: Maximum number of activities to store
+            live_updates: Optional LiveUpdateHub that new activities are pushed to
         """
         self.activities = deque(maxlen=max_activities)
         self.lock = threading.Lock()
+        self.live_updates = live_updates
+        self.last_id = 0
     
     def log(self, activity_type: str, message: str, symbol: str = None, 
             data: Dict = None, level: str = 'info'):
@@ -38,6 +45,7 @@ class ActivityLogger:
             level: Log level (info, success, warning, error)
         """
         activity = {
+            'id': 0,
             'timestamp': datetime.now().isoformat(),
             'type': activity_type,
             'message': message,
@@ -47,7 +55,12 @@ class ActivityLogger:
         }
         
         with self.lock:
+            self.last_id += 1
+            activity['id'] = self.last_id
             self.activities.append(activity)
+        
+        if self.live_updates is not None:
+            self.live_updates.publish('activity', activity)
     
     def get_recent(self, limit: int = 100, activity_type: str = None) -> List[Dict]:
         """
@@ -61,14 +74,27 @@ class ActivityLogger:
             List of recent activities
         """
         with self.lock:
-            activities = list(self.activities)
-        
-        # Filter by type if specified
-        if activity_type:
-            activities = [a for a in activities if a['type'] == activity_type]
+            # Walk from the newest entry and stop at limit instead of copying the buffer
+            activities = reversed(self.activities)
+            if activity_type:
+                activities = (a for a in activities if a['type'] == activity_type)
+            return list(islice(activities, limit))
+    
+    def get_since(self, after_id: int, limit: int = 500) -> List[Dict]:
+        """
+        Get activities logged after a cursor
         
-        # Return most recent first, limited
-        return list(reversed(activities))[:limit]
+        Args:
+            after_id: Id of the last activity the caller has seen
+            limit: Maximum number of activities to return (the newest are kept)
+            
+        Returns:
+            Activities with id > after_id, oldest first
+        """
+        with self.lock:
+            newer = list(islice(takewhile(lambda a: a['id'] > after_id, reversed(self.activities)), limit))
+        newer.reverse()
+        return newer
     
     def clear(self):
         """Clear all activities"""
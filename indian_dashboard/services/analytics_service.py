@@ -4,19 +4,110 @@ Calculates performance metrics and statistics from trade history
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from collections import defaultdict
+from pathlib import Path
 import logging
+import sys
+import threading
+import time
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.managers.trade_ledger_manager import BUCKET_COLUMNS, normalize_fill
 
 logger = logging.getLogger(__name__)
 
+# Order statuses that count as fills when feeding the ledger
+FILLED_STATUSES = ('COMPLETE',)
+
+# Ledger source used when the caller does not name the broker
+DEFAULT_SOURCE = 'default'
+
 
 class AnalyticsService:
     """Service for calculating trading analytics and performance metrics"""
     
-    def __init__(self):
+    def __init__(self, ledger=None):
+        """
+        Args:
+            ledger: Optional TradeLedgerManager. When set, summaries are read
+                from its aggregates and the broker's orders only feed it.
+        """
+        self.ledger = ledger
         self.cache = {}
         self.cache_timeout = 60  # Cache for 60 seconds
+        self._cache_lock = threading.Lock()
+        self._last_sync = {}
+    
+    def get_summary(self, fetch_trades: Callable, from_date: str = None, to_date: str = None,
+                    source: Optional[str] = None) -> Dict:
+        """
+        Calculate every analytics panel in one pass
+        
+        Args:
+            fetch_trades: Callable(from_date, to_date) returning trade dictionaries,
+                e.g. BotController.get_trades
+            from_date: Start date filter (YYYY-MM-DD)
+            to_date: End date filter (YYYY-MM-DD)
+            source: Broker the trades come from; ledger summaries only
+                include fills recorded for it, so paper and live stay apart
+                (DEFAULT_SOURCE when None)
+            
+        Returns:
+            Dictionary with performance, profit_by_symbol, win_loss_by_symbol,
+            daily_profit, hourly_performance, trade_distribution, drawdown
+            and risk_metrics
+        """
+        source = source or DEFAULT_SOURCE
+        if self.ledger is not None and self._sync_due(source):
+            try:
+                self.sync_ledger(fetch_trades(), source)
+            except Exception as e:
+                logger.error(f"Error syncing trade ledger: {e}", exc_info=True)
+        
+        key = (source, from_date, to_date)
+        with self._cache_lock:
+            cached = self.cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self.cache_timeout:
+                return cached[1]
+        
+        if self.ledger is not None:
+            timestamps, pnl = self.ledger.get_pnl_series(from_date, to_date, source)
+            summary = self._summarize(self.ledger.get_buckets(from_date, to_date, source), timestamps, pnl)
+        else:
+            trades = self._filter_trades_by_date(fetch_trades(from_date, to_date), from_date, to_date)
+            summary = self._summarize(*self._aggregate(trades))
+        
+        with self._cache_lock:
+            self.cache[key] = (time.monotonic(), summary)
+        return summary
+    
+    def sync_ledger(self, trades: List[Dict], source: str = DEFAULT_SOURCE) -> int:
+        """
+        Record filled orders in the ledger
+        
+        Args:
+            trades: Order/trade dictionaries from the broker adapter
+            source: Broker the trades come from
+            
+        Returns:
+            Number of new or changed fills
+        """
+        self._last_sync[source] = time.monotonic()
+        fills = [t for t in trades or [] if t.get('status', 'COMPLETE') in FILLED_STATUSES]
+        written = self.ledger.record_fills(fills, source)
+        if written:
+            with self._cache_lock:
+                self.cache.clear()
+        return written
+    
+    def _sync_due(self, source: str) -> bool:
+        last_sync = self._last_sync.get(source)
+        return last_sync is None or time.monotonic() - last_sync >= self.cache_timeout
     
     def get_performance_metrics(self, trades: List[Dict], from_date: str = None, to_date: str = None) -> Dict:
         """
@@ -31,51 +122,8 @@ class AnalyticsService:
             Dictionary with performance metrics
         """
         try:
-            # Filter trades by date
-            filtered_trades = self._filter_trades_by_date(trades, from_date, to_date)
-            
-            if not filtered_trades:
-                return self._empty_metrics()
-            
-            # Calculate metrics
-            total_trades = len(filtered_trades)
-            winning_trades = [t for t in filtered_trades if self._get_pnl(t) > 0]
-            losing_trades = [t for t in filtered_trades if self._get_pnl(t) < 0]
-            
-            total_pnl = sum(self._get_pnl(t) for t in filtered_trades)
-            total_wins = len(winning_trades)
-            total_losses = len(losing_trades)
-            
-            win_rate = (total_wins / total_trades * 100) if total_trades > 0 else 0
-            
-            avg_win = sum(self._get_pnl(t) for t in winning_trades) / total_wins if total_wins > 0 else 0
-            avg_loss = sum(self._get_pnl(t) for t in losing_trades) / total_losses if total_losses > 0 else 0
-            avg_trade = total_pnl / total_trades if total_trades > 0 else 0
-            
-            largest_win = max((self._get_pnl(t) for t in winning_trades), default=0)
-            largest_loss = min((self._get_pnl(t) for t in losing_trades), default=0)
-            
-            # Profit factor
-            gross_profit = sum(self._get_pnl(t) for t in winning_trades)
-            gross_loss = abs(sum(self._get_pnl(t) for t in losing_trades))
-            profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0
-            
-            return {
-                'total_trades': total_trades,
-                'winning_trades': total_wins,
-                'losing_trades': total_losses,
-                'win_rate': round(win_rate, 2),
-                'total_pnl': round(total_pnl, 2),
-                'avg_win': round(avg_win, 2),
-                'avg_loss': round(avg_loss, 2),
-                'avg_trade': round(avg_trade, 2),
-                'largest_win': round(largest_win, 2),
-                'largest_loss': round(largest_loss, 2),
-                'profit_factor': round(profit_factor, 2),
-                'gross_profit': round(gross_profit, 2),
-                'gross_loss': round(gross_loss, 2)
-            }
-            
+            buckets, _, pnl = self._aggregate(self._filter_trades_by_date(trades, from_date, to_date))
+            return self._performance(buckets, pnl)
         except Exception as e:
             logger.error(f"Error calculating performance metrics: {e}", exc_info=True)
             return self._empty_metrics()
@@ -93,36 +141,8 @@ class AnalyticsService:
             List of {symbol, pnl, trades_count, win_rate}
         """
         try:
-            filtered_trades = self._filter_trades_by_date(trades, from_date, to_date)
-            
-            symbol_data = defaultdict(lambda: {'pnl': 0, 'trades': [], 'wins': 0})
-            
-            for trade in filtered_trades:
-                symbol = trade.get('symbol', 'UNKNOWN')
-                pnl = self._get_pnl(trade)
-                
-                symbol_data[symbol]['pnl'] += pnl
-                symbol_data[symbol]['trades'].append(trade)
-                if pnl > 0:
-                    symbol_data[symbol]['wins'] += 1
-            
-            result = []
-            for symbol, data in symbol_data.items():
-                trades_count = len(data['trades'])
-                win_rate = (data['wins'] / trades_count * 100) if trades_count > 0 else 0
-                
-                result.append({
-                    'symbol': symbol,
-                    'pnl': round(data['pnl'], 2),
-                    'trades_count': trades_count,
-                    'win_rate': round(win_rate, 2)
-                })
-            
-            # Sort by PnL descending
-            result.sort(key=lambda x: x['pnl'], reverse=True)
-            
-            return result
-            
+            buckets, _, _ = self._aggregate(self._filter_trades_by_date(trades, from_date, to_date))
+            return self._profit_by_symbol(buckets)
         except Exception as e:
             logger.error(f"Error calculating profit by symbol: {e}", exc_info=True)
             return []
@@ -140,32 +160,8 @@ class AnalyticsService:
             List of {symbol, wins, losses}
         """
         try:
-            filtered_trades = self._filter_trades_by_date(trades, from_date, to_date)
-            
-            symbol_data = defaultdict(lambda: {'wins': 0, 'losses': 0})
-            
-            for trade in filtered_trades:
-                symbol = trade.get('symbol', 'UNKNOWN')
-                pnl = self._get_pnl(trade)
-                
-                if pnl > 0:
-                    symbol_data[symbol]['wins'] += 1
-                elif pnl < 0:
-                    symbol_data[symbol]['losses'] += 1
-            
-            result = []
-            for symbol, data in symbol_data.items():
-                result.append({
-                    'symbol': symbol,
-                    'wins': data['wins'],
-                    'losses': data['losses']
-                })
-            
-            # Sort by total trades descending
-            result.sort(key=lambda x: x['wins'] + x['losses'], reverse=True)
-            
-            return result
-            
+            buckets, _, _ = self._aggregate(self._filter_trades_by_date(trades, from_date, to_date))
+            return self._win_loss_by_symbol(buckets)
         except Exception as e:
             logger.error(f"Error calculating win/loss by symbol: {e}", exc_info=True)
             return []
@@ -183,27 +179,8 @@ class AnalyticsService:
             List of {date, pnl, trades_count}
         """
         try:
-            filtered_trades = self._filter_trades_by_date(trades, from_date, to_date)
-            
-            daily_data = defaultdict(lambda: {'pnl': 0, 'trades_count': 0})
-            
-            for trade in filtered_trades:
-                date = self._get_trade_date(trade)
-                pnl = self._get_pnl(trade)
-                
-                daily_data[date]['pnl'] += pnl
-                daily_data[date]['trades_count'] += 1
-            
-            result = []
-            for date, data in sorted(daily_data.items()):
-                result.append({
-                    'date': date,
-                    'pnl': round(data['pnl'], 2),
-                    'trades_count': data['trades_count']
-                })
-            
-            return result
-            
+            buckets, _, _ = self._aggregate(self._filter_trades_by_date(trades, from_date, to_date))
+            return self._daily_profit(buckets)
         except Exception as e:
             logger.error(f"Error calculating daily profit: {e}", exc_info=True)
             return []
@@ -221,29 +198,8 @@ class AnalyticsService:
             List of {hour, pnl, trades_count}
         """
         try:
-            filtered_trades = self._filter_trades_by_date(trades, from_date, to_date)
-            
-            hourly_data = defaultdict(lambda: {'pnl': 0, 'trades_count': 0})
-            
-            for trade in filtered_trades:
-                hour = self._get_trade_hour(trade)
-                pnl = self._get_pnl(trade)
-                
-                hourly_data[hour]['pnl'] += pnl
-                hourly_data[hour]['trades_count'] += 1
-            
-            result = []
-            for hour in range(24):
-                hour_str = f"{hour:02d}:00"
-                data = hourly_data.get(hour, {'pnl': 0, 'trades_count': 0})
-                result.append({
-                    'hour': hour_str,
-                    'pnl': round(data['pnl'], 2),
-                    'trades_count': data['trades_count']
-                })
-            
-            return result
-            
+            buckets, _, _ = self._aggregate(self._filter_trades_by_date(trades, from_date, to_date))
+            return self._hourly_performance(buckets)
         except Exception as e:
             logger.error(f"Error calculating hourly performance: {e}", exc_info=True)
             return []
@@ -261,33 +217,8 @@ class AnalyticsService:
             List of {symbol, count, percentage}
         """
         try:
-            filtered_trades = self._filter_trades_by_date(trades, from_date, to_date)
-            
-            if not filtered_trades:
-                return []
-            
-            symbol_counts = defaultdict(int)
-            
-            for trade in filtered_trades:
-                symbol = trade.get('symbol', 'UNKNOWN')
-                symbol_counts[symbol] += 1
-            
-            total_trades = len(filtered_trades)
-            
-            result = []
-            for symbol, count in symbol_counts.items():
-                percentage = (count / total_trades * 100) if total_trades > 0 else 0
-                result.append({
-                    'symbol': symbol,
-                    'count': count,
-                    'percentage': round(percentage, 2)
-                })
-            
-            # Sort by count descending
-            result.sort(key=lambda x: x['count'], reverse=True)
-            
-            return result
-            
+            buckets, _, _ = self._aggregate(self._filter_trades_by_date(trades, from_date, to_date))
+            return self._trade_distribution(buckets)
         except Exception as e:
             logger.error(f"Error calculating trade distribution: {e}", exc_info=True)
             return []
@@ -305,46 +236,8 @@ class AnalyticsService:
             Dictionary with drawdown data
         """
         try:
-            filtered_trades = self._filter_trades_by_date(trades, from_date, to_date)
-            
-            if not filtered_trades:
-                return {'max_drawdown': 0, 'current_drawdown': 0, 'equity_curve': []}
-            
-            # Sort trades by timestamp
-            sorted_trades = sorted(filtered_trades, key=lambda t: self._get_timestamp(t))
-            
-            equity = 0
-            peak_equity = 0
-            max_drawdown = 0
-            equity_curve = []
-            
-            for trade in sorted_trades:
-                pnl = self._get_pnl(trade)
-                equity += pnl
-                
-                if equity > peak_equity:
-                    peak_equity = equity
-                
-                drawdown = peak_equity - equity
-                if drawdown > max_drawdown:
-                    max_drawdown = drawdown
-                
-                equity_curve.append({
-                    'timestamp': self._get_timestamp(t),
-                    'equity': round(equity, 2),
-                    'drawdown': round(drawdown, 2)
-                })
-            
-            current_drawdown = peak_equity - equity
-            
-            return {
-                'max_drawdown': round(max_drawdown, 2),
-                'current_drawdown': round(current_drawdown, 2),
-                'peak_equity': round(peak_equity, 2),
-                'current_equity': round(equity, 2),
-                'equity_curve': equity_curve
-            }
-            
+            _, timestamps, pnl = self._aggregate(self._filter_trades_by_date(trades, from_date, to_date))
+            return self._drawdown(timestamps, pnl)
         except Exception as e:
             logger.error(f"Error calculating drawdown: {e}", exc_info=True)
             return {'max_drawdown': 0, 'current_drawdown': 0, 'equity_curve': []}
@@ -362,49 +255,206 @@ class AnalyticsService:
             Dictionary with risk metrics
         """
         try:
-            filtered_trades = self._filter_trades_by_date(trades, from_date, to_date)
-            
-            if not filtered_trades:
-                return self._empty_risk_metrics()
-            
-            pnls = [self._get_pnl(t) for t in filtered_trades]
-            
-            # Calculate standard deviation
-            mean_pnl = sum(pnls) / len(pnls)
-            variance = sum((x - mean_pnl) ** 2 for x in pnls) / len(pnls)
-            std_dev = variance ** 0.5
-            
-            # Sharpe ratio (simplified, assuming risk-free rate = 0)
-            sharpe_ratio = mean_pnl / std_dev if std_dev > 0 else 0
-            
-            # Max consecutive wins/losses
-            max_consecutive_wins = 0
-            max_consecutive_losses = 0
-            current_wins = 0
-            current_losses = 0
-            
-            for trade in filtered_trades:
-                pnl = self._get_pnl(trade)
-                if pnl > 0:
-                    current_wins += 1
-                    current_losses = 0
-                    max_consecutive_wins = max(max_consecutive_wins, current_wins)
-                elif pnl < 0:
-                    current_losses += 1
-                    current_wins = 0
-                    max_consecutive_losses = max(max_consecutive_losses, current_losses)
-            
-            return {
-                'sharpe_ratio': round(sharpe_ratio, 2),
-                'std_deviation': round(std_dev, 2),
-                'max_consecutive_wins': max_consecutive_wins,
-                'max_consecutive_losses': max_consecutive_losses
-            }
-            
+            _, _, pnl = self._aggregate(self._filter_trades_by_date(trades, from_date, to_date))
+            return self._risk(pnl)
         except Exception as e:
             logger.error(f"Error calculating risk metrics: {e}", exc_info=True)
             return self._empty_risk_metrics()
     
+    # Aggregation
+    
+    def _aggregate(self, trades: List[Dict]) -> Tuple[List[Dict], List[str], np.ndarray]:
+        """
+        Reduce trades to the same shape the ledger stores
+        
+        Returns:
+            (buckets per date/hour/symbol, timestamps oldest first, P&L in the same order)
+        """
+        rows = sorted((normalize_fill(trade) for trade in trades), key=lambda row: row[6])
+        buckets = {}
+        for row in rows:
+            symbol, pnl, trade_date, hour = row[1], row[5], row[7], row[8]
+            bucket = buckets.get((trade_date, hour, symbol))
+            if bucket is None:
+                bucket = buckets[(trade_date, hour, symbol)] = dict.fromkeys(BUCKET_COLUMNS, 0)
+                bucket.update(trade_date=trade_date, hour=hour, symbol=symbol)
+            bucket['trades'] += 1
+            bucket['wins'] += pnl > 0
+            bucket['losses'] += pnl < 0
+            bucket['pnl'] += pnl
+            bucket['gross_profit'] += max(pnl, 0.0)
+            bucket['gross_loss'] += max(-pnl, 0.0)
+        
+        pnl = np.fromiter((row[5] for row in rows), dtype=float, count=len(rows))
+        return list(buckets.values()), [row[6] for row in rows], pnl
+    
+    def _summarize(self, buckets: List[Dict], timestamps: List[str], pnl: np.ndarray) -> Dict:
+        """All panels from aggregated buckets and the P&L series"""
+        return {
+            'performance': self._performance(buckets, pnl),
+            'profit_by_symbol': self._profit_by_symbol(buckets),
+            'win_loss_by_symbol': self._win_loss_by_symbol(buckets),
+            'daily_profit': self._daily_profit(buckets),
+            'hourly_performance': self._hourly_performance(buckets),
+            'trade_distribution': self._trade_distribution(buckets),
+            'drawdown': self._drawdown(timestamps, pnl),
+            'risk_metrics': self._risk(pnl)
+        }
+    
+    def _group(self, buckets: List[Dict], field: str) -> Dict:
+        """Sum bucket counters per value of field"""
+        grouped = defaultdict(lambda: {'trades': 0, 'wins': 0, 'losses': 0, 'pnl': 0.0,
+                                       'gross_profit': 0.0, 'gross_loss': 0.0})
+        for bucket in buckets:
+            totals = grouped[bucket[field]]
+            for counter in totals:
+                totals[counter] += bucket[counter]
+        return grouped
+    
+    def _performance(self, buckets: List[Dict], pnl: np.ndarray) -> Dict:
+        total_trades = sum(b['trades'] for b in buckets)
+        if total_trades == 0:
+            return self._empty_metrics()
+        
+        total_wins = sum(b['wins'] for b in buckets)
+        total_losses = sum(b['losses'] for b in buckets)
+        total_pnl = sum(b['pnl'] for b in buckets)
+        gross_profit = sum(b['gross_profit'] for b in buckets)
+        gross_loss = sum(b['gross_loss'] for b in buckets)
+        
+        win_rate = total_wins / total_trades * 100
+        avg_win = gross_profit / total_wins if total_wins > 0 else 0
+        avg_loss = -gross_loss / total_losses if total_losses > 0 else 0
+        avg_trade = total_pnl / total_trades
+        largest_win = max(float(pnl.max()), 0) if len(pnl) else 0
+        largest_loss = min(float(pnl.min()), 0) if len(pnl) else 0
+        profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0
+        
+        return {
+            'total_trades': total_trades,
+            'winning_trades': total_wins,
+            'losing_trades': total_losses,
+            'win_rate': round(win_rate, 2),
+            'total_pnl': round(total_pnl, 2),
+            'avg_win': round(avg_win, 2),
+            'avg_loss': round(avg_loss, 2),
+            'avg_trade': round(avg_trade, 2),
+            'largest_win': round(largest_win, 2),
+            'largest_loss': round(largest_loss, 2),
+            'profit_factor': round(profit_factor, 2),
+            'gross_profit': round(gross_profit, 2),
+            'gross_loss': round(gross_loss, 2)
+        }
+    
+    def _profit_by_symbol(self, buckets: List[Dict]) -> List[Dict]:
+        result = []
+        for symbol, data in self._group(buckets, 'symbol').items():
+            result.append({
+                'symbol': symbol,
+                'pnl': round(data['pnl'], 2),
+                'trades_count': data['trades'],
+                'win_rate': round(data['wins'] / data['trades'] * 100, 2) if data['trades'] else 0
+            })
+        
+        # Sort by PnL descending
+        result.sort(key=lambda x: x['pnl'], reverse=True)
+        return result
+    
+    def _win_loss_by_symbol(self, buckets: List[Dict]) -> List[Dict]:
+        result = [
+            {'symbol': symbol, 'wins': data['wins'], 'losses': data['losses']}
+            for symbol, data in self._group(buckets, 'symbol').items()
+            if data['wins'] or data['losses']
+        ]
+        
+        # Sort by total trades descending
+        result.sort(key=lambda x: x['wins'] + x['losses'], reverse=True)
+        return result
+    
+    def _daily_profit(self, buckets: List[Dict]) -> List[Dict]:
+        return [
+            {'date': date, 'pnl': round(data['pnl'], 2), 'trades_count': data['trades']}
+            for date, data in sorted(self._group(buckets, 'trade_date').items())
+        ]
+    
+    def _hourly_performance(self, buckets: List[Dict]) -> List[Dict]:
+        hourly_data = self._group(buckets, 'hour')
+        result = []
+        for hour in range(24):
+            data = hourly_data.get(hour)
+            result.append({
+                'hour': f"{hour:02d}:00",
+                'pnl': round(data['pnl'], 2) if data else 0,
+                'trades_count': data['trades'] if data else 0
+            })
+        return result
+    
+    def _trade_distribution(self, buckets: List[Dict]) -> List[Dict]:
+        total_trades = sum(b['trades'] for b in buckets)
+        if total_trades == 0:
+            return []
+        
+        result = [
+            {'symbol': symbol, 'count': data['trades'],
+             'percentage': round(data['trades'] / total_trades * 100, 2)}
+            for symbol, data in self._group(buckets, 'symbol').items()
+        ]
+        
+        # Sort by count descending
+        result.sort(key=lambda x: x['count'], reverse=True)
+        return result
+    
+    def _drawdown(self, timestamps: List[str], pnl: np.ndarray) -> Dict:
+        if len(pnl) == 0:
+            return {'max_drawdown': 0, 'current_drawdown': 0, 'equity_curve': []}
+        
+        equity = np.cumsum(pnl)
+        # Peak equity starts at zero, the equity before the first trade
+        peak = np.maximum.accumulate(np.maximum(equity, 0))
+        drawdown = peak - equity
+        
+        equity_curve = [
+            {'timestamp': timestamp, 'equity': e, 'drawdown': d}
+            for timestamp, e, d in zip(timestamps, np.round(equity, 2).tolist(), np.round(drawdown, 2).tolist())
+        ]
+        
+        return {
+            'max_drawdown': round(float(drawdown.max()), 2),
+            'current_drawdown': round(float(drawdown[-1]), 2),
+            'peak_equity': round(float(peak[-1]), 2),
+            'current_equity': round(float(equity[-1]), 2),
+            'equity_curve': equity_curve
+        }
+    
+    def _risk(self, pnl: np.ndarray) -> Dict:
+        if len(pnl) == 0:
+            return self._empty_risk_metrics()
+        
+        mean_pnl = float(pnl.mean())
+        std_dev = float(pnl.std())
+        
+        # Sharpe ratio (simplified, assuming risk-free rate = 0)
+        sharpe_ratio = mean_pnl / std_dev if std_dev > 0 else 0
+        
+        # Breakeven trades neither extend nor break a streak
+        signs = np.sign(pnl)
+        signs = signs[signs != 0]
+        
+        return {
+            'sharpe_ratio': round(sharpe_ratio, 2),
+            'std_deviation': round(std_dev, 2),
+            'max_consecutive_wins': self._longest_run(signs > 0),
+            'max_consecutive_losses': self._longest_run(signs < 0)
+        }
+    
+    @staticmethod
+    def _longest_run(mask: np.ndarray) -> int:
+        """Length of the longest run of True values"""
+        if not mask.any():
+            return 0
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.astype(np.int8), [0]))))
+        return int((edges[1::2] - edges[::2]).max())
+    
     # Helper methods
     
     def _filter_trades_by_date(self, trades: List[Dict], from_date: str = None, to_date: str = None) -> List[Dict]:
@@ -425,10 +475,6 @@ class AnalyticsService:
         
         return filtered
     
-    def _get_pnl(self, trade: Dict) -> float:
-        """Extract P&L from trade"""
-        return float(trade.get('pnl', 0) or trade.get('profit', 0) or 0)
-    
     def _get_trade_date(self, trade: Dict) -> str:
         """Extract date from trade (YYYY-MM-DD)"""
         timestamp = trade.get('timestamp') or trade.get('order_timestamp') or trade.get('exit_time')
@@ -439,24 +485,6 @@ class AnalyticsService:
                 return timestamp.strftime('%Y-%m-%d')
         return datetime.now().strftime('%Y-%m-%d')
     
-    def _get_trade_hour(self, trade: Dict) -> int:
-        """Extract hour from trade (0-23)"""
-        timestamp = trade.get('timestamp') or trade.get('order_timestamp') or trade.get('exit_time')
-        if timestamp:
-            if isinstance(timestamp, str):
-                try:
-                    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                    return dt.hour
-                except:
-                    pass
-            elif isinstance(timestamp, datetime):
-                return timestamp.hour
-        return 0
-    
-    def _get_timestamp(self, trade: Dict) -> str:
-        """Extract timestamp from trade"""
-        return trade.get('timestamp') or trade.get('order_timestamp') or trade.get('exit_time') or ''
-    
     def _empty_metrics(self) -> Dict:
         """Return empty metrics structure"""
         return {
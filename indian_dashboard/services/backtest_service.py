@@ -82,8 +82,15 @@ class BacktestService:
     def list_runs(self, mode: Optional[str] = None) -> list:
         return self.db.list_runs(mode=mode)
 
-    def get_result(self, run_id: str) -> Optional[Dict]:
-        return self.db.get_run(run_id)
+    def get_result(self, run_id: str, max_points: Optional[int] = None,
+                   trade_limit: Optional[int] = None) -> Optional[Dict]:
+        return self.db.get_run(run_id, max_points=max_points, trade_limit=trade_limit)
+
+    def get_equity_curve(self, run_id: str, max_points: Optional[int] = None) -> Optional[Dict]:
+        return self.db.get_equity_curve(run_id, max_points=max_points)
+
+    def get_trades(self, run_id: str, limit: int = 100, offset: int = 0) -> Dict:
+        return self.db.get_trades(run_id, limit=limit, offset=offset)
 
     def delete_run(self, run_id: str) -> bool:
         with self._lock:
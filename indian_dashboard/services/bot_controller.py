@@ -16,6 +16,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from src.core.indian_trading_bot import IndianTradingBot
 from src.adapters.broker_adapter import BrokerAdapter
 from .activity_logger import ActivityLogger
+from .live_updates import LiveUpdateHub
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +32,8 @@ class BotController:
         self.config = None
         self.broker_adapter = None
         self.stop_requested = False
-        self.activity_logger = ActivityLogger()
+        self.live_updates = LiveUpdateHub()
+        self.activity_logger = ActivityLogger(live_updates=self.live_updates)
     
     def start(self, config: Dict, broker_adapter: BrokerAdapter) -> tuple[bool, str]:
         """
@@ -64,6 +66,10 @@ class BotController:
             if hasattr(self.bot, 'set_activity_logger'):
                 self.bot.set_activity_logger(self.activity_logger)
             
+            # Let the bot loop push positions and account snapshots to dashboard streams
+            if hasattr(self.bot, 'set_live_updates'):
+                self.bot.set_live_updates(self.live_updates)
+            
             # Log bot startup configuration
             self.activity_logger.log_bot_start(config)
             
@@ -82,6 +88,7 @@ class BotController:
             
             self.is_running = True
             self.start_time = datetime.now()
+            self.live_updates.publish('status', self.get_status())
             
             # Log successful start
             symbols = config.get('symbols', [])
@@ -108,6 +115,7 @@ class BotController:
             logger.error(f"Bot thread error: {e}", exc_info=True)
         finally:
             self.is_running = False
+            self.live_updates.publish('status', self.get_status())
             logger.info("Bot thread stopped")
 
     def stop(self) -> tuple[bool, str]:
@@ -145,6 +153,7 @@ class BotController:
             self.bot = None
             self.bot_thread = None
             self.start_time = None
+            self.live_updates.publish('status', self.get_status())
             
             logger.info("Trading bot stopped")
             return True, "Bot stopped successfully"
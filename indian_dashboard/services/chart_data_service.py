@@ -4,28 +4,117 @@ Prepares historical price data and indicators for charting
 """
 
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Dict, List, Optional
 import logging
+import sys
+import threading
+import time
 import pandas as pd
 import numpy as np
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.analyzers.multi_timeframe_analyzer import session_bar_close
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on entry age; entries also expire when the current bar closes
+DEFAULT_CACHE_TIMEOUT = 300
+
+# Bars are laid out on the NSE session grid (09:15 open) in exchange time
+MARKET_TIMEZONE = 'Asia/Kolkata'
+
+# Cached frames and payloads kept before the oldest are evicted
+MAX_CACHE_ENTRIES = 128
+
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+def downsample_ohlcv(df: pd.DataFrame, max_points: int) -> pd.DataFrame:
+    """
+    Merge consecutive bars so at most max_points candles remain
+
+    Each bucket keeps the first open and time, the highest high, the lowest
+    low, the last close and the summed volume, so price extremes survive.
+    Other columns (indicators) take the value at the bucket's last bar.
+    """
+    length = len(df)
+    if not max_points or length <= max_points:
+        return df
+
+    starts = np.linspace(0, length, max_points + 1).astype(int)[:-1]
+    ends = np.append(starts[1:], length) - 1
+
+    merged = df.iloc[ends].copy()
+    merged.index = df.index[starts]
+    merged['open'] = df['open'].to_numpy()[starts]
+    merged['high'] = np.maximum.reduceat(df['high'].to_numpy(dtype=float), starts)
+    merged['low'] = np.minimum.reduceat(df['low'].to_numpy(dtype=float), starts)
+    if 'volume' in df.columns:
+        merged['volume'] = np.add.reduceat(df['volume'].to_numpy(dtype=float), starts)
+    if 'time' in df.columns:
+        merged['time'] = df['time'].to_numpy()[starts]
+    return merged
+
+
+def lttb_indices(values: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-triangle-three-buckets selection over an evenly spaced series
+
+    Keeps the first and last points and, from each bucket in between, the
+    point forming the largest triangle with the previously kept point and
+    the average of the next bucket. Returns the indices of kept points.
+    """
+    values = np.asarray(values, dtype=float)
+    length = len(values)
+    if threshold >= length or threshold < 3:
+        return np.arange(length)
+
+    values = np.nan_to_num(values)
+    edges = np.linspace(1, length - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=int)
+    selected[0] = 0
+    selected[-1] = length - 1
+
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_start = end
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else length
+        avg_x = (next_start + next_end - 1) / 2.0
+        avg_y = values[next_start:next_end].mean()
+
+        xs = np.arange(start, end)
+        areas = np.abs(
+            (previous - avg_x) * (values[start:end] - values[previous])
+            - (previous - xs) * (avg_y - values[previous])
+        )
+        previous = start + int(areas.argmax())
+        selected[bucket + 1] = previous
+
+    return selected
+
 
 class ChartDataService:
     """Service for preparing chart data with technical indicators"""
     
-    def __init__(self, broker_manager=None):
+    def __init__(self, broker_manager=None, cache_timeout: int = DEFAULT_CACHE_TIMEOUT):
         self.broker_manager = broker_manager
         self.cache = {}
-        self.cache_timeout = 300  # Cache for 5 minutes
+        self.cache_timeout = cache_timeout
+        self.cache_stats = {'hits': 0, 'misses': 0}
+        self._cache_lock = threading.Lock()
     
     def get_price_data(
         self,
         symbol: str,
         timeframe: str = '15min',
         bars: int = 200,
-        indicators: List[str] = None
+        indicators: List[str] = None,
+        max_points: Optional[int] = None,
+        columnar: bool = False
     ) -> Dict:
         """
         Get historical price data with optional indicators
@@ -35,35 +124,45 @@ class ChartDataService:
             timeframe: Timeframe (1min, 5min, 15min, 1h, 1d)
             bars: Number of bars to fetch
             indicators: List of indicators to calculate
+            max_points: Merge bars so at most this many candles are returned
+            columnar: Return 'data' as parallel arrays instead of one dict per bar
             
         Returns:
             Dictionary with OHLCV data and indicators
         """
+        indicators = sorted({i.lower() for i in indicators or []})
+        key = ('price', symbol, timeframe, bars, tuple(indicators), max_points, columnar)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         try:
             # Get historical data from broker
-            df = self._fetch_historical_data(symbol, timeframe, bars)
+            df = self._get_historical_data(symbol, timeframe, bars)
             
             if df is None or len(df) == 0:
                 return {'error': 'No data available'}
             
-            # Calculate indicators if requested
+            # Calculate indicators on a copy so the cached bars stay untouched
+            df = df.copy()
             if indicators:
                 df = self._calculate_indicators(df, indicators)
+            df = downsample_ohlcv(df, max_points)
             
             # Format for frontend
             result = {
                 'symbol': symbol,
                 'timeframe': timeframe,
-                'data': self._format_ohlcv(df),
+                'data': self._format_ohlcv(df, columnar=columnar),
                 'indicators': {}
             }
             
-            # Add indicator data
-            if indicators:
-                for indicator in indicators:
-                    if indicator in df.columns:
-                        result['indicators'][indicator] = df[indicator].fillna(0).tolist()
+            # Add indicator data, including derived columns such as ma_20 or bb_upper
+            for col in df.columns:
+                if col not in OHLCV_COLUMNS and col != 'time':
+                    result['indicators'][col] = df[col].fillna(0).tolist()
             
+            self._cache_put(key, timeframe, result)
             return result
             
         except Exception as e:
@@ -76,7 +175,8 @@ class ChartDataService:
         indicator: str,
         timeframe: str = '15min',
         bars: int = 200,
-        params: Dict = None
+        params: Dict = None,
+        max_points: Optional[int] = None
     ) -> Dict:
         """
         Get specific indicator data
@@ -87,18 +187,28 @@ class ChartDataService:
             timeframe: Timeframe
             bars: Number of bars
             params: Indicator parameters
+            max_points: Thin the series to this many points (largest-triangle-three-buckets on close)
             
         Returns:
             Dictionary with indicator data
         """
+        params = params or {}
+        key = ('indicator', symbol, indicator.lower(), timeframe, bars,
+               tuple(sorted(params.items())), max_points)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         try:
-            df = self._fetch_historical_data(symbol, timeframe, bars)
+            df = self._get_historical_data(symbol, timeframe, bars)
             
             if df is None or len(df) == 0:
                 return {'error': 'No data available'}
             
             # Calculate specific indicator
-            df = self._calculate_single_indicator(df, indicator, params or {})
+            df = self._calculate_single_indicator(df.copy(), indicator, params)
+            if max_points:
+                df = df.iloc[lttb_indices(df['close'].to_numpy(), max_points)]
             
             result = {
                 'symbol': symbol,
@@ -112,12 +222,18 @@ class ChartDataService:
                 if col.lower().startswith(indicator.lower()) or col in ['close', 'time']:
                     result['data'][col] = df[col].fillna(0).tolist()
             
+            self._cache_put(key, timeframe, result)
             return result
             
         except Exception as e:
             logger.error(f"Error getting indicator data: {e}", exc_info=True)
             return {'error': str(e)}
     
+    def clear_cache(self):
+        """Drop every cached frame and payload"""
+        with self._cache_lock:
+            self.cache.clear()
+    
     def get_trade_markers(self, symbol: str, trades: List[Dict]) -> List[Dict]:
         """
         Get trade entry/exit markers for chart overlay
@@ -171,6 +287,51 @@ class ChartDataService:
     
     # Private methods
     
+    def _cache_expiry(self, timeframe: str, now: float) -> float:
+        """Time at which data fetched now goes stale: the bar close or the timeout"""
+        try:
+            minutes = self._timeframe_to_minutes(timeframe)
+            if minutes <= 0:
+                raise ValueError(f"Invalid timeframe: {timeframe}")
+            market_now = pd.Timestamp(now, unit='s', tz=MARKET_TIMEZONE).tz_localize(None)
+            bar_close = session_bar_close(market_now, minutes).tz_localize(MARKET_TIMEZONE).timestamp()
+        except ValueError:
+            return now + self.cache_timeout
+        return min(bar_close, now + self.cache_timeout)
+    
+    def _cache_get(self, key):
+        """Cached value for key, or None when missing or expired"""
+        now = time.time()
+        with self._cache_lock:
+            entry = self.cache.get(key)
+            if entry is not None and entry[0] > now:
+                self.cache_stats['hits'] += 1
+                return entry[1]
+            if entry is not None:
+                del self.cache[key]
+            self.cache_stats['misses'] += 1
+        return None
+    
+    def _cache_put(self, key, timeframe: str, value):
+        """Store value until the current bar of timeframe closes"""
+        now = time.time()
+        with self._cache_lock:
+            if len(self.cache) >= MAX_CACHE_ENTRIES:
+                expired = [k for k, (expires, _) in self.cache.items() if expires <= now]
+                for k in expired or [next(iter(self.cache))]:
+                    del self.cache[k]
+            self.cache[key] = (self._cache_expiry(timeframe, now), value)
+    
+    def _get_historical_data(self, symbol: str, timeframe: str, bars: int) -> Optional[pd.DataFrame]:
+        """Historical bars, fetched from the broker at most once per bar"""
+        key = ('bars', symbol, timeframe, bars)
+        df = self._cache_get(key)
+        if df is None:
+            df = self._fetch_historical_data(symbol, timeframe, bars)
+            if df is not None and len(df) > 0:
+                self._cache_put(key, timeframe, df)
+        return df
+    
     def _fetch_historical_data(self, symbol: str, timeframe: str, bars: int) -> Optional[pd.DataFrame]:
         """Fetch historical data from broker"""
         try:
@@ -258,26 +419,34 @@ class ChartDataService:
             logger.error(f"Error calculating indicator {indicator}: {e}", exc_info=True)
             return df
     
-    def _format_ohlcv(self, df: pd.DataFrame) -> List[Dict]:
-        """Format OHLCV data for frontend"""
+    def _format_ohlcv(self, df: pd.DataFrame, columnar: bool = False):
+        """
+        Format OHLCV data for frontend
+        
+        Returns one dict per bar, or with columnar=True a dict of parallel
+        arrays (time, open, high, low, close, volume).
+        """
         try:
-            data = []
+            times = df['time'] if 'time' in df.columns else df.index
+            columns = {
+                'time': [t.isoformat() if isinstance(t, datetime) else str(t) for t in times],
+                'open': df['open'].astype(float).tolist(),
+                'high': df['high'].astype(float).tolist(),
+                'low': df['low'].astype(float).tolist(),
+                'close': df['close'].astype(float).tolist(),
+                'volume': (df['volume'].astype(float).tolist() if 'volume' in df.columns
+                           else [0.0] * len(df)),
+            }
             
-            for idx, row in df.iterrows():
-                data.append({
-                    'time': idx.isoformat() if isinstance(idx, datetime) else str(idx),
-                    'open': float(row['open']),
-                    'high': float(row['high']),
-                    'low': float(row['low']),
-                    'close': float(row['close']),
-                    'volume': float(row.get('volume', 0))
-                })
+            if columnar:
+                return columns
             
-            return data
+            keys = list(columns)
+            return [dict(zip(keys, row)) for row in zip(*columns.values())]
             
         except Exception as e:
             logger.error(f"Error formatting OHLCV data: {e}", exc_info=True)
-            return []
+            return {} if columnar else []
     
     def _timeframe_to_minutes(self, timeframe: str) -> int:
         """Convert timeframe string to minutes"""
@@ -0,0 +1,220 @@
+"""
+Instrument Catalog
+Indexed, in-memory view of a cached instrument list
+"""
+
+import json
+import logging
+import os
+import threading
+from array import array
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Fields that can be used with InstrumentCatalog.query filters
+FILTER_FIELDS = ('exchange', 'instrument_type', 'segment')
+
+# Page size used when a query does not set its own limit
+DEFAULT_RESULT_LIMIT = 50
+
+
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class InstrumentCatalog:
+    """
+    Instruments with hash and search indexes
+
+    Lookups by token and by (exchange, symbol) are dictionary hits. Search
+    keeps the substring semantics of the list-based search: queries of
+    three or more characters are narrowed with a trigram index over symbol
+    and name; shorter ones scan the precomputed upper-case keys.
+    """
+
+    def __init__(self, instruments: List[Dict]):
+        self.instruments = instruments
+        self.by_token: Dict = {}
+        self.by_symbol: Dict[Tuple[str, str], int] = {}
+        self._first_by_symbol: Dict[str, int] = {}
+        self._by_field: Dict[str, Dict[str, List[int]]] = {field: {} for field in FILTER_FIELDS}
+        self._search_keys: List[str] = []
+        self._symbol_keys: List[str] = []
+        self._trigram_index: Dict[str, array] = {}
+        self._build()
+
+    def _build(self):
+        for idx, inst in enumerate(self.instruments):
+            token = inst.get('token')
+            symbol = str(inst.get('symbol') or '').upper()
+            name = str(inst.get('name') or '').upper()
+            exchange = str(inst.get('exchange') or '').upper()
+
+            self.by_token.setdefault(token, idx)
+            self.by_symbol.setdefault((exchange, symbol), idx)
+            self._first_by_symbol.setdefault(symbol, idx)
+            for field in FILTER_FIELDS:
+                value = str(inst.get(field) or '').upper()
+                self._by_field[field].setdefault(value, []).append(idx)
+
+            self._symbol_keys.append(symbol)
+            self._search_keys.append(f"{symbol}\n{name}")
+            for gram in _trigrams(symbol) | _trigrams(name):
+                posting = self._trigram_index.get(gram)
+                if posting is None:
+                    posting = self._trigram_index[gram] = array('I')
+                posting.append(idx)
+
+    def __len__(self) -> int:
+        return len(self.instruments)
+
+    def get_by_token(self, token) -> Optional[Dict]:
+        idx = self.by_token.get(token)
+        return self.instruments[idx] if idx is not None else None
+
+    def get_by_symbol(self, symbol: str, exchange: Optional[str] = None) -> Optional[Dict]:
+        symbol = symbol.upper()
+        if exchange is None:
+            idx = self._first_by_symbol.get(symbol)
+        else:
+            idx = self.by_symbol.get((exchange.upper(), symbol))
+        return self.instruments[idx] if idx is not None else None
+
+    def _search(self, query: str) -> List[int]:
+        """Indices matching query, best matches first"""
+        if len(query) >= 3:
+            postings = [self._trigram_index.get(gram, ()) for gram in _trigrams(query)]
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates.intersection_update(posting)
+                if not candidates:
+                    break
+            matches = [idx for idx in candidates if query in self._search_keys[idx]]
+        else:
+            matches = [idx for idx, key in enumerate(self._search_keys) if query in key]
+
+        # Exact symbol first, then symbol prefix, then everything else
+        def rank(idx):
+            symbol = self._symbol_keys[idx]
+            if symbol == query:
+                return (0, idx)
+            if symbol.startswith(query):
+                return (1, idx)
+            return (2, idx)
+
+        matches.sort(key=rank)
+        return matches
+
+    def _filter(self, filters: Dict[str, Iterable[str]]) -> Optional[set]:
+        """Indices passing every filter, or None when no filter is set"""
+        selected = None
+        for field in FILTER_FIELDS:
+            values = filters.get(field)
+            if not values:
+                continue
+            index = self._by_field[field]
+            matching = set()
+            for value in values:
+                matching.update(index.get(str(value).upper(), ()))
+            selected = matching if selected is None else selected & matching
+        return selected
+
+    def query(self, search: str = '', filters: Optional[Dict[str, Sequence[str]]] = None,
+              limit: Optional[int] = DEFAULT_RESULT_LIMIT, offset: int = 0) -> Tuple[List[Dict], int]:
+        """
+        Search and filter the catalog
+
+        Args:
+            search: Substring of symbol or name (case-insensitive)
+            filters: Allowed values per field in FILTER_FIELDS
+            limit: Page size (None returns every match)
+            offset: Matches to skip
+
+        Returns:
+            (page of instruments, total number of matches)
+        """
+        search = (search or '').strip().upper()
+        allowed = self._filter(filters or {})
+
+        if search:
+            indices = self._search(search)
+            if allowed is not None:
+                indices = [idx for idx in indices if idx in allowed]
+        elif allowed is not None:
+            indices = sorted(allowed)
+        else:
+            indices = range(len(self.instruments))
+
+        total = len(indices)
+        end = total if limit is None else offset + limit
+        return [self.instruments[idx] for idx in indices[offset:end]], total
+
+
+_catalogs: Dict[str, Tuple[object, InstrumentCatalog]] = {}
+_catalogs_lock = threading.Lock()
+
+
+def _file_version(path: Path) -> Tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def cached_catalog(key: str, version, load: Callable[[], List[Dict]]) -> InstrumentCatalog:
+    """
+    Catalog for a data source, shared across the process
+
+    load() is called, and the catalog rebuilt, only when version differs
+    from the one the cached catalog was built from.
+    """
+    with _catalogs_lock:
+        cached = _catalogs.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+    catalog = InstrumentCatalog(load())
+    logger.info(f"Indexed {len(catalog)} instruments from {key}")
+
+    with _catalogs_lock:
+        _catalogs[key] = (version, catalog)
+    return catalog
+
+
+def load_catalog(path: Path) -> Optional[InstrumentCatalog]:
+    """
+    Catalog for an instrument JSON file, shared across the process
+
+    The file is parsed once and parsed again only after its mtime or size
+    changes. Returns None if the file does not exist.
+    """
+    path = Path(path)
+    try:
+        version = _file_version(path)
+    except FileNotFoundError:
+        return None
+
+    def load():
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    return cached_catalog(str(path.resolve()), version, load)
+
+
+def store_catalog(path: Path, instruments: List[Dict]) -> InstrumentCatalog:
+    """
+    Write instruments to path and install their catalog without re-reading
+
+    The file is replaced atomically so readers never see a partial write.
+    """
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(instruments, f)
+    os.replace(tmp_path, path)
+
+    catalog = InstrumentCatalog(instruments)
+    with _catalogs_lock:
+        _catalogs[str(path.resolve())] = (_file_version(path), catalog)
+    return catalog
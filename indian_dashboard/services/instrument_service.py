@@ -3,17 +3,33 @@ Instrument Service
 Manages instrument data with caching
 """
 
-import json
 import logging
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.managers.instrument_store_manager import InstrumentStoreManager
+from services.instrument_catalog import InstrumentCatalog, cached_catalog, load_catalog, store_catalog
+
 logger = logging.getLogger(__name__)
 
 
 class InstrumentService:
-    """Manages instrument data with caching"""
+    """
+    Manages instrument data with caching
+
+    The cache file is parsed into a process-wide InstrumentCatalog that is
+    reused until the file changes; get_catalog gives indexed lookups,
+    search and pagination over it.
+
+    Adapters that keep a shared InstrumentStoreManager (KiteAdapter) are
+    read from that store instead, so the bot and the dashboard use one
+    daily download and no JSON copy is written.
+    """
     
     def __init__(self, cache_dir: Path, cache_ttl: int = 86400):
         """
@@ -28,6 +44,7 @@ class InstrumentService:
         self.cache_ttl = cache_ttl
         self.instruments_cache = {}
         self.cache_timestamp = None
+        self.instrument_stores: Dict[str, InstrumentStoreManager] = {}
     
     def get_cache_file(self, broker: str) -> Path:
         """Get cache file path for broker"""
@@ -43,6 +60,10 @@ class InstrumentService:
         Returns:
             True if cache is valid, False otherwise
         """
+        store = self.instrument_stores.get(broker)
+        if store is not None:
+            return store.is_fresh()
+        
         cache_file = self.get_cache_file(broker)
         
         if not cache_file.exists():
@@ -69,13 +90,8 @@ class InstrumentService:
                 logger.info(f"Cache invalid or expired for {broker}")
                 return None
             
-            cache_file = self.get_cache_file(broker)
-            
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
-            
-            logger.info(f"Loaded {len(data)} instruments from cache for {broker}")
-            return data
+            catalog = load_catalog(self.get_cache_file(broker))
+            return catalog.instruments if catalog is not None else None
             
         except Exception as e:
             logger.error(f"Error loading from cache: {e}", exc_info=True)
@@ -93,10 +109,7 @@ class InstrumentService:
             True if successful, False otherwise
         """
         try:
-            cache_file = self.get_cache_file(broker)
-            
-            with open(cache_file, 'w') as f:
-                json.dump(instruments, f, indent=2)
+            store_catalog(self.get_cache_file(broker), instruments)
             
             logger.info(f"Saved {len(instruments)} instruments to cache for {broker}")
             return True
@@ -118,6 +131,10 @@ class InstrumentService:
             List of instrument dictionaries
         """
         try:
+            store = self._get_instrument_store(broker_adapter, broker, force_refresh)
+            if store is not None:
+                return self._catalog_from_store(store).instruments
+            
             # Try cache first if not forcing refresh
             if not force_refresh:
                 cached = self.load_from_cache(broker)
@@ -133,20 +150,7 @@ class InstrumentService:
                 return []
             
             # Convert to standard format
-            formatted_instruments = []
-            for inst in instruments:
-                formatted_instruments.append({
-                    'token': inst.get('instrument_token') or inst.get('token'),
-                    'symbol': inst.get('tradingsymbol') or inst.get('symbol'),
-                    'name': inst.get('name', ''),
-                    'exchange': inst.get('exchange', ''),
-                    'instrument_type': inst.get('instrument_type', ''),
-                    'segment': inst.get('segment', ''),
-                    'expiry': inst.get('expiry', ''),
-                    'strike': inst.get('strike', 0),
-                    'lot_size': inst.get('lot_size', 1),
-                    'tick_size': inst.get('tick_size', 0.05),
-                })
+            formatted_instruments = self._format_instruments(instruments)
             
             # Save to cache
             self.save_to_cache(broker, formatted_instruments)
@@ -160,6 +164,62 @@ class InstrumentService:
             cached = self.load_from_cache(broker)
             return cached if cached else []
     
+    def _format_instruments(self, instruments: List[Dict]) -> List[Dict]:
+        """Convert broker instrument dicts to the dashboard format"""
+        return [{
+            'token': inst.get('instrument_token') or inst.get('token'),
+            'symbol': inst.get('tradingsymbol') or inst.get('symbol'),
+            'name': inst.get('name', ''),
+            'exchange': inst.get('exchange', ''),
+            'instrument_type': inst.get('instrument_type', ''),
+            'segment': inst.get('segment', ''),
+            'expiry': inst.get('expiry', ''),
+            'strike': inst.get('strike', 0),
+            'lot_size': inst.get('lot_size', 1),
+            'tick_size': inst.get('tick_size', 0.05),
+        } for inst in instruments]
+    
+    def _get_instrument_store(self, broker_adapter, broker: str,
+                              force_refresh: bool = False) -> Optional[InstrumentStoreManager]:
+        """The adapter's shared instrument store, if it keeps one"""
+        get_store = getattr(broker_adapter, 'get_instrument_store', None)
+        store = get_store(force_refresh=force_refresh) if callable(get_store) else None
+        if not isinstance(store, InstrumentStoreManager) or store.refreshed_at() is None:
+            return None
+        self.instrument_stores[broker] = store
+        return store
+    
+    def _catalog_from_store(self, store: InstrumentStoreManager) -> InstrumentCatalog:
+        """Catalog of a store, rebuilt only after the store is refreshed"""
+        return cached_catalog(
+            f"store:{Path(store.db_path).resolve()}",
+            store.refreshed_at(),
+            lambda: self._format_instruments(store.get_all())
+        )
+    
+    def get_catalog(self, broker_adapter, broker: str, force_refresh: bool = False) -> InstrumentCatalog:
+        """
+        Get the indexed instrument catalog, fetching from the broker if needed
+        
+        Args:
+            broker_adapter: Broker adapter instance
+            broker: Broker ID
+            force_refresh: Force refresh from broker
+            
+        Returns:
+            InstrumentCatalog (empty if no instruments are available)
+        """
+        instruments = self.get_instruments(broker_adapter, broker, force_refresh=force_refresh)
+        store = self.instrument_stores.get(broker)
+        if store is not None:
+            catalog = self._catalog_from_store(store)
+            if catalog.instruments is instruments:
+                return catalog
+        catalog = load_catalog(self.get_cache_file(broker))
+        if catalog is None or catalog.instruments is not instruments:
+            catalog = InstrumentCatalog(instruments)
+        return catalog
+    
     def refresh_instruments(self, broker_adapter, broker: str) -> List[Dict]:
         """
         Force refresh instruments from broker
@@ -280,6 +340,17 @@ class InstrumentService:
         Returns:
             Dictionary with cache info
         """
+        store = self.instrument_stores.get(broker)
+        if store is not None:
+            refreshed = store.refreshed_at()
+            return {
+                'exists': True,
+                'valid': store.is_fresh(),
+                'timestamp': refreshed.isoformat(),
+                'age_seconds': int((datetime.now() - refreshed).total_seconds()),
+                'count': store.count()
+            }
+        
         cache_file = self.get_cache_file(broker)
         
         if not cache_file.exists():
@@ -294,12 +365,11 @@ class InstrumentService:
         mtime = datetime.fromtimestamp(cache_file.stat().st_mtime)
         age = datetime.now() - mtime
         
-        # Count instruments
+        # Count instruments (parsed once per file version)
         try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
-                count = len(data)
-        except:
+            catalog = load_catalog(cache_file)
+            count = len(catalog) if catalog is not None else 0
+        except Exception:
             count = 0
         
         return {
@@ -0,0 +1,123 @@
+"""
+Live Updates
+Publish/subscribe hub that pushes bot state to dashboard streams
+"""
+
+import queue
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# Events a subscriber may hold before it is told to resync
+DEFAULT_QUEUE_SIZE = 256
+
+
+def _position_key(position: Dict) -> str:
+    return str(position.get('order_id') or position.get('position_id') or position.get('symbol'))
+
+
+class Subscription:
+    """One stream's queue of (event, data) pairs"""
+
+    def __init__(self, max_queue: int = DEFAULT_QUEUE_SIZE):
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.overflowed = False
+
+    def get(self, timeout: float) -> List[Tuple[str, Dict]]:
+        """
+        Wait up to timeout for an event, then drain whatever else is queued
+
+        Returns:
+            Events in publish order (empty on timeout)
+        """
+        try:
+            events = [self.queue.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        while True:
+            try:
+                events.append(self.queue.get_nowait())
+            except queue.Empty:
+                return events
+
+
+class LiveUpdateHub:
+    """
+    Fan-out of bot state changes to every open dashboard stream
+
+    Positions are published as deltas against the last published list and
+    account snapshots only when they change. A subscriber that falls
+    DEFAULT_QUEUE_SIZE events behind has its queue dropped and is flagged
+    to resync from a fresh snapshot.
+    """
+
+    def __init__(self, max_queue: int = DEFAULT_QUEUE_SIZE):
+        self.max_queue = max_queue
+        self._subscribers: List[Subscription] = []
+        self._positions: Optional[Dict[str, Dict]] = None
+        self._account: Optional[Dict] = None
+        self._lock = threading.Lock()
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(self.max_queue)
+        with self._lock:
+            self._subscribers.append(subscription)
+        # The new stream starts from its own snapshot; send full state next
+        self.reset()
+        return subscription
+
+    def reset(self):
+        """Forget published state so the next positions and account are sent in full"""
+        with self._lock:
+            self._positions = None
+            self._account = None
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    def has_subscribers(self) -> bool:
+        return bool(self._subscribers)
+
+    def publish(self, event: str, data: Dict):
+        """Queue an event for every subscriber"""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            try:
+                subscription.queue.put_nowait((event, data))
+            except queue.Full:
+                subscription.overflowed = True
+                with subscription.queue.mutex:
+                    subscription.queue.queue.clear()
+
+    def publish_positions(self, positions: List[Dict]):
+        """
+        Publish what changed since the last call
+
+        The first call after a subscribe sends the full list with
+        full=True; later calls send only upserted and removed positions.
+        """
+        current = {_position_key(p): p for p in positions or []}
+        with self._lock:
+            previous = self._positions
+            self._positions = current
+
+        if previous is None:
+            self.publish('positions', {'full': True, 'upserted': list(current.values()), 'removed': []})
+            return
+
+        upserted = [p for key, p in current.items() if previous.get(key) != p]
+        removed = [key for key in previous if key not in current]
+        if upserted or removed:
+            self.publish('positions', {'full': False, 'upserted': upserted, 'removed': removed})
+
+    def publish_account(self, account: Optional[Dict]):
+        """Publish the account snapshot if it differs from the last one"""
+        if not account:
+            return
+        with self._lock:
+            if account == self._account:
+                return
+            self._account = dict(account)
+        self.publish('account', account)
@@ -10,6 +10,11 @@ class ActivityLog {
         this.refreshInterval = null;
         this.isAutoScroll = true;
         this.filterType = null;
+        // Streamed activities, newest first, and the highest id seen
+        this.streamed = [];
+        this.lastId = 0;
+        this.maxActivities = 500;
+        this.displayLimit = 100;
     }
 
     /**
@@ -24,6 +29,59 @@ class ActivityLog {
 
         this.setupUI();
         this.startAutoRefresh();
+        this.setupLiveUpdates();
+    }
+
+    /**
+     * Receive activities from the live stream instead of polling while it is open
+     */
+    setupLiveUpdates() {
+        if (typeof LiveUpdates === 'undefined') {
+            return;
+        }
+
+        LiveUpdates.on('connection', (connected) => {
+            if (connected) {
+                this.stopAutoRefresh();
+            } else {
+                this.startAutoRefresh();
+            }
+        });
+
+        LiveUpdates.on('snapshot', (snapshot) => {
+            if (!snapshot.resumed) {
+                this.streamed = [];
+                this.lastId = 0;
+            }
+            this.mergeActivities(snapshot.activities || []);
+        });
+
+        LiveUpdates.on('activities', (data) => {
+            this.mergeActivities(data.activities || []);
+        });
+    }
+
+    /**
+     * Add streamed activities (oldest first) that have not been seen yet
+     */
+    mergeActivities(activities) {
+        const fresh = activities.filter(activity => activity.id > this.lastId);
+        if (fresh.length > 0) {
+            this.lastId = fresh[fresh.length - 1].id;
+            this.streamed = fresh.reverse().concat(this.streamed).slice(0, this.maxActivities);
+        }
+        this.applyFilter();
+    }
+
+    /**
+     * Show streamed activities matching the current filter
+     */
+    applyFilter() {
+        const matching = this.filterType
+            ? this.streamed.filter(activity => activity.type === this.filterType)
+            : this.streamed;
+        this.activities = matching.slice(0, this.displayLimit);
+        this.renderActivities();
     }
 
     /**
@@ -77,13 +135,21 @@ class ActivityLog {
         }
 
         // Refresh display
-        this.fetchActivities();
+        if (typeof LiveUpdates !== 'undefined' && LiveUpdates.isConnected()) {
+            this.applyFilter();
+        } else {
+            this.fetchActivities();
+        }
     }
 
     /**
      * Start auto-refresh
      */
     startAutoRefresh() {
+        if (this.refreshInterval) {
+            return; // Already running
+        }
+
         // Initial fetch
         this.fetchActivities();
 
@@ -231,6 +297,7 @@ class ActivityLog {
 
             if (data.success) {
                 this.activities = [];
+                this.streamed = [];
                 this.renderActivities();
                 showNotification('Activities cleared', 'success');
             } else {
@@ -143,15 +143,14 @@ class AnalyticsDashboard {
         this.showLoading();
         
         try {
-            // Load all analytics in parallel
-            await Promise.all([
-                this.loadPerformanceMetrics(),
-                this.loadProfitBySymbol(),
-                this.loadWinLossBySymbol(),
-                this.loadDailyProfit(),
-                this.loadHourlyPerformance(),
-                this.loadTradeDistribution()
-            ]);
+            // One request returns every panel
+            const response = await fetch(this.buildUrl('/api/analytics/summary'));
+            const data = await response.json();
+            
+            if (!data.success) {
+                throw new Error(data.error || 'Failed to load analytics');
+            }
+            this.renderSummary(data.data);
             
             this.hideLoading();
         } catch (error) {
@@ -163,6 +162,26 @@ class AnalyticsDashboard {
         }
     }
 
+    /**
+     * Render every panel from an /api/analytics/summary payload
+     */
+    renderSummary(summary) {
+        this.updatePerformanceMetrics(summary.performance);
+        
+        const charts = {
+            ProfitBySymbolChart: summary.profit_by_symbol,
+            WinLossChart: summary.win_loss_by_symbol,
+            DailyProfitChart: summary.daily_profit,
+            HourlyPerformanceChart: summary.hourly_performance,
+            TradeDistributionChart: summary.trade_distribution
+        };
+        Object.entries(charts).forEach(([name, data]) => {
+            if (window[name]) {
+                window[name].render(data);
+            }
+        });
+    }
+
     /**
      * Load performance metrics
      */
@@ -1066,9 +1066,10 @@ async function loadMonitorData() {
     await updatePositions();
 }
 
-async function updateBotStatus() {
+async function updateBotStatus(prefetched = null) {
     try {
-        const response = await api.getBotStatus();
+        // Live stream events pass the response in; polling fetches it
+        const response = prefetched || await api.getBotStatus();
         const statusBadge = document.getElementById('bot-status');
         const statusIndicator = document.getElementById('bot-status-indicator');
         const statusText = document.getElementById('bot-running-status');
@@ -1178,9 +1179,10 @@ async function updateBotStatus() {
     }
 }
 
-async function updateAccountInfo() {
+async function updateAccountInfo(prefetched = null) {
     try {
-        const response = await api.getAccountInfo();
+        // Live stream events pass the response in; polling fetches it
+        const response = prefetched || await api.getAccountInfo();
         const statusMessage = document.getElementById('account-status-message');
 
         if (response.success && response.account) {
@@ -1278,9 +1280,10 @@ function resetAccountInfo() {
     pnlTodayEl.classList.remove('positive', 'negative');
 }
 
-async function updatePositions() {
+async function updatePositions(prefetched = null) {
     try {
-        const response = await api.getPositions();
+        // Live stream events pass the response in; polling fetches it
+        const response = prefetched || await api.getPositions();
         const tbody = document.getElementById('positions-tbody');
 
         tbody.innerHTML = '';
@@ -1854,7 +1857,7 @@ const AutoRefresh = {
             const activeTab = document.querySelector('.tab-content.active');
 
             // Only refresh if monitor tab is active and not paused
-            if (activeTab && activeTab.id === 'monitor-tab' && !this.isPaused) {
+            if (activeTab && activeTab.id === 'monitor-tab' && !this.isPaused && !LiveMonitor.isLive()) {
                 // Check if tab is visible (not minimized or in background)
                 if (!document.hidden) {
                     this.refresh();
@@ -1939,6 +1942,66 @@ const AutoRefresh = {
     }
 };
 
+// Monitor tab fed by the live stream while it is connected
+const LiveMonitor = {
+    positions: new Map(),
+
+    init() {
+        if (typeof LiveUpdates === 'undefined') {
+            return;
+        }
+
+        LiveUpdates.on('snapshot', (snapshot) => {
+            this.positions = new Map((snapshot.positions || []).map(pos => [this.key(pos), pos]));
+            this.render(() => {
+                updateBotStatus({ success: true, status: snapshot.status });
+                updateAccountInfo({ success: true, account: snapshot.account });
+                this.renderPositions();
+            });
+        });
+
+        LiveUpdates.on('positions', (delta) => {
+            if (delta.full) {
+                this.positions.clear();
+            }
+            (delta.removed || []).forEach(key => this.positions.delete(key));
+            (delta.upserted || []).forEach(pos => this.positions.set(this.key(pos), pos));
+            this.render(() => this.renderPositions());
+        });
+
+        LiveUpdates.on('account', (account) => {
+            this.render(() => updateAccountInfo({ success: true, account }));
+        });
+
+        LiveUpdates.on('status', (status) => {
+            this.render(() => updateBotStatus({ success: true, status }));
+        });
+    },
+
+    // Same key the server uses for position deltas
+    key(pos) {
+        return String(pos.order_id || pos.position_id || pos.symbol);
+    },
+
+    isLive() {
+        return typeof LiveUpdates !== 'undefined' && LiveUpdates.isConnected();
+    },
+
+    render(update) {
+        update();
+        AutoRefresh.lastUpdated = new Date();
+        AutoRefresh.updateLastUpdatedDisplay();
+    },
+
+    renderPositions() {
+        updatePositions({ success: true, positions: Array.from(this.positions.values()) });
+    }
+};
+
+document.addEventListener('DOMContentLoaded', () => {
+    LiveMonitor.init();
+});
+
 // Update last updated display every second
 setInterval(() => {
     if (AutoRefresh.lastUpdated) {
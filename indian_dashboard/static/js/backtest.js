@@ -17,6 +17,9 @@ const TimeMachine = (() => {
     let equityChart = null;
     let currentRunId = null;
 
+    const EQUITY_CHART_POINTS = 1500;      // server downsamples the curve to about this many points
+    const TRADE_PAGE_SIZE = 100;
+
     // ----------------------------------------------------------------
     // Initialisation (called once when tab first opens)
     // ----------------------------------------------------------------
@@ -243,7 +246,7 @@ const TimeMachine = (() => {
         panel.innerHTML = '<div class="text-center py-4"><div class="spinner-border text-primary"></div></div>';
 
         try {
-            const res = await fetch(`/api/backtest/results/${runId}`);
+            const res = await fetch(`/api/backtest/results/${runId}?points=${EQUITY_CHART_POINTS}&trades=${TRADE_PAGE_SIZE}`);
             const json = await res.json();
             if (!json.success) throw new Error(json.error || 'Load failed');
 
@@ -262,20 +265,9 @@ const TimeMachine = (() => {
         const capital = `₹${(r.initial_capital || 0).toLocaleString('en-IN')}`;
         const finalCap = `₹${(r.final_capital || 0).toLocaleString('en-IN')}`;
 
-        const tradesHTML = (r.trades || []).slice(0, 100).map(t => {
-            const pnlColor = t.pnl >= 0 ? 'text-success' : 'text-danger';
-            return `
-            <tr>
-                <td>${_esc(t.symbol)}</td>
-                <td><span class="badge ${t.direction === 'buy' ? 'bg-success' : 'bg-danger'}">${t.direction.toUpperCase()}</span></td>
-                <td><small>${(t.entry_time || '').slice(0, 16)}</small></td>
-                <td>₹${(t.entry_price || 0).toFixed(2)}</td>
-                <td><small>${(t.exit_time || '').slice(0, 16)}</small></td>
-                <td>₹${(t.exit_price || 0).toFixed(2)}</td>
-                <td class="${pnlColor} fw-bold">₹${(t.pnl || 0).toFixed(2)}</td>
-                <td><span class="badge bg-secondary">${t.exit_reason || ''}</span></td>
-            </tr>`;
-        }).join('') || '<tr><td colspan="8" class="text-muted text-center">No trades</td></tr>';
+        const trades = r.trades || [];
+        const tradesTotal = r.trades_total ?? trades.length;
+        const tradesHTML = trades.map(_tradeRowHTML).join('') || '<tr><td colspan="8" class="text-muted text-center">No trades</td></tr>';
 
         const metricsHTML = (r.symbol_metrics || []).map(m => `
             <tr>
@@ -336,19 +328,65 @@ const TimeMachine = (() => {
 
         <!-- Trades list -->
         <div class="tm-card">
-            <h6 class="mb-2">📋 Trade History ${(r.trades || []).length > 100 ? '(showing first 100)' : ''}</h6>
+            <h6 class="mb-2">📋 Trade History <small class="text-muted" id="tm-trades-count">${_tradesCountLabel(trades.length, tradesTotal)}</small></h6>
             <div class="table-responsive" style="max-height:350px;overflow-y:auto">
                 <table class="table table-sm table-hover mb-0">
                     <thead class="table-dark sticky-top"><tr>
                         <th>Symbol</th><th>Dir</th><th>Entry Time</th><th>Entry ₹</th>
                         <th>Exit Time</th><th>Exit ₹</th><th>P&L</th><th>Reason</th>
                     </tr></thead>
-                    <tbody>${tradesHTML}</tbody>
+                    <tbody id="tm-trades-body" data-loaded="${trades.length}" data-total="${tradesTotal}">${tradesHTML}</tbody>
                 </table>
             </div>
+            <button class="btn btn-sm btn-outline-secondary mt-2" id="tm-trades-more"
+                    style="${trades.length < tradesTotal ? '' : 'display:none'}"
+                    onclick="TimeMachine.loadMoreTrades('${r.id}')">Load more trades</button>
         </div>`;
     }
 
+    function _tradeRowHTML(t) {
+        const pnlColor = t.pnl >= 0 ? 'text-success' : 'text-danger';
+        return `
+            <tr>
+                <td>${_esc(t.symbol)}</td>
+                <td><span class="badge ${t.direction === 'buy' ? 'bg-success' : 'bg-danger'}">${t.direction.toUpperCase()}</span></td>
+                <td><small>${(t.entry_time || '').slice(0, 16)}</small></td>
+                <td>₹${(t.entry_price || 0).toFixed(2)}</td>
+                <td><small>${(t.exit_time || '').slice(0, 16)}</small></td>
+                <td>₹${(t.exit_price || 0).toFixed(2)}</td>
+                <td class="${pnlColor} fw-bold">₹${(t.pnl || 0).toFixed(2)}</td>
+                <td><span class="badge bg-secondary">${t.exit_reason || ''}</span></td>
+            </tr>`;
+    }
+
+    function _tradesCountLabel(loaded, total) {
+        return loaded < total ? `(showing ${loaded} of ${total})` : '';
+    }
+
+    async function loadMoreTrades(runId) {
+        const tbody = document.getElementById('tm-trades-body');
+        const moreBtn = document.getElementById('tm-trades-more');
+        if (!tbody) return;
+        const offset = parseInt(tbody.dataset.loaded, 10) || 0;
+        moreBtn.disabled = true;
+
+        try {
+            const res = await fetch(`/api/backtest/results/${runId}/trades?limit=${TRADE_PAGE_SIZE}&offset=${offset}`);
+            const json = await res.json();
+            if (!json.success) throw new Error(json.error || 'Load failed');
+
+            tbody.insertAdjacentHTML('beforeend', json.trades.map(_tradeRowHTML).join(''));
+            const loaded = offset + json.trades.length;
+            tbody.dataset.loaded = loaded;
+            document.getElementById('tm-trades-count').textContent = _tradesCountLabel(loaded, json.total);
+            moreBtn.style.display = loaded < json.total && json.trades.length ? '' : 'none';
+        } catch (err) {
+            console.error('Error loading trades:', err);
+        } finally {
+            moreBtn.disabled = false;
+        }
+    }
+
     function _kpiCard(label, value, colorClass) {
         return `<div class="col-6 col-md-3 col-xl-auto flex-fill">
             <div class="tm-kpi-card">
@@ -468,5 +506,5 @@ const TimeMachine = (() => {
     // ----------------------------------------------------------------
     // Public API
     // ----------------------------------------------------------------
-    return { init, loadRunDetail, loadResultsList, exportRun, deleteRun };
+    return { init, loadRunDetail, loadResultsList, loadMoreTrades, exportRun, deleteRun };
 })();
@@ -0,0 +1,85 @@
+/**
+ * Live Updates
+ * Single EventSource on /api/bot/stream shared by the dashboard components.
+ * The server pushes a snapshot on connect, then position deltas, account
+ * snapshots, status changes and activity batches. EventSource reconnects
+ * on its own and resumes activities from the last event id.
+ */
+
+const LiveUpdates = {
+    source: null,
+    connected: false,
+    handlers: {},
+    events: ['snapshot', 'positions', 'account', 'status', 'activities'],
+
+    /**
+     * Open the stream (no-op when already open or unsupported)
+     */
+    connect() {
+        if (this.source || typeof EventSource === 'undefined') {
+            return;
+        }
+
+        this.source = new EventSource('/api/bot/stream');
+
+        this.source.onopen = () => {
+            this.connected = true;
+            this.emit('connection', true);
+        };
+
+        this.source.onerror = () => {
+            // EventSource retries by itself; callers fall back to polling meanwhile
+            if (this.connected) {
+                this.connected = false;
+                this.emit('connection', false);
+            }
+        };
+
+        this.events.forEach(event => {
+            this.source.addEventListener(event, (e) => {
+                try {
+                    this.emit(event, JSON.parse(e.data));
+                } catch (error) {
+                    console.error(`Error handling live ${event} event:`, error);
+                }
+            });
+        });
+    },
+
+    /**
+     * Close the stream
+     */
+    disconnect() {
+        if (this.source) {
+            this.source.close();
+            this.source = null;
+        }
+        if (this.connected) {
+            this.connected = false;
+            this.emit('connection', false);
+        }
+    },
+
+    /**
+     * Register a handler for an event ('connection' reports open/closed)
+     */
+    on(event, callback) {
+        (this.handlers[event] = this.handlers[event] || []).push(callback);
+    },
+
+    emit(event, data) {
+        (this.handlers[event] || []).forEach(callback => callback(data));
+    },
+
+    isConnected() {
+        return this.connected;
+    }
+};
+
+document.addEventListener('DOMContentLoaded', () => {
+    LiveUpdates.connect();
+});
+
+window.addEventListener('beforeunload', () => {
+    LiveUpdates.disconnect();
+});
@@ -6,6 +6,9 @@ class LogViewer {
     constructor() {
         this.currentPage = 1;
         this.limit = 100;
+        // before_id cursor for each page (page 1 has none)
+        this.pageCursors = [null];
+        this.hasNextPage = false;
         this.elements = {
             tab: document.getElementById('logs-tab'),
             tbody: document.getElementById('logs-tbody'),
@@ -38,7 +41,7 @@ class LogViewer {
         });
 
         this.elements.nextPage.addEventListener('click', () => {
-            this.loadLogs(this.currentPage + 1);
+            if (this.hasNextPage) this.loadLogs(this.currentPage + 1);
         });
 
         this.elements.applyGlobalBtn.addEventListener('click', () => this.setGlobalLogLevel());
@@ -47,22 +50,25 @@ class LogViewer {
     }
 
     async loadLogs(page = 1) {
+        if (page === 1) this.pageCursors = [null];
         this.currentPage = page;
-        const offset = (page - 1) * this.limit;
 
         const params = {
             limit: this.limit,
-            offset: offset,
             level: this.elements.levelFilter.value,
             search: this.elements.search.value
         };
+        const cursor = this.pageCursors[page - 1];
+        if (cursor) params.before_id = cursor;
 
         this.showLoading(true);
         try {
             const response = await api.getLogs(params);
             if (response.success) {
+                this.pageCursors[page] = response.next_before_id;
+                this.hasNextPage = response.next_before_id !== null;
                 this.renderLogs(response.logs);
-                this.updatePagination(response.total);
+                this.updatePagination(response.total, response.total_capped);
             }
         } catch (error) {
             console.error('Error loading logs:', error);
@@ -98,12 +104,13 @@ class LogViewer {
         });
     }
 
-    updatePagination(total) {
+    updatePagination(total, capped = false) {
         const totalPages = Math.ceil(total / this.limit) || 1;
-        this.elements.pageInfo.innerText = `Page ${this.currentPage} of ${totalPages} (${total} logs)`;
+        const suffix = capped ? '+' : '';
+        this.elements.pageInfo.innerText = `Page ${this.currentPage} of ${totalPages}${suffix} (${total}${suffix} logs)`;
 
         this.elements.prevPage.disabled = this.currentPage <= 1;
-        this.elements.nextPage.disabled = this.currentPage >= totalPages;
+        this.elements.nextPage.disabled = !this.hasNextPage;
     }
 
     async setGlobalLogLevel() {
@@ -3,6 +3,9 @@
  * TradingView Lightweight Charts for candlestick display
  */
 
+// Lower bound on requested candles when the container has no width yet
+const CHART_MIN_POINTS = 200;
+
 class PriceChart {
     constructor(containerId) {
         this.containerId = containerId;
@@ -92,7 +95,11 @@ class PriceChart {
 
             // Fetch price data
             const indicatorsParam = indicators.join(',');
-            const url = `/api/charts/price-data/${symbol}?timeframe=${timeframe}&bars=500&indicators=${indicatorsParam}`;
+            // One candle per pixel at most; the server merges the rest
+            const container = document.getElementById(this.containerId);
+            const points = Math.max(CHART_MIN_POINTS, container ? container.clientWidth : 0);
+            const url = `/api/charts/price-data/${symbol}?timeframe=${timeframe}&bars=500` +
+                `&indicators=${indicatorsParam}&points=${points}&format=columns`;
             
             const response = await fetch(url);
             const result = await response.json();
@@ -120,22 +127,26 @@ class PriceChart {
      * Update chart with data
      */
     updateChart(data) {
-        if (!data || !data.data) return;
+        if (!data || !data.data || !data.data.time) return;
+
+        // Columns arrive as parallel arrays: time, open, high, low, close, volume
+        const bars = data.data;
+        const times = bars.time.map(t => this.parseTime(t));
 
         // Prepare candlestick data
-        const candleData = data.data.map(d => ({
-            time: this.parseTime(d.time),
-            open: d.open,
-            high: d.high,
-            low: d.low,
-            close: d.close
+        const candleData = times.map((time, i) => ({
+            time: time,
+            open: bars.open[i],
+            high: bars.high[i],
+            low: bars.low[i],
+            close: bars.close[i]
         }));
 
         // Prepare volume data
-        const volumeData = data.data.map(d => ({
-            time: this.parseTime(d.time),
-            value: d.volume,
-            color: d.close >= d.open ? 'rgba(14, 203, 129, 0.5)' : 'rgba(246, 70, 93, 0.5)'
+        const volumeData = times.map((time, i) => ({
+            time: time,
+            value: bars.volume[i],
+            color: bars.close[i] >= bars.open[i] ? 'rgba(14, 203, 129, 0.5)' : 'rgba(246, 70, 93, 0.5)'
         }));
 
         // Update series
@@ -144,7 +155,7 @@ class PriceChart {
 
         // Update indicators
         if (data.indicators) {
-            this.updateIndicators(data.indicators, data.data);
+            this.updateIndicators(data.indicators, times);
         }
 
         // Fit content
@@ -154,7 +165,7 @@ class PriceChart {
     /**
      * Update indicators
      */
-    updateIndicators(indicators, priceData) {
+    updateIndicators(indicators, times) {
         // Clear existing indicators
         Object.values(this.indicators).forEach(series => {
             this.chart.removeSeries(series);
@@ -165,8 +176,8 @@ class PriceChart {
         Object.keys(indicators).forEach(key => {
             if (key.startsWith('ma_') || key.startsWith('ema_')) {
                 const values = indicators[key];
-                const lineData = priceData.map((d, i) => ({
-                    time: this.parseTime(d.time),
+                const lineData = times.map((time, i) => ({
+                    time: time,
                     value: values[i]
                 })).filter(d => d.value > 0);
 
@@ -183,8 +194,8 @@ class PriceChart {
             // Bollinger Bands
             if (key === 'bb_upper' || key === 'bb_middle' || key === 'bb_lower') {
                 const values = indicators[key];
-                const lineData = priceData.map((d, i) => ({
-                    time: this.parseTime(d.time),
+                const lineData = times.map((time, i) => ({
+                    time: time,
                     value: values[i]
                 })).filter(d => d.value > 0);
 
@@ -0,0 +1,137 @@
+"""
+Unit tests for AnalyticsService summaries and the trade ledger path
+"""
+
+import pytest
+from pathlib import Path
+import sys
+from unittest.mock import Mock
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from flask import Flask
+from services.analytics_service import AnalyticsService
+from api.analytics import init_analytics_api
+from src.managers.trade_ledger_manager import TradeLedgerManager
+
+
+def make_trades():
+    pnls = [120.0, -40.0, -60.0, 0.0, 80.0, 30.0, -200.0, 50.0]
+    return [{
+        'order_id': f'ORD{i}',
+        'symbol': 'RELIANCE' if i % 2 else 'TCS',
+        'status': 'COMPLETE',
+        'pnl': pnl,
+        'order_timestamp': f'2025-01-{6 + i // 3:02d} {9 + i:02d}:30:00',
+    } for i, pnl in enumerate(pnls)]
+
+
+@pytest.fixture
+def ledger_service(tmp_path):
+    return AnalyticsService(ledger=TradeLedgerManager(str(tmp_path / "ledger.db")))
+
+
+class TestSummary:
+    """Panels computed from trades"""
+
+    def test_performance_and_risk(self):
+        summary = AnalyticsService().get_summary(lambda f, t: make_trades())
+        performance = summary['performance']
+
+        assert performance['total_trades'] == 8
+        assert performance['winning_trades'] == 4
+        assert performance['losing_trades'] == 3
+        assert performance['total_pnl'] == -20.0
+        assert performance['avg_loss'] == -100.0
+        assert performance['largest_loss'] == -200.0
+        assert performance['profit_factor'] == 0.93
+
+        risk = summary['risk_metrics']
+        assert risk['max_consecutive_losses'] == 2
+        assert risk['max_consecutive_wins'] == 2
+        assert risk['std_deviation'] == 93.11
+
+    def test_drawdown(self):
+        drawdown = AnalyticsService().get_drawdown_data(make_trades())
+
+        assert drawdown['max_drawdown'] == 200.0
+        assert drawdown['current_drawdown'] == 150.0
+        assert drawdown['peak_equity'] == 130.0
+        assert drawdown['equity_curve'][0] == {'timestamp': '2025-01-06 09:30:00', 'equity': 120.0,
+                                               'drawdown': 0.0}
+
+    def test_groupings(self):
+        summary = AnalyticsService().get_summary(lambda f, t: make_trades(), '2025-01-07', '2025-01-08')
+
+        assert [d['date'] for d in summary['daily_profit']] == ['2025-01-07', '2025-01-08']
+        assert summary['performance']['total_trades'] == 5
+        assert len(summary['hourly_performance']) == 24
+        assert sum(d['count'] for d in summary['trade_distribution']) == 5
+
+    def test_results_are_cached(self):
+        fetch = Mock(return_value=make_trades())
+        service = AnalyticsService()
+
+        service.get_summary(fetch)
+        service.get_summary(fetch)
+        assert fetch.call_count == 1
+
+
+class TestLedgerSummary:
+    """Summaries read from the ledger and the broker only feeds it"""
+
+    def test_matches_list_path(self, ledger_service):
+        expected = AnalyticsService().get_summary(lambda f, t: make_trades())
+
+        assert ledger_service.get_summary(lambda: make_trades()) == expected
+
+    def test_history_survives_the_order_book(self, ledger_service):
+        ledger_service.get_summary(lambda: make_trades())
+        ledger_service.cache_timeout = 0
+
+        summary = ledger_service.get_summary(lambda: [])
+        assert summary['performance']['total_trades'] == 8
+
+    def test_only_fills_are_recorded(self, ledger_service):
+        trades = make_trades() + [{'order_id': 'REJ1', 'symbol': 'TCS', 'status': 'REJECTED',
+                                   'order_timestamp': '2025-01-06 10:00:00'}]
+
+        assert ledger_service.sync_ledger(trades) == 8
+        assert ledger_service.sync_ledger(trades) == 0
+
+    def test_summaries_are_per_source(self, ledger_service):
+        ledger_service.get_summary(lambda: make_trades(), source='paper')
+        live = ledger_service.get_summary(lambda: make_trades()[:2], source='kite')
+
+        assert live['performance']['total_trades'] == 2
+        assert ledger_service.get_summary(lambda: [], source='paper')['performance']['total_trades'] == 8
+
+    def test_new_fill_clears_cache(self, ledger_service):
+        ledger_service.get_summary(lambda: make_trades())
+        ledger_service.sync_ledger([{'order_id': 'NEW', 'symbol': 'TCS', 'status': 'COMPLETE',
+                                     'pnl': 10, 'order_timestamp': '2025-01-09 10:00:00'}])
+
+        assert ledger_service.get_summary(lambda: [])['performance']['total_trades'] == 9
+
+
+class TestAnalyticsAPI:
+    """Every endpoint is served from one fetch"""
+
+    def test_panels_share_one_fetch(self, ledger_service):
+        bot_controller = Mock()
+        bot_controller.get_trades.return_value = make_trades()
+        app = Flask(__name__)
+        app.config['TESTING'] = True
+        app.register_blueprint(init_analytics_api(bot_controller, ledger_service))
+        client = app.test_client()
+
+        summary = client.get('/api/analytics/summary').get_json()['data']
+        for path in ('performance', 'profit-by-symbol', 'win-loss-by-symbol', 'daily-profit',
+                     'hourly-performance', 'trade-distribution', 'drawdown', 'risk-metrics'):
+            assert client.get(f'/api/analytics/{path}').status_code == 200
+
+        assert client.get('/api/analytics/performance').get_json()['metrics'] == summary['performance']
+        assert bot_controller.get_trades.call_count == 1
+        assert client.get('/api/analytics/summary?from_date=bad').status_code == 400
@@ -0,0 +1,165 @@
+"""
+Unit tests for ChartDataService caching and downsampling
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from pathlib import Path
+import sys
+from unittest.mock import Mock, patch
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from flask import Flask
+from services.chart_data_service import ChartDataService, downsample_ohlcv, lttb_indices
+from api.charts import init_charts_api
+
+
+def make_bars(count):
+    rng = np.random.default_rng(7)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, count))
+    return pd.DataFrame({
+        'time': pd.date_range('2025-01-06 09:15', periods=count, freq='min'),
+        'open': close + rng.normal(0, 0.2, count),
+        'high': close + np.abs(rng.normal(0, 0.5, count)) + 0.3,
+        'low': close - np.abs(rng.normal(0, 0.5, count)) - 0.3,
+        'close': close,
+        'volume': rng.integers(1000, 10000, count),
+    })
+
+
+@pytest.fixture
+def adapter():
+    adapter = Mock()
+    adapter.get_historical_data.side_effect = lambda symbol, timeframe, bars: make_bars(bars)
+    return adapter
+
+
+@pytest.fixture
+def service(adapter):
+    broker_manager = Mock()
+    broker_manager.is_connected.return_value = True
+    broker_manager.get_adapter.return_value = adapter
+    return ChartDataService(broker_manager)
+
+
+class TestChartCache:
+    """Broker data is fetched once per bar"""
+
+    def test_repeated_requests_hit_cache(self, service, adapter):
+        first = service.get_price_data('INFY', '15min', 300, ['rsi'])
+        second = service.get_price_data('INFY', '15min', 300, ['rsi'])
+        service.get_price_data('INFY', '15min', 300, ['ma'])
+        service.get_indicator_data('INFY', 'macd', '15min', 300)
+
+        assert second is first
+        assert adapter.get_historical_data.call_count == 1
+        assert service.cache_stats['hits'] >= 3
+
+    def test_key_includes_symbol_and_bars(self, service, adapter):
+        service.get_price_data('INFY', '15min', 300)
+        service.get_price_data('TCS', '15min', 300)
+        service.get_price_data('INFY', '15min', 100)
+
+        assert adapter.get_historical_data.call_count == 3
+
+    def test_entries_expire_at_bar_close(self, service, adapter):
+        bar_start = 1736135100.0  # a 15 minute boundary
+        with patch('services.chart_data_service.time.time', return_value=bar_start + 700):
+            service.get_price_data('INFY', '15min', 300)
+        with patch('services.chart_data_service.time.time', return_value=bar_start + 899):
+            service.get_price_data('INFY', '15min', 300)
+        assert adapter.get_historical_data.call_count == 1
+
+        with patch('services.chart_data_service.time.time', return_value=bar_start + 900):
+            service.get_price_data('INFY', '15min', 300)
+        assert adapter.get_historical_data.call_count == 2
+
+    @pytest.mark.parametrize('timeframe, now, bar_close', [
+        ('1h', '2025-01-06 10:20', '2025-01-06 11:15'),
+        ('1d', '2025-01-06 10:20', '2025-01-06 15:30'),
+        ('15min', '2025-01-06 16:00', '2025-01-07 09:15'),
+    ])
+    def test_bar_close_follows_nse_session(self, timeframe, now, bar_close):
+        service = ChartDataService(cache_timeout=86400)
+        ist = lambda value: pd.Timestamp(value, tz='Asia/Kolkata').timestamp()
+
+        assert service._cache_expiry(timeframe, ist(now)) == ist(bar_close)
+
+    def test_timeout_caps_long_bars(self, service, adapter):
+        with patch('services.chart_data_service.time.time', return_value=1736135100.0):
+            service.get_price_data('INFY', '1d', 100)
+            expires = service.cache[('bars', 'INFY', '1d', 100)][0]
+
+        assert expires == 1736135100.0 + service.cache_timeout
+
+    def test_cached_bars_are_not_mutated(self, service):
+        service.get_price_data('INFY', '15min', 300, ['bollinger'])
+        df = service._get_historical_data('INFY', '15min', 300)
+
+        assert 'bb_upper' not in df.columns
+
+
+class TestDownsampling:
+    """Server-side reduction to the chart width"""
+
+    def test_ohlcv_keeps_extremes(self):
+        df = make_bars(1000)
+        merged = downsample_ohlcv(df, 100)
+
+        assert len(merged) == 100
+        assert merged['high'].max() == df['high'].max()
+        assert merged['low'].min() == df['low'].min()
+        assert merged['volume'].sum() == df['volume'].sum()
+        assert merged['open'].iloc[0] == df['open'].iloc[0]
+        assert merged['close'].iloc[-1] == df['close'].iloc[-1]
+        assert merged['time'].iloc[1] == df['time'].iloc[10]
+
+    def test_small_frames_untouched(self):
+        df = make_bars(50)
+        assert downsample_ohlcv(df, 100) is df
+
+    def test_lttb_keeps_endpoints_and_spikes(self):
+        values = np.zeros(1000)
+        values[500] = 50.0
+        indices = lttb_indices(values, 50)
+
+        assert len(indices) == 50
+        assert indices[0] == 0 and indices[-1] == 999
+        assert 500 in indices
+        assert np.all(np.diff(indices) > 0)
+
+    def test_price_data_points(self, service):
+        result = service.get_price_data('INFY', '15min', 1000, ['ema'], max_points=200)
+
+        assert len(result['data']) == 200
+        assert len(result['indicators']['ema_20']) == 200
+
+
+class TestPayload:
+    """Row and columnar formats carry the same values"""
+
+    def test_columnar_matches_rows(self, service):
+        rows = service.get_price_data('INFY', '15min', 50)['data']
+        columns = service.get_price_data('INFY', '15min', 50, columnar=True)['data']
+
+        assert set(columns) == {'time', 'open', 'high', 'low', 'close', 'volume'}
+        assert [row['close'] for row in rows] == columns['close']
+        assert rows[0]['time'] == columns['time'][0] == '2025-01-06T09:15:00'
+
+    def test_api_params(self, service):
+        app = Flask(__name__)
+        app.config['TESTING'] = True
+        app.register_blueprint(init_charts_api(Mock(), service))
+        client = app.test_client()
+
+        data = client.get('/api/charts/price-data/INFY?bars=500&points=100&format=columns').get_json()
+        assert data['success'] is True
+        assert len(data['data']['data']['close']) == 100
+
+        data = client.get('/api/charts/indicator-data/INFY/rsi?bars=500&points=100').get_json()
+        assert len(data['data']['data']['rsi']) == 100
+
+        assert client.get('/api/charts/price-data/INFY?format=xml').status_code == 400
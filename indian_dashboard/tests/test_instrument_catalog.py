@@ -0,0 +1,184 @@
+"""
+Unit tests for InstrumentCatalog
+"""
+
+import pytest
+import json
+import os
+import time
+from pathlib import Path
+import sys
+from unittest.mock import Mock, patch
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.instrument_catalog import InstrumentCatalog, load_catalog, store_catalog
+from services.instrument_service import InstrumentService
+
+
+def make_instruments():
+    instruments = [
+        {'token': 738561, 'symbol': 'RELIANCE', 'name': 'RELIANCE INDUSTRIES', 'exchange': 'NSE',
+         'instrument_type': 'EQ', 'segment': 'NSE'},
+        {'token': 128083204, 'symbol': 'RELIANCE', 'name': 'RELIANCE INDUSTRIES', 'exchange': 'BSE',
+         'instrument_type': 'EQ', 'segment': 'BSE'},
+        {'token': 2953217, 'symbol': 'TCS', 'name': 'TATA CONSULTANCY SERV LT', 'exchange': 'NSE',
+         'instrument_type': 'EQ', 'segment': 'NSE'},
+        {'token': 256265, 'symbol': 'NIFTY24JANFUT', 'name': 'NIFTY', 'exchange': 'NFO',
+         'instrument_type': 'FUT', 'segment': 'NFO-FUT'},
+    ]
+    for i in range(200):
+        instruments.append({'token': 1000 + i, 'symbol': f'NIFTY24JAN{20000 + i * 50}CE', 'name': 'NIFTY',
+                            'exchange': 'NFO', 'instrument_type': 'CE', 'segment': 'NFO-OPT'})
+    return instruments
+
+
+def linear_search(instruments, query, exchanges=None):
+    query = query.upper()
+    return [inst['token'] for inst in instruments
+            if (query in inst['symbol'].upper() or query in inst['name'].upper())
+            and (not exchanges or inst['exchange'] in exchanges)]
+
+
+class TestInstrumentCatalog:
+    """Indexed lookups and search"""
+
+    def setup_method(self):
+        self.instruments = make_instruments()
+        self.catalog = InstrumentCatalog(self.instruments)
+
+    def test_lookups(self):
+        assert self.catalog.get_by_token(2953217)['symbol'] == 'TCS'
+        assert self.catalog.get_by_token(1) is None
+        assert self.catalog.get_by_symbol('reliance', 'BSE')['token'] == 128083204
+        assert self.catalog.get_by_symbol('RELIANCE')['exchange'] == 'NSE'
+        assert self.catalog.get_by_symbol('RELIANCE', 'NFO') is None
+
+    @pytest.mark.parametrize("query", ["NIFTY", "jan2", "consult", "CE", "x", "24JAN2005"])
+    def test_search_matches_linear_scan(self, query):
+        instruments, total = self.catalog.query(query, limit=None)
+
+        assert sorted(inst['token'] for inst in instruments) == sorted(linear_search(self.instruments, query))
+        assert total == len(instruments)
+
+    def test_exact_and_prefix_matches_rank_first(self):
+        instruments, _ = self.catalog.query('NIFTY24JANFUT', limit=5)
+        assert instruments[0]['token'] == 256265
+
+        instruments, _ = self.catalog.query('TCS', limit=5)
+        assert instruments[0]['symbol'] == 'TCS'
+
+    def test_filters_and_pagination(self):
+        first, total = self.catalog.query('', {'instrument_type': ['ce']}, limit=50)
+        second, _ = self.catalog.query('', {'instrument_type': ['CE']}, limit=50, offset=50)
+
+        assert total == 200
+        assert len(first) == 50
+        assert first[-1]['token'] + 1 == second[0]['token']
+
+        instruments, total = self.catalog.query('RELIANCE', {'exchange': ['BSE']})
+        assert total == 1
+        assert instruments[0]['exchange'] == 'BSE'
+
+
+class TestCatalogFile:
+    """The catalog is loaded once per file version"""
+
+    def test_loaded_once_until_file_changes(self, tmp_path):
+        path = tmp_path / 'instruments_kite.json'
+        path.write_text(json.dumps(make_instruments()))
+
+        with patch('services.instrument_catalog.json.load', wraps=json.load) as load:
+            first = load_catalog(path)
+            assert load_catalog(path) is first
+            assert load.call_count == 1
+
+            path.write_text(json.dumps(make_instruments()[:3]))
+            os.utime(path, ns=(time.time_ns(), time.time_ns() + 10**9))
+            assert len(load_catalog(path)) == 3
+            assert load.call_count == 2
+
+    def test_store_installs_catalog(self, tmp_path):
+        path = tmp_path / 'instruments_kite.json'
+        with patch('services.instrument_catalog.json.load') as load:
+            stored = store_catalog(path, make_instruments())
+            assert load_catalog(path) is stored
+        load.assert_not_called()
+        assert len(json.loads(path.read_text())) == 204
+
+    def test_missing_file(self, tmp_path):
+        assert load_catalog(tmp_path / 'missing.json') is None
+
+
+class TestInstrumentServiceCatalog:
+    """InstrumentService serves requests from the shared catalog"""
+
+    def test_repeated_requests_do_not_reparse(self, tmp_path):
+        service = InstrumentService(tmp_path, cache_ttl=3600)
+        adapter = Mock()
+        adapter.get_instruments.return_value = [
+            {'instrument_token': inst['token'], 'tradingsymbol': inst['symbol'], 'name': inst['name'],
+             'exchange': inst['exchange'], 'instrument_type': inst['instrument_type'], 'segment': inst['segment']}
+            for inst in make_instruments()
+        ]
+        service.refresh_instruments(adapter, 'kite')
+
+        with patch('services.instrument_catalog.json.load') as load:
+            for _ in range(5):
+                catalog = service.get_catalog(adapter, 'kite')
+                service.get_cache_info('kite')
+        load.assert_not_called()
+        assert adapter.get_instruments.call_count == 1
+        assert catalog.get_by_token(2953217)['symbol'] == 'TCS'
+
+
+class TestInstrumentsAPIPagination:
+    """/api/instruments pages through the catalog"""
+
+    def test_search_page(self, tmp_path):
+        from flask import Flask
+        from api.instruments import init_instruments_api
+
+        service = InstrumentService(tmp_path, cache_ttl=3600)
+        service.save_to_cache('kite', make_instruments())
+        broker_manager = Mock()
+        broker_manager.is_connected.return_value = True
+        broker_manager.get_broker_type.return_value = 'kite'
+        app = Flask(__name__)
+        app.register_blueprint(init_instruments_api(broker_manager, service))
+        client = app.test_client()
+
+        data = client.get('/api/instruments?search=nifty&exchange=NFO&limit=20&offset=180').get_json()
+
+        assert data['total'] == 201
+        assert data['count'] == 20
+        assert data['has_more'] is True
+        assert len(client.get('/api/instruments').get_json()['instruments']) == 204
+        assert client.get('/api/instruments?limit=5000').status_code == 400
+
+
+class TestSharedInstrumentStore:
+    """Adapters with an instrument store are read without a JSON copy"""
+
+    def test_catalog_reads_adapter_store(self, tmp_path):
+        from src.managers.instrument_store_manager import InstrumentStoreManager
+
+        store = InstrumentStoreManager(str(tmp_path / 'instruments.db'))
+        store.replace_all([{'instrument_token': inst['token'], 'tradingsymbol': inst['symbol'], 'name': inst['name'],
+                            'exchange': inst['exchange'], 'instrument_type': inst['instrument_type'],
+                            'segment': inst['segment']} for inst in make_instruments()])
+        adapter = Mock()
+        adapter.get_instrument_store.return_value = store
+        service = InstrumentService(tmp_path / 'cache', cache_ttl=3600)
+
+        first = service.get_catalog(adapter, 'kite')
+        second = service.get_catalog(adapter, 'kite')
+
+        assert second is first
+        assert first.get_by_symbol('TCS', 'NSE')['token'] == 2953217
+        assert not service.get_cache_file('kite').exists()
+        adapter.get_instruments.assert_not_called()
+        info = service.get_cache_info('kite')
+        assert info['count'] == 204
+        assert info['valid'] is True
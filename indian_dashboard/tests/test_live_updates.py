@@ -0,0 +1,151 @@
+"""
+Unit tests for the live update hub, activity cursors and the bot event stream
+"""
+
+import json
+import pytest
+from pathlib import Path
+import sys
+from unittest.mock import Mock
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from flask import Flask
+from services.live_updates import LiveUpdateHub
+from services.activity_logger import ActivityLogger
+from services.bot_controller import BotController
+from api.bot import init_bot_api
+
+
+def parse_events(chunk):
+    """(event, id, data) for each server-sent event in a chunk"""
+    events = []
+    for block in chunk.decode().strip().split('\n\n'):
+        fields = dict(line.split(': ', 1) for line in block.split('\n'))
+        events.append((fields['event'], fields.get('id'), json.loads(fields['data'])))
+    return events
+
+
+@pytest.fixture
+def controller():
+    return BotController()
+
+
+@pytest.fixture
+def client(controller):
+    app = Flask(__name__)
+    app.config['TESTING'] = True
+    broker_manager = Mock()
+    broker_manager.is_connected.return_value = False
+    app.register_blueprint(init_bot_api(controller, broker_manager))
+    return app.test_client()
+
+
+class TestLiveUpdateHub:
+    """Only changes reach subscribers"""
+
+    def test_position_deltas(self):
+        hub = LiveUpdateHub()
+        sub = hub.subscribe()
+        a = {'order_id': 'A', 'symbol': 'TCS', 'pnl': 10}
+        b = {'order_id': 'B', 'symbol': 'INFY', 'pnl': 5}
+
+        hub.publish_positions([a, b])
+        hub.publish_positions([a, b])
+        hub.publish_positions([dict(a, pnl=12)])
+
+        events = sub.get(timeout=0)
+        assert len(events) == 2
+        assert events[0] == ('positions', {'full': True, 'upserted': [a, b], 'removed': []})
+        assert events[1] == ('positions', {'full': False, 'upserted': [dict(a, pnl=12)], 'removed': ['B']})
+
+    def test_account_only_on_change(self):
+        hub = LiveUpdateHub()
+        sub = hub.subscribe()
+
+        hub.publish_account({'balance': 100})
+        hub.publish_account({'balance': 100})
+        hub.publish_account(None)
+
+        assert sub.get(timeout=0) == [('account', {'balance': 100})]
+
+    def test_overflow_flags_resync(self):
+        hub = LiveUpdateHub(max_queue=3)
+        sub = hub.subscribe()
+        for i in range(4):
+            hub.publish('status', {'n': i})
+
+        assert sub.overflowed is True
+        assert sub.get(timeout=0) == []
+
+        hub.unsubscribe(sub)
+        assert hub.has_subscribers() is False
+
+
+class TestActivityCursor:
+    """Activities carry ids and can be read from a cursor"""
+
+    def test_ids_and_since(self):
+        logger = ActivityLogger(max_activities=5)
+        for i in range(8):
+            logger.log('analysis' if i % 2 else 'signal', f'message {i}')
+
+        assert logger.last_id == 8
+        assert [a['id'] for a in logger.get_since(5)] == [6, 7, 8]
+        assert [a['id'] for a in logger.get_since(0)] == [4, 5, 6, 7, 8]
+        assert [a['id'] for a in logger.get_recent(limit=2, activity_type='analysis')] == [8, 6]
+
+    def test_log_publishes(self):
+        hub = LiveUpdateHub()
+        sub = hub.subscribe()
+        ActivityLogger(live_updates=hub).log('order', 'filled', symbol='TCS')
+
+        [(event, activity)] = sub.get(timeout=0)
+        assert event == 'activity'
+        assert activity['id'] == 1 and activity['symbol'] == 'TCS'
+
+
+class TestBotStream:
+    """The stream opens with a snapshot and then pushes batches"""
+
+    def test_snapshot_then_activities(self, client, controller):
+        controller.activity_logger.log('analysis', 'before connect')
+        response = client.get('/api/bot/stream', buffered=False)
+        assert response.mimetype == 'text/event-stream'
+        chunks = iter(response.response)
+
+        [(event, event_id, snapshot)] = parse_events(next(chunks))
+        assert event == 'snapshot' and event_id == '1'
+        assert [a['message'] for a in snapshot['activities']] == ['before connect']
+        assert snapshot['positions'] == [] and snapshot['resumed'] is False
+
+        controller.activity_logger.log('signal', 'first')
+        controller.activity_logger.log('order', 'second')
+        [(event, event_id, data)] = parse_events(next(chunks))
+        assert event == 'activities' and event_id == '3'
+        assert [a['message'] for a in data['activities']] == ['first', 'second']
+
+        response.close()
+        assert controller.live_updates.has_subscribers() is False
+
+    def test_resume_from_last_event_id(self, client, controller):
+        for i in range(3):
+            controller.activity_logger.log('analysis', f'message {i}')
+
+        response = client.get('/api/bot/stream', headers={'Last-Event-ID': '2'}, buffered=False)
+        [(_, event_id, snapshot)] = parse_events(next(iter(response.response)))
+        response.close()
+
+        assert snapshot['resumed'] is True and event_id == '3'
+        assert [a['id'] for a in snapshot['activities']] == [3]
+
+    def test_activities_after_id(self, client, controller):
+        for i in range(4):
+            controller.activity_logger.log('analysis', f'message {i}')
+
+        data = client.get('/api/bot/activities?after_id=2').get_json()
+        assert [a['id'] for a in data['activities']] == [3, 4]
+        assert data['last_id'] == 4
+        assert client.get('/api/bot/activities?after_id=x').status_code == 400
@@ -0,0 +1,150 @@
+"""
+Integration tests for Logs API endpoints
+"""
+
+import pytest
+import csv
+import gzip
+import io
+import sys
+from pathlib import Path
+from flask import Flask
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.managers.database_manager import LogDatabaseManager
+from api.logs import init_logs_api
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Create a log database with 250 rows"""
+    manager = LogDatabaseManager(str(tmp_path / "logs.db"))
+    manager.insert_logs([{
+        'level': 'ERROR' if i % 10 == 0 else 'INFO',
+        'level_no': 40 if i % 10 == 0 else 20,
+        'logger_name': 'src.core.bot',
+        'message': f"Order placed for {'INFY' if i % 2 else 'TCS'} #{i}",
+        'symbol': 'INFY' if i % 2 else 'TCS',
+    } for i in range(250)])
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def client(db_manager):
+    """Create test client with the logs API"""
+    app = Flask(__name__)
+    app.config['TESTING'] = True
+    app.register_blueprint(init_logs_api(db_manager))
+    return app.test_client()
+
+
+class TestLogsAPI:
+    """Test the logs list endpoint"""
+
+    def test_cursor_pagination(self, client):
+        """Following next_before_id walks every row once"""
+        seen = []
+        before_id = None
+        while True:
+            query = '/api/logs?limit=100' + (f'&before_id={before_id}' if before_id else '')
+            data = client.get(query).get_json()
+            assert data['success'] is True
+            assert data['total'] == 250
+            seen.extend(log['id'] for log in data['logs'])
+            before_id = data['next_before_id']
+            if before_id is None:
+                break
+
+        assert seen == list(range(250, 0, -1))
+
+    def test_search_and_level(self, client):
+        """Search uses the full-text index together with other filters"""
+        data = client.get('/api/logs?search=INFY&level=ERROR').get_json()
+
+        assert data['total'] == 0
+        data = client.get('/api/logs?search=TCS&level=ERROR').get_json()
+        assert data['total'] == 25
+        assert all('TCS' in log['message'] for log in data['logs'])
+        assert data['total_capped'] is False
+
+    def test_offset_still_supported(self, client):
+        """Older clients paging by offset get the same rows"""
+        first = client.get('/api/logs?limit=10&offset=10').get_json()['logs']
+        second = client.get('/api/logs?limit=10&before_id=241').get_json()['logs']
+
+        assert first == second
+
+    def test_invalid_cursor(self, client):
+        """before_id must be a positive integer"""
+        response = client.get('/api/logs?before_id=abc')
+        assert response.status_code == 400
+
+
+class TestLogDownload:
+    """CSV export streams every matching row"""
+
+    def read_csv(self, body):
+        return list(csv.reader(io.StringIO(body.decode('utf-8'))))
+
+    def test_exports_all_rows_in_chunks(self, client, db_manager):
+        db_manager.insert_logs([{'level': 'INFO', 'level_no': 20, 'logger_name': 'bot',
+                                 'message': f'bulk, "quoted" {i}'} for i in range(5000)])
+
+        response = client.get('/api/logs/download')
+        chunks = list(response.response)
+        rows = self.read_csv(b''.join(chunks))
+
+        assert response.mimetype == 'text/csv'
+        assert rows[0] == ['id', 'timestamp', 'level', 'logger_name', 'message', 'symbol', 'level_no']
+        assert len(rows) == 5251
+        assert rows[1][4] == 'bulk, "quoted" 4999'
+        assert len(chunks) > 10
+
+    def test_filters_apply(self, client):
+        rows = self.read_csv(client.get('/api/logs/download?level=ERROR&symbol=TCS').data)
+
+        assert len(rows) == 26
+        assert {row[2] for row in rows[1:]} == {'ERROR'}
+
+    def test_gzip(self, client):
+        response = client.get('/api/logs/download?compress=gzip')
+
+        assert response.headers['Content-Disposition'].endswith('.csv.gz"')
+        assert len(self.read_csv(gzip.decompress(response.data))) == 251
+
+
+class TestLogArchivesAPI:
+    """Archived days are listed and queried through the same endpoint"""
+
+    @pytest.fixture
+    def archive_client(self, tmp_path):
+        manager = LogDatabaseManager(str(tmp_path / "logs.db"), archive_dir=str(tmp_path / "archive"))
+        manager.insert_logs([{
+            'timestamp': f'2025-01-06T09:15:{i:02d}',
+            'level': 'ERROR' if i % 10 == 0 else 'INFO',
+            'level_no': 40 if i % 10 == 0 else 20,
+            'logger_name': 'src.core.bot',
+            'message': f"Archived order #{i}",
+        } for i in range(50)])
+        manager.apply_retention(max_age_days=30)
+        app = Flask(__name__)
+        app.config['TESTING'] = True
+        app.register_blueprint(init_logs_api(manager))
+        yield app.test_client()
+        manager.close()
+
+    def test_list_and_query_archive(self, archive_client):
+        archives = archive_client.get('/api/logs/archives').get_json()['archives']
+        assert [a['date'] for a in archives] == ['2025-01-06']
+
+        data = archive_client.get('/api/logs?archive_date=2025-01-06&level=ERROR&limit=2').get_json()
+        assert data['total'] == 5
+        assert [log['message'] for log in data['logs']] == ['Archived order #40', 'Archived order #30']
+        assert archive_client.get('/api/logs').get_json()['total'] == 0
+
+    def test_invalid_archive_date(self, archive_client):
+        response = archive_client.get('/api/logs?archive_date=../logs')
+        assert response.status_code == 400
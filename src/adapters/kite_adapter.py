@@ -52,6 +52,14 @@ class KiteAdapter(BrokerAdapter):
                 - kite_api_key: API key from Kite Connect
                 - kite_token_file: Path to token file (default: 'kite_token.json')
                 - default_exchange: Default exchange (default: 'NSE')
+                - use_bar_cache: Keep fetched bars on disk and only request
+                  newer bars afterwards (default: True)
+                - bar_cache_path: SQLite file for the bar cache
+                  (default: 'data/cache/bars.db')
+                - use_instrument_store: Keep the daily instrument dump on disk
+                  and download it at most once a day (default: True)
+                - instrument_store_path: SQLite file for the instrument dump
+                  (default: 'data/cache/instruments.db')
         """
         self.config = config
         self.api_key = config.get('kite_api_key')
@@ -62,6 +70,16 @@ class KiteAdapter(BrokerAdapter):
         self.access_token = None
         self.instrument_cache = {}  # Cache for instrument tokens
         
+        # On-disk OHLCV cache for delta fetches (created lazily)
+        self.use_bar_cache = config.get('use_bar_cache', True)
+        self.bar_cache_path = config.get('bar_cache_path', 'data/cache/bars.db')
+        self._bar_store = None
+        
+        # Shared on-disk instrument dump (created lazily)
+        self.use_instrument_store = config.get('use_instrument_store', True)
+        self.instrument_store_path = config.get('instrument_store_path', 'data/cache/instruments.db')
+        self._instrument_store = None
+        
         self.logger = logging.getLogger(__name__)
         self.error_handler = ErrorHandler(self.logger)
     
@@ -156,9 +174,24 @@ class KiteAdapter(BrokerAdapter):
         
         Validates: Requirement 2.8
         
-        This method caches instrument tokens to avoid repeated API calls
-        for symbol-to-token conversion.
+        With the instrument store, the dump is downloaded only when today's
+        copy is not on disk yet and lookups read it on demand; instrument_cache
+        then just remembers symbols already looked up. Without the store the
+        whole dump is held in instrument_cache.
         """
+        store = self._get_instrument_store()
+        if store is not None:
+            try:
+                if store.ensure_fresh(self.kite.instruments):
+                    self.logger.info(f"Downloaded {store.count()} instruments into {self.instrument_store_path}")
+                else:
+                    self.logger.info(f"Using today's instrument dump from {self.instrument_store_path}")
+                return
+            except Exception as e:
+                self.logger.warning(f"Instrument store unavailable, keeping instruments in memory: {e}")
+                self._instrument_store = None
+                self.use_instrument_store = False
+        
         try:
             instruments = self.kite.instruments()
             for inst in instruments:
@@ -172,6 +205,67 @@ class KiteAdapter(BrokerAdapter):
         except Exception as e:
             self.logger.warning(f"Failed to load instrument cache: {e}")
     
+    def _get_instrument_store(self):
+        """Return the on-disk instrument dump, creating it on first use."""
+        if not self.use_instrument_store:
+            return None
+        if self._instrument_store is None:
+            try:
+                from src.managers.instrument_store_manager import InstrumentStoreManager
+                self._instrument_store = InstrumentStoreManager(self.instrument_store_path)
+            except Exception as e:
+                self.logger.warning(f"Instrument store unavailable: {e}")
+                self.use_instrument_store = False
+        return self._instrument_store
+    
+    def get_instrument_store(self, force_refresh: bool = False):
+        """
+        The shared instrument dump, refreshed if today's copy is missing.
+        
+        Args:
+            force_refresh (bool): Download the dump even if today's copy exists
+        
+        Returns:
+            InstrumentStoreManager, or None when the store is disabled
+        """
+        store = self._get_instrument_store()
+        if store is not None and self.kite is not None:
+            try:
+                store.ensure_fresh(self.kite.instruments, force=force_refresh)
+            except Exception as e:
+                self.logger.warning(f"Failed to refresh instrument dump: {e}")
+        return store
+    
+    def get_instruments(self) -> List[Dict]:
+        """
+        Get every tradable instrument in kite.instruments() form.
+        
+        Returns:
+            List[Dict]: Instruments from the daily dump
+        """
+        store = self.get_instrument_store()
+        if store is not None:
+            return store.get_all()
+        return self.kite.instruments() if self.kite else []
+    
+    def _lookup_instrument(self, symbol: str, exchange: str) -> Optional[Dict]:
+        """Token, lot size and tick size for a symbol, from memory or the store."""
+        key = f"{exchange}:{symbol}"
+        cached = self.instrument_cache.get(key)
+        if cached is None and self._instrument_store is not None:
+            try:
+                inst = self._instrument_store.get(exchange, symbol)
+            except Exception as e:
+                self.logger.warning(f"Instrument store lookup failed for {key}: {e}")
+                inst = None
+            if inst is not None:
+                cached = self.instrument_cache[key] = {
+                    'instrument_token': inst['instrument_token'],
+                    'lot_size': inst.get('lot_size', 1),
+                    'tick_size': inst.get('tick_size', 0.05)
+                }
+        return cached
+    
     def _get_instrument_token(self, symbol: str, exchange: str = None) -> Optional[int]:
         """
         Get instrument token for a symbol.
@@ -188,8 +282,7 @@ class KiteAdapter(BrokerAdapter):
         if exchange is None:
             exchange = self.default_exchange
         
-        key = f"{exchange}:{symbol}"
-        cached = self.instrument_cache.get(key)
+        cached = self._lookup_instrument(symbol, exchange)
         return cached['instrument_token'] if cached else None
     
     def _retry_with_backoff(self, func, max_retries=3):
@@ -252,18 +345,21 @@ class KiteAdapter(BrokerAdapter):
             
             # Calculate date range
             to_date = datetime.now()
-            
-            # Estimate days needed based on timeframe and bars
-            if "minute" in timeframe:
-                minutes = int(timeframe.replace("minute", ""))
-                days_needed = (bars * minutes) // (6 * 60) + 5  # 6 hours trading day
-            elif "hour" in timeframe:
-                hours = int(timeframe.replace("hour", ""))
-                days_needed = (bars * hours) // 6 + 5
-            else:  # day
-                days_needed = bars + 10
-            
-            from_date = to_date - timedelta(days=days_needed)
+            from_date = to_date - timedelta(days=self._days_needed(timeframe, bars))
+            
+            # Delta fetch: only request bars from the newest stored bar onwards
+            # (it is re-fetched because it may still have been forming)
+            store = self._get_bar_store()
+            if store is not None:
+                try:
+                    last_time = store.get_last_time(instrument_token, timeframe)
+                    if last_time is not None and store.count_bars(instrument_token, timeframe) >= bars:
+                        if last_time.tzinfo is not None:
+                            last_time = last_time.replace(tzinfo=None)
+                        from_date = max(from_date, last_time)
+                except Exception as e:
+                    self.logger.warning(f"Bar cache lookup failed for {symbol}: {e}")
+                    store = None
             
             # Fetch data with retry logic
             def fetch():
@@ -276,22 +372,26 @@ class KiteAdapter(BrokerAdapter):
             
             data = self._retry_with_backoff(fetch)
             
-            if not data:
+            df = self._to_ohlcv_frame(data) if data else None
+            
+            if store is not None:
+                try:
+                    if df is not None:
+                        store.save_bars(instrument_token, timeframe, df)
+                    result = store.get_bars(instrument_token, timeframe, bars)
+                    if not result.empty:
+                        self.logger.info(
+                            f"Fetched {len(df) if df is not None else 0} new bars for {symbol} "
+                            f"({timeframe}), serving {len(result)} from cache"
+                        )
+                        return result
+                except Exception as e:
+                    self.logger.warning(f"Bar cache update failed for {symbol}: {e}")
+            
+            if df is None:
                 self.logger.warning(f"No data returned for {symbol}")
                 return None
             
-            # Convert to DataFrame
-            df = pd.DataFrame(data)
-            df.rename(columns={'date': 'time'}, inplace=True)
-            
-            # Ensure correct data types
-            df['time'] = pd.to_datetime(df['time'])
-            df['open'] = df['open'].astype(float)
-            df['high'] = df['high'].astype(float)
-            df['low'] = df['low'].astype(float)
-            df['close'] = df['close'].astype(float)
-            df['volume'] = df['volume'].astype(int)
-            
             # Return last N bars
             result = df.tail(bars).reset_index(drop=True)
             
@@ -304,6 +404,46 @@ class KiteAdapter(BrokerAdapter):
             self.error_handler.handle_data_error(e, symbol, timeframe, "fetch_historical_data")
             return None
     
+    def _days_needed(self, timeframe: str, bars: int) -> int:
+        """Estimate calendar days covering ``bars`` bars of ``timeframe``."""
+        if "minute" in timeframe:
+            minutes = int(timeframe.replace("minute", "") or 1)
+            return (bars * minutes) // (6 * 60) + 5  # 6 hours trading day
+        elif "hour" in timeframe:
+            hours = int(timeframe.replace("hour", ""))
+            return (bars * hours) // 6 + 5
+        else:  # day
+            return bars + 10
+    
+    @staticmethod
+    def _to_ohlcv_frame(data: List[Dict]) -> pd.DataFrame:
+        """Convert a kite.historical_data payload to the standard OHLCV frame."""
+        df = pd.DataFrame(data)
+        df.rename(columns={'date': 'time'}, inplace=True)
+        
+        # Ensure correct data types
+        df['time'] = pd.to_datetime(df['time'])
+        df['open'] = df['open'].astype(float)
+        df['high'] = df['high'].astype(float)
+        df['low'] = df['low'].astype(float)
+        df['close'] = df['close'].astype(float)
+        df['volume'] = df['volume'].astype(int)
+        return df
+    
+    def _get_bar_store(self):
+        """Return the on-disk bar cache, creating it on first use."""
+        if not self.use_bar_cache:
+            return None
+        if self._bar_store is None:
+            try:
+                from src.managers.bar_store_manager import BarStoreManager
+                self._bar_store = BarStoreManager(self.bar_cache_path)
+            except Exception as e:
+                self.logger.warning(f"Bar cache unavailable, fetching full history: {e}")
+                self.use_bar_cache = False
+                return None
+        return self._bar_store
+    
     def place_order(
         self,
         symbol: str,
@@ -684,10 +824,9 @@ class KiteAdapter(BrokerAdapter):
         """
         try:
             exchange = self.default_exchange
-            key = f"{exchange}:{symbol}"
             
-            # Check cache first
-            cached = self.instrument_cache.get(key)
+            # Check cache / instrument store first
+            cached = self._lookup_instrument(symbol, exchange)
             if cached:
                 return {
                     'symbol': symbol,
@@ -696,6 +835,11 @@ class KiteAdapter(BrokerAdapter):
                     'instrument_token': str(cached['instrument_token'])
                 }
             
+            # The stored dump is complete; a miss there means no such instrument
+            if self._instrument_store is not None:
+                self.logger.warning(f"Instrument not found: {symbol}")
+                return None
+            
             # If not in cache, fetch from API
             instruments = self.kite.instruments(exchange)
             for inst in instruments:
@@ -5,6 +5,7 @@ Implements EMA calculation, crossover detection, and slope analysis for momentum
 
 import pandas as pd
 import numpy as np
+from collections import deque
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
@@ -12,6 +13,107 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+
+def rolling_slope(values, lookback: int) -> np.ndarray:
+    """
+    Least-squares slope of every ``lookback``-bar window, in O(n)
+    
+    Closed form of np.polyfit(range(lookback), window, 1)[0] built from
+    prefix sums of y and j*y. The series is shifted by its first value
+    first (slopes are shift-invariant) to keep the sums small.
+    
+    Args:
+        values: Series values
+        lookback: Window length
+        
+    Returns:
+        Array of slopes aligned to the window's last bar; NaN where the
+        window is incomplete or contains NaN
+    """
+    y = np.asarray(values, dtype=float)
+    n = len(y)
+    slopes = np.full(n, np.nan)
+    if lookback < 2 or n < lookback:
+        return slopes
+    
+    missing = np.isnan(y)
+    finite = y[~missing]
+    z = np.where(missing, 0.0, y - (finite[0] if len(finite) else 0.0))
+    j = np.arange(n, dtype=float)
+    
+    sum_y = np.concatenate(([0.0], np.cumsum(z)))
+    sum_jy = np.concatenate(([0.0], np.cumsum(j * z)))
+    nan_count = np.concatenate(([0], np.cumsum(missing)))
+    
+    end = np.arange(lookback, n + 1)           # window is [end - lookback, end)
+    window_y = sum_y[end] - sum_y[end - lookback]
+    window_jy = sum_jy[end] - sum_jy[end - lookback]
+    # Sum of x*y with x = 0..lookback-1 inside the window
+    window_xy = window_jy - (end - lookback) * window_y
+    
+    x_mean = (lookback - 1) / 2.0
+    sxx = lookback * (lookback * lookback - 1) / 12.0
+    window_slopes = (window_xy - x_mean * window_y) / sxx
+    window_slopes[(nan_count[end] - nan_count[end - lookback]) > 0] = np.nan
+    
+    slopes[lookback - 1:] = window_slopes
+    return slopes
+
+
+class RollingSlope:
+    """
+    Incremental least-squares slope over the last ``lookback`` values
+    
+    Each update adjusts the window sums in O(1); they are rebuilt from the
+    window periodically so rounding errors cannot accumulate.
+    """
+    
+    RESYNC_INTERVAL = 1000
+    
+    def __init__(self, lookback: int):
+        if lookback < 2:
+            raise ValueError("Slope lookback must be at least 2")
+        self.lookback = lookback
+        self._x_mean = (lookback - 1) / 2.0
+        self._sxx = lookback * (lookback * lookback - 1) / 12.0
+        self.reset()
+    
+    def reset(self):
+        self._window: deque = deque(maxlen=self.lookback)
+        self._sum_y = 0.0
+        self._sum_xy = 0.0
+        self._updates = 0
+    
+    def _resync(self):
+        self._sum_y = float(sum(self._window))
+        self._sum_xy = float(sum(i * v for i, v in enumerate(self._window)))
+    
+    def update(self, value: float) -> float:
+        """
+        Append a value and return the slope of the current window
+        
+        Returns:
+            Slope per bar, or NaN until ``lookback`` values have been seen
+        """
+        value = float(value)
+        if len(self._window) == self.lookback:
+            oldest = self._window[0]
+            # Every remaining value moves one step left on the x axis
+            self._sum_xy -= self._sum_y - oldest
+            self._sum_y -= oldest
+        self._window.append(value)
+        self._sum_y += value
+        self._sum_xy += (len(self._window) - 1) * value
+        
+        self._updates += 1
+        if self._updates % self.RESYNC_INTERVAL == 0:
+            self._resync()
+        
+        if len(self._window) < self.lookback:
+            return float('nan')
+        return (self._sum_xy - self._x_mean * self._sum_y) / self._sxx
+
+
 @dataclass
 class EMASignal:
     """Represents an EMA momentum signal"""
@@ -327,26 +429,38 @@ class EMAMomentumAnalyzer:
         Returns:
             Series with slope values
         """
-        slopes = []
-        
-        for i in range(len(series)):
-            if i < lookback:
-                slopes.append(np.nan)
-            else:
-                # Calculate slope using linear regression
-                y_values = series.iloc[i-lookback+1:i+1].values
-                x_values = np.arange(len(y_values))
-                
-                if len(y_values) > 1:
-                    slope = np.polyfit(x_values, y_values, 1)[0]
-                    # Normalize slope as percentage change per bar
-                    slope_pct = (slope / y_values[-1]) * 100 if y_values[-1] != 0 else 0
-                    slopes.append(slope_pct)
-                else:
-                    slopes.append(0.0)
+        values = series.to_numpy(dtype=float)
+        slopes = np.full(len(values), np.nan)
+        
+        if lookback <= 1:
+            # Single-point window has no slope
+            slopes[max(lookback, 0):] = 0.0
+        elif len(values) > lookback:
+            # Linear regression slope over each window (closed form)
+            raw = rolling_slope(values, lookback)[lookback:]
+            last = values[lookback:]
+            # Normalize slope as percentage change per bar
+            with np.errstate(divide='ignore', invalid='ignore'):
+                slopes[lookback:] = np.where(last != 0, raw / last * 100, 0.0)
         
         return pd.Series(slopes, index=series.index)
     
+    def _recent_slopes(self, df: pd.DataFrame, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fast and slow EMA slopes for the last ``count`` bars
+        
+        Uses the slope columns from calculate_emas() when present; otherwise
+        only the tail needed for those bars is regressed.
+        """
+        if 'ema_fast_slope' in df.columns and 'ema_slow_slope' in df.columns:
+            tail = df.tail(count)
+            return tail['ema_fast_slope'].to_numpy(dtype=float), tail['ema_slow_slope'].to_numpy(dtype=float)
+        
+        tail = df.tail(count + self.slope_lookback)
+        fast = self._calculate_slope(tail[f'ema_{self.fast_period}'], self.slope_lookback)
+        slow = self._calculate_slope(tail[f'ema_{self.slow_period}'], self.slope_lookback)
+        return fast.to_numpy()[-count:], slow.to_numpy()[-count:]
+    
     def identify_ema_support_resistance(self, df: pd.DataFrame) -> List[EMASupportResistance]:
         """
         Identify support and resistance levels using EMAs
@@ -474,9 +588,9 @@ class EMAMomentumAnalyzer:
         if len(df) < 3:
             return 0.5
         
-        current = df.iloc[-1]
-        slope_fast = current['ema_fast_slope']
-        slope_slow = current['ema_slow_slope']
+        fast_slopes, slow_slopes = self._recent_slopes(df, 2)
+        slope_fast = fast_slopes[-1]
+        slope_slow = slow_slopes[-1]
         
         # 1. Current slope magnitude
         avg_slope = (abs(slope_fast) + abs(slope_slow)) / 2
@@ -484,8 +598,8 @@ class EMAMomentumAnalyzer:
         
         # 2. Slope acceleration (is momentum increasing?)
         if len(df) >= 3:
-            prev_fast_slope = df.iloc[-2]['ema_fast_slope']
-            prev_slow_slope = df.iloc[-2]['ema_slow_slope']
+            prev_fast_slope = fast_slopes[-2]
+            prev_slow_slope = slow_slopes[-2]
             
             # Calculate acceleration (change in slope)
             fast_acceleration = slope_fast - prev_fast_slope
@@ -516,26 +630,16 @@ class EMAMomentumAnalyzer:
         
         # Analyze last 5-10 periods for consistency
         lookback = min(10, len(df))
-        recent_data = df.tail(lookback)
-        
-        fast_slopes = recent_data['ema_fast_slope'].values
-        slow_slopes = recent_data['ema_slow_slope'].values
+        fast_slopes, slow_slopes = self._recent_slopes(df, lookback)
         
         # 1. Direction consistency (how often slopes point in same direction)
-        direction_consistency = 0.0
-        same_direction_count = 0
-        
-        for i in range(len(fast_slopes)):
-            if not (pd.isna(fast_slopes[i]) or pd.isna(slow_slopes[i])):
-                if fast_slopes[i] * slow_slopes[i] > 0:  # Same sign
-                    same_direction_count += 1
-        
-        if len(fast_slopes) > 0:
-            direction_consistency = same_direction_count / len(fast_slopes)
+        # NaN products compare False, so incomplete windows never count
+        same_direction_count = int(np.count_nonzero(fast_slopes * slow_slopes > 0))
+        direction_consistency = same_direction_count / len(fast_slopes)
         
         # 2. Magnitude consistency (low standard deviation = more consistent)
-        fast_slope_std = np.std(fast_slopes[~pd.isna(fast_slopes)])
-        slow_slope_std = np.std(slow_slopes[~pd.isna(slow_slopes)])
+        fast_slope_std = np.std(fast_slopes[~np.isnan(fast_slopes)])
+        slow_slope_std = np.std(slow_slopes[~np.isnan(slow_slopes)])
         
         # Normalize standard deviation (lower std = higher consistency)
         fast_consistency = max(0.0, 1.0 - (fast_slope_std / 0.01))  # Normalize to 1% std
@@ -12,6 +12,7 @@ import logging
 
 # Import data models from trend detection engine
 from src.analyzers.trend_detection_engine import StructureBreakResult, BreakType
+from src.indicators.swing_points import find_swing_indices
 
 logger = logging.getLogger(__name__)
 
@@ -400,33 +401,17 @@ class MarketStructureAnalyzer:
         swing_points = []
         prices = df[price_type].values
         
-        for i in range(self.swing_strength, len(prices) - self.swing_strength):
-            is_swing = True
-            current_price = prices[i]
-            
-            # Check if current point is higher/lower than surrounding points
-            for j in range(i - self.swing_strength, i + self.swing_strength + 1):
-                if j == i:
-                    continue
-                
-                if price_type == 'high':
-                    if prices[j] >= current_price:
-                        is_swing = False
-                        break
-                else:  # low
-                    if prices[j] <= current_price:
-                        is_swing = False
-                        break
-            
-            if is_swing:
-                swing_points.append(SwingPoint(
-                    index=i,
-                    timestamp=df.iloc[i].name if hasattr(df.iloc[i].name, 'timestamp') else datetime.now(),
-                    price=current_price,
-                    swing_type=price_type,
-                    strength=self.swing_strength,
-                    volume=df.iloc[i]['volume'] if 'volume' in df.columns else 0
-                ))
+        # Points strictly higher/lower than the surrounding points
+        for i in find_swing_indices(prices, self.swing_strength, price_type):
+            i = int(i)
+            swing_points.append(SwingPoint(
+                index=i,
+                timestamp=df.iloc[i].name if hasattr(df.iloc[i].name, 'timestamp') else datetime.now(),
+                price=prices[i],
+                swing_type=price_type,
+                strength=self.swing_strength,
+                volume=df.iloc[i]['volume'] if 'volume' in df.columns else 0
+            ))
         
         return swing_points
     
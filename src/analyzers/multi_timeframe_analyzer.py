@@ -1,11 +1,14 @@
 """
 Multi-Timeframe Analyzer for GEM Trading Bot
 Implements multi-timeframe confirmation system for trend detection signals
+
+Higher-timeframe bars are built by resampling the primary-timeframe bars the
+bot already holds, aligned to the NSE session. Timeframes are in minutes.
 """
 
-import MetaTrader5 as mt5
 import pandas as pd
 import numpy as np
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
@@ -16,6 +19,150 @@ from src.analyzers.trend_detection_engine import TimeframeAlignment, TrendSignal
 
 logger = logging.getLogger(__name__)
 
+# Timeframe names for logging (minutes)
+TIMEFRAME_NAMES = {
+    1: "M1",
+    3: "M3",
+    5: "M5",
+    10: "M10",
+    15: "M15",
+    30: "M30",
+    60: "H1",
+    120: "H2",
+    240: "H4",
+    1440: "D1",
+}
+
+# Used when the config does not map the primary timeframe
+DEFAULT_PRIMARY_TO_HIGHER = {1: 5, 3: 15, 5: 15, 10: 30, 15: 60, 30: 60, 60: 1440}
+
+# NSE cash session; bins are anchored at the open and the last one ends at the close
+NSE_SESSION_START = '09:15'
+NSE_SESSION_END = '15:30'
+
+# _get_timeframe_signal needs this many higher-timeframe bars
+MIN_HIGHER_TF_BARS = 50
+
+OHLC_AGGREGATION = {
+    'open': 'first',
+    'high': 'max',
+    'low': 'min',
+    'close': 'last',
+    'volume': 'sum',
+    'tick_volume': 'sum',
+}
+
+
+def _parse_session_time(value: str) -> pd.Timedelta:
+    hours, minutes = value.split(':')
+    return pd.Timedelta(hours=int(hours), minutes=int(minutes))
+
+
+def _bar_times(df: pd.DataFrame) -> Optional[pd.DatetimeIndex]:
+    """Bar open times from a 'time' column or a DatetimeIndex"""
+    if 'time' in df.columns:
+        return pd.DatetimeIndex(pd.to_datetime(df['time']))
+    if isinstance(df.index, pd.DatetimeIndex):
+        return df.index
+    return None
+
+
+def _resample_with_bounds(df: pd.DataFrame, minutes: int, session_start: str,
+                          session_end: str) -> Tuple[pd.DataFrame, pd.Series]:
+    """
+    Aggregate bars into session-aligned bins
+
+    Returns the bars indexed by bin start and the end time of each bin. The
+    last bin of a day ends at the session close, so 15-minute bins on NSE run
+    09:15, 09:30, ... 15:15 and 60-minute bins end with a 15:15-15:30 bar.
+    """
+    times = _bar_times(df)
+    if times is None:
+        raise ValueError("Bars need a 'time' column or a DatetimeIndex")
+    
+    day = times.normalize()
+    session_open = day + _parse_session_time(session_start)
+    session_close = day + _parse_session_time(session_end)
+    in_session = np.asarray((times >= session_open) & (times < session_close))
+    
+    times, session_open, session_close = times[in_session], session_open[in_session], session_close[in_session]
+    session_minutes = (_parse_session_time(session_end) - _parse_session_time(session_start)) / pd.Timedelta(minutes=1)
+    
+    if minutes >= session_minutes:
+        starts, ends = session_open, session_close
+    else:
+        step = pd.Timedelta(minutes=minutes)
+        starts = session_open + ((times - session_open) // step) * step
+        ends = starts + step
+        ends = ends.where(ends < session_close, session_close)
+    
+    columns = [c for c in OHLC_AGGREGATION if c in df.columns]
+    frame = pd.DataFrame({c: df[c].to_numpy()[in_session] for c in columns})
+    frame['bin_end'] = ends
+    
+    aggregation = {c: OHLC_AGGREGATION[c] for c in columns}
+    aggregation['bin_end'] = 'first'
+    bars = frame.groupby(pd.DatetimeIndex(starts, name='time'), sort=True).agg(aggregation)
+    return bars.drop(columns='bin_end'), bars['bin_end']
+
+
+def resample_to_session_bars(df: pd.DataFrame, minutes: int,
+                             session_start: str = NSE_SESSION_START,
+                             session_end: str = NSE_SESSION_END) -> pd.DataFrame:
+    """
+    Resample OHLCV bars to a higher timeframe aligned to the trading session
+    
+    Args:
+        df: Bars with a 'time' column or a DatetimeIndex
+        minutes: Target timeframe in minutes (session length or more gives daily bars)
+        session_start: Session open as 'HH:MM'
+        session_end: Session close as 'HH:MM'
+        
+    Returns:
+        DataFrame indexed by bin start with open/high/low/close and summed volume
+    """
+    bars, _ = _resample_with_bounds(df, minutes, session_start, session_end)
+    return bars
+
+
+def session_bar_close(when: pd.Timestamp, minutes: int,
+                      session_start: str = NSE_SESSION_START,
+                      session_end: str = NSE_SESSION_END) -> pd.Timestamp:
+    """
+    End of the session-aligned bar forming at a given time
+    
+    Uses the grid of resample_to_session_bars. Outside the session no bar
+    is forming, so the next open (today's or the following day's) is
+    returned instead.
+    
+    Args:
+        when: Naive timestamp in exchange time
+        minutes: Bar length in minutes (session length or more gives daily bars)
+        session_start: Session open as 'HH:MM'
+        session_end: Session close as 'HH:MM'
+    """
+    day = when.normalize()
+    session_open = day + _parse_session_time(session_start)
+    session_close = day + _parse_session_time(session_end)
+    if when < session_open:
+        return session_open
+    if when >= session_close:
+        return session_open + pd.Timedelta(days=1)
+    
+    step = pd.Timedelta(minutes=minutes)
+    if step >= session_close - session_open:
+        return session_close
+    bar_start = session_open + ((when - session_open) // step) * step
+    return min(bar_start + step, session_close)
+
+
+@dataclass
+class ResampleState:
+    """Completed higher-timeframe bars for one symbol and timeframe"""
+    bars: pd.DataFrame
+    completed_through: pd.Timestamp  # End of the last completed bin
+
+
 @dataclass
 class TimeframeData:
     """Represents data from a specific timeframe"""
@@ -52,37 +199,66 @@ class MultiTimeframeAnalyzer:
         # Configuration parameters
         self.enable_mtf = config.get('enable_mtf_confirmation', True)
         self.mtf_weight = config.get('mtf_weight', 0.3)
-        self.primary_to_higher = config.get('mtf_primary_to_higher', {})
+        self.primary_to_higher = {
+            int(primary): int(higher)
+            for primary, higher in (config.get('mtf_primary_to_higher') or DEFAULT_PRIMARY_TO_HIGHER).items()
+        }
         self.confirmation_bars = config.get('mtf_confirmation_bars', 100)
         self.alignment_threshold = config.get('mtf_alignment_threshold', 0.6)
         self.contradiction_penalty = config.get('mtf_contradiction_penalty', 0.4)
+        self.session_start = config.get('mtf_session_start', NSE_SESSION_START)
+        self.session_end = config.get('mtf_session_end', NSE_SESSION_END)
+        self.min_higher_bars = config.get('mtf_min_higher_bars', MIN_HIGHER_TF_BARS)
         
         # Cache for higher timeframe data
         self.timeframe_cache = {}
         self.cache_expiry = {}
         
+        # Completed resampled bars per (symbol, higher timeframe)
+        self._resample_state: Dict[Tuple[str, int], ResampleState] = {}
+        self._resample_lock = threading.Lock()
+        self.resample_stats = {'local': 0, 'broker': 0, 'resets': 0}
+        
+        # Broker fallback when local history is too short
+        self.broker = None
+        self.broker_rate_limiter = None
+        self._broker_retry_after = {}
+        
         # Timeframe names for logging
-        self.timeframe_names = {
-            mt5.TIMEFRAME_M1: "M1",
-            mt5.TIMEFRAME_M5: "M5",
-            mt5.TIMEFRAME_M15: "M15",
-            mt5.TIMEFRAME_M30: "M30",
-            mt5.TIMEFRAME_H1: "H1",
-            mt5.TIMEFRAME_H4: "H4",
-            mt5.TIMEFRAME_D1: "D1",
-            mt5.TIMEFRAME_W1: "W1",
-            mt5.TIMEFRAME_MN1: "MN1"
-        }
+        self.timeframe_names = dict(TIMEFRAME_NAMES)
         
         self.logger.info(f"MultiTimeframeAnalyzer initialized with {len(self.primary_to_higher)} timeframe relationships")
+    
+    def set_broker_adapter(self, broker, rate_limiter=None):
+        """
+        Set the broker used when local history is too short
+        
+        Args:
+            broker: BrokerAdapter with get_historical_data/convert_timeframe
+            rate_limiter: Optional limiter whose acquire() is called before each fetch
+        """
+        self.broker = broker
+        self.broker_rate_limiter = rate_limiter
+    
+    def get_higher_timeframe(self, primary_tf: int) -> Optional[int]:
+        """Higher timeframe (minutes) mapped to the primary timeframe"""
+        return self.primary_to_higher.get(int(primary_tf))
         
-    def get_higher_timeframe_data(self, symbol: str, primary_tf: int) -> Optional[pd.DataFrame]:
+    def get_higher_timeframe_data(self, symbol: str, primary_tf: int,
+                                  primary_df: Optional[pd.DataFrame] = None) -> Optional[pd.DataFrame]:
         """
-        Retrieve higher timeframe data for the given primary timeframe
+        Build higher timeframe data for the given primary timeframe
+        
+        Bars are resampled from primary_df when it is given. Completed
+        higher-timeframe bars are kept between calls so only bars after the
+        last completed bin are aggregated again; the current bin is rebuilt
+        each call as a forming bar. The broker is asked for higher-timeframe
+        history only when the local bars are fewer than mtf_min_higher_bars.
         
         Args:
             symbol: Trading symbol
-            primary_tf: Primary timeframe (MT5 constant)
+            primary_tf: Primary timeframe in minutes
+            primary_df: Primary-timeframe bars the caller already holds
             
         Returns:
             DataFrame with higher timeframe data or None if not available
@@ -91,57 +267,159 @@ class MultiTimeframeAnalyzer:
             return None
             
         # Get the corresponding higher timeframe
-        higher_tf = self.primary_to_higher.get(primary_tf)
+        higher_tf = self.get_higher_timeframe(primary_tf)
         if higher_tf is None:
-            self.logger.debug(f"No higher timeframe mapping for {self.timeframe_names.get(primary_tf, primary_tf)}")
+            self.logger.debug(f"No higher timeframe mapping for {self.get_timeframe_name(primary_tf)}")
             return None
         
         cache_key = f"{symbol}_{higher_tf}"
         current_time = datetime.now()
         
-        # Check cache validity (5 minutes for higher timeframes)
-        if (cache_key in self.timeframe_cache and 
-            cache_key in self.cache_expiry and 
-            current_time < self.cache_expiry[cache_key]):
-            
-            self.logger.debug(f"Using cached data for {symbol} {self.timeframe_names.get(higher_tf, higher_tf)}")
-            return self.timeframe_cache[cache_key].data
-        
         try:
-            # Fetch higher timeframe data
-            self.logger.info(f"Fetching {self.timeframe_names.get(higher_tf, higher_tf)} data for {symbol}")
-            
-            rates = mt5.copy_rates_from_pos(symbol, higher_tf, 0, self.confirmation_bars)
-            
-            if rates is None or len(rates) == 0:
-                self.logger.warning(f"Failed to fetch {self.timeframe_names.get(higher_tf, higher_tf)} data for {symbol}")
+            bars = None
+            if primary_df is not None and len(primary_df) > 0 and higher_tf <= 1440:
+                bars = self._update_resampled_bars(symbol, int(primary_tf), higher_tf, primary_df)
+                if bars is not None:
+                    self.resample_stats['local'] += 1
+            elif (cache_key in self.timeframe_cache and 
+                  cache_key in self.cache_expiry and 
+                  current_time < self.cache_expiry[cache_key]):
+                self.logger.debug(f"Using cached data for {symbol} {self.get_timeframe_name(higher_tf)}")
+                return self.timeframe_cache[cache_key].data
+            
+            if ((bars is None or len(bars) < self.min_higher_bars) and self.broker is not None and
+                    current_time >= self._broker_retry_after.get(cache_key, current_time)):
+                fetched = self._fetch_broker_bars(symbol, int(primary_tf), higher_tf, primary_df)
+                if fetched is None:
+                    self._broker_retry_after[cache_key] = current_time + timedelta(minutes=5)
+                elif bars is None or len(fetched) > len(bars):
+                    bars = fetched
+            
+            if bars is None or len(bars) == 0:
+                self.logger.debug(f"No {self.get_timeframe_name(higher_tf)} data available for {symbol}")
                 return None
             
-            # Convert to DataFrame
-            df = pd.DataFrame(rates)
-            df['time'] = pd.to_datetime(df['time'], unit='s')
-            df.set_index('time', inplace=True)
-            
             # Calculate basic indicators for higher timeframe analysis
-            df = self._calculate_higher_tf_indicators(df)
+            df = self._calculate_higher_tf_indicators(bars.tail(self.confirmation_bars).copy())
             
-            # Cache the data
             self.timeframe_cache[cache_key] = TimeframeData(
                 timeframe=higher_tf,
-                timeframe_name=self.timeframe_names.get(higher_tf, str(higher_tf)),
+                timeframe_name=self.get_timeframe_name(higher_tf),
                 data=df,
                 last_update=current_time
             )
-            
-            # Set cache expiry (5 minutes for higher timeframes)
             self.cache_expiry[cache_key] = current_time + timedelta(minutes=5)
-            
-            self.logger.info(f"Successfully fetched {len(df)} bars of {self.timeframe_names.get(higher_tf, higher_tf)} data for {symbol}")
             return df
             
         except Exception as e:
-            self.logger.error(f"Error fetching higher timeframe data for {symbol}: {e}")
+            self.logger.error(f"Error building higher timeframe data for {symbol}: {e}")
+            return None
+    
+    def _update_resampled_bars(self, symbol: str, primary_tf: int, higher_tf: int,
+                               primary_df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Resample new primary bars and merge them with the completed bins
+        
+        Returns completed bars followed by the forming bin, or None when the
+        primary bars carry no timestamps.
+        """
+        times = _bar_times(primary_df)
+        if times is None:
+            return None
+        
+        key = (symbol, higher_tf)
+        primary_end = times[-1] + pd.Timedelta(minutes=primary_tf)
+        
+        with self._resample_lock:
+            state = self._resample_state.get(key)
+            if state is not None and (times[0] > state.completed_through or
+                                      primary_end < state.completed_through):
+                # History no longer reaches the stored bins, or moved backwards
+                self._resample_state.pop(key, None)
+                self.resample_stats['resets'] += 1
+                state = None
+            
+            if state is None:
+                rows = primary_df
+            else:
+                rows = primary_df[np.asarray(times >= state.completed_through)]
+            
+            if len(rows) == 0:
+                return state.bars
+            
+            new_bars, bin_ends = _resample_with_bounds(rows, higher_tf, self.session_start, self.session_end)
+            
+            # A leading bin is partial unless the stored state already covers its start
+            if state is None and len(new_bars) > 0 and times[0] > new_bars.index[0]:
+                new_bars, bin_ends = new_bars.iloc[1:], bin_ends.iloc[1:]
+            
+            complete = np.asarray(bin_ends <= primary_end, dtype=bool)
+            completed, forming = new_bars[complete], new_bars[~complete]
+            
+            if len(completed) > 0:
+                merged = completed if state is None else pd.concat([state.bars, completed])
+                state = ResampleState(bars=merged.tail(self.confirmation_bars),
+                                      completed_through=bin_ends[complete].iloc[-1])
+                self._resample_state[key] = state
+            
+            if state is None:
+                return forming if len(forming) > 0 else None
+            return pd.concat([state.bars, forming]) if len(forming) > 0 else state.bars
+    
+    def _fetch_broker_bars(self, symbol: str, primary_tf: int, higher_tf: int,
+                           primary_df: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+        """
+        Fetch higher timeframe history from the broker and seed the resample state
+        """
+        self.logger.info(f"Fetching {self.get_timeframe_name(higher_tf)} data for {symbol} from broker")
+        
+        if self.broker_rate_limiter is not None:
+            self.broker_rate_limiter.acquire()
+        fetched = self.broker.get_historical_data(symbol, self.broker.convert_timeframe(higher_tf),
+                                                  self.confirmation_bars)
+        self.resample_stats['broker'] += 1
+        
+        if fetched is None or len(fetched) == 0:
+            self.logger.warning(f"Failed to fetch {self.get_timeframe_name(higher_tf)} data for {symbol}")
+            return None
+        
+        # Broker bars already sit on bin starts; resampling normalises columns and index
+        bars, bin_ends = _resample_with_bounds(fetched, higher_tf, self.session_start, self.session_end)
+        if len(bars) == 0:
             return None
+        
+        primary_times = _bar_times(primary_df) if primary_df is not None and len(primary_df) > 0 else None
+        if primary_times is not None:
+            reference_end = primary_times[-1] + pd.Timedelta(minutes=primary_tf)
+            complete = np.asarray(bin_ends <= reference_end, dtype=bool)
+        else:
+            # Without primary bars the latest broker bar is treated as forming
+            complete = np.arange(len(bars)) < len(bars) - 1
+        
+        if complete.any():
+            with self._resample_lock:
+                self._resample_state[(symbol, higher_tf)] = ResampleState(
+                    bars=bars[complete].tail(self.confirmation_bars),
+                    completed_through=bin_ends[complete].iloc[-1]
+                )
+        
+        if primary_df is not None and primary_times is not None:
+            # Re-run the merge so the forming bin comes from the primary bars
+            local = self._update_resampled_bars(symbol, primary_tf, higher_tf, primary_df)
+            if local is not None:
+                return local
+        
+        self.logger.info(f"Fetched {len(bars)} bars of {self.get_timeframe_name(higher_tf)} data for {symbol}")
+        return bars
+    
+    def clear_resampled_bars(self, symbol: Optional[str] = None):
+        """Forget completed higher-timeframe bars for one symbol or all symbols"""
+        with self._resample_lock:
+            if symbol is None:
+                self._resample_state.clear()
+            else:
+                for key in [k for k in self._resample_state if k[0] == symbol]:
+                    del self._resample_state[key]
     
     def _calculate_higher_tf_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -553,10 +831,10 @@ class MultiTimeframeAnalyzer:
     
     def get_timeframe_name(self, timeframe: int) -> str:
         """
-        Get human-readable name for MT5 timeframe constant
+        Get human-readable name for a timeframe
         
         Args:
-            timeframe: MT5 timeframe constant
+            timeframe: Timeframe in minutes
             
         Returns:
             Human-readable timeframe name
@@ -19,7 +19,7 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import List, Dict, Tuple, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
 from enum import Enum
 import time
@@ -28,8 +28,13 @@ import weakref
 import traceback
 import sys
 import gc
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from contextlib import contextmanager
 
+from src.indicators.swing_points import find_swing_indices
+
 # Configure logging with enhanced detail levels
 logger = logging.getLogger(__name__)
 
@@ -68,7 +73,7 @@ class TrendDetectionLogger:
         self.log_signal_generation = self.logging_level in ['standard', 'detailed', 'debug']
         self.log_cache_operations = self.logging_level == 'debug'
         self.enable_data_validation_logging = self.logging_level == 'debug'
-        self.log_error_recovery = self.logging_level in ['detailed', 'debug']
+        self.log_recovery_actions = self.logging_level in ['detailed', 'debug']
     
     def set_logging_level(self, level: str):
         """Update logging level dynamically"""
@@ -131,7 +136,7 @@ class TrendDetectionLogger:
     
     def log_error_recovery(self, component: str, error_type: str, recovery_action: str):
         """Log error recovery actions"""
-        if self.log_error_recovery:
+        if self.log_recovery_actions:
             self.base_logger.warning(f"🔄 ERROR RECOVERY: {component} - {error_type} -> {recovery_action}")
     
     def log_component_failure(self, component: str, error: str, symbol: str = None):
@@ -156,7 +161,7 @@ class TrendDetectionLogger:
     
     def log_circuit_breaker_action(self, component: str, action: str, failure_count: int):
         """Log circuit breaker actions"""
-        if self.log_error_recovery:
+        if self.log_recovery_actions:
             self.base_logger.warning(f"⚡ CIRCUIT BREAKER: {component} - {action} "
                                    f"(failures: {failure_count})")
     
@@ -229,6 +234,14 @@ class ConfigurationValidator:
         else:
             config['use_trend_detection'] = True
         
+        # Validate use_trend_components
+        if 'use_trend_components' in config:
+            if not isinstance(config['use_trend_components'], bool):
+                self.validation_errors.append("use_trend_components must be a boolean")
+                config['use_trend_components'] = False
+        else:
+            config['use_trend_components'] = False
+        
         # Validate trend_detection_sensitivity (1-10)
         if 'trend_detection_sensitivity' in config:
             sensitivity = config['trend_detection_sensitivity']
@@ -302,6 +315,78 @@ class ConfigurationValidator:
         else:
             config['max_memory_mb'] = 500
         
+        # Validate memory_sample_interval_seconds (0.1-60s)
+        if 'memory_sample_interval_seconds' in config:
+            interval = config['memory_sample_interval_seconds']
+            if not isinstance(interval, (int, float)):
+                self.validation_errors.append("memory_sample_interval_seconds must be a number")
+                config['memory_sample_interval_seconds'] = 5.0
+            elif interval < 0.1 or interval > 60:
+                self.validation_errors.append("memory_sample_interval_seconds must be between 0.1 and 60")
+                config['memory_sample_interval_seconds'] = max(0.1, min(60, interval))
+        else:
+            config['memory_sample_interval_seconds'] = 5.0
+        
+        # Validate background_memory_sampler
+        if 'background_memory_sampler' in config:
+            if not isinstance(config['background_memory_sampler'], bool):
+                self.validation_errors.append("background_memory_sampler must be a boolean")
+                config['background_memory_sampler'] = True
+        else:
+            config['background_memory_sampler'] = True
+        
+        # Validate trend_cache_max_mb (1-2048MB)
+        if 'trend_cache_max_mb' in config:
+            cache_mb = config['trend_cache_max_mb']
+            if not isinstance(cache_mb, (int, float)):
+                self.validation_errors.append("trend_cache_max_mb must be a number")
+                config['trend_cache_max_mb'] = 64
+            elif cache_mb < 1 or cache_mb > 2048:
+                self.validation_errors.append("trend_cache_max_mb must be between 1 and 2048")
+                config['trend_cache_max_mb'] = max(1, min(2048, cache_mb))
+        else:
+            config['trend_cache_max_mb'] = 64
+        
+        # Validate trend_cache_ttl_seconds ({entry_type: seconds})
+        if 'trend_cache_ttl_seconds' in config:
+            ttls = config['trend_cache_ttl_seconds']
+            if not isinstance(ttls, dict) or not all(
+                    isinstance(v, (int, float)) and v > 0 for v in ttls.values()):
+                self.validation_errors.append("trend_cache_ttl_seconds must map entry types to positive numbers")
+                config['trend_cache_ttl_seconds'] = {}
+        else:
+            config['trend_cache_ttl_seconds'] = {}
+        
+        # Validate parallel component execution (opt-in)
+        if 'parallel_component_analysis' in config:
+            if not isinstance(config['parallel_component_analysis'], bool):
+                self.validation_errors.append("parallel_component_analysis must be a boolean")
+                config['parallel_component_analysis'] = False
+        else:
+            config['parallel_component_analysis'] = False
+        
+        # Validate component_workers (1-16)
+        if 'component_workers' in config:
+            workers = config['component_workers']
+            if not isinstance(workers, int):
+                self.validation_errors.append("component_workers must be an integer")
+                config['component_workers'] = 4
+            elif workers < 1 or workers > 16:
+                self.validation_errors.append("component_workers must be between 1 and 16")
+                config['component_workers'] = max(1, min(16, workers))
+        else:
+            config['component_workers'] = 4
+        
+        # Validate component_deadlines_ms ({step_name: ms})
+        if 'component_deadlines_ms' in config:
+            deadlines = config['component_deadlines_ms']
+            if not isinstance(deadlines, dict) or not all(
+                    isinstance(v, (int, float)) and v > 0 for v in deadlines.values()):
+                self.validation_errors.append("component_deadlines_ms must map step names to positive numbers")
+                config['component_deadlines_ms'] = {}
+        else:
+            config['component_deadlines_ms'] = {}
+        
         # Validate boolean performance settings
         bool_settings = [
             'enable_performance_monitoring',
@@ -661,22 +746,81 @@ class ErrorRecoveryManager:
             'error_types': list(self.error_counts.keys())
         }
 
+def _memory_sampler_loop(manager_ref, wake: threading.Event, interval: float):
+    """Background loop; holds only a weak reference so the manager can be collected"""
+    while True:
+        wake.wait(interval)
+        wake.clear()
+        manager = manager_ref()
+        if manager is None or manager._stopping:
+            return
+        try:
+            manager._sampler_tick()
+        except Exception as e:
+            manager.logger.debug(f"Memory sampler error: {e}")
+        interval = manager.sample_interval_seconds
+        del manager
+
+
 class MemoryManager:
-    """Manages memory usage and cleanup for trend detection"""
+    """
+    Manages memory usage and cleanup for trend detection
+    
+    RSS is read from a cached psutil.Process. With the background sampler
+    running, get_memory_usage_mb returns the latest sample and cleanups
+    requested from the analysis path run on the sampler thread.
+    """
     
-    def __init__(self, max_memory_mb: int = 500):
+    def __init__(self, max_memory_mb: int = 500, sample_interval_seconds: float = 5.0):
         self.max_memory_mb = max_memory_mb
+        self.sample_interval_seconds = sample_interval_seconds
         self.logger = logging.getLogger(__name__)
         
+        self._process = None
+        self._psutil_available = True
+        self._rss_mb = 0.0
+        self._sampled_at = None
+        self._lock = threading.Lock()
+        
+        self._wake = threading.Event()
+        self._cleanup_requested = False
+        self._stopping = False
+        self._sampler = None
+        
+        # Set when a cleanup left usage above the limit, cleared by the next sample under it
+        self.cleanup_ineffective = False
+        self.stats = {'samples': 0, 'cleanups': 0}
+        
+    def _read_rss_mb(self) -> float:
+        if self._process is None:
+            if not self._psutil_available:
+                return 0.0
+            try:
+                import psutil
+                self._process = psutil.Process()
+            except ImportError:
+                # Fallback if psutil not available
+                self._psutil_available = False
+                return 0.0
+        return self._process.memory_info().rss / 1024 / 1024
+    
+    def sample(self) -> float:
+        """Read RSS now and store it as the latest sample"""
+        rss_mb = self._read_rss_mb()
+        with self._lock:
+            self._rss_mb = rss_mb
+            self._sampled_at = time.monotonic()
+            self.stats['samples'] += 1
+            if rss_mb <= self.max_memory_mb:
+                self.cleanup_ineffective = False
+        return rss_mb
+        
     def get_memory_usage_mb(self) -> float:
-        """Get current memory usage in MB"""
-        try:
-            import psutil
-            process = psutil.Process()
-            return process.memory_info().rss / 1024 / 1024
-        except ImportError:
-            # Fallback if psutil not available
-            return 0.0
+        """Get current memory usage in MB (re-sampled only when the sample is older than the interval)"""
+        sampled_at = self._sampled_at
+        if sampled_at is not None and time.monotonic() - sampled_at < self.sample_interval_seconds:
+            return self._rss_mb
+        return self.sample()
             
     def check_memory_limit(self) -> bool:
         """Check if memory usage is within limits"""
@@ -689,7 +833,58 @@ class MemoryManager:
     def force_cleanup(self):
         """Force garbage collection and cleanup"""
         gc.collect()
+        self.stats['cleanups'] += 1
         self.logger.debug("Forced memory cleanup completed")
+    
+    def request_cleanup(self):
+        """
+        Ask for a cleanup without blocking the caller
+        
+        Runs on the sampler thread when it is active, otherwise inline.
+        """
+        if self.is_sampler_running():
+            self._cleanup_requested = True
+            self._wake.set()
+        else:
+            self._cleanup_and_resample()
+    
+    def _cleanup_and_resample(self):
+        self.force_cleanup()
+        rss_mb = self.sample()
+        self.cleanup_ineffective = rss_mb > self.max_memory_mb
+    
+    def _sampler_tick(self):
+        self.sample()
+        if self._cleanup_requested:
+            self._cleanup_requested = False
+            self._cleanup_and_resample()
+    
+    def start_sampler(self):
+        """Start refreshing the RSS sample on a daemon thread"""
+        if self.is_sampler_running():
+            return
+        self._stopping = False
+        self.sample()
+        self._sampler = threading.Thread(
+            target=_memory_sampler_loop,
+            args=(weakref.ref(self), self._wake, self.sample_interval_seconds),
+            name="trend-memory-sampler",
+            daemon=True
+        )
+        self._sampler.start()
+    
+    def stop_sampler(self, timeout: float = 1.0):
+        """Stop the sampler thread; later reads sample on demand"""
+        sampler = self._sampler
+        if sampler is None:
+            return
+        self._stopping = True
+        self._wake.set()
+        sampler.join(timeout)
+        self._sampler = None
+    
+    def is_sampler_running(self) -> bool:
+        return self._sampler is not None and self._sampler.is_alive()
         
     @contextmanager
     def memory_monitor(self, operation_name: str):
@@ -712,22 +907,40 @@ class CircuitBreaker:
         self.failure_count = 0
         self.last_failure_time = None
         self.state = 'closed'  # closed, open, half_open
+        self._lock = threading.Lock()
         
     def call(self, func, *args, **kwargs):
         """Execute function with circuit breaker protection"""
-        if self.state == 'open':
-            if self._should_attempt_reset():
-                self.state = 'half_open'
-            else:
-                raise TrendDetectionError("Circuit breaker is open")
+        if not self.allow_request():
+            raise TrendDetectionError("Circuit breaker is open")
                 
         try:
             result = func(*args, **kwargs)
-            self._on_success()
+            self.record_success()
             return result
         except Exception as e:
-            self._on_failure()
+            self.record_failure()
             raise
+    
+    def allow_request(self) -> bool:
+        """Check whether a call may go through (moves open -> half_open after the timeout)"""
+        with self._lock:
+            if self.state == 'open':
+                if self._should_attempt_reset():
+                    self.state = 'half_open'
+                else:
+                    return False
+            return True
+    
+    def record_success(self):
+        """Record a successful call made outside call()"""
+        with self._lock:
+            self._on_success()
+    
+    def record_failure(self):
+        """Record a failed (or late) call made outside call()"""
+        with self._lock:
+            self._on_failure()
             
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt reset"""
@@ -768,48 +981,94 @@ class PerformanceTimer:
             self.logger.debug(f"⏱️ Performance: {self.operation_name} took {elapsed:.1f}ms")
 
 class DataCache:
-    """Efficient caching system for analysis data with error handling"""
-    def __init__(self, max_size: int = 1000):
+    """
+    LRU cache for analysis data with per-type TTL and a memory budget
+    
+    Entries live in an OrderedDict in recency order, so lookups, inserts and
+    evictions are O(1). Each entry carries a wall-clock expiry chosen by its
+    type (analysis results, trendlines, MTF frames) and an approximate size;
+    least recently used entries are evicted when either the entry count or
+    the byte budget is exceeded.
+    """
+    DEFAULT_TTL_SECONDS = {
+        'analysis': 600,     # keyed by frame content, TTL only bounds memory
+        'trendlines': 60,    # keyed by frame length, so must not outlive a bar
+        'mtf': 300,          # higher timeframe frames change slowly
+        'default': 3600,
+    }
+    
+    def __init__(self, max_size: int = 1000, max_bytes: int = 64 * 1024 * 1024,
+                 ttl_seconds: Optional[Dict[str, float]] = None):
         self.max_size = max_size
-        self._cache = {}
-        self._access_times = {}
-        self._current_time = 0
+        self.max_bytes = max_bytes
+        self.ttl_seconds = {**self.DEFAULT_TTL_SECONDS, **(ttl_seconds or {})}
+        self._cache = OrderedDict()  # key -> (value, expires_at, stored_at, nbytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0}
         self.logger = logging.getLogger(__name__)
         
     def get(self, key: str) -> Optional[Any]:
         """Get cached data with error handling"""
         try:
-            if key in self._cache:
-                self._access_times[key] = self._current_time
-                self._current_time += 1
-                return self._cache[key]
+            with self._lock:
+                entry = self._cache.get(key)
+                if entry is None:
+                    self._stats['misses'] += 1
+                    return None
+                if time.monotonic() >= entry[1]:
+                    self._remove(key)
+                    self._stats['expirations'] += 1
+                    self._stats['misses'] += 1
+                    return None
+                self._cache.move_to_end(key)
+                self._stats['hits'] += 1
+                return entry[0]
         except Exception as e:
             self.logger.error(f"Error accessing cache key {key}: {e}")
         return None
         
-    def set(self, key: str, value: Any) -> None:
-        """Set cached data with LRU eviction and error handling"""
+    def set(self, key: str, value: Any, entry_type: str = 'default') -> None:
+        """
+        Set cached data with LRU eviction and error handling
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            entry_type: TTL class ('analysis', 'trendlines', 'mtf' or 'default')
+        """
         try:
-            # Clean up if at capacity
-            if len(self._cache) >= self.max_size and key not in self._cache:
-                # Find least recently used item
-                if self._access_times:
-                    lru_key = min(self._access_times.keys(), key=lambda k: self._access_times[k])
-                    del self._cache[lru_key]
-                    del self._access_times[lru_key]
+            nbytes = _estimate_bytes(value)
+            if nbytes > self.max_bytes:
+                self.logger.debug(f"Not caching {key}: {nbytes} bytes exceeds the cache budget")
+                return
+            
+            now = time.monotonic()
+            ttl = self.ttl_seconds.get(entry_type, self.ttl_seconds['default'])
+            with self._lock:
+                if key in self._cache:
+                    self._remove(key)
+                self._cache[key] = (value, now + ttl, now, nbytes)
+                self._bytes += nbytes
                 
-            self._cache[key] = value
-            self._access_times[key] = self._current_time
-            self._current_time += 1
+                while len(self._cache) > self.max_size or self._bytes > self.max_bytes:
+                    lru_key = next(iter(self._cache))
+                    self._remove(lru_key)
+                    self._stats['evictions'] += 1
         except Exception as e:
             self.logger.error(f"Error setting cache key {key}: {e}")
+    
+    def _remove(self, key: str) -> None:
+        """Drop an entry (caller holds the lock)"""
+        entry = self._cache.pop(key)
+        self._bytes -= entry[3]
         
     def clear(self) -> None:
         """Clear all cached data with error handling"""
         try:
-            self._cache.clear()
-            self._access_times.clear()
-            self._current_time = 0
+            with self._lock:
+                self._cache.clear()
+                self._bytes = 0
         except Exception as e:
             self.logger.error(f"Error clearing cache: {e}")
         
@@ -819,23 +1078,41 @@ class DataCache:
             return len(self._cache)
         except Exception:
             return 0
+    
+    def size_bytes(self) -> int:
+        """Approximate bytes held by cached values"""
+        return self._bytes
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters and current usage"""
+        with self._lock:
+            lookups = self._stats['hits'] + self._stats['misses']
+            return {
+                **self._stats,
+                'entries': len(self._cache),
+                'bytes': self._bytes,
+                'max_entries': self.max_size,
+                'max_bytes': self.max_bytes,
+                'hit_rate_percent': (self._stats['hits'] / lookups * 100) if lookups else 0.0,
+            }
             
-    def cleanup_expired(self, max_age_seconds: int = 3600):
-        """Clean up expired cache entries"""
+    def cleanup_expired(self, max_age_seconds: Optional[int] = None):
+        """
+        Clean up expired cache entries
+        
+        Args:
+            max_age_seconds: Also drop entries stored longer ago than this
+        """
         try:
-            current_time = time.time()
-            expired_keys = []
-            
-            for key in list(self._cache.keys()):
-                # Simple time-based expiration (would need timestamps in real implementation)
-                if self._current_time - self._access_times.get(key, 0) > max_age_seconds:
-                    expired_keys.append(key)
-            
-            for key in expired_keys:
-                if key in self._cache:
-                    del self._cache[key]
-                if key in self._access_times:
-                    del self._access_times[key]
+            now = time.monotonic()
+            with self._lock:
+                expired_keys = [
+                    key for key, (_, expires_at, stored_at, _) in self._cache.items()
+                    if now >= expires_at or (max_age_seconds is not None and now - stored_at > max_age_seconds)
+                ]
+                for key in expired_keys:
+                    self._remove(key)
+                self._stats['expirations'] += len(expired_keys)
                     
             if expired_keys:
                 self.logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
@@ -843,6 +1120,25 @@ class DataCache:
         except Exception as e:
             self.logger.error(f"Error during cache cleanup: {e}")
 
+def _estimate_bytes(value: Any, depth: int = 0) -> int:
+    """Approximate memory held by a cached value (shallow beyond a few levels)"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=False).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=False))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    size = sys.getsizeof(value)
+    if depth >= 3:
+        return size
+    if isinstance(value, dict):
+        return size + sum(_estimate_bytes(v, depth + 1) for v in value.values())
+    if isinstance(value, (list, tuple, set)):
+        return size + sum(_estimate_bytes(v, depth + 1) for v in value)
+    if hasattr(value, '__dict__'):
+        return size + sum(_estimate_bytes(v, depth + 1) for v in vars(value).values())
+    return size
+
 class SignalType(Enum):
     """Enumeration for different signal types"""
     BULLISH_TREND_CHANGE = "bullish_trend_change"
@@ -965,6 +1261,22 @@ class TrendAnalysisResult:
     volume_confirmation: Optional[VolumeConfirmation]
     early_warnings: List[EarlyWarningSignal]
 
+@dataclass
+class AnalysisSession:
+    """
+    One trend analysis of a symbol's latest bar
+    
+    analyze_trend_change, get_trend_signals and should_trade_trend read the
+    session for the current bar instead of re-running the analysis.
+    """
+    symbol: str
+    bar_time: Any
+    fingerprint: Tuple
+    result: TrendAnalysisResult
+    created_at: float = field(default_factory=time.time)
+    reuse_count: int = 0
+    directional_confidence: Dict[str, float] = field(default_factory=dict)
+
 class TrendDetectionEngine:
     """
     Main orchestrator for all trend detection functionality
@@ -1005,7 +1317,12 @@ class TrendDetectionEngine:
         
         # Initialize error handling and recovery systems
         self.error_recovery = ErrorRecoveryManager(self.logger)
-        self.memory_manager = MemoryManager(max_memory_mb=self.config.get('max_memory_mb', 500))
+        self.memory_manager = MemoryManager(
+            max_memory_mb=self.config.get('max_memory_mb', 500),
+            sample_interval_seconds=self.config.get('memory_sample_interval_seconds', 5.0)
+        )
+        if self.config.get('background_memory_sampler', True):
+            self.memory_manager.start_sampler()
         self.circuit_breakers = {}
         
         # Performance monitoring
@@ -1020,19 +1337,25 @@ class TrendDetectionEngine:
             'component_failures': 0,
             'cache_hits': 0,
             'cache_misses': 0,
-            'memory_cleanups': 0
+            'memory_cleanups': 0,
+            'component_timeouts': 0
         }
         
         # Initialize caching system with error handling
         try:
             cache_size = self.config.get('trend_cache_size', 1000)
-            self.data_cache = DataCache(max_size=cache_size)
+            self.data_cache = DataCache(
+                max_size=cache_size,
+                max_bytes=int(self.config.get('trend_cache_max_mb', 64) * 1024 * 1024),
+                ttl_seconds=self.config.get('trend_cache_ttl_seconds')
+            )
         except Exception as e:
             self.logger.error(f"Failed to initialize cache: {e}")
             self.data_cache = None
         
         # Configuration parameters (already validated)
         self.use_trend_detection = self.config.get('use_trend_detection', True)
+        self.use_trend_components = self.config.get('use_trend_components', False)
         self.sensitivity = self.config.get('trend_detection_sensitivity', 5)
         self.min_confidence = self.config.get('min_trend_confidence', 0.6)
         self.enable_early_signals = self.config.get('enable_early_signals', True)
@@ -1042,6 +1365,20 @@ class TrendDetectionEngine:
         self.enable_performance_monitoring = self.config.get('enable_performance_monitoring', True)
         self.cache_analysis_results = self.config.get('cache_analysis_results', True)
         
+        # Parallel component execution (worker pool created on first use)
+        self.parallel_component_analysis = self.config.get('parallel_component_analysis', False)
+        self.component_workers = self.config.get('component_workers', 4)
+        self.component_deadlines_ms = self.config.get('component_deadlines_ms', {})
+        self._component_executor = None
+        self._executor_lock = threading.Lock()
+        self._volume_analyzer = None
+        
+        # Analysis sessions: latest analysed bar per (symbol, timeframe)
+        self._sessions = {}
+        self._session_locks = {}
+        self._sessions_lock = threading.Lock()
+        self.session_stats = {'analyses': 0, 'reuses': 0, 'refreshes': 0}
+        
         # Error handling settings
         self.max_retries = self.config.get('max_error_retries', 3)
         self.enable_circuit_breaker = self.config.get('enable_circuit_breaker', True)
@@ -1180,6 +1517,15 @@ class TrendDetectionEngine:
             self.max_analysis_time_ms = self.config.get('max_analysis_time_ms', 100)
             self.enable_performance_monitoring = self.config.get('enable_performance_monitoring', True)
             self.cache_analysis_results = self.config.get('cache_analysis_results', True)
+            self.parallel_component_analysis = self.config.get('parallel_component_analysis', False)
+            self.component_deadlines_ms = self.config.get('component_deadlines_ms', {})
+            new_workers = self.config.get('component_workers', 4)
+            if new_workers != self.component_workers:
+                self.component_workers = new_workers
+                self._shutdown_component_executor()
+            
+            # Results produced under the old settings must not be reused
+            self.clear_analysis_sessions()
             self.max_retries = self.config.get('max_error_retries', 3)
             self.enable_circuit_breaker = self.config.get('enable_circuit_breaker', True)
             self.graceful_degradation = self.config.get('graceful_degradation', True)
@@ -1195,7 +1541,12 @@ class TrendDetectionEngine:
                 old_limit = self.memory_manager.max_memory_mb
                 self.memory_manager.max_memory_mb = new_memory_limit
                 self.trend_logger.log_configuration_change('memory_limit', old_limit, new_memory_limit)
-            
+            self.memory_manager.sample_interval_seconds = self.config.get('memory_sample_interval_seconds', 5.0)
+            if self.config.get('background_memory_sampler', True):
+                self.memory_manager.start_sampler()
+            else:
+                self.memory_manager.stop_sampler()
+
             # Clear cache if cache size changed significantly
             new_cache_size = self.config.get('trend_cache_size', 1000)
             old_cache_size = old_config.get('trend_cache_size', 1000)
@@ -1205,6 +1556,10 @@ class TrendDetectionEngine:
                     self.data_cache.max_size = new_cache_size
                 self.trend_logger.log_configuration_change('cache_size', old_cache_size, new_cache_size)
             
+            if self.data_cache is not None:
+                self.data_cache.max_bytes = int(self.config.get('trend_cache_max_mb', 64) * 1024 * 1024)
+                self.data_cache.ttl_seconds.update(self.config.get('trend_cache_ttl_seconds', {}))
+            
             # Log successful update
             self.logger.info(f"Configuration updated successfully (validation_errors: {len(validation_errors)})")
             if changed_params:
@@ -1252,14 +1607,25 @@ class TrendDetectionEngine:
         
         # Component initialization with individual error handling
         components_to_init = [
-            ('market_structure', 'src.market_structure_analyzer', 'MarketStructureAnalyzer'),
-            ('aroon', 'src.aroon_indicator', 'AroonIndicator'),
-            ('ema', 'src.ema_momentum_analyzer', 'EMAMomentumAnalyzer'),
-            ('divergence', 'src.divergence_detector', 'DivergenceDetector'),
-            ('multi_timeframe', 'src.multi_timeframe_analyzer', 'MultiTimeframeAnalyzer'),
-            ('trendline', 'src.trendline_analyzer', 'TrendlineAnalyzer')
+            ('market_structure', 'src.analyzers.market_structure_analyzer', 'MarketStructureAnalyzer'),
+            ('aroon', 'src.indicators.aroon_indicator', 'AroonIndicator'),
+            ('ema', 'src.analyzers.ema_momentum_analyzer', 'EMAMomentumAnalyzer'),
+            ('divergence', 'src.indicators.divergence_detector', 'DivergenceDetector'),
+            ('multi_timeframe', 'src.analyzers.multi_timeframe_analyzer', 'MultiTimeframeAnalyzer'),
+            ('trendline', 'src.analyzers.trendline_analyzer', 'TrendlineAnalyzer')
         ]
         
+        # Component signals decide entries in check_entry_signal, so loading
+        # them is opt-in; without them the engine uses its fallback confidence
+        if not self.use_trend_components:
+            for component_name, _, _ in components_to_init:
+                self.components_status[component_name] = 'disabled'
+                setattr(self, f"{component_name}_analyzer" if component_name != 'aroon' else f"{component_name}_indicator", None)
+            self.components_status['volume'] = 'disabled'
+            self._components = {}
+            self.logger.info("Trend components disabled (use_trend_components is off)")
+            return
+        
         for component_name, module_name, class_name in components_to_init:
             try:
                 # Import module
@@ -1306,6 +1672,9 @@ class TrendDetectionEngine:
                 setattr(self, f"{component_name}_analyzer" if component_name != 'aroon' else f"{component_name}_indicator", None)
                 self.error_recovery.record_error('component_init', e, {'component': component_name})
         
+        # Volume analysis needs no import of its own
+        self.components_status['volume'] = 'available'
+        
         # Set up weak references to avoid circular dependencies (only for successfully initialized components)
         self._components = {}
         for component_name in self.components_status:
@@ -1328,6 +1697,11 @@ class TrendDetectionEngine:
             if not self.graceful_degradation:
                 raise ComponentInitializationError(f"Critical components failed to initialize: {failed_components}")
     
+    def set_broker_adapter(self, broker, rate_limiter=None):
+        """Give components that can fall back to broker data access to the adapter"""
+        if self.is_component_available('multi_timeframe'):
+            self.multi_timeframe_analyzer.set_broker_adapter(broker, rate_limiter)
+    
     def get_component_status(self) -> Dict[str, str]:
         """Get status of all components"""
         return self.components_status.copy()
@@ -1373,9 +1747,10 @@ class TrendDetectionEngine:
         if len(df) == 0:
             return "empty"
         
-        # Use last few rows and key columns for hash
+        # Use last few rows and key columns for hash; the length separates
+        # frames that end the same but differ in history
         key_data = df.tail(10)[['open', 'high', 'low', 'close']].values
-        return str(hash(key_data.tobytes()))
+        return f"{len(df)}_{hash(key_data.tobytes())}"
     
     def _validate_input_data(self, df: pd.DataFrame, symbol: str) -> bool:
         """Validate input data for analysis with comprehensive error handling"""
@@ -1796,19 +2171,13 @@ class TrendDetectionEngine:
         swing_highs = []
         swing_lows = []
         
-        for i in range(5, len(analysis_df) - 5):
-            current_high = analysis_df['high'].iloc[i]
-            current_low = analysis_df['low'].iloc[i]
-            
-            # Check for swing high
-            if (current_high >= analysis_df['high'].iloc[i-5:i].max() and
-                current_high >= analysis_df['high'].iloc[i+1:i+6].max()):
-                swing_highs.append((analysis_df.index[i], current_high))
-            
-            # Check for swing low
-            if (current_low <= analysis_df['low'].iloc[i-5:i].min() and
-                current_low <= analysis_df['low'].iloc[i+1:i+6].min()):
-                swing_lows.append((analysis_df.index[i], current_low))
+        # Bars at least as high/low as the 5 bars on each side
+        highs = analysis_df['high'].values
+        lows = analysis_df['low'].values
+        for i in find_swing_indices(highs, 5, 'high', strict=False):
+            swing_highs.append((analysis_df.index[i], highs[i]))
+        for i in find_swing_indices(lows, 5, 'low', strict=False):
+            swing_lows.append((analysis_df.index[i], lows[i]))
         
         # Group similar price levels (within 0.1% of each other)
         def group_levels(levels, level_type):
@@ -2069,6 +2438,9 @@ class TrendDetectionEngine:
         """
         Perform comprehensive trend change analysis with robust error handling and recovery
         
+        The analysis runs once per bar; further calls for the same bar are
+        served from its analysis session.
+        
         Args:
             df: Price data with indicators
             symbol: Trading symbol
@@ -2076,6 +2448,83 @@ class TrendDetectionEngine:
         Returns:
             TrendAnalysisResult with all analysis components
         """
+        return self.get_analysis_session(df, symbol).result
+    
+    def get_analysis_session(self, df: pd.DataFrame, symbol: str) -> AnalysisSession:
+        """
+        Get the analysis session for the frame's latest bar, analysing it on first use
+        
+        Sessions are keyed by symbol, timeframe and the last bar's timestamp.
+        A bar that is still forming (same timestamp, different OHLCV) refreshes
+        the session so decisions never use a stale bar.
+        
+        Args:
+            df: Price data with indicators
+            symbol: Trading symbol
+            
+        Returns:
+            AnalysisSession for the current bar
+        """
+        key = (symbol, self.config.get('timeframe', 30))
+        bar_time, fingerprint = self._get_bar_identity(df)
+        
+        with self._sessions_lock:
+            session_lock = self._session_locks.setdefault(key, threading.Lock())
+        
+        # Per-symbol lock: concurrent callers for one bar wait for a single analysis
+        with session_lock:
+            session = self._sessions.get(key)
+            if session is not None and session.bar_time == bar_time and session.fingerprint == fingerprint:
+                with self._sessions_lock:
+                    session.reuse_count += 1
+                    self.session_stats['reuses'] += 1
+                return session
+            
+            refresh = session is not None and session.bar_time == bar_time
+            result = self._run_trend_analysis(df, symbol)
+            session = AnalysisSession(symbol=symbol, bar_time=bar_time, fingerprint=fingerprint, result=result)
+            
+            with self._sessions_lock:
+                self._sessions[key] = session
+                self.session_stats['analyses'] += 1
+                if refresh:
+                    self.session_stats['refreshes'] += 1
+            return session
+    
+    def _get_bar_identity(self, df: pd.DataFrame) -> Tuple[Any, Tuple]:
+        """Timestamp of the last bar and a fingerprint of its values"""
+        if df is None or len(df) == 0:
+            return None, (0, b'')
+        
+        if 'time' in df.columns:
+            bar_time = df['time'].iloc[-1]
+        elif isinstance(df.index, pd.DatetimeIndex):
+            bar_time = df.index[-1]
+        else:
+            bar_time = None
+        
+        columns = [c for c in ('open', 'high', 'low', 'close', 'tick_volume', 'volume') if c in df.columns]
+        last_bar = df[columns].iloc[-1].to_numpy(dtype=float).tobytes() if columns else b''
+        return bar_time, (len(df), last_bar)
+    
+    def get_session_stats(self) -> Dict[str, int]:
+        """
+        Analysis session counters
+        
+        'analyses' counts full analyses and 'reuses' calls answered from a
+        session. With closed bars, analyses equals the number of bars seen;
+        'refreshes' counts re-analyses of a bar that was still forming.
+        """
+        with self._sessions_lock:
+            return {'sessions': len(self._sessions), **self.session_stats}
+    
+    def clear_analysis_sessions(self) -> None:
+        """Forget analysed bars so the next call re-runs the analysis"""
+        with self._sessions_lock:
+            self._sessions.clear()
+    
+    def _run_trend_analysis(self, df: pd.DataFrame, symbol: str) -> TrendAnalysisResult:
+        """Run the full component analysis for a frame"""
         # Enhanced logging: Start analysis
         timeframe_name = self.config.get('timeframe_name', str(self.config.get('timeframe', 'unknown')))
         self.trend_logger.log_analysis_start_event(symbol, timeframe_name)
@@ -2097,15 +2546,15 @@ class TrendDetectionEngine:
                                                  memory_usage, self.memory_manager.max_memory_mb)
                 
                 try:
-                    # Check memory limits before starting
+                    # Check memory limits before starting (cleanup runs on the sampler thread)
                     if not self.memory_manager.check_memory_limit():
-                        self.memory_manager.force_cleanup()
-                        self.performance_stats['memory_cleanups'] += 1
-                        self.trend_logger.log_error_recovery('memory_manager', 'memory_limit_exceeded', 'force_cleanup')
-                        
-                        # Recheck after cleanup
-                        if not self.memory_manager.check_memory_limit():
+                        # A finished cleanup already left usage above the limit
+                        if self.memory_manager.cleanup_ineffective:
                             raise MemoryError("Memory usage exceeds limits even after cleanup")
+                        
+                        self.memory_manager.request_cleanup()
+                        self.performance_stats['memory_cleanups'] += 1
+                        self.trend_logger.log_error_recovery('memory_manager', 'memory_limit_exceeded', 'request_cleanup')
                     
                     # Validate input data with comprehensive error handling
                     if not self.use_trend_detection:
@@ -2151,7 +2600,7 @@ class TrendDetectionEngine:
                     # Cache the result (with error handling)
                     if self.cache_analysis_results and self.data_cache is not None and result is not None:
                         try:
-                            self.data_cache.set(cache_key, result)
+                            self.data_cache.set(cache_key, result, entry_type='analysis')
                             self.trend_logger.log_cache_operation('set', cache_key)
                         except Exception as e:
                             self.logger.error(f"Cache storage error for {symbol}: {e}")
@@ -2185,7 +2634,7 @@ class TrendDetectionEngine:
                     self.logger.error(f"Memory error during analysis for {symbol}: {e}")
                     self.error_recovery.record_error('memory_error', e, {'symbol': symbol})
                     self.trend_logger.log_component_failure('memory_manager', f'memory_error: {e}', symbol)
-                    self.memory_manager.force_cleanup()
+                    self.memory_manager.request_cleanup()
                     self.performance_stats['failed_analyses'] += 1
                     return self._create_empty_result()
                     
@@ -2205,7 +2654,7 @@ class TrendDetectionEngine:
                     return self._create_empty_result()
                     if self.cache_analysis_results and self.data_cache is not None and result is not None:
                         try:
-                            self.data_cache.set(cache_key, result)
+                            self.data_cache.set(cache_key, result, entry_type='analysis')
                         except Exception as e:
                             self.logger.error(f"Cache storage error for {symbol}: {e}")
                             self.error_recovery.record_error('cache_error', e, {'symbol': symbol})
@@ -2226,7 +2675,7 @@ class TrendDetectionEngine:
                 except MemoryError as e:
                     self.logger.error(f"Memory error during analysis for {symbol}: {e}")
                     self.error_recovery.record_error('memory_error', e, {'symbol': symbol})
-                    self.memory_manager.force_cleanup()
+                    self.memory_manager.request_cleanup()
                     self.performance_stats['failed_analyses'] += 1
                     return self._create_empty_result()
                     
@@ -2249,7 +2698,6 @@ class TrendDetectionEngine:
         Perform analysis with comprehensive error handling and recovery strategies
         """
         start_time = time.perf_counter()
-        max_time_seconds = self.max_analysis_time_ms / 1000.0
         
         # Initialize result components
         signals = []
@@ -2278,11 +2726,32 @@ class TrendDetectionEngine:
             'divergence': 'divergence',
             'trendline': 'trendline',
             'multi_timeframe': 'multi_timeframe',
-            'volume': 'volume',  # Special case - no component check needed
+            'volume': 'volume',  # Built in, available whenever components are loaded
             'early_warnings': None  # Special case - no component check needed
         }
         
         # Execute analysis steps with timeout checking and error recovery
+        if self.parallel_component_analysis:
+            analysis_results.update(
+                self._run_steps_in_parallel(analysis_steps, step_to_component, df, symbol, start_time))
+        else:
+            analysis_results.update(
+                self._run_steps_sequentially(analysis_steps, step_to_component, df, symbol, start_time))
+        
+        # Compile results efficiently with error handling
+        try:
+            return self._compile_analysis_results(analysis_results, signals, current_price)
+        except Exception as e:
+            self.logger.error(f"Error compiling analysis results for {symbol}: {e}")
+            self.error_recovery.record_error('compilation_error', e, {'symbol': symbol})
+            return self._create_empty_result()
+    
+    def _run_steps_sequentially(self, analysis_steps, step_to_component, df: pd.DataFrame,
+                                symbol: str, start_time: float) -> Dict[str, Any]:
+        """Run analysis steps one after another, skipping the rest near the time budget"""
+        max_time_seconds = self.max_analysis_time_ms / 1000.0
+        analysis_results = {}
+        
         for step_name, analysis_func in analysis_steps:
             # Check timeout before each step
             elapsed = time.perf_counter() - start_time
@@ -2312,31 +2781,136 @@ class TrendDetectionEngine:
                 if step_time > 20:  # Log slow steps
                     self.logger.debug(f"Slow analysis step {step_name}: {step_time:.1f}ms")
                     
-            except TrendDetectionError as e:
-                self.logger.warning(f"Component error in {step_name} for {symbol}: {e}")
-                self.error_recovery.record_error(f'{step_name}_error', e, {'symbol': symbol})
-                self.performance_stats['component_failures'] += 1
+            except Exception as e:
+                self._handle_step_error(step_name, symbol, e)
+                analysis_results[step_name] = None
+        
+        return analysis_results
+    
+    def _run_steps_in_parallel(self, analysis_steps, step_to_component, df: pd.DataFrame,
+                               symbol: str, start_time: float) -> Dict[str, Any]:
+        """
+        Run analysis steps concurrently on the component worker pool
+        
+        Inputs several components read are prepared once before fanning out.
+        Each step has a deadline (component_deadlines_ms, capped by
+        max_analysis_time_ms from the start of the analysis); a step that
+        misses it contributes None and counts as a failure for its circuit
+        breaker, so a persistently slow component is skipped until it recovers.
+        """
+        analysis_results = {}
+        self._prepare_shared_inputs(df)
+        executor = self._get_component_executor()
+        
+        pending = []
+        for step_name, analysis_func in analysis_steps:
+            component_name = step_to_component.get(step_name)
+            if component_name is not None and not self.is_component_available(component_name):
+                self.logger.debug(f"Component {component_name} not available, skipping {step_name}")
+                analysis_results[step_name] = None
+                continue
+            
+            breaker = self.circuit_breakers.get(step_name) if self.enable_circuit_breaker else None
+            if breaker is not None and not breaker.allow_request():
+                self.trend_logger.log_circuit_breaker_action(step_name, 'skip', breaker.failure_count)
+                analysis_results[step_name] = None
+                continue
+            
+            deadline_ms = min(self.max_analysis_time_ms,
+                              self.component_deadlines_ms.get(step_name, self.max_analysis_time_ms))
+            deadline = start_time + deadline_ms / 1000.0
+            future = executor.submit(self._run_component_step, analysis_func, df, symbol, breaker, deadline)
+            pending.append((step_name, future, breaker, deadline))
+        
+        for step_name, future, breaker, deadline in pending:
+            try:
+                analysis_results[step_name] = future.result(timeout=max(0.0, deadline - time.perf_counter()))
+            except FutureTimeoutError:
+                # Not started yet: drop it; already running: its result is discarded
+                future.cancel()
+                if breaker is not None:
+                    breaker.record_failure()
+                self.logger.warning(f"⚠️ {step_name} missed its deadline for {symbol}, continuing without it")
+                self.trend_logger.log_component_failure(step_name, 'deadline exceeded', symbol)
+                self.performance_stats['component_timeouts'] += 1
                 analysis_results[step_name] = None
-                
-                # Apply recovery strategy if available
-                recovery_strategy = self.error_recovery.get_recovery_strategy(step_name)
-                if recovery_strategy == 'skip_component':
-                    self.logger.info(f"Skipping {step_name} component due to repeated failures")
-                    continue
-                    
             except Exception as e:
-                self.logger.error(f"Unexpected error in {step_name} analysis for {symbol}: {e}")
-                self.error_recovery.record_error(f'{step_name}_error', e, {'symbol': symbol})
-                self.performance_stats['component_failures'] += 1
+                self._handle_step_error(step_name, symbol, e)
                 analysis_results[step_name] = None
         
-        # Compile results efficiently with error handling
+        return analysis_results
+    
+    def _run_component_step(self, analysis_func, df: pd.DataFrame, symbol: str,
+                            breaker: Optional[CircuitBreaker], deadline: float):
+        """
+        Worker body: run one step and report the outcome to its breaker
+        
+        A step finishing after its deadline reports nothing; the collector
+        has already counted the timeout as a failure.
+        """
         try:
-            return self._compile_analysis_results(analysis_results, signals, current_price)
+            result = analysis_func(df, symbol)
+        except Exception:
+            if breaker is not None and time.perf_counter() <= deadline:
+                breaker.record_failure()
+            raise
+        
+        if breaker is not None and time.perf_counter() <= deadline:
+            breaker.record_success()
+        return result
+    
+    def _handle_step_error(self, step_name: str, symbol: str, error: Exception) -> None:
+        """Log and record a failed analysis step"""
+        if isinstance(error, TrendDetectionError):
+            self.logger.warning(f"Component error in {step_name} for {symbol}: {error}")
+        else:
+            self.logger.error(f"Unexpected error in {step_name} analysis for {symbol}: {error}")
+        self.error_recovery.record_error(f'{step_name}_error', error, {'symbol': symbol})
+        self.performance_stats['component_failures'] += 1
+    
+    def _prepare_shared_inputs(self, df: pd.DataFrame) -> None:
+        """
+        Compute inputs several components read before fanning out, so the
+        workers find them memoized instead of each computing them
+        """
+        try:
+            strengths = set()
+            for component_name, attr in (('market_structure', 'market_structure_analyzer'),
+                                         ('trendline', 'trendline_analyzer'),
+                                         ('divergence', 'divergence_analyzer')):
+                if self.is_component_available(component_name):
+                    strengths.add(getattr(self, attr).swing_strength)
+            
+            for strength in strengths:
+                find_swing_indices(df['high'].values, strength, 'high')
+                find_swing_indices(df['low'].values, strength, 'low')
+            
+            if 'tick_volume' in df.columns:
+                self._get_volume_analyzer().get_volume_ratio(df)
         except Exception as e:
-            self.logger.error(f"Error compiling analysis results for {symbol}: {e}")
-            self.error_recovery.record_error('compilation_error', e, {'symbol': symbol})
-            return self._create_empty_result()
+            # Workers compute whatever is missing themselves
+            self.logger.debug(f"Shared input preparation failed: {e}")
+    
+    def _get_component_executor(self) -> ThreadPoolExecutor:
+        """Worker pool for parallel component analysis (created on first use)"""
+        with self._executor_lock:
+            if self._component_executor is None:
+                self._component_executor = ThreadPoolExecutor(
+                    max_workers=self.component_workers, thread_name_prefix='trend-component')
+            return self._component_executor
+    
+    def _shutdown_component_executor(self) -> None:
+        with self._executor_lock:
+            if self._component_executor is not None:
+                self._component_executor.shutdown(wait=False, cancel_futures=True)
+                self._component_executor = None
+    
+    def _get_volume_analyzer(self):
+        """Shared VolumeAnalyzer so its per-frame feature cache is reused"""
+        if self._volume_analyzer is None:
+            from src.analyzers.volume_analyzer import VolumeAnalyzer
+            self._volume_analyzer = VolumeAnalyzer(self.config)
+        return self._volume_analyzer
     
     def _analyze_market_structure_safe(self, df: pd.DataFrame, symbol: str) -> Optional[StructureBreakResult]:
         """Safe market structure analysis with error handling"""
@@ -2465,7 +3039,7 @@ class TrendDetectionEngine:
                     # Cache for reuse
                     if self.data_cache is not None:
                         try:
-                            self.data_cache.set(cache_key, active_trendlines)
+                            self.data_cache.set(cache_key, active_trendlines, entry_type='trendlines')
                         except Exception as e:
                             self.logger.debug(f"Trendline cache storage failed: {e}")
                             
@@ -2494,8 +3068,9 @@ class TrendDetectionEngine:
             
             primary_timeframe = self.config.get('timeframe', 30)
             
-            # Use cached higher timeframe data if available
-            cache_key = f"mtf_data_{symbol}_{primary_timeframe}"
+            # Higher-timeframe bars are resampled from df, so key them by its last bar
+            bar_time, fingerprint = self._get_bar_identity(df)
+            cache_key = f"mtf_data_{symbol}_{primary_timeframe}_{bar_time}_{hash(fingerprint)}"
             higher_df = None
             
             if self.data_cache is not None:
@@ -2506,11 +3081,10 @@ class TrendDetectionEngine:
             
             if higher_df is None:
                 try:
-                    higher_df = self.multi_timeframe_analyzer.get_higher_timeframe_data(symbol, primary_timeframe)
+                    higher_df = self.multi_timeframe_analyzer.get_higher_timeframe_data(symbol, primary_timeframe, df)
                     if higher_df is not None and self.data_cache is not None:
-                        # Cache for 5 minutes (higher timeframe data changes less frequently)
                         try:
-                            self.data_cache.set(cache_key, higher_df)
+                            self.data_cache.set(cache_key, higher_df, entry_type='mtf')
                         except Exception as e:
                             self.logger.debug(f"MTF cache storage failed: {e}")
                 except Exception as e:
@@ -2544,10 +3118,8 @@ class TrendDetectionEngine:
     def _analyze_volume_safe(self, df: pd.DataFrame, symbol: str) -> Optional[VolumeConfirmation]:
         """Safe volume analysis with error handling"""
         try:
-            from src.analyzers.volume_analyzer import VolumeAnalyzer
-            
             # Use simplified volume analysis for speed and reliability
-            volume_analyzer = VolumeAnalyzer(self.config)
+            volume_analyzer = self._get_volume_analyzer()
             
             try:
                 volume_ratio = volume_analyzer.get_volume_ratio(df)
@@ -2854,11 +3426,15 @@ class TrendDetectionEngine:
             
             return {
                 **self.performance_stats,
+                'analysis_sessions': self.get_session_stats(),
                 'cache_hit_rate_percent': cache_hit_rate,
                 'success_rate_percent': success_rate,
                 'cache_size': self.data_cache.size() if self.data_cache else 0,
                 'cache_max_size': self.data_cache.max_size if self.data_cache else 0,
+                'cache_stats': self.data_cache.get_stats() if self.data_cache else {},
                 'memory_usage_mb': self.memory_manager.get_memory_usage_mb(),
+                'memory_sampler': {'running': self.memory_manager.is_sampler_running(),
+                                   **self.memory_manager.stats},
                 'error_counts': self.error_recovery.error_counts.copy(),
                 'component_status': self.get_component_status()
             }
@@ -2869,6 +3445,7 @@ class TrendDetectionEngine:
     def clear_cache(self) -> None:
         """Clear all cached data with error handling"""
         try:
+            self.clear_analysis_sessions()
             if self.data_cache is not None:
                 self.data_cache.clear()
                 self.logger.info("Trend detection cache cleared")
@@ -2992,7 +3569,10 @@ class TrendDetectionEngine:
             List of relevant trend signals
         """
         analysis_result = self.analyze_trend_change(df, symbol)
-        
+        return self._select_signals(analysis_result, signal_type)
+    
+    def _select_signals(self, analysis_result: TrendAnalysisResult, signal_type: str) -> List[TrendSignal]:
+        """Signals of an analysis that match the trade direction"""
         if signal_type.lower() == 'buy':
             return [s for s in analysis_result.signals if 'bullish' in s.signal_type]
         elif signal_type.lower() == 'sell':
@@ -3226,10 +3806,11 @@ class TrendDetectionEngine:
         Returns:
             Tuple of (should_trade, confidence_score)
         """
-        analysis_result = self.analyze_trend_change(df, symbol)
+        session = self.get_analysis_session(df, symbol)
+        analysis_result = session.result
         
         # Check if we have relevant signals
-        relevant_signals = self.get_trend_signals(df, signal_type, symbol)
+        relevant_signals = self._select_signals(analysis_result, signal_type)
         
         if not relevant_signals:
             # ---------------------------------------------------------------
@@ -3238,9 +3819,12 @@ class TrendDetectionEngine:
             # EMA and Aroon state so we don't always block trading when the
             # trend is intact but no recent crossover has occurred.
             # ---------------------------------------------------------------
-            fallback_confidence = self._compute_directional_confidence(
-                df, signal_type, symbol
-            )
+            fallback_confidence = session.directional_confidence.get(signal_type.lower())
+            if fallback_confidence is None:
+                fallback_confidence = self._compute_directional_confidence(
+                    df, signal_type, symbol, analysis_result
+                )
+                session.directional_confidence[signal_type.lower()] = fallback_confidence
             self.logger.debug(
                 f"No trend signals for {symbol} ({signal_type}); "
                 f"fallback directional confidence = {fallback_confidence:.3f}"
@@ -3286,12 +3870,14 @@ class TrendDetectionEngine:
         return True, analysis_result.confidence
 
     def _compute_directional_confidence(
-        self, df: pd.DataFrame, signal_type: str, symbol: str = "unknown"
+        self, df: pd.DataFrame, signal_type: str, symbol: str = "unknown",
+        analysis_result: Optional[TrendAnalysisResult] = None
     ) -> float:
         """
         Compute a directional confidence score from continuous EMA and Aroon
         state (not crossover events). Used as fallback when no crossover-based
-        TrendSignals are detected.
+        TrendSignals are detected. EMA and Aroon signals already present in
+        analysis_result are reused.
 
         Returns a value in [0.0, 1.0].
         """
@@ -3302,7 +3888,9 @@ class TrendDetectionEngine:
 
             # --- EMA alignment ---
             try:
-                ema_signal = self._analyze_ema_safe(df, symbol)
+                ema_signal = analysis_result.ema_signal if analysis_result is not None else None
+                if ema_signal is None:
+                    ema_signal = self._analyze_ema_safe(df, symbol)
                 if ema_signal is not None:
                     ema_type = ema_signal.signal_type.lower()
                     # "bullish_*" or "bearish_*" (may not contain "cross")
@@ -3319,7 +3907,9 @@ class TrendDetectionEngine:
 
             # --- Aroon direction ---
             try:
-                aroon_signal = self._analyze_aroon_safe(df, symbol)
+                aroon_signal = analysis_result.aroon_signal if analysis_result is not None else None
+                if aroon_signal is None:
+                    aroon_signal = self._analyze_aroon_safe(df, symbol)
                 if aroon_signal is not None:
                     aroon_type = aroon_signal.signal_type.lower()
                     # Aroon Up > Aroon Down → bullish tendency (and vice-versa)
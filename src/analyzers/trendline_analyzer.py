@@ -13,6 +13,7 @@ import math
 
 # Import data models from trend detection engine
 from src.analyzers.trend_detection_engine import Trendline, TrendlineBreak
+from src.indicators.swing_points import find_swing_indices
 
 logger = logging.getLogger(__name__)
 
@@ -174,39 +175,27 @@ class TrendlineAnalyzer:
         # Limit lookback to avoid excessive computation
         start_idx = max(0, len(prices) - self.max_lookback_bars)
         
-        for i in range(start_idx + self.swing_strength, len(prices) - self.swing_strength):
-            is_swing = True
+        # Points strictly higher/lower than the surrounding points
+        pivots = find_swing_indices(prices, self.swing_strength, price_type)
+        
+        for i in pivots[pivots >= start_idx + self.swing_strength]:
+            i = int(i)
             current_price = prices[i]
             
-            # Check if current point is higher/lower than surrounding points
-            for j in range(i - self.swing_strength, i + self.swing_strength + 1):
-                if j == i:
-                    continue
-                
-                if price_type == 'high':
-                    if prices[j] >= current_price:
-                        is_swing = False
-                        break
-                else:  # low
-                    if prices[j] <= current_price:
-                        is_swing = False
-                        break
-            
-            if is_swing:
-                # Calculate significance of this swing point
-                significance = self._calculate_swing_significance(df, i, price_type)
-                
-                # Only include significant swing points
-                if significance >= self.min_swing_significance:
-                    swing_points.append(SwingPoint(
-                        index=i,
-                        timestamp=df.iloc[i].name if hasattr(df.iloc[i].name, 'timestamp') else datetime.now(),
-                        price=current_price,
-                        swing_type=price_type,
-                        strength=self.swing_strength,
-                        volume=df.iloc[i]['volume'] if 'volume' in df.columns else 0,
-                        significance=significance
-                    ))
+            # Calculate significance of this swing point
+            significance = self._calculate_swing_significance(df, i, price_type)
+            
+            # Only include significant swing points
+            if significance >= self.min_swing_significance:
+                swing_points.append(SwingPoint(
+                    index=i,
+                    timestamp=df.iloc[i].name if hasattr(df.iloc[i].name, 'timestamp') else datetime.now(),
+                    price=current_price,
+                    swing_type=price_type,
+                    strength=self.swing_strength,
+                    volume=df.iloc[i]['volume'] if 'volume' in df.columns else 0,
+                    significance=significance
+                ))
         
         # Sort by significance (most significant first)
         swing_points.sort(key=lambda x: x.significance, reverse=True)
@@ -5,11 +5,20 @@ Implements volume filtering, confirmation, and indicators (OBV, Volume Profile)
 
 import numpy as np
 import pandas as pd
+import hashlib
 import logging
+import threading
 import time
 import inspect
+from collections import OrderedDict
 from pathlib import Path
 
+# Frames whose volume features are kept (one per symbol/timeframe in a scan)
+MAX_FEATURE_FRAMES = 32
+
+# Columns the volume features are derived from
+FEATURE_COLUMNS = ('open', 'high', 'low', 'close', 'tick_volume')
+
 # Enhanced logging for volume analyzer
 class VolumePerformanceLogger:
     """Enhanced logger for volume analyzer with performance tracking"""
@@ -105,6 +114,12 @@ class VolumeAnalyzer:
         self.divergence_lookback = config.get('divergence_lookback', 20)
         self.divergence_threshold = config.get('divergence_threshold', 0.85)  # 15% volume drop
         
+        # Per-frame feature bundles (volume MA, ratio, OBV, profile) shared
+        # by the confirmation steps instead of recomputing them
+        self._feature_cache = OrderedDict()
+        self._feature_lock = threading.Lock()
+        self._feature_stats = {'hits': 0, 'misses': 0}
+        
         self.logger.info(f"Volume Analyzer initialized with improved settings:")
         self.logger.info(f"  Filter Enabled: {self.use_volume_filter}")
         self.logger.info(f"  Min Volume Threshold: {self.min_volume_ma}x (only reject very low)")
@@ -128,7 +143,64 @@ class VolumeAnalyzer:
         Returns:
             Series: Volume moving average
         """
-        return df['tick_volume'].rolling(window=self.volume_ma_period).mean()
+        return pd.Series(self._volume_ma_values(df, self.volume_ma_period),
+                         index=df.index, name='tick_volume')
+    
+    def _frame_key(self, df):
+        """Content key for a frame (valid for copies, never stale)"""
+        digest = hashlib.blake2b(digest_size=16)
+        for column in FEATURE_COLUMNS:
+            if column in df.columns:
+                digest.update(column.encode())
+                digest.update(np.ascontiguousarray(df[column].to_numpy(dtype=float)).tobytes())
+        return len(df), digest.digest()
+    
+    def _cached_feature(self, df, name, compute):
+        """
+        Get one feature of a frame's bundle, computing it on first use
+        
+        Args:
+            df: DataFrame the feature is derived from
+            name: Hashable feature name (e.g. ('volume_ma', 20))
+            compute: Callable producing the feature
+        """
+        key = self._frame_key(df)
+        with self._feature_lock:
+            bundle = self._feature_cache.get(key)
+            if bundle is None:
+                bundle = {}
+                self._feature_cache[key] = bundle
+                while len(self._feature_cache) > MAX_FEATURE_FRAMES:
+                    self._feature_cache.popitem(last=False)
+            self._feature_cache.move_to_end(key)
+            if name in bundle:
+                self._feature_stats['hits'] += 1
+                return bundle[name]
+            self._feature_stats['misses'] += 1
+        
+        value = compute()
+        with self._feature_lock:
+            bundle[name] = value
+        return value
+    
+    def clear_feature_cache(self):
+        """Drop cached volume features"""
+        with self._feature_lock:
+            self._feature_cache.clear()
+            self._feature_stats['hits'] = 0
+            self._feature_stats['misses'] = 0
+    
+    def get_feature_cache_stats(self):
+        with self._feature_lock:
+            return {'frames': len(self._feature_cache), **self._feature_stats}
+    
+    def _volume_ma_values(self, df, period):
+        """Rolling mean of tick volume as a read-only array"""
+        def compute():
+            values = df['tick_volume'].rolling(window=period).mean().to_numpy()
+            values.flags.writeable = False
+            return values
+        return self._cached_feature(df, ('volume_ma', period), compute)
     
     def is_above_average_volume(self, df):
         """
@@ -158,9 +230,8 @@ class VolumeAnalyzer:
         else:
             actual_period = self.volume_ma_period
         
-        volume_ma = df['tick_volume'].rolling(window=actual_period).mean()
         current_volume = df['tick_volume'].iloc[-1]
-        avg_volume = volume_ma.iloc[-1]
+        avg_volume = self._volume_ma_values(df, actual_period)[-1]
         
         if pd.isna(avg_volume) or avg_volume == 0:
             self.logger.end_operation("Volume Analysis", "- No average volume data, allowing trade")
@@ -293,23 +364,23 @@ class VolumeAnalyzer:
         if len(df) < 2:
             return pd.Series([0] * len(df), index=df.index)
         
-        # Calculate price changes
-        price_change = df['close'].diff()
-        
-        # Initialize OBV
-        obv = pd.Series(index=df.index, dtype=float)
-        obv.iloc[0] = df['tick_volume'].iloc[0]
-        
-        # Calculate OBV
-        for i in range(1, len(df)):
-            if price_change.iloc[i] > 0:
-                obv.iloc[i] = obv.iloc[i-1] + df['tick_volume'].iloc[i]
-            elif price_change.iloc[i] < 0:
-                obv.iloc[i] = obv.iloc[i-1] - df['tick_volume'].iloc[i]
-            else:
-                obv.iloc[i] = obv.iloc[i-1]
-        
-        return obv
+        return pd.Series(self._obv_values(df), index=df.index, dtype=float)
+    
+    def _obv_values(self, df):
+        """OBV as a read-only array: cumulative sum of signed volume"""
+        def compute():
+            volume = df['tick_volume'].to_numpy(dtype=float)
+            price_change = np.diff(df['close'].to_numpy(dtype=float))
+            
+            # Unchanged (or NaN) price carries OBV forward, even if volume is NaN
+            steps = np.empty(len(volume))
+            steps[0] = volume[0]
+            steps[1:] = np.where(price_change > 0, volume[1:],
+                                 np.where(price_change < 0, -volume[1:], 0.0))
+            values = np.cumsum(steps)
+            values.flags.writeable = False
+            return values
+        return self._cached_feature(df, ('obv',), compute)
     
     def get_obv_signal(self, df):
         """
@@ -324,11 +395,14 @@ class VolumeAnalyzer:
         if len(df) < self.obv_period + 1:
             return 'neutral'
         
-        obv = self.calculate_obv(df)
-        obv_ma = obv.rolling(window=self.obv_period).mean()
+        obv = self._obv_values(df)
+        obv_ma = self._cached_feature(
+            df, ('obv_ma', self.obv_period),
+            lambda: pd.Series(obv).rolling(window=self.obv_period).mean().iloc[-1]
+        )
         
-        current_obv = obv.iloc[-1]
-        current_obv_ma = obv_ma.iloc[-1]
+        current_obv = obv[-1]
+        current_obv_ma = obv_ma
         
         if pd.isna(current_obv_ma):
             return 'neutral'
@@ -415,7 +489,7 @@ class VolumeAnalyzer:
         is_bullish = candle_body > 0
         
         # Check volume relative to average
-        avg_volume = df['tick_volume'].rolling(20).mean().iloc[-1]
+        avg_volume = self._volume_ma_values(df, 20)[-1]
         volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1.0
         
         # Analyze pressure based on candle color and volume
@@ -469,6 +543,19 @@ class VolumeAnalyzer:
         if len(df) < 10:
             return None
         
+        profile = self._cached_feature(df, ('profile', num_bins),
+                                       lambda: self._compute_volume_profile(df, num_bins))
+        return {**profile, 'profile': dict(profile['profile'])}
+    
+    def _compute_volume_profile(self, df, num_bins):
+        """
+        Volume profile in one pass over the candles
+        
+        A candle counts towards every bin its low-high range touches. Instead
+        of masking the frame once per bin, each candle's first and last bin
+        come from a binary search and the per-bin totals from a histogram of
+        range starts minus range ends.
+        """
         # Get price range
         price_min = df['low'].min()
         price_max = df['high'].max()
@@ -476,18 +563,25 @@ class VolumeAnalyzer:
         # Create price bins
         bins = np.linspace(price_min, price_max, num_bins + 1)
         
-        # Calculate volume at each price level
-        volume_profile = {}
-        for i in range(len(bins) - 1):
-            bin_low = bins[i]
-            bin_high = bins[i + 1]
-            
-            # Find candles in this price range
-            mask = (df['low'] <= bin_high) & (df['high'] >= bin_low)
-            volume_in_bin = df.loc[mask, 'tick_volume'].sum()
-            
-            price_level = (bin_low + bin_high) / 2
-            volume_profile[price_level] = volume_in_bin
+        low = df['low'].to_numpy(dtype=float)
+        high = df['high'].to_numpy(dtype=float)
+        volume = df['tick_volume'].to_numpy(dtype=float)
+        valid = ~(np.isnan(low) | np.isnan(high))
+        weights = np.nan_to_num(volume[valid])  # NaN volume adds nothing, like Series.sum()
+        
+        # Bins i with bins[i] <= high and bins[i + 1] >= low
+        first = np.searchsorted(bins[1:], low[valid], side='left')
+        stop = np.searchsorted(bins[:-1], high[valid], side='right')
+        touched = first < stop
+        
+        edges = (np.bincount(first[touched], weights=weights[touched], minlength=num_bins + 1)
+                 - np.bincount(stop[touched], weights=weights[touched], minlength=num_bins + 1))
+        volumes = np.cumsum(edges)[:num_bins]
+        if pd.api.types.is_integer_dtype(df['tick_volume'].dtype):
+            volumes = np.rint(volumes).astype(df['tick_volume'].dtype)
+        
+        price_levels = (bins[:-1] + bins[1:]) / 2
+        volume_profile = dict(zip(price_levels, volumes))
         
         # Find Point of Control (POC) - price with highest volume
         poc_price = max(volume_profile, key=volume_profile.get)
@@ -1049,9 +1143,8 @@ class VolumeAnalyzer:
         else:
             actual_period = self.volume_ma_period
         
-        volume_ma = df['tick_volume'].rolling(window=actual_period).mean()
         current_volume = df['tick_volume'].iloc[-1]
-        avg_volume = volume_ma.iloc[-1]
+        avg_volume = self._volume_ma_values(df, actual_period)[-1]
         
         if pd.isna(avg_volume) or avg_volume == 0:
             return 1.0
@@ -7,6 +7,10 @@ Supports two modes:
 
 Reuses IndianTradingBot.check_entry_signal() and calculate_indicators()
 so the exact same strategy logic is exercised.
+
+Set ``simulation_mode: "fast"`` in the config to compute indicators and
+signals once per symbol (vectorized) instead of re-running them on every
+bar; it reports the same trades as the bar-by-bar replay.
 """
 
 from __future__ import annotations
@@ -125,6 +129,10 @@ class BacktestEngine:
         self.position_size_capital = float(config.get("base_position_size", 100_000))
         self.commission_pct = float(config.get("commission_pct", 0.03)) / 100  # 0.03%
 
+        # "bar" replays the strategy bar-by-bar; "fast" computes indicators
+        # and signals once per symbol and resolves exits vectorized
+        self.simulation_mode = str(config.get("simulation_mode", "bar")).lower()
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -408,6 +416,9 @@ class BacktestEngine:
         """
         Walk bar-by-bar through df, generating signals and simulating trades.
 
+        When ``simulation_mode`` is "fast" the work is delegated to
+        _simulate_symbol_fast(), which produces the same result in one pass.
+
         Returns list of closed trades and an equity curve list.
         """
         trades: List[BacktestTrade] = []
@@ -421,65 +432,13 @@ class BacktestEngine:
         capital = capital_per_symbol
         open_trade: Optional[Dict] = None
 
-        # Import bot logic classes for indicator calculation
-        try:
-            from src.core.indian_trading_bot import IndianTradingBot
-            # Create a mock decision logger to avoid crashes
-            class MockDecisionLogger:
-                def log_signal(self, *args, **kwargs): pass
-                def log_trade(self, *args, **kwargs): pass
-            
-            _bot = IndianTradingBot.__new__(IndianTradingBot)
-            _bot.config = self.config
-            _bot.timeframe = int(self._timeframe_to_minutes())
-            
-            # Indicator parameters (sync with IndianTradingBot.__init__)
-            _bot.fast_ma_period = int(self.config.get("fast_ma_period", 10))
-            _bot.slow_ma_period = int(self.config.get("slow_ma_period", 21))
-            _bot.atr_period = int(self.config.get("atr_period", 14))
-            _bot.atr_multiplier = float(self.config.get("atr_multiplier", 2.0))
-            _bot.rsi_period = int(self.config.get("rsi_period", 14))
-            _bot.rsi_overbought = float(self.config.get("rsi_overbought", 70))
-            _bot.rsi_oversold = float(self.config.get("rsi_oversold", 30))
-            _bot.macd_fast = int(self.config.get("macd_fast", 12))
-            _bot.macd_slow = int(self.config.get("macd_slow", 26))
-            _bot.macd_signal = int(self.config.get("macd_signal", 9))
-            _bot.macd_min_histogram = float(self.config.get("macd_min_histogram", 0.0001))
-            _bot.roc_period = int(self.config.get("roc_period", 3))
-            _bot.ema_micro_fast = int(self.config.get("ema_micro_fast", 6))
-            _bot.ema_micro_slow = int(self.config.get("ema_micro_slow", 12))
-            _bot.adx_period = int(self.config.get("adx_period", 14))
-            _bot.adx_min_strength = float(self.config.get("adx_min_strength", 25))
-            
-            # Filter parameters
-            _bot.min_trend_confidence = 0.0  # disable trend filter in backtest for now
-            _bot.roc_threshold = float(self.config.get("roc_threshold", 0.15))
-            
-            # Risk/Trade settings
-            _bot.risk_percent = float(self.config.get("risk_per_trade", self.config.get("risk_percent", 1.0)))
-            
-            # Use rewarding ratio if provided, else calc from TP/SL
-            tp = float(self.config.get("take_profit", 1.5))
-            sl = float(self.config.get("stop_loss", 0.75))
-            _bot.reward_ratio = float(self.config.get("reward_ratio", tp / sl if sl > 0 else 2.0))
-            
-            _bot.logger = logger
-            _bot.decision_logger = MockDecisionLogger()
-            _bot.trend_detection_engine = None
-            _bot.ml_integration = None
-            _bot.volume_analyzer = None
-            _bot.adaptive_risk_manager = None
-            _bot.paper_trading = True
-            _bot.symbols = [symbol]
-            
-            indicator_fn = _bot.calculate_indicators
-            signal_fn = _bot.check_entry_signal
-            use_bot_signals = True
-        except Exception as e:
-            logger.debug(f"  Bot signal logic unavailable ({e}), using simple MA crossover")
-            use_bot_signals = False
-            indicator_fn = None
-            signal_fn = None
+        if self.simulation_mode == "fast":
+            return self._simulate_symbol_fast(symbol, df, capital_per_symbol, lookback)
+
+        _bot = self._build_signal_bot(symbol)
+        use_bot_signals = _bot is not None
+        indicator_fn = _bot.calculate_indicators if use_bot_signals else None
+        signal_fn = _bot.check_entry_signal if use_bot_signals else None
 
         for i in range(lookback, len(df)):
             bar = df.iloc[i]
@@ -591,6 +550,373 @@ class BacktestEngine:
 
         return trades, equity_curve
 
+    def _build_signal_bot(self, symbol: str):
+        """
+        Build a lightweight IndianTradingBot carrying only the strategy
+        parameters needed by calculate_indicators() / check_entry_signal().
+
+        Returns None when the bot logic cannot be imported, in which case
+        callers fall back to the simple MA crossover.
+        """
+        try:
+            from src.core.indian_trading_bot import IndianTradingBot
+            # Create a mock decision logger to avoid crashes
+            class MockDecisionLogger:
+                def log_signal(self, *args, **kwargs): pass
+                def log_trade(self, *args, **kwargs): pass
+            
+            _bot = IndianTradingBot.__new__(IndianTradingBot)
+            _bot.config = self.config
+            _bot.timeframe = int(self._timeframe_to_minutes())
+            
+            # Indicator parameters (sync with IndianTradingBot.__init__)
+            _bot.fast_ma_period = int(self.config.get("fast_ma_period", 10))
+            _bot.slow_ma_period = int(self.config.get("slow_ma_period", 21))
+            _bot.atr_period = int(self.config.get("atr_period", 14))
+            _bot.atr_multiplier = float(self.config.get("atr_multiplier", 2.0))
+            _bot.rsi_period = int(self.config.get("rsi_period", 14))
+            _bot.rsi_overbought = float(self.config.get("rsi_overbought", 70))
+            _bot.rsi_oversold = float(self.config.get("rsi_oversold", 30))
+            _bot.macd_fast = int(self.config.get("macd_fast", 12))
+            _bot.macd_slow = int(self.config.get("macd_slow", 26))
+            _bot.macd_signal = int(self.config.get("macd_signal", 9))
+            _bot.macd_min_histogram = float(self.config.get("macd_min_histogram", 0.0001))
+            _bot.roc_period = int(self.config.get("roc_period", 3))
+            _bot.ema_micro_fast = int(self.config.get("ema_micro_fast", 6))
+            _bot.ema_micro_slow = int(self.config.get("ema_micro_slow", 12))
+            _bot.adx_period = int(self.config.get("adx_period", 14))
+            _bot.adx_min_strength = float(self.config.get("adx_min_strength", 25))
+            
+            # Filter parameters
+            _bot.min_trend_confidence = 0.0  # disable trend filter in backtest for now
+            _bot.roc_threshold = float(self.config.get("roc_threshold", 0.15))
+            
+            # Risk/Trade settings
+            _bot.risk_percent = float(self.config.get("risk_per_trade", self.config.get("risk_percent", 1.0)))
+            
+            # Use rewarding ratio if provided, else calc from TP/SL
+            tp = float(self.config.get("take_profit", 1.5))
+            sl = float(self.config.get("stop_loss", 0.75))
+            _bot.reward_ratio = float(self.config.get("reward_ratio", tp / sl if sl > 0 else 2.0))
+            
+            _bot.logger = logger
+            _bot.decision_logger = MockDecisionLogger()
+            _bot.trend_detection_engine = None
+            _bot.ml_integration = None
+            _bot.volume_analyzer = None
+            _bot.adaptive_risk_manager = None
+            _bot.paper_trading = True
+            _bot.symbols = [symbol]
+            return _bot
+        except Exception as e:
+            logger.debug(f"  Bot signal logic unavailable ({e}), using simple MA crossover")
+            return None
+
+    # ------------------------------------------------------------------
+    # Vectorized ("fast") simulation
+    # ------------------------------------------------------------------
+
+    def _simulate_symbol_fast(
+        self, symbol: str, df: pd.DataFrame, capital_per_symbol: float, lookback: int
+    ) -> Tuple[List[BacktestTrade], List[Dict]]:
+        """
+        Single-pass equivalent of the bar-by-bar loop in _simulate_symbol().
+
+        Indicators are computed once over the whole frame (they are all
+        causal, so row i matches the last row of ``df.iloc[: i + 1]``), the
+        entry signal column is produced in one vectorized pass, and SL/TP
+        exits are located with array searches instead of a Python loop over
+        every bar. Produces the same trades and equity curve.
+        """
+        bot = self._build_signal_bot(symbol)
+        if bot is not None:
+            signals = self._vectorized_bot_signals(df, bot)
+        else:
+            signals = self._vectorized_ma_signals(df)
+        return self._resolve_trades(symbol, df, signals, capital_per_symbol, lookback)
+
+    def _vectorized_bot_signals(self, df: pd.DataFrame, bot) -> np.ndarray:
+        """
+        Vectorized mirror of IndianTradingBot.check_entry_signal().
+
+        Evaluates the same signal cascade (EMA6/12 micro-crossover, ROC
+        momentum, MA crossover, trend confirmation, momentum, pullback,
+        breakout) followed by the RSI, MACD, ADX and hour filters for every
+        bar at once. The trend detection filter is not applied — the backtest
+        bot runs without a TrendDetectionEngine.
+
+        Returns:
+            int8 array of 1 (buy), -1 (sell) or 0 per bar
+        """
+        ind = bot.calculate_indicators(df.copy())
+        n = len(ind)
+
+        def col(name):
+            return ind[name].to_numpy(dtype=float)
+
+        def prev(arr):
+            out = np.empty_like(arr)
+            out[0] = np.nan
+            out[1:] = arr[:-1]
+            return out
+
+        close = col("close")
+        fast, slow = col("fast_ma"), col("slow_ma")
+        ema6, ema12 = col("ema6"), col("ema12")
+        roc, rsi = col("roc3"), col("rsi")
+        hist = col("macd_histogram")
+        ma_cross = col("ma_cross")
+        ma_trend = col("ma_trend")
+        ema6_prev, ema12_prev = prev(ema6), prev(ema12)
+        trend_prev = prev(ma_trend)
+        hist_prev = prev(hist)
+        hist_prev = np.where(np.isnan(hist_prev), 0.0, hist_prev)
+
+        signal = np.zeros(n, dtype=np.int8)
+        has_prev = np.arange(n) >= 1
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # METHOD 0A: EMA6/12 micro-crossover
+            micro_valid = has_prev & ~(
+                np.isnan(ema6) | np.isnan(ema12) | np.isnan(ema6_prev) | np.isnan(ema12_prev)
+            )
+            bullish_micro = (ema6 > ema12) & (ema6_prev <= ema12_prev)
+            bearish_micro = (ema6 < ema12) & (ema6_prev >= ema12_prev)
+            signal[micro_valid & bullish_micro & (fast > slow)] = 1
+            signal[micro_valid & ~(bullish_micro & (fast > slow)) & bearish_micro & (fast < slow)] = -1
+
+            # METHOD 0B: ROC momentum pre-signal
+            roc_threshold = bot.config.get("roc_threshold", 0.15)
+            pending = (signal == 0) & ~np.isnan(roc)
+            roc_buy = (roc > roc_threshold) & (ema6 > ema12)
+            roc_sell = (roc < -roc_threshold) & (ema6 < ema12)
+            signal[pending & roc_buy] = 1
+            signal[pending & ~roc_buy & roc_sell] = -1
+
+            # METHOD 1: MA crossover (overrides the early signals)
+            signal[ma_cross == 1] = 1
+            signal[ma_cross == -1] = -1
+
+            # METHOD 2: trend confirmation
+            pending = signal == 0
+            trend_buy = (close > fast) & (close > slow) & (ma_trend == 1) & (trend_prev == -1)
+            trend_sell = (close < fast) & (close < slow) & (ma_trend == -1) & (trend_prev == 1)
+            signal[pending & trend_buy] = 1
+            signal[pending & ~trend_buy & trend_sell] = -1
+
+            # METHOD 3: momentum
+            pending = (signal == 0) & ~np.isnan(rsi) & ~np.isnan(hist)
+            mom_buy = ((rsi > 30) & (rsi < 60) & (hist > 0) & (hist > hist_prev)
+                       & (close > fast) & (fast > slow))
+            mom_sell = ((rsi < 70) & (rsi > 40) & (hist < 0) & (hist < hist_prev)
+                        & (close < fast) & (fast < slow))
+            signal[pending & mom_buy] = 1
+            signal[pending & ~mom_buy & mom_sell] = -1
+
+            # METHOD 4: pullback
+            pending = signal == 0
+            fast_dist = (close - fast) / fast * 100
+            slow_dist = (close - slow) / slow * 100
+            pb_buy = ((fast > slow) & (np.abs(fast_dist) < 0.1)
+                      & (fast_dist > -0.05) & (slow_dist > 0.05))
+            pb_sell = ((fast < slow) & (np.abs(fast_dist) < 0.1)
+                       & (fast_dist < 0.05) & (slow_dist < -0.05))
+            signal[pending & pb_buy] = 1
+            signal[pending & ~pb_buy & pb_sell] = -1
+
+            # METHOD 5: breakout of the last 10 bars (current bar included)
+            pending = (signal == 0) & (np.arange(n) + 1 >= 20)
+            recent_high = ind["high"].rolling(10, min_periods=1).max().to_numpy(dtype=float)
+            recent_low = ind["low"].rolling(10, min_periods=1).min().to_numpy(dtype=float)
+            bo_buy = (close > recent_high) & (fast > slow) & (close > fast)
+            bo_sell = (close < recent_low) & (fast < slow) & (close < fast)
+            signal[pending & bo_buy] = 1
+            signal[pending & ~bo_buy & bo_sell] = -1
+
+            signal[~has_prev] = 0
+            buy, sell = signal == 1, signal == -1
+
+            # RSI filter
+            rsi_valid = ~np.isnan(rsi)
+            rsi_overbought = bot.config.get("rsi_overbought", 70)
+            reject = rsi_valid & buy & ((rsi > rsi_overbought) | (rsi < 45))
+            reject |= rsi_valid & sell & ((rsi < bot.rsi_oversold) | (rsi > 55))
+
+            # MACD filter
+            if bot.config.get("use_macd", True):
+                macd_threshold = bot.config.get("macd_min_histogram", 0.0001)
+                hist_valid = ~np.isnan(hist)
+                reject |= hist_valid & buy & (hist <= macd_threshold)
+                reject |= hist_valid & sell & (hist >= -macd_threshold)
+
+            # ADX filter — check_entry_signal only applies it when the
+            # indicator frame already carries an 'adx' column
+            if bot.config.get("use_adx", True) and "adx" in ind.columns:
+                adx = col("adx")
+                plus_di = col("plus_di") if "plus_di" in ind.columns else np.zeros(n)
+                minus_di = col("minus_di") if "minus_di" in ind.columns else np.zeros(n)
+                strong = ~np.isnan(adx) & (adx > bot.adx_min_strength)
+                reject |= strong & buy & ~(plus_di > minus_di)
+                reject |= strong & sell & ~(minus_di > plus_di)
+
+        signal[reject] = 0
+
+        # Hour filter uses the wall clock, exactly like check_entry_signal
+        if bot.config.get("enable_hour_filter", True):
+            dead_hours = bot.config.get("dead_hours", [0, 1, 2, 17, 20, 21, 22])
+            if datetime.now().hour in dead_hours:
+                signal[:] = 0
+
+        return signal
+
+    def _vectorized_ma_signals(self, df: pd.DataFrame) -> np.ndarray:
+        """Vectorized mirror of _simple_ma_signal() for every bar."""
+        close = df["close"]
+        ema20 = close.ewm(span=20, adjust=False).mean().to_numpy(dtype=float)
+        ema50 = close.ewm(span=50, adjust=False).mean().to_numpy(dtype=float)
+        n = len(df)
+        signal = np.zeros(n, dtype=np.int8)
+        if n < 2:
+            return signal
+        prev20, curr20 = ema20[:-1], ema20[1:]
+        prev50, curr50 = ema50[:-1], ema50[1:]
+        bull = (prev20 <= prev50) & (curr20 > curr50)
+        bear = (prev20 >= prev50) & (curr20 < curr50)
+        signal[1:][bull] = 1
+        signal[1:][~bull & bear] = -1
+        signal[: min(54, n)] = 0  # needs 55 bars of history
+        return signal
+
+    # Initial number of bars scanned when searching for an SL/TP hit
+    EXIT_SCAN_CHUNK = 256
+
+    def _find_exit_bar(
+        self, high: np.ndarray, low: np.ndarray, start: int,
+        direction: str, sl_price: float, tp_price: float,
+    ) -> Tuple[Optional[int], Optional[str]]:
+        """
+        Locate the first bar at or after ``start`` that hits SL or TP.
+
+        Scans in geometrically growing chunks so a trade that closes quickly
+        only touches a few bars. SL takes precedence over TP on the same bar,
+        matching the bar-by-bar loop.
+        """
+        n = len(high)
+        chunk = self.EXIT_SCAN_CHUNK
+        pos = start
+        while pos < n:
+            end = min(pos + chunk, n)
+            if direction == "buy":
+                sl_hit = low[pos:end] <= sl_price
+                tp_hit = high[pos:end] >= tp_price
+            else:
+                sl_hit = high[pos:end] >= sl_price
+                tp_hit = low[pos:end] <= tp_price
+            hit = sl_hit | tp_hit
+            if hit.any():
+                k = int(np.argmax(hit))
+                return pos + k, ("sl" if sl_hit[k] else "tp")
+            pos = end
+            chunk *= 2
+        return None, None
+
+    def _resolve_trades(
+        self, symbol: str, df: pd.DataFrame, signals: np.ndarray,
+        capital_per_symbol: float, lookback: int,
+    ) -> Tuple[List[BacktestTrade], List[Dict]]:
+        """
+        Turn a precomputed signal column into trades and an equity curve.
+
+        Only jumps between entry and exit bars; per-bar work is limited to
+        array operations for mark-to-market equity.
+        """
+        n = len(df)
+        close = df["close"].to_numpy(dtype=float)
+        high = df["high"].to_numpy(dtype=float) if "high" in df.columns else close
+        low = df["low"].to_numpy(dtype=float) if "low" in df.columns else close
+        if "time" in df.columns:
+            times = [str(t) for t in df["time"]]
+        else:
+            times = [str(i) for i in range(n)]
+
+        entry_bars = np.flatnonzero(signals[lookback:]) + lookback
+        capital = capital_per_symbol
+        capital_at = np.full(n, np.nan)
+        capital_at[lookback] = capital
+        unrealised = np.zeros(n)
+        trades: List[BacktestTrade] = []
+
+        i = lookback
+        while True:
+            k = int(np.searchsorted(entry_bars, i))
+            if k >= len(entry_bars):
+                break
+            entry_bar = int(entry_bars[k])
+            direction = "buy" if signals[entry_bar] == 1 else "sell"
+            entry_price = float(close[entry_bar])
+            quantity = max(1.0, capital * self.risk_per_trade_pct / (entry_price * self.stop_loss_pct))
+            quantity = round(quantity, 2)
+
+            if direction == "buy":
+                tp_price = entry_price * (1 + self.take_profit_pct)
+                sl_price = entry_price * (1 - self.stop_loss_pct)
+            else:
+                tp_price = entry_price * (1 - self.take_profit_pct)
+                sl_price = entry_price * (1 + self.stop_loss_pct)
+
+            exit_bar, exit_reason = self._find_exit_bar(
+                high, low, entry_bar + 1, direction, sl_price, tp_price
+            )
+            if exit_bar is None:
+                if entry_bar == n - 1:
+                    # Entered on the final bar: the trade stays open
+                    break
+                exit_bar, exit_reason = n - 1, "end_of_data"
+                exit_price = float(close[exit_bar])
+            else:
+                exit_price = sl_price if exit_reason == "sl" else tp_price
+
+            held = close[entry_bar:exit_bar]
+            if direction == "buy":
+                unrealised[entry_bar:exit_bar] = (held - entry_price) * quantity
+            else:
+                unrealised[entry_bar:exit_bar] = (entry_price - held) * quantity
+
+            gross_pnl = (
+                (exit_price - entry_price) * quantity
+                if direction == "buy"
+                else (entry_price - exit_price) * quantity
+            )
+            commission = (entry_price + exit_price) * quantity * self.commission_pct
+            net_pnl = gross_pnl - commission
+            pnl_pct = net_pnl / (entry_price * quantity) * 100
+            capital += net_pnl
+            capital_at[exit_bar] = capital
+
+            trades.append(BacktestTrade(
+                symbol=symbol,
+                direction=direction,
+                entry_time=times[entry_bar],
+                entry_price=entry_price,
+                exit_time=times[exit_bar],
+                exit_price=exit_price,
+                quantity=quantity,
+                pnl=round(net_pnl, 2),
+                pnl_pct=round(pnl_pct, 4),
+                exit_reason=exit_reason,
+                bars_held=exit_bar - entry_bar,
+            ))
+            # The bar-by-bar loop re-checks for entries on the exit bar
+            i = exit_bar
+
+        capital_curve = pd.Series(capital_at[lookback:]).ffill().to_numpy()
+        equity = (capital_curve + unrealised[lookback:]).tolist()
+        equity_curve = [
+            {"time": times[lookback + j], "equity": round(v, 2)}
+            for j, v in enumerate(equity)
+        ]
+        return trades, equity_curve
+
     def _simple_ma_signal(self, df: pd.DataFrame) -> int:
         """Fallback: simple 20/50 EMA crossover signal."""
         if len(df) < 55:
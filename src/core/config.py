@@ -317,6 +317,7 @@ EMAIL_PASSWORD = ''
 # ADVANCED TREND DETECTION SYSTEM
 # ==============================================================================
 USE_TREND_DETECTION = True
+USE_TREND_COMPONENTS = False            # Load the trend analyzers; their signals then gate entries
 TREND_DETECTION_SENSITIVITY = 5         # 1-10 scale (5 = balanced)
 MIN_TREND_CONFIDENCE = 0.6              # Minimum confidence for trend signals
 ENABLE_EARLY_SIGNALS = True             # Enable early warning signals
@@ -497,6 +498,7 @@ def get_config():
         
         # Advanced Trend Detection
         'use_trend_detection': USE_TREND_DETECTION,
+        'use_trend_components': USE_TREND_COMPONENTS,
         'trend_detection_sensitivity': TREND_DETECTION_SENSITIVITY,
         'min_trend_confidence': MIN_TREND_CONFIDENCE,
         'enable_early_signals': ENABLE_EARLY_SIGNALS,
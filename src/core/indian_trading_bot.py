@@ -9,6 +9,8 @@ import numpy as np
 from datetime import datetime, timedelta
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import sys
 from pathlib import Path
 from typing import Dict, Optional, List
@@ -31,7 +33,10 @@ from src.utils.logging_utils import configure_safe_logging
 # Import broker adapter and validator
 from src.adapters.broker_adapter import BrokerAdapter
 from src.utils.instrument_validator import InstrumentValidator
+from src.utils.rate_limiter import RateLimiter
 from src.core.trading_decision_logger import TradingDecisionLogger
+from src.core.position_snapshot import PositionSnapshot
+from src.core.market_data_context import MarketDataContext
 
 # Import optional components (same as MT5 bot)
 try:
@@ -62,6 +67,8 @@ except ImportError:
     TREND_DETECTION_AVAILABLE = False
     logging.warning("Trend Detection Engine not available")
 
+from src.indicators.streaming_indicators import StreamingIndicators
+
 # Reconfigure stdout for UTF-8 as early as possible for Windows compatibility
 if hasattr(sys.stdout, 'reconfigure'):
     try:
@@ -181,6 +188,28 @@ class IndianTradingBot:
         self.analysis_bars = config.get('analysis_bars', 200)
         self.max_positions = config.get('max_positions', 5)
         
+        # Streaming indicators: keep per-symbol indicator state and fetch only
+        # the latest bars each loop instead of recomputing the whole window
+        self.use_streaming_indicators = config.get('use_streaming_indicators', False)
+        self.streaming_refresh_bars = config.get('streaming_refresh_bars', 10)
+        self.indicator_streams: Dict[str, StreamingIndicators] = {}
+        
+        # Concurrent scan: symbols are analysed by a bounded worker pool that
+        # shares one broker rate limit; order placement stays serialized
+        self.scan_workers = max(1, int(config.get('scan_workers', 1)))
+        self.broker_rate_limiter = RateLimiter(config.get('broker_rate_limit', 3))
+        self._order_lock = threading.RLock()
+        
+        # Broker positions are fetched once per loop iteration and shared by
+        # run_strategy, manage_positions and the cleanup passes
+        self._position_snapshot: Optional[PositionSnapshot] = None
+        self._snapshot_cycle_active = False
+        self._snapshot_lock = threading.Lock()
+        
+        # Indicator frames computed by run_strategy, reused by position
+        # management for the rest of the loop iteration
+        self.market_data = MarketDataContext()
+        
         # Paper trading mode (Requirement 15.1)
         self.paper_trading = config.get('paper_trading', False)
         self.paper_trading_engine = None
@@ -208,8 +237,9 @@ class IndianTradingBot:
         decision_log_file = config.get('decision_log_file', 'trading_decisions.log')
         self.decision_logger = TradingDecisionLogger(logger=logging.getLogger(), log_file=decision_log_file)
         
-        # Activity logger (for dashboard)
+        # Activity logger and live update hub (for dashboard)
         self.activity_logger = None
+        self.live_updates = None
         
         logging.info("="*80)
         logging.info("Indian Trading Bot Initialized")
@@ -233,6 +263,26 @@ class IndianTradingBot:
                 data={}
             )
 
+    def set_live_updates(self, live_updates):
+        """Set the dashboard hub that receives per-cycle positions and account snapshots"""
+        self.live_updates = live_updates
+    
+    def _publish_live_state(self):
+        """
+        Push this cycle's positions and account snapshot to dashboard streams.
+        
+        Positions come from the cycle's snapshot (or the paper engine), so
+        this adds at most one account request per iteration, and nothing
+        when no stream is open.
+        """
+        if not self.live_updates or not self.live_updates.has_subscribers():
+            return
+        try:
+            self.live_updates.publish_positions(self._get_positions())
+            self.live_updates.publish_account(self._get_account_info())
+        except Exception as e:
+            logging.warning(f"Failed to publish live state: {e}")
+
     
     def _init_components(self):
         """Initialize adaptive risk, ML, volume analyzer, etc. (same as MT5)"""
@@ -264,6 +314,7 @@ class IndianTradingBot:
         # Trend detection
         if self.config.get('use_trend_detection', True) and TREND_DETECTION_AVAILABLE:
             self.trend_detection_engine = TrendDetectionEngine(self.config)
+            self.trend_detection_engine.set_broker_adapter(self.broker, self.broker_rate_limiter)
             logging.info("Advanced Trend Detection enabled")
         else:
             self.trend_detection_engine = None
@@ -295,18 +346,56 @@ class IndianTradingBot:
             List of position dictionaries
         """
         if self.paper_trading and self.paper_trading_engine:
-            return self.paper_trading_engine.get_positions(symbol)
+            positions = self.paper_trading_engine.get_positions(symbol)
         else:
-            if symbol:
-                return self.broker.get_positions(symbol)
-            else:
-                # Get positions for all symbols
-                all_positions = []
-                for sym in self.symbols:
-                    positions = self.broker.get_positions(sym)
-                    if positions:
-                        all_positions.extend(positions)
-                return all_positions
+            snapshot = self._get_position_snapshot()
+            if snapshot is not None:
+                return snapshot.get_positions(symbol, symbols=None if symbol else self.symbols)
+            
+            # No snapshot cycle running - ask the broker directly
+            self.broker_rate_limiter.acquire()
+            positions = self.broker.get_positions(symbol)
+        
+        if symbol or not positions:
+            return positions
+        # All positions for the configured symbols
+        symbols = set(self.symbols)
+        return [p for p in positions if p.get('symbol') in symbols]
+    
+    def begin_position_snapshot(self):
+        """
+        Start a loop iteration: the first position lookup fetches every
+        broker position in one call and later lookups reuse it
+        """
+        with self._snapshot_lock:
+            self._position_snapshot = None
+            self._snapshot_cycle_active = True
+    
+    def end_position_snapshot(self):
+        """End the loop iteration and drop the snapshot"""
+        with self._snapshot_lock:
+            self._position_snapshot = None
+            self._snapshot_cycle_active = False
+    
+    def _invalidate_position_snapshot(self):
+        """Orders were placed or closed - refetch on the next lookup"""
+        with self._snapshot_lock:
+            self._position_snapshot = None
+    
+    def _get_position_snapshot(self) -> Optional[PositionSnapshot]:
+        """
+        Current snapshot, fetching it if needed
+        
+        Returns:
+            PositionSnapshot, or None outside a snapshot cycle
+        """
+        with self._snapshot_lock:
+            if not self._snapshot_cycle_active:
+                return None
+            if self._position_snapshot is None:
+                self.broker_rate_limiter.acquire()
+                self._position_snapshot = PositionSnapshot(self.broker.get_positions())
+            return self._position_snapshot
     
     def _get_account_info(self) -> Dict:
         """
@@ -466,6 +555,7 @@ class IndianTradingBot:
         broker_timeframe = self.broker.convert_timeframe(timeframe)
         
         # Fetch data
+        self.broker_rate_limiter.acquire()
         df = self.broker.get_historical_data(symbol, broker_timeframe, bars)
         
         if df is None:
@@ -541,6 +631,80 @@ class IndianTradingBot:
         
         return df
     
+    def _get_indicator_data(self, symbol: str, bars: int) -> Optional[pd.DataFrame]:
+        """
+        Recent bars with indicators for position management
+        
+        Within a loop iteration the frame already computed by run_strategy
+        (or by an earlier position) is reused; only the latest row is read,
+        so a longer cached frame gives the same values.
+        
+        Args:
+            symbol (str): Trading symbol
+            bars (int): Bars to fetch if nothing is cached
+            
+        Returns:
+            pd.DataFrame: Data with indicators, or None if no data
+        """
+        def load():
+            df = self.get_historical_data(symbol, self.timeframe, bars)
+            if df is None or len(df) == 0:
+                return None
+            return self.calculate_indicators(df)
+        
+        return self.market_data.get_or_load(symbol, self.timeframe, load)
+    
+    def _create_indicator_stream(self) -> StreamingIndicators:
+        """Build a streaming indicator engine with the current indicator parameters"""
+        return StreamingIndicators(
+            fast_ma_period=self.fast_ma_period,
+            slow_ma_period=self.slow_ma_period,
+            ema_micro_fast=self.config.get('ema_micro_fast', 6),
+            ema_micro_slow=self.config.get('ema_micro_slow', 12),
+            roc_period=self.config.get('roc_period', 3),
+            atr_period=self.atr_period,
+            rsi_period=self.rsi_period,
+            macd_fast=self.macd_fast,
+            macd_slow=self.macd_slow,
+            macd_signal=self.macd_signal,
+            max_bars=self.analysis_bars,
+        )
+    
+    def get_streaming_indicators(self, symbol: str) -> Optional[pd.DataFrame]:
+        """
+        Get price data with indicators using the per-symbol streaming engine
+        
+        The first call seeds the stream with analysis_bars of history. Later
+        calls fetch only streaming_refresh_bars bars and append the newly
+        closed ones; the stream is re-seeded if bars were missed in between.
+        
+        Args:
+            symbol (str): Trading symbol
+            
+        Returns:
+            pd.DataFrame: Same layout as calculate_indicators() output, or None
+        """
+        stream = self.indicator_streams.get(symbol)
+        if stream is None:
+            stream = self._create_indicator_stream()
+            self.indicator_streams[symbol] = stream
+        
+        if stream.bar_count > 0:
+            df = self.get_historical_data(symbol, self.timeframe, self.streaming_refresh_bars)
+            if df is None:
+                return None
+            if stream.covers(df):
+                added = stream.update(df)
+                logging.debug(f"Streaming indicators for {symbol}: {added} new closed bar(s)")
+                return stream.to_frame()
+            logging.info(f"Gap in streamed bars for {symbol} - re-seeding indicators")
+        
+        df = self.get_historical_data(symbol, self.timeframe, self.analysis_bars)
+        if df is None:
+            return None
+        stream.seed(df)
+        return stream.to_frame()
+    
     def check_entry_signal(self, df, symbol="unknown"):
         """
         Check for entry signals with RSI and MACD filtering
@@ -1508,24 +1672,27 @@ class IndianTradingBot:
         Returns:
             bool: True if successful
         """
-        # Check if split orders are enabled
-        if self.use_split_orders:
-            return self._open_split_positions(
-                symbol=symbol,
-                direction=direction,
-                entry_price=entry_price,
-                stop_loss=stop_loss,
-                total_quantity=quantity
-            )
-        else:
-            return self._open_single_position(
-                symbol=symbol,
-                direction=direction,
-                entry_price=entry_price,
-                stop_loss=stop_loss,
-                take_profit=take_profit,
-                quantity=quantity
-            )
+        try:
+            # Check if split orders are enabled
+            if self.use_split_orders:
+                return self._open_split_positions(
+                    symbol=symbol,
+                    direction=direction,
+                    entry_price=entry_price,
+                    stop_loss=stop_loss,
+                    total_quantity=quantity
+                )
+            else:
+                return self._open_single_position(
+                    symbol=symbol,
+                    direction=direction,
+                    entry_price=entry_price,
+                    stop_loss=stop_loss,
+                    take_profit=take_profit,
+                    quantity=quantity
+                )
+        finally:
+            self._invalidate_position_snapshot()
 
     def _open_single_position(
         self,
@@ -1941,7 +2108,7 @@ class IndianTradingBot:
             self.activity_logger.log_symbol_analysis_start(symbol)
             
             # Log position check
-            positions = self.broker.get_positions(symbol)
+            positions = self._get_positions(symbol)
             current_positions = len(positions) if positions else 0
             
             logging.info(f"📊 Position Check: {current_positions}/{self.max_positions} positions for {symbol}")
@@ -1953,7 +2120,7 @@ class IndianTradingBot:
             )
         else:
             # Fallback if activity logger is not set
-            positions = self.broker.get_positions(symbol)
+            positions = self._get_positions(symbol)
             current_positions = len(positions) if positions else 0
             logging.info(f"📊 Position Check: {current_positions}/{self.max_positions} positions for {symbol}")
         
@@ -1972,7 +2139,10 @@ class IndianTradingBot:
                 data={'bars_requested': self.analysis_bars}
             )
         
-        df = self.get_historical_data(symbol, self.timeframe, self.analysis_bars)
+        if self.use_streaming_indicators:
+            df = self.get_streaming_indicators(symbol)
+        else:
+            df = self.get_historical_data(symbol, self.timeframe, self.analysis_bars)
         if df is None or len(df) < 50:
             logging.error(f"Insufficient data for {symbol}")
             if self.activity_logger:
@@ -2002,7 +2172,9 @@ class IndianTradingBot:
                 data={}
             )
         
-        df = self.calculate_indicators(df)
+        if not self.use_streaming_indicators:
+            df = self.calculate_indicators(df)
+        self.market_data.put(symbol, self.timeframe, df)
         logging.info(f"✅ Indicators calculated successfully")
         logging.info("")
         
@@ -2041,6 +2213,30 @@ class IndianTradingBot:
                 data={'signal': signal}
             )
         
+        # Price checks, sizing and placement read and change shared position
+        # state, so only one worker at a time may run them
+        with self._order_lock:
+            if not self._execute_signal(symbol, signal, df):
+                return
+        
+        # Log completion
+        if self.activity_logger:
+            self.activity_logger.log_separator()
+    
+    def _execute_signal(self, symbol: str, signal: int, df: pd.DataFrame):
+        """
+        Validate and place the order for an entry signal
+        
+        Called from run_strategy while holding the order lock.
+        
+        Args:
+            symbol (str): Trading symbol
+            signal (int): 1 for BUY, -1 for SELL
+            df (pd.DataFrame): Data with indicators
+            
+        Returns:
+            bool: False if the signal was rejected before placing an order
+        """
         # Check price level protection
         can_trade, limit_price, reason = self.check_existing_position_prices(symbol, signal)
         if not can_trade:
@@ -2051,7 +2247,7 @@ class IndianTradingBot:
                     decision="SIGNAL REJECTED",
                     reason=f"Price level protection: {reason}"
                 )
-            return
+            return False
         
         # Calculate position parameters
         latest = df.iloc[-1]
@@ -2109,9 +2305,7 @@ class IndianTradingBot:
                     reason="Order placement failed"
                 )
         
-        # Log completion
-        if self.activity_logger:
-            self.activity_logger.log_separator()
+        return True
     
     def update_trailing_stop(self, position_dict, symbol, direction):
         """
@@ -2132,11 +2326,10 @@ class IndianTradingBot:
             entry_price = position_dict['entry_price']
             
             # Get current ATR
-            df = self.get_historical_data(symbol, self.timeframe, 50)
-            if df is None or len(df) == 0:
+            df = self._get_indicator_data(symbol, 50)
+            if df is None:
                 return False
             
-            df = self.calculate_indicators(df)
             current_atr = df.iloc[-1]['atr']
             
             # Check if trailing should be activated
@@ -2236,11 +2429,10 @@ class IndianTradingBot:
             order_ids = group['order_ids']
             
             # Get current data
-            df = self.get_historical_data(symbol, self.timeframe, 50)
-            if df is None or len(df) == 0:
+            df = self._get_indicator_data(symbol, 50)
+            if df is None:
                 return 0
             
-            df = self.calculate_indicators(df)
             current_atr = df.iloc[-1]['atr']
             
             # Get current positions from broker or paper trading
@@ -2346,6 +2538,7 @@ class IndianTradingBot:
                     order_type="MARKET",
                     product_type=self.product_type
                 )
+                self._invalidate_position_snapshot()
             
             if order_id:
                 pnl = position_dict.get('pnl', 0)
@@ -2415,11 +2608,7 @@ class IndianTradingBot:
         - Time-based exits
         """
         # Get all positions from broker
-        all_positions = []
-        for symbol in self.symbols:
-            positions = self._get_positions(symbol)
-            if positions:
-                all_positions.extend(positions)
+        all_positions = self._get_positions() or []
         
         if not all_positions:
             # Clean up tracking dictionaries if no positions
@@ -2469,9 +2658,8 @@ class IndianTradingBot:
                             
                             # Action 2: Break-even stop
                             if enable_breakeven:
-                                df_be = self.get_historical_data(symbol, self.timeframe, 20)
-                                if df_be is not None and len(df_be) > 0:
-                                    df_be = self.calculate_indicators(df_be)
+                                df_be = self._get_indicator_data(symbol, 20)
+                                if df_be is not None:
                                     atr_be = df_be.iloc[-1]['atr']
                                     
                                     entry_price = position['entry_price']
@@ -2597,11 +2785,7 @@ class IndianTradingBot:
         Adapted from MT5 bot to use broker adapter
         """
         # Get all currently open positions from broker
-        all_open_positions = []
-        for symbol in self.symbols:
-            positions = self._get_positions(symbol)
-            if positions:
-                all_open_positions.extend(positions)
+        all_open_positions = self._get_positions() or []
         
         # Extract open position IDs
         open_position_ids = set()
@@ -2691,6 +2875,17 @@ class IndianTradingBot:
             self.use_split_orders = get_param('use_split_orders', True)
             self.num_positions = int(get_param('num_positions', 3))
             
+            # Streaming indicators - parameters may have changed, so re-seed
+            self.use_streaming_indicators = get_param('use_streaming_indicators', False)
+            self.streaming_refresh_bars = int(get_param('streaming_refresh_bars', 10))
+            self.indicator_streams.clear()
+            
+            # Concurrent scan
+            self.scan_workers = max(1, int(get_param('scan_workers', self.scan_workers)))
+            self.broker_rate_limiter = RateLimiter(get_param('broker_rate_limit', self.broker_rate_limiter.rate))
+            if self.trend_detection_engine:
+                self.trend_detection_engine.set_broker_adapter(self.broker, self.broker_rate_limiter)
+            
             # Update symbols if instruments changed
             if 'instruments' in new_config:
                 new_symbols = [inst['symbol'] for inst in new_config['instruments']]
@@ -2721,6 +2916,36 @@ class IndianTradingBot:
             logging.error(traceback.format_exc())
             return False
         
+    def _run_strategy_safe(self, symbol: str):
+        """run_strategy() that logs instead of raising, so one symbol cannot stop the scan"""
+        try:
+            self.run_strategy(symbol)
+        except Exception as e:
+            logging.error(f"Error processing {symbol}: {e}")
+            import traceback
+            logging.error(traceback.format_exc())
+
+    def scan_symbols(self):
+        """
+        Run the strategy for every symbol
+        
+        With scan_workers > 1 the symbols are processed by a bounded thread
+        pool: data fetches overlap (subject to broker_rate_limit) while order
+        placement is serialized by the order lock in run_strategy.
+        """
+        symbols = list(self.symbols)
+        workers = min(self.scan_workers, len(symbols))
+        
+        if workers <= 1:
+            for symbol in symbols:
+                self._run_strategy_safe(symbol)
+            return
+        
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scan') as executor:
+            list(executor.map(self._run_strategy_safe, symbols))
+        logging.info(f"⏱️ Scanned {len(symbols)} symbols with {workers} workers in {time.perf_counter() - start:.1f}s")
+
     def run(self):
         """Main bot loop"""
         logging.info("="*80)
@@ -2788,14 +3013,12 @@ class IndianTradingBot:
                     if not is_actual_open:
                         logging.info(f"🧪 AFTER-HOURS TRADING ENABLED (Current time: {now.strftime('%H:%M:%S IST')})")
                 
+                # One positions snapshot and market data cache for this iteration
+                self.begin_position_snapshot()
+                self.market_data.begin()
+                
                 # Run strategy for each symbol
-                for symbol in self.symbols:
-                    try:
-                        self.run_strategy(symbol)
-                    except Exception as e:
-                        logging.error(f"Error processing {symbol}: {e}")
-                        import traceback
-                        logging.error(traceback.format_exc())
+                self.scan_symbols()
                 
                 # Manage open positions
                 try:
@@ -2804,6 +3027,11 @@ class IndianTradingBot:
                     logging.error(f"Error managing positions: {e}")
                     import traceback
                     logging.error(traceback.format_exc())
+                finally:
+                    # Dashboard push still runs when position management failed
+                    self._publish_live_state()
+                    self.end_position_snapshot()
+                    self.market_data.end()
                 
                 # Wait before next iteration
                 interval = self.loop_interval
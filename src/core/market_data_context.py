@@ -0,0 +1,75 @@
+"""
+Market Data Context
+Per-iteration cache of indicator frames keyed by (symbol, timeframe)
+
+run_strategy fetches and computes indicators for every symbol. Position
+management (trailing stops, group trailing, break-even) needs the latest
+ATR for the same symbols a moment later. The context keeps the frames for
+the rest of the loop iteration, so those steps reuse them instead of
+fetching the bars again.
+"""
+
+from typing import Callable, Dict, Optional, Tuple
+import threading
+
+import pandas as pd
+
+
+class MarketDataContext:
+    """Indicator frames shared within one bot loop iteration"""
+
+    def __init__(self):
+        self._frames: Dict[Tuple[str, int], pd.DataFrame] = {}
+        self._lock = threading.Lock()
+        self.active = False
+        self.hits = 0
+        self.misses = 0
+
+    def begin(self):
+        """Start a new iteration with an empty cache"""
+        with self._lock:
+            self._frames.clear()
+            self.active = True
+            self.hits = 0
+            self.misses = 0
+
+    def end(self):
+        """Finish the iteration and release the frames"""
+        with self._lock:
+            self._frames.clear()
+            self.active = False
+
+    def put(self, symbol: str, timeframe: int, df: Optional[pd.DataFrame]):
+        """Store a frame with indicators (ignored outside an iteration)"""
+        if df is None or len(df) == 0:
+            return
+        with self._lock:
+            if self.active:
+                self._frames[(symbol, timeframe)] = df
+
+    def get(self, symbol: str, timeframe: int) -> Optional[pd.DataFrame]:
+        with self._lock:
+            df = self._frames.get((symbol, timeframe))
+            if df is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return df
+
+    def get_or_load(self, symbol: str, timeframe: int,
+                    loader: Callable[[], Optional[pd.DataFrame]]) -> Optional[pd.DataFrame]:
+        """
+        Cached frame for the key, or the loader's result (cached when active)
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe in minutes
+            loader: Returns a frame with indicators, or None on failure
+        """
+        if self.active:
+            df = self.get(symbol, timeframe)
+            if df is not None:
+                return df
+        df = loader()
+        self.put(symbol, timeframe, df)
+        return df
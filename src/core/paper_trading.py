@@ -216,6 +216,7 @@ class PaperTradingEngine:
         
         # Record trade
         trade = {
+            'order_id': position['order_id'],
             'symbol': position['symbol'],
             'direction': position['direction'],
             'quantity': position['quantity'],
@@ -416,10 +417,10 @@ class PaperTradingEngine:
             
         # Add completed trades (exit orders)
         for trade in self.trades:
-            # We don't have order_ids for exits in trades list currently, 
-            # but we can return them as completed orders
+            # Exits have no order of their own; derive a stable id from the entry order
+            entry_id = trade.get('order_id') or trade['entry_time'].strftime('%Y%m%d%H%M%S')
             result.append({
-                'order_id': f"EXIT_{trade['entry_time'].strftime('%H%M%S')}",
+                'order_id': f"EXIT_{entry_id}",
                 'symbol': trade['symbol'],
                 'status': 'COMPLETE',
                 'direction': 'SELL' if trade['direction'] == 1 else 'BUY',
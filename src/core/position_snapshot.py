@@ -0,0 +1,42 @@
+"""
+Position Snapshot
+Point-in-time view of broker positions shared by one bot cycle
+
+KiteAdapter.get_positions() downloads the full kite.positions() payload and
+filters it, so asking per symbol costs one REST call per symbol. The
+snapshot fetches everything once and indexes it by symbol.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+class PositionSnapshot:
+    """Positions indexed by symbol"""
+
+    def __init__(self, positions: Optional[List[Dict]]):
+        """
+        Initialize the snapshot
+
+        Args:
+            positions: All open positions from the broker
+        """
+        self.taken_at = datetime.now()
+        self.positions: List[Dict] = list(positions or [])
+        self.by_symbol: Dict[str, List[Dict]] = defaultdict(list)
+        for position in self.positions:
+            self.by_symbol[position.get('symbol')].append(position)
+
+    def get_positions(self, symbol: Optional[str] = None,
+                      symbols: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Positions for one symbol, a set of symbols, or all of them
+
+        Returns copies of the lists so callers may modify them freely.
+        """
+        if symbol:
+            return list(self.by_symbol.get(symbol, []))
+        if symbols is not None:
+            return [p for sym in symbols for p in self.by_symbol.get(sym, [])]
+        return list(self.positions)
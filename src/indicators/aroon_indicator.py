@@ -5,6 +5,7 @@ Calculates Aroon Up/Down indicators for trend strength and direction analysis
 
 import pandas as pd
 import numpy as np
+from collections import deque
 from datetime import datetime
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
@@ -62,38 +63,14 @@ class AroonIndicator:
         try:
             df_copy = df.copy()
             
-            # Calculate periods since highest high and lowest low
-            aroon_up_values = []
-            aroon_down_values = []
+            # Periods since highest high / lowest low for every full window
+            periods_since_high = self._periods_since_extreme(df['high'].to_numpy(dtype=float), highest=True)
+            periods_since_low = self._periods_since_extreme(df['low'].to_numpy(dtype=float), highest=False)
             
-            for i in range(len(df)):
-                if i < self.period - 1:
-                    aroon_up_values.append(np.nan)
-                    aroon_down_values.append(np.nan)
-                    continue
-                
-                # Get the period window
-                window_start = i - self.period + 1
-                window_high = df['high'].iloc[window_start:i+1]
-                window_low = df['low'].iloc[window_start:i+1]
-                
-                # Find periods since highest high and lowest low
-                highest_high_idx = window_high.idxmax()
-                lowest_low_idx = window_low.idxmin()
-                
-                # Calculate periods since (using position-based indexing)
-                high_position = window_high.index.get_loc(highest_high_idx)
-                low_position = window_low.index.get_loc(lowest_low_idx)
-                
-                periods_since_high = (self.period - 1) - high_position
-                periods_since_low = (self.period - 1) - low_position
-                
-                # Calculate Aroon values
-                aroon_up = ((self.period - periods_since_high) / self.period) * 100
-                aroon_down = ((self.period - periods_since_low) / self.period) * 100
-                
-                aroon_up_values.append(aroon_up)
-                aroon_down_values.append(aroon_down)
+            aroon_up_values = np.full(len(df), np.nan)
+            aroon_down_values = np.full(len(df), np.nan)
+            aroon_up_values[self.period - 1:] = ((self.period - periods_since_high) / self.period) * 100
+            aroon_down_values[self.period - 1:] = ((self.period - periods_since_low) / self.period) * 100
             
             # Add to dataframe
             df_copy['aroon_up'] = aroon_up_values
@@ -107,6 +84,35 @@ class AroonIndicator:
             self.logger.error(f"Error calculating Aroon indicators: {e}")
             return df.copy()
     
+    def _periods_since_extreme(self, values: np.ndarray, highest: bool) -> np.ndarray:
+        """
+        Bars since the window extreme for every full window
+        
+        Ties resolve to the earliest bar in the window (same as idxmax/idxmin)
+        and NaN values are skipped; an all-NaN window gives NaN.
+        
+        Args:
+            values: High or low prices
+            highest: True for highest high, False for lowest low
+            
+        Returns:
+            Array of length len(values) - period + 1
+        """
+        fill = -np.inf if highest else np.inf
+        missing = np.isnan(values)
+        windows = np.lib.stride_tricks.sliding_window_view(np.where(missing, fill, values), self.period)
+        position = windows.argmax(axis=1) if highest else windows.argmin(axis=1)
+        
+        periods_since = ((self.period - 1) - position).astype(float)
+        if missing.any():
+            all_missing = np.lib.stride_tricks.sliding_window_view(missing, self.period).all(axis=1)
+            periods_since[all_missing] = np.nan
+        return periods_since
+    
+    def create_stream(self) -> 'AroonStream':
+        """Create an incremental Aroon calculator with this indicator's period"""
+        return AroonStream(self.period)
+    
     def get_aroon_signal(self, df: pd.DataFrame) -> Optional[AroonSignal]:
         """
         Get Aroon signal from price data with enhanced crossover detection
@@ -540,3 +546,79 @@ class AroonIndicator:
         
         total_prob = base_prob + momentum_factor + duration_factor
         return min(1.0, total_prob)
+
+
+class AroonStream:
+    """
+    Incremental Aroon for appending one bar at a time
+    
+    Monotonic deques track the window's highest high and lowest low, so each
+    update is amortised O(1) instead of rescanning the whole period. Values
+    match AroonIndicator.calculate_aroon() for the same bars.
+    
+    Usage::
+    
+        stream = AroonIndicator(25).create_stream()
+        for high, low in bars:
+            values = stream.update(high, low)   # None until period bars seen
+    """
+    
+    def __init__(self, period: int = 25):
+        if period < 1:
+            raise ValueError("Aroon period must be at least 1")
+        self.period = period
+        self.reset()
+    
+    def reset(self):
+        """Forget all bars"""
+        self._index = -1
+        # (bar index, price) candidates; the front is the window extreme
+        self._highs: deque = deque()
+        self._lows: deque = deque()
+    
+    def update(self, high: float, low: float) -> Optional[Dict[str, float]]:
+        """
+        Append a bar and return the Aroon values for the window ending on it
+        
+        Args:
+            high: Bar high
+            low: Bar low
+            
+        Returns:
+            Dict with aroon_up, aroon_down, aroon_oscillator, or None while
+            fewer than period bars have been seen
+        """
+        self._index += 1
+        window_start = self._index - self.period + 1
+        
+        # Strict comparisons keep the earliest bar on ties
+        if not np.isnan(high):
+            while self._highs and self._highs[-1][1] < high:
+                self._highs.pop()
+            self._highs.append((self._index, high))
+        if not np.isnan(low):
+            while self._lows and self._lows[-1][1] > low:
+                self._lows.pop()
+            self._lows.append((self._index, low))
+        
+        while self._highs and self._highs[0][0] < window_start:
+            self._highs.popleft()
+        while self._lows and self._lows[0][0] < window_start:
+            self._lows.popleft()
+        
+        if window_start < 0:
+            return None
+        
+        aroon_up = self._aroon_value(self._highs)
+        aroon_down = self._aroon_value(self._lows)
+        return {
+            'aroon_up': aroon_up,
+            'aroon_down': aroon_down,
+            'aroon_oscillator': aroon_up - aroon_down
+        }
+    
+    def _aroon_value(self, extremes: deque) -> float:
+        if not extremes:
+            return np.nan
+        periods_since = self._index - extremes[0][0]
+        return ((self.period - periods_since) / self.period) * 100
@@ -12,6 +12,7 @@ import logging
 
 # Import data models from trend detection engine
 from src.analyzers.trend_detection_engine import DivergenceResult, DivergenceType
+from src.indicators.swing_points import find_swing_indices
 
 logger = logging.getLogger(__name__)
 
@@ -489,47 +490,27 @@ class DivergenceDetector:
         try:
             values = df[column].values
             
-            for i in range(self.swing_strength, len(values) - self.swing_strength):
-                is_swing = True
+            # Points strictly higher/lower than the surrounding points (NaNs skipped)
+            for i in find_swing_indices(values, self.swing_strength, swing_type):
+                i = int(i)
                 current_value = values[i]
                 
-                if pd.isna(current_value):
-                    continue
-                
-                # Check if current point is higher/lower than surrounding points
-                for j in range(i - self.swing_strength, i + self.swing_strength + 1):
-                    if j == i:
-                        continue
-                    
-                    if pd.isna(values[j]):
-                        continue
-                    
-                    if swing_type == 'high':
-                        if values[j] >= current_value:
-                            is_swing = False
-                            break
-                    else:  # low
-                        if values[j] <= current_value:
-                            is_swing = False
-                            break
+                # Get corresponding indicator value for divergence analysis
+                if column in ['high', 'low']:
+                    # For price swings, we need the corresponding indicator value
+                    indicator_value = current_value  # Will be updated when matching
+                else:
+                    # For indicator swings, the value is the indicator itself
+                    indicator_value = current_value
                 
-                if is_swing:
-                    # Get corresponding indicator value for divergence analysis
-                    if column in ['high', 'low']:
-                        # For price swings, we need the corresponding indicator value
-                        indicator_value = current_value  # Will be updated when matching
-                    else:
-                        # For indicator swings, the value is the indicator itself
-                        indicator_value = current_value
-                    
-                    swing_points.append(SwingPoint(
-                        index=i,
-                        timestamp=df.index[i] if hasattr(df.index[i], 'timestamp') else datetime.now(),
-                        price=current_value,
-                        indicator_value=indicator_value,
-                        swing_type=swing_type,
-                        strength=self.swing_strength
-                    ))
+                swing_points.append(SwingPoint(
+                    index=i,
+                    timestamp=df.index[i] if hasattr(df.index[i], 'timestamp') else datetime.now(),
+                    price=current_value,
+                    indicator_value=indicator_value,
+                    swing_type=swing_type,
+                    strength=self.swing_strength
+                ))
             
             return swing_points
             
@@ -0,0 +1,302 @@
+"""
+Streaming Indicator Engine
+Incremental version of IndianTradingBot.calculate_indicators()
+
+Keeps per-symbol recurrence state (EMAs, MACD, rolling TR/ATR and RSI
+windows) so each newly closed bar costs O(1) instead of recomputing every
+indicator over the whole analysis window on every loop.
+"""
+
+import math
+from collections import deque
+from typing import Dict, List, Optional
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Columns added by IndianTradingBot.calculate_indicators(), in the same order
+INDICATOR_COLUMNS = [
+    'fast_ma', 'slow_ma', 'ema6', 'ema12', 'roc3',
+    'high_low', 'high_close', 'low_close', 'tr', 'atr',
+    'rsi', 'macd', 'macd_signal', 'macd_histogram',
+    'ma_trend', 'ma_cross',
+]
+
+
+def _ewm_alpha(span: int) -> float:
+    """Smoothing factor derived exactly the way pandas does for ewm(span=...)"""
+    com = (span - 1) / 2.0
+    return 1.0 / (1.0 + com)
+
+
+def _ewm_step(prev: float, value: float, alpha: float) -> float:
+    """One step of pandas' ewm(adjust=False).mean() recurrence"""
+    if math.isnan(prev):
+        return value
+    if math.isnan(value) or prev == value:
+        return prev
+    old_wt = 1.0 - alpha
+    return (old_wt * prev + alpha * value) / (old_wt + alpha)
+
+
+def _window_mean(window: deque, period: int) -> float:
+    """Mean of a full rolling window, NaN until the window is filled"""
+    if len(window) < period:
+        return float('nan')
+    return math.fsum(window) / period
+
+
+class _IndicatorState:
+    """Recurrence state after the last committed bar"""
+
+    def __init__(self, roc_period: int, atr_period: int, rsi_period: int):
+        self.ema: Dict[str, float] = {}
+        self.prev_close = float('nan')
+        self.prev_fast = float('nan')
+        self.prev_slow = float('nan')
+        self.closes = deque(maxlen=roc_period + 1)
+        self.tr_window = deque(maxlen=atr_period)
+        self.gain_window = deque(maxlen=rsi_period)
+        self.loss_window = deque(maxlen=rsi_period)
+
+    def copy(self) -> '_IndicatorState':
+        clone = _IndicatorState.__new__(_IndicatorState)
+        clone.ema = dict(self.ema)
+        clone.prev_close = self.prev_close
+        clone.prev_fast = self.prev_fast
+        clone.prev_slow = self.prev_slow
+        clone.closes = deque(self.closes, maxlen=self.closes.maxlen)
+        clone.tr_window = deque(self.tr_window, maxlen=self.tr_window.maxlen)
+        clone.gain_window = deque(self.gain_window, maxlen=self.gain_window.maxlen)
+        clone.loss_window = deque(self.loss_window, maxlen=self.loss_window.maxlen)
+        return clone
+
+
+class StreamingIndicators:
+    """
+    Per-symbol incremental indicator calculator
+
+    Produces the same columns as IndianTradingBot.calculate_indicators().
+    Closed bars are committed to the recurrence state once; the newest bar
+    of every update is treated as still forming and is evaluated
+    provisionally, so it can be revised by the next fetch without
+    corrupting the state.
+
+    Usage::
+
+        stream = StreamingIndicators(fast_ma_period=10, slow_ma_period=21)
+        stream.seed(df)                 # full history once
+        stream.update(latest_bars_df)   # afterwards, only the last few bars
+        df = stream.to_frame()
+    """
+
+    def __init__(
+        self,
+        fast_ma_period: int = 10,
+        slow_ma_period: int = 21,
+        ema_micro_fast: int = 6,
+        ema_micro_slow: int = 12,
+        roc_period: int = 3,
+        atr_period: int = 14,
+        rsi_period: int = 14,
+        macd_fast: int = 12,
+        macd_slow: int = 26,
+        macd_signal: int = 9,
+        max_bars: int = 200,
+    ):
+        """
+        Initialize the streaming indicator engine
+
+        Args:
+            fast_ma_period / slow_ma_period: Trend EMA spans
+            ema_micro_fast / ema_micro_slow: Early-signal EMA spans
+            roc_period: Rate-of-change lookback in bars
+            atr_period: ATR rolling window
+            rsi_period: RSI rolling window
+            macd_fast / macd_slow / macd_signal: MACD spans
+            max_bars: Number of bars kept for to_frame()
+        """
+        if max_bars < 1:
+            raise ValueError("max_bars must be at least 1")
+
+        self.roc_period = roc_period
+        self.atr_period = atr_period
+        self.rsi_period = rsi_period
+        self.max_bars = max_bars
+        self.alphas = {
+            'fast_ma': _ewm_alpha(fast_ma_period),
+            'slow_ma': _ewm_alpha(slow_ma_period),
+            'ema6': _ewm_alpha(ema_micro_fast),
+            'ema12': _ewm_alpha(ema_micro_slow),
+            'macd_fast': _ewm_alpha(macd_fast),
+            'macd_slow': _ewm_alpha(macd_slow),
+            'macd_signal': _ewm_alpha(macd_signal),
+        }
+        self.reset()
+
+    def reset(self):
+        """Drop all state and buffered bars"""
+        self._state = _IndicatorState(self.roc_period, self.atr_period, self.rsi_period)
+        self._rows: deque = deque(maxlen=self.max_bars)
+        self._pending: Optional[Dict] = None
+        self._base_columns: List[str] = []
+        self.last_time = None
+        self.bar_count = 0
+
+    # ------------------------------------------------------------------
+    # Feeding bars
+    # ------------------------------------------------------------------
+
+    def seed(self, df: pd.DataFrame) -> int:
+        """
+        Reset and load a full history frame
+
+        Returns:
+            Number of bars committed
+        """
+        self.reset()
+        return self.update(df)
+
+    def covers(self, df: pd.DataFrame) -> bool:
+        """
+        Check that df overlaps the last committed bar
+
+        A frame starting after the last committed bar means bars were missed
+        (e.g. the bot was paused) and the stream has to be re-seeded.
+        """
+        if self.last_time is None or df is None or len(df) == 0:
+            return True
+        return df['time'].iloc[0] <= self.last_time
+
+    def update(self, df: pd.DataFrame) -> int:
+        """
+        Append bars newer than the last committed bar
+
+        Every new bar except the last is committed; the last one is kept as
+        the provisional (still forming) bar.
+
+        Args:
+            df: OHLCV frame sorted by time, overlapping the stream
+
+        Returns:
+            Number of bars committed
+        """
+        if df is None or len(df) == 0:
+            return 0
+
+        if not self._base_columns:
+            self._base_columns = list(df.columns)
+
+        new_bars = df if self.last_time is None else df[df['time'] > self.last_time]
+        if len(new_bars) == 0:
+            return 0
+
+        records = new_bars[self._base_columns].to_dict('records')
+        for bar in records[:-1]:
+            row = self._advance(self._state, bar)
+            self._rows.append(row)
+            self.last_time = bar['time']
+            self.bar_count += 1
+
+        last_bar = records[-1]
+        self._pending = self._advance(self._state.copy(), last_bar)
+        return len(records) - 1
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def latest(self) -> Optional[Dict]:
+        """Indicator row for the most recent bar (provisional if forming)"""
+        if self._pending is not None:
+            return self._pending
+        return self._rows[-1] if self._rows else None
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Buffered bars plus the provisional bar as a DataFrame
+
+        Matches the layout returned by IndianTradingBot.calculate_indicators().
+        """
+        rows = list(self._rows)
+        if self._pending is not None:
+            rows.append(self._pending)
+        columns = self._base_columns + [c for c in INDICATOR_COLUMNS if c not in self._base_columns]
+        return pd.DataFrame.from_records(rows, columns=columns)
+
+    # ------------------------------------------------------------------
+    # Recurrences
+    # ------------------------------------------------------------------
+
+    def _advance(self, state: _IndicatorState, bar: Dict) -> Dict:
+        """Feed one bar into state and return its indicator row"""
+        close = float(bar['close'])
+        high = float(bar['high'])
+        low = float(bar['low'])
+        prev_close = state.prev_close
+        row = dict(bar)
+
+        # EMAs
+        for name in ('fast_ma', 'slow_ma', 'ema6', 'ema12', 'macd_fast', 'macd_slow'):
+            state.ema[name] = _ewm_step(state.ema.get(name, float('nan')), close, self.alphas[name])
+        fast_ma = state.ema['fast_ma']
+        slow_ma = state.ema['slow_ma']
+        row['fast_ma'] = fast_ma
+        row['slow_ma'] = slow_ma
+        row['ema6'] = state.ema['ema6']
+        row['ema12'] = state.ema['ema12']
+
+        # Rate of change over roc_period bars
+        state.closes.append(close)
+        if len(state.closes) == state.closes.maxlen:
+            row['roc3'] = (close / state.closes[0] - 1) * 100
+        else:
+            row['roc3'] = float('nan')
+
+        # True range and ATR
+        high_low = high - low
+        high_close = abs(high - prev_close)
+        low_close = abs(low - prev_close)
+        tr = max(v for v in (high_low, high_close, low_close) if not math.isnan(v))
+        row['high_low'] = high_low
+        row['high_close'] = high_close
+        row['low_close'] = low_close
+        row['tr'] = tr
+        state.tr_window.append(tr)
+        row['atr'] = _window_mean(state.tr_window, self.atr_period)
+
+        # RSI from rolling mean gain/loss
+        delta = close - prev_close
+        state.gain_window.append(delta if delta > 0 else 0.0)
+        state.loss_window.append(-delta if delta < 0 else 0.0)
+        avg_gain = _window_mean(state.gain_window, self.rsi_period)
+        avg_loss = _window_mean(state.loss_window, self.rsi_period)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rs = np.float64(avg_gain) / np.float64(avg_loss)
+        row['rsi'] = float(100 - (100 / (1 + rs)))
+
+        # MACD
+        macd = state.ema['macd_fast'] - state.ema['macd_slow']
+        state.ema['macd_signal'] = _ewm_step(
+            state.ema.get('macd_signal', float('nan')), macd, self.alphas['macd_signal']
+        )
+        row['macd'] = macd
+        row['macd_signal'] = state.ema['macd_signal']
+        row['macd_histogram'] = macd - state.ema['macd_signal']
+
+        # Trend direction and crossovers
+        row['ma_trend'] = 1 if fast_ma > slow_ma else -1
+        if fast_ma > slow_ma and state.prev_fast <= state.prev_slow:
+            row['ma_cross'] = 1
+        elif fast_ma < slow_ma and state.prev_fast >= state.prev_slow:
+            row['ma_cross'] = -1
+        else:
+            row['ma_cross'] = 0
+
+        state.prev_close = close
+        state.prev_fast = fast_ma
+        state.prev_slow = slow_ma
+        return row
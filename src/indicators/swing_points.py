@@ -0,0 +1,120 @@
+"""
+Swing Point Detection
+Vectorized pivot highs/lows shared by the trend analyzers
+
+A bar is a swing high when it is above (or, non-strict, not below) the
+highest value of the ``strength`` bars on each side; swing lows mirror
+this. Instead of a nested loop per bar, the left and right neighbourhood
+extremes come from one sliding-window max/min each.
+
+TrendlineAnalyzer, MarketStructureAnalyzer, DivergenceDetector and
+TrendDetectionEngine all ask for pivots on the same frame during one
+analysis, so results are memoized by (values, strength, type, strictness).
+The key is the content of the values, which makes cached results valid for
+copies and slices of the frame and never stale.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Distinct series kept in the memo (a few columns x strengths per symbol)
+MAX_CACHE_ENTRIES = 256
+
+_cache: "OrderedDict[Tuple, np.ndarray]" = OrderedDict()
+_cache_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0}
+
+
+def find_swing_indices(values, strength: int, swing_type: str, strict: bool = True) -> np.ndarray:
+    """
+    Positions of swing highs or lows in a series
+
+    Args:
+        values: Price or indicator values (array-like)
+        strength: Bars on each side that must be exceeded
+        swing_type: 'high' or 'low'
+        strict: True requires strictly higher/lower than every neighbour
+            (ties disqualify); False allows equal neighbours
+
+    Returns:
+        Read-only array of integer positions in ascending order. NaN values
+        are never swing points and NaN neighbours are ignored.
+    """
+    if swing_type not in ('high', 'low'):
+        raise ValueError(f"swing_type must be 'high' or 'low', got {swing_type!r}")
+
+    values = np.ascontiguousarray(values, dtype=float)
+    strength = int(strength)
+    key = (
+        swing_type, strength, bool(strict), len(values),
+        hashlib.blake2b(values.tobytes(), digest_size=16).digest(),
+    )
+
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+            _stats['hits'] += 1
+            return cached
+        _stats['misses'] += 1
+
+    result = _detect(values, strength, swing_type == 'high', strict)
+    result.flags.writeable = False
+
+    with _cache_lock:
+        _cache[key] = result
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_CACHE_ENTRIES:
+            _cache.popitem(last=False)
+    return result
+
+
+def _detect(values: np.ndarray, strength: int, highest: bool, strict: bool) -> np.ndarray:
+    n = len(values)
+    if n < 2 * strength + 1:
+        return np.empty(0, dtype=np.intp)
+
+    valid = ~np.isnan(values)
+    if strength < 1:
+        return np.flatnonzero(valid)
+
+    # NaN neighbours must never win the comparison
+    filled = np.where(valid, values, -np.inf if highest else np.inf)
+    windows = sliding_window_view(filled, strength)
+    side = windows.max(axis=1) if highest else windows.min(axis=1)
+
+    centers = np.arange(strength, n - strength)
+    left = side[centers - strength]     # bars i-strength .. i-1
+    right = side[centers + 1]           # bars i+1 .. i+strength
+    current = values[centers]
+
+    if highest:
+        neighbours = np.maximum(left, right)
+        is_swing = current > neighbours if strict else (current >= left) & (current >= right)
+    else:
+        neighbours = np.minimum(left, right)
+        is_swing = current < neighbours if strict else (current <= left) & (current <= right)
+
+    if not strict:
+        # Like pandas max()/min(), an all-NaN side compares as NaN (no swing)
+        is_swing &= np.isfinite(left) & np.isfinite(right)
+
+    return centers[is_swing & valid[centers]]
+
+
+def clear_swing_cache():
+    """Drop memoized results"""
+    with _cache_lock:
+        _cache.clear()
+        _stats['hits'] = 0
+        _stats['misses'] = 0
+
+
+def get_swing_cache_stats() -> Dict[str, int]:
+    with _cache_lock:
+        return {'entries': len(_cache), 'hits': _stats['hits'], 'misses': _stats['misses']}
@@ -2,7 +2,11 @@
 Backtest Database Manager
 =========================
 SQLite persistence for backtest and forward-test runs.
-Tables: backtest_runs, backtest_trades, backtest_metrics
+Tables: backtest_runs, backtest_trades, backtest_metrics, backtest_series
+
+Equity curves are stored column-wise in backtest_series: the timestamps as
+zlib-compressed text and the equity values as a zlib-compressed float64
+array. Runs saved before that table existed keep their JSON equity_curve.
 """
 
 import csv
@@ -10,9 +14,56 @@ import io
 import json
 import sqlite3
 import os
+import zlib
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Default number of points returned for an equity chart
+DEFAULT_CHART_POINTS = 2000
+
+
+def _encode_equity_curve(equity_curve: List[Dict]) -> Tuple[bytes, bytes]:
+    """Split an equity curve into compressed time and equity columns."""
+    times = "\n".join(str(point["time"]) for point in equity_curve)
+    equity = np.fromiter((point["equity"] for point in equity_curve),
+                         dtype="<f8", count=len(equity_curve))
+    return zlib.compress(times.encode("utf-8")), zlib.compress(equity.tobytes())
+
+
+def _decode_equity_curve(times_blob: bytes, equity_blob: bytes) -> Tuple[List[str], np.ndarray]:
+    """Inverse of _encode_equity_curve."""
+    equity = np.frombuffer(zlib.decompress(equity_blob), dtype="<f8")
+    times = zlib.decompress(times_blob).decode("utf-8").split("\n") if len(equity) else []
+    return times, equity
+
+
+def downsample_min_max(equity: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Indices of a min/max downsampled series.
+
+    The series is cut into buckets and the lowest and highest point of
+    each bucket are kept, so peaks and drawdowns survive the reduction.
+    The first and last points are always kept.
+    """
+    n = len(equity)
+    if max_points <= 0 or n <= max_points:
+        return np.arange(n)
+
+    buckets = max(1, (max_points - 2) // 2)
+    edges = np.linspace(1, n - 1, buckets + 1).astype(int)
+    keep = [0]
+    for start, end in zip(edges[:-1], edges[1:]):
+        if end <= start:
+            continue
+        chunk = equity[start:end]
+        low = start + int(np.argmin(chunk))
+        high = start + int(np.argmax(chunk))
+        keep.extend(sorted({low, high}))
+    keep.append(n - 1)
+    return np.asarray(keep)
 
 
 class BacktestDatabaseManager:
@@ -95,8 +146,17 @@ class BacktestDatabaseManager:
                     FOREIGN KEY (run_id) REFERENCES backtest_runs(id)
                 );
 
+                CREATE TABLE IF NOT EXISTS backtest_series (
+                    run_id          TEXT PRIMARY KEY,
+                    points          INTEGER NOT NULL,
+                    times           BLOB NOT NULL,
+                    equity          BLOB NOT NULL,
+                    FOREIGN KEY (run_id) REFERENCES backtest_runs(id)
+                );
+
                 CREATE INDEX IF NOT EXISTS idx_bt_runs_created ON backtest_runs(created_at DESC);
                 CREATE INDEX IF NOT EXISTS idx_bt_trades_run ON backtest_trades(run_id);
+                CREATE INDEX IF NOT EXISTS idx_bt_trades_run_entry ON backtest_trades(run_id, entry_time);
                 CREATE INDEX IF NOT EXISTS idx_bt_metrics_run ON backtest_metrics(run_id);
             """)
             conn.commit()
@@ -139,9 +199,16 @@ class BacktestDatabaseManager:
                     result.error,
                     result.duration_seconds,
                     result.created_at,
-                    json.dumps(result.equity_curve),
+                    None,
                 ))
 
+                # Equity curve, column-wise
+                times_blob, equity_blob = _encode_equity_curve(result.equity_curve or [])
+                conn.execute("""
+                    INSERT OR REPLACE INTO backtest_series (run_id, points, times, equity)
+                    VALUES (?,?,?,?)
+                """, (result.run_id, len(result.equity_curve or []), times_blob, equity_blob))
+
                 # Trades
                 if result.trades:
                     conn.executemany("""
@@ -231,7 +298,21 @@ class BacktestDatabaseManager:
             print(f"[BacktestDB] Error listing runs: {e}")
             return []
 
-    def get_run(self, run_id: str) -> Optional[Dict]:
+    def get_run(self, run_id: str, max_points: Optional[int] = None,
+                trade_limit: Optional[int] = None) -> Optional[Dict]:
+        """
+        Load a run with its equity curve, trades and per-symbol metrics.
+
+        Args:
+            run_id: Run to load
+            max_points: Downsample the equity curve to about this many points
+                        (None returns every point)
+            trade_limit: Return only the first trade_limit trades; the rest
+                         can be paged with get_trades (None returns all)
+
+        The full point and trade counts are returned as equity_points and
+        trades_total.
+        """
         try:
             with self._connect() as conn:
                 row = conn.execute(
@@ -242,14 +323,19 @@ class BacktestDatabaseManager:
                 d = dict(row)
                 d["symbols"] = json.loads(d.get("symbols") or "[]")
                 d["config"] = json.loads(d.get("config") or "{}")
-                d["equity_curve"] = json.loads(d.get("equity_curve") or "[]")
+
+                series = conn.execute(
+                    "SELECT times, equity FROM backtest_series WHERE run_id=?", (run_id,)
+                ).fetchone()
+                d["equity_curve"], d["equity_points"] = self._load_equity_curve(
+                    series, d.get("equity_curve"), max_points
+                )
 
                 # Trades
-                trades = conn.execute(
-                    "SELECT * FROM backtest_trades WHERE run_id=? ORDER BY entry_time",
-                    (run_id,)
-                ).fetchall()
-                d["trades"] = [dict(t) for t in trades]
+                d["trades"] = self._query_trades(conn, run_id, trade_limit, 0)
+                d["trades_total"] = conn.execute(
+                    "SELECT COUNT(*) FROM backtest_trades WHERE run_id=?", (run_id,)
+                ).fetchone()[0]
 
                 # Metrics
                 metrics = conn.execute(
@@ -262,11 +348,68 @@ class BacktestDatabaseManager:
             print(f"[BacktestDB] Error getting run {run_id}: {e}")
             return None
 
+    def get_equity_curve(self, run_id: str,
+                         max_points: Optional[int] = DEFAULT_CHART_POINTS) -> Optional[Dict]:
+        """Equity curve of a run, downsampled to about max_points for charts."""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT equity_curve FROM backtest_runs WHERE id=?", (run_id,)
+                ).fetchone()
+                if not row:
+                    return None
+                series = conn.execute(
+                    "SELECT times, equity FROM backtest_series WHERE run_id=?", (run_id,)
+                ).fetchone()
+                curve, points = self._load_equity_curve(series, row["equity_curve"], max_points)
+                return {"equity_curve": self._clean_metrics(curve), "equity_points": points}
+        except Exception as e:
+            print(f"[BacktestDB] Error getting equity curve {run_id}: {e}")
+            return None
+
+    def get_trades(self, run_id: str, limit: int = 100, offset: int = 0) -> Dict:
+        """One page of a run's trades, ordered by entry time."""
+        try:
+            with self._connect() as conn:
+                trades = self._query_trades(conn, run_id, limit, offset)
+                total = conn.execute(
+                    "SELECT COUNT(*) FROM backtest_trades WHERE run_id=?", (run_id,)
+                ).fetchone()[0]
+                return {"trades": self._clean_metrics(trades), "total": total,
+                        "limit": limit, "offset": offset}
+        except Exception as e:
+            print(f"[BacktestDB] Error getting trades {run_id}: {e}")
+            return {"trades": [], "total": 0, "limit": limit, "offset": offset}
+
+    def _query_trades(self, conn, run_id: str, limit: Optional[int], offset: int) -> List[Dict]:
+        query = "SELECT * FROM backtest_trades WHERE run_id=? ORDER BY entry_time, id"
+        params: List[Any] = [run_id]
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+        return [dict(t) for t in conn.execute(query, params).fetchall()]
+
+    def _load_equity_curve(self, series, legacy_json: Optional[str],
+                           max_points: Optional[int]) -> Tuple[List[Dict], int]:
+        """Decode the stored curve (columnar or legacy JSON) and downsample it."""
+        if series is not None:
+            times, equity = _decode_equity_curve(series["times"], series["equity"])
+        else:
+            legacy = json.loads(legacy_json or "[]")
+            times = [point["time"] for point in legacy]
+            equity = np.array([point["equity"] for point in legacy], dtype=float)
+
+        indices = downsample_min_max(equity, max_points) if max_points else np.arange(len(equity))
+        values = equity[indices].tolist()
+        curve = [{"time": times[i], "equity": v} for i, v in zip(indices.tolist(), values)]
+        return curve, len(equity)
+
     def delete_run(self, run_id: str) -> bool:
         try:
             with self._connect() as conn:
                 conn.execute("DELETE FROM backtest_trades WHERE run_id=?", (run_id,))
                 conn.execute("DELETE FROM backtest_metrics WHERE run_id=?", (run_id,))
+                conn.execute("DELETE FROM backtest_series WHERE run_id=?", (run_id,))
                 conn.execute("DELETE FROM backtest_runs WHERE id=?", (run_id,))
                 conn.commit()
             return True
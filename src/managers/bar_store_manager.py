@@ -0,0 +1,166 @@
+"""
+Bar Store Manager
+=================
+On-disk OHLCV cache keyed by (instrument token, interval).
+
+Lets broker adapters request only the bars newer than the last stored
+timestamp instead of re-downloading the whole lookback window on every
+call. Table: bars
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Optional
+
+import pandas as pd
+
+
+class BarStoreManager:
+    """SQLite persistence for historical OHLCV bars."""
+
+    # Bars kept per (token, interval) after pruning
+    DEFAULT_MAX_BARS = 10_000
+
+    def __init__(self, db_path: str = "data/cache/bars.db", max_bars: int = DEFAULT_MAX_BARS):
+        self.db_path = db_path
+        self.max_bars = max_bars
+        self._write_lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._init_schema()
+
+    # ------------------------------------------------------------------
+    # Schema
+    # ------------------------------------------------------------------
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def _init_schema(self):
+        with self._connect() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS bars (
+                    token       INTEGER NOT NULL,
+                    interval    TEXT NOT NULL,
+                    time        TEXT NOT NULL,
+                    open        REAL NOT NULL,
+                    high        REAL NOT NULL,
+                    low         REAL NOT NULL,
+                    close       REAL NOT NULL,
+                    volume      INTEGER NOT NULL,
+                    PRIMARY KEY (token, interval, time)
+                ) WITHOUT ROWID;
+            """)
+            conn.commit()
+
+    # ------------------------------------------------------------------
+    # Read
+    # ------------------------------------------------------------------
+
+    def get_last_time(self, token: int, interval: str) -> Optional[datetime]:
+        """Timestamp of the newest stored bar, or None when nothing is stored."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT MAX(time) FROM bars WHERE token = ? AND interval = ?",
+                (token, interval),
+            ).fetchone()
+        if not row or row[0] is None:
+            return None
+        return pd.Timestamp(row[0]).to_pydatetime()
+
+    def count_bars(self, token: int, interval: str) -> int:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM bars WHERE token = ? AND interval = ?",
+                (token, interval),
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    def get_bars(self, token: int, interval: str, limit: int) -> pd.DataFrame:
+        """
+        Return the newest ``limit`` bars in ascending time order.
+
+        Columns: time, open, high, low, close, volume
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT time, open, high, low, close, volume FROM (
+                    SELECT time, open, high, low, close, volume FROM bars
+                    WHERE token = ? AND interval = ?
+                    ORDER BY time DESC LIMIT ?
+                ) ORDER BY time ASC
+                """,
+                (token, interval, int(limit)),
+            ).fetchall()
+
+        df = pd.DataFrame(rows, columns=["time", "open", "high", "low", "close", "volume"])
+        df["time"] = pd.to_datetime(df["time"])
+        df["volume"] = df["volume"].astype(int)
+        return df
+
+    # ------------------------------------------------------------------
+    # Write
+    # ------------------------------------------------------------------
+
+    def save_bars(self, token: int, interval: str, df: pd.DataFrame) -> int:
+        """
+        Insert or replace bars (the newest stored bar may still have been forming).
+
+        Returns:
+            Number of rows written
+        """
+        if df is None or df.empty:
+            return 0
+
+        rows = [
+            (
+                token,
+                interval,
+                pd.Timestamp(t).isoformat(),
+                float(o), float(h), float(l), float(c), int(v),
+            )
+            for t, o, h, l, c, v in zip(
+                df["time"], df["open"], df["high"], df["low"], df["close"], df["volume"]
+            )
+        ]
+
+        with self._write_lock, self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO bars
+                (token, interval, time, open, high, low, close, volume)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            self._prune(conn, token, interval)
+            conn.commit()
+        return len(rows)
+
+    def _prune(self, conn, token: int, interval: str):
+        """Keep only the newest max_bars bars for a key."""
+        conn.execute(
+            """
+            DELETE FROM bars WHERE token = ? AND interval = ? AND time < (
+                SELECT time FROM bars WHERE token = ? AND interval = ?
+                ORDER BY time DESC LIMIT 1 OFFSET ?
+            )
+            """,
+            (token, interval, token, interval, self.max_bars - 1),
+        )
+
+    def clear(self, token: Optional[int] = None, interval: Optional[str] = None):
+        """Delete stored bars, optionally for a single key."""
+        query = "DELETE FROM bars WHERE 1=1"
+        params = []
+        if token is not None:
+            query += " AND token = ?"
+            params.append(token)
+        if interval is not None:
+            query += " AND interval = ?"
+            params.append(interval)
+        with self._write_lock, self._connect() as conn:
+            conn.execute(query, params)
+            conn.commit()
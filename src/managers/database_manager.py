@@ -5,39 +5,123 @@ Handles all database operations for log persistence
 
 import sqlite3
 import os
-from datetime import datetime
+import re
+import gzip
+import json
+import time
+import threading
+from collections import OrderedDict, deque
+from contextlib import closing
+from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+LOG_COLUMNS = ('timestamp', 'level', 'logger_name', 'message', 'symbol', 'level_no')
+EXPORT_COLUMNS = ('id',) + LOG_COLUMNS
+
+# Counts beyond this are reported as capped instead of scanned to the end
+MAX_EXACT_COUNT = 100000
+
+# Filter combinations whose counts are kept for incremental updates
+COUNT_CACHE_SIZE = 64
+
+# Rows fetched per step when streaming an export
+EXPORT_FETCH_SIZE = 1000
+
+# Retention deletes and vacuums in steps this size so inserts are not held up
+RETENTION_BATCH_SIZE = 5000
+VACUUM_PAGES_PER_STEP = 2000
+
+# Seconds a connection waits for another connection's lock (sqlite3 default
+# is 5). Other processes and log handlers write through their own
+# connections, and enable_incremental_vacuum on an old database can hold the
+# lock far longer than a retention batch.
+BUSY_TIMEOUT_SECONDS = 60
+
+ARCHIVE_NAME_PATTERN = re.compile(r'^logs-(\d{4}-\d{2}-\d{2})\.jsonl\.gz$')
+ARCHIVE_DAY_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# External-content FTS index over logs, kept in sync by triggers
+FTS_INSERT_TRIGGER = """
+    CREATE TRIGGER IF NOT EXISTS logs_fts_insert AFTER INSERT ON logs BEGIN
+        INSERT INTO logs_fts(rowid, message, logger_name) VALUES (new.id, new.message, new.logger_name);
+    END
+"""
+FTS_DELETE_TRIGGER = """
+    CREATE TRIGGER IF NOT EXISTS logs_fts_delete AFTER DELETE ON logs BEGIN
+        INSERT INTO logs_fts(logs_fts, rowid, message, logger_name)
+        VALUES ('delete', old.id, old.message, old.logger_name);
+    END
+"""
 
 
 class LogDatabaseManager:
     """
     Manager for the SQLite log database.
     Provides thread-safe access to log storage and retrieval.
+    
+    Writes go through one long-lived connection guarded by a lock; reads
+    open their own connections, which WAL mode lets run alongside writes.
+    
+    Searches use an FTS5 index over message and logger_name. The trigram
+    tokenizer keeps the substring semantics of the old LIKE search; terms
+    shorter than three characters, or builds without FTS5, fall back to LIKE.
+    
+    Retention treats each calendar day as a partition: whole days past the
+    age or size limit are archived (optionally), deleted in small batches
+    and their pages returned with incremental vacuum.
     """
     
-    def __init__(self, db_path: str = "data/logs.db"):
+    def __init__(self, db_path: str = "data/logs.db", archive_dir: Optional[str] = None,
+                 busy_timeout: float = BUSY_TIMEOUT_SECONDS):
         """
         Initialize the database manager.
         
         Args:
             db_path: Path to the SQLite database file
+            archive_dir: Directory for compressed daily archives (None disables archiving)
+            busy_timeout: Seconds to wait for a lock held by another connection
         """
         self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self.archive_dir = Path(archive_dir) if archive_dir else None
+        self._retention_thread = None
+        self._retention_stop = threading.Event()
+        self.retention_stats = {'runs': 0, 'days_removed': 0, 'rows_deleted': 0, 'rows_archived': 0}
+        self._write_conn = None
+        self._write_lock = threading.Lock()
+        self.fts_tokenizer = None
+        self._count_cache = OrderedDict()
+        self._count_lock = threading.Lock()
         self._ensure_dir()
         self.init_db()
     
     def _ensure_dir(self):
         """Ensure the directory for the database exists"""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
     
     def _get_connection(self):
         """Get a thread-local connection to the database"""
-        return sqlite3.connect(self.db_path)
+        return sqlite3.connect(self.db_path, timeout=self.busy_timeout)
+    
+    def _get_write_connection(self):
+        """Long-lived connection used for inserts (caller holds _write_lock)"""
+        if self._write_conn is None:
+            self._write_conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout,
+                                               check_same_thread=False)
+            self._write_conn.execute("PRAGMA synchronous=NORMAL")
+        return self._write_conn
     
     def init_db(self):
         """Initialize the database schema"""
         with self._get_connection() as conn:
+            # auto_vacuum can only be chosen before the first table is created
+            if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'logs'").fetchone() is None:
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            # WAL lets dashboard reads run while the logging thread writes
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS logs (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -52,8 +136,33 @@ class LogDatabaseManager:
             conn.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON logs(timestamp)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_level ON logs(level)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_symbol ON logs(symbol)")
+            self.fts_tokenizer = self._init_fts(conn)
             conn.commit()
     
+    def _init_fts(self, conn) -> Optional[str]:
+        """Create the FTS index and its triggers; returns the tokenizer in use"""
+        row = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'logs_fts'").fetchone()
+        if row is None:
+            for tokenizer in ('trigram', 'unicode61'):
+                try:
+                    conn.execute(
+                        "CREATE VIRTUAL TABLE logs_fts USING fts5("
+                        "message, logger_name, content='logs', content_rowid='id', "
+                        f"tokenize='{tokenizer}')"
+                    )
+                    break
+                except sqlite3.OperationalError:
+                    continue
+            else:
+                return None
+            # Index rows written before the FTS table existed
+            conn.execute("INSERT INTO logs_fts(logs_fts) VALUES ('rebuild')")
+            row = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'logs_fts'").fetchone()
+        
+        conn.execute(FTS_INSERT_TRIGGER)
+        conn.execute(FTS_DELETE_TRIGGER)
+        return 'trigram' if 'trigram' in row[0] else 'unicode61'
+    
     def insert_log(self, level: str, level_no: int, logger_name: str, message: str, symbol: Optional[str] = None):
         """
         Insert a log record into the database.
@@ -65,55 +174,120 @@ class LogDatabaseManager:
             message: Log message
             symbol: Trading symbol related to the log (optional)
         """
+        self.insert_logs([{
+            'timestamp': datetime.now().isoformat(),
+            'level': level,
+            'logger_name': logger_name,
+            'message': message,
+            'symbol': symbol,
+            'level_no': level_no
+        }])
+    
+    def insert_logs(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert a batch of log records in one transaction.
+        
+        Args:
+            records: Dicts with the LOG_COLUMNS keys; a missing timestamp
+                is filled with the current time
+            
+        Returns:
+            Number of rows written (0 if the batch failed)
+        """
+        now = None
+        rows = []
+        for record in records:
+            timestamp = record.get('timestamp')
+            if timestamp is None:
+                now = now or datetime.now().isoformat()
+                timestamp = now
+            rows.append((timestamp, record['level'], record['logger_name'],
+                         record['message'], record.get('symbol'), record['level_no']))
+        if not rows:
+            return 0
+        
         try:
-            timestamp = datetime.now().isoformat()
-            with self._get_connection() as conn:
-                conn.execute(
-                    "INSERT INTO logs (timestamp, level, logger_name, message, symbol, level_no) VALUES (?, ?, ?, ?, ?, ?)",
-                    (timestamp, level, logger_name, message, symbol, level_no)
-                )
-                conn.commit()
+            with self._write_lock:
+                conn = self._get_write_connection()
+                with conn:
+                    conn.executemany(
+                        "INSERT INTO logs (timestamp, level, logger_name, message, symbol, level_no) VALUES (?, ?, ?, ?, ?, ?)",
+                        rows
+                    )
+            return len(rows)
         except Exception as e:
             # Avoid infinite recursion if logging fails
-            print(f"Error inserting log into DB: {e}")
+            print(f"Error inserting logs into DB: {e}")
+            return 0
+    
+    def close(self):
+        """Close the write connection (reopened on the next insert)"""
+        with self._write_lock:
+            if self._write_conn is not None:
+                self._write_conn.close()
+                self._write_conn = None
+    
+    def _build_filters(self, level: Optional[str], search: Optional[str],
+                       symbol: Optional[str]) -> Tuple[str, List[Any]]:
+        """WHERE clause (without the keyword) and parameters for the log filters"""
+        clauses, params = ["1=1"], []
+        
+        if level:
+            clauses.append("level = ?")
+            params.append(level)
+        
+        if symbol:
+            clauses.append("symbol = ?")
+            params.append(symbol)
+            
+        if search:
+            if self.fts_tokenizer and (self.fts_tokenizer != 'trigram' or len(search) >= 3):
+                # Quoted phrase; trigram phrases match substrings, unicode61 matches token prefixes
+                phrase = '"' + search.replace('"', '""') + '"'
+                if self.fts_tokenizer != 'trigram':
+                    phrase += '*'
+                clauses.append("id IN (SELECT rowid FROM logs_fts WHERE logs_fts MATCH ?)")
+                params.append(phrase)
+            else:
+                clauses.append("(message LIKE ? OR logger_name LIKE ?)")
+                search_param = f"%{search}%"
+                params.extend([search_param, search_param])
+        
+        return " AND ".join(clauses), params
     
     def get_logs(self, limit: int = 100, offset: int = 0, level: Optional[str] = None, 
-                 search: Optional[str] = None, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+                 search: Optional[str] = None, symbol: Optional[str] = None,
+                 before_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Retrieve logs from the database with filtering and pagination.
         
+        Pass the id of the last log on a page as before_id to get the next
+        page; unlike offset, this stays an index seek however deep the page.
+        
         Args:
             limit: Maximum number of logs to return
-            offset: Number of logs to skip
+            offset: Number of logs to skip (ignored when before_id is given)
             level: Filter by log level
             search: Search in message or logger_name
             symbol: Filter by symbol
+            before_id: Only return logs with a smaller id
             
         Returns:
-            List of log dictionaries
+            List of log dictionaries, newest first
         """
-        query = "SELECT id, timestamp, level, logger_name, message, symbol, level_no FROM logs WHERE 1=1"
-        params = []
+        where, params = self._build_filters(level, search, symbol)
+        query = f"SELECT id, timestamp, level, logger_name, message, symbol, level_no FROM logs WHERE {where}"
         
-        if level:
-            query += " AND level = ?"
-            params.append(level)
-        
-        if symbol:
-            query += " AND symbol = ?"
-            params.append(symbol)
-            
-        if search:
-            query += " AND (message LIKE ? OR logger_name LIKE ?)"
-            search_param = f"%{search}%"
-            params.extend([search_param, search_param])
-            
-        query += " ORDER BY id DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
+        if before_id is not None:
+            query += " AND id < ? ORDER BY id DESC LIMIT ?"
+            params.extend([before_id, limit])
+        else:
+            query += " ORDER BY id DESC LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
         
         logs = []
         try:
-            with self._get_connection() as conn:
+            with closing(self._get_connection()) as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.execute(query, params)
                 for row in cursor:
@@ -123,35 +297,335 @@ class LogDatabaseManager:
             
         return logs
 
+    def iter_logs(self, level: Optional[str] = None, search: Optional[str] = None,
+                  symbol: Optional[str] = None, fetch_size: int = EXPORT_FETCH_SIZE) -> Iterator[Tuple]:
+        """
+        Stream every log matching the filters, newest first
+        
+        Rows come from one cursor in fetch_size steps, so memory stays flat
+        whatever the number of rows, and the export sees a single snapshot
+        while new logs keep arriving. The connection is closed when the
+        generator finishes or is closed early.
+        
+        Yields:
+            Row tuples in EXPORT_COLUMNS order
+        """
+        where, params = self._build_filters(level, search, symbol)
+        query = f"SELECT {', '.join(EXPORT_COLUMNS)} FROM logs WHERE {where} ORDER BY id DESC"
+        
+        with closing(self._get_connection()) as conn:
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(fetch_size)
+                if not rows:
+                    return
+                yield from rows
+    
     def get_log_count(self, level: Optional[str] = None, search: Optional[str] = None, 
                      symbol: Optional[str] = None) -> int:
         """Get total count of logs matching filters"""
-        query = "SELECT COUNT(*) FROM logs WHERE 1=1"
-        params = []
+        return self.count_logs(level=level, search=search, symbol=symbol, max_count=None)['total']
+    
+    def count_logs(self, level: Optional[str] = None, search: Optional[str] = None,
+                   symbol: Optional[str] = None, max_count: Optional[int] = MAX_EXACT_COUNT) -> Dict[str, Any]:
+        """
+        Count logs matching filters, reusing earlier counts where possible
         
-        if level:
-            query += " AND level = ?"
-            params.append(level)
+        An exact count is cached per filter combination together with the
+        id range it covered. Later calls only count rows added since; a
+        change in the oldest id (clear or retention) forces a recount.
+        Counts that reach max_count stop there and are flagged as capped.
+        
+        Returns:
+            Dict with 'total' and 'capped'
+        """
+        key = (level or None, search or None, symbol or None)
+        where, params = self._build_filters(level, search, symbol)
         
-        if symbol:
-            query += " AND symbol = ?"
-            params.append(symbol)
-            
-        if search:
-            query += " AND (message LIKE ? OR logger_name LIKE ?)"
-            search_param = f"%{search}%"
-            params.extend([search_param, search_param])
-            
         try:
-            with self._get_connection() as conn:
-                cursor = conn.execute(query, params)
-                return cursor.fetchone()[0]
+            with closing(self._get_connection()) as conn:
+                min_id, max_id = conn.execute("SELECT MIN(id), MAX(id) FROM logs").fetchone()
+                if max_id is None:
+                    return {'total': 0, 'capped': False}
+                
+                with self._count_lock:
+                    cached = self._count_cache.get(key)
+                
+                if cached is not None and cached['min_id'] == min_id and cached['max_id'] <= max_id:
+                    added = conn.execute(
+                        f"SELECT COUNT(*) FROM logs WHERE {where} AND id > ? AND id <= ?",
+                        params + [cached['max_id'], max_id]
+                    ).fetchone()[0]
+                    total = cached['total'] + added
+                elif max_count is None:
+                    total = conn.execute(
+                        f"SELECT COUNT(*) FROM logs WHERE {where} AND id <= ?", params + [max_id]
+                    ).fetchone()[0]
+                else:
+                    total = conn.execute(
+                        f"SELECT COUNT(*) FROM (SELECT 1 FROM logs WHERE {where} AND id <= ? LIMIT ?)",
+                        params + [max_id, max_count + 1]
+                    ).fetchone()[0]
+                    if total > max_count:
+                        return {'total': max_count, 'capped': True}
+            
+            with self._count_lock:
+                self._count_cache[key] = {'total': total, 'min_id': min_id, 'max_id': max_id}
+                self._count_cache.move_to_end(key)
+                while len(self._count_cache) > COUNT_CACHE_SIZE:
+                    self._count_cache.popitem(last=False)
+            return {'total': total, 'capped': False}
         except Exception as e:
             print(f"Error counting logs in DB: {e}")
-            return 0
+            return {'total': 0, 'capped': False}
 
     def clear_logs(self):
         """Clear all logs from the database"""
-        with self._get_connection() as conn:
-            conn.execute("DELETE FROM logs")
-            conn.commit()
+        with self._write_lock:
+            conn = self._get_write_connection()
+            with conn:
+                if self.fts_tokenizer:
+                    # Empty the index in one step rather than row by row through the trigger
+                    conn.execute("DROP TRIGGER IF EXISTS logs_fts_delete")
+                    conn.execute("DELETE FROM logs")
+                    conn.execute("INSERT INTO logs_fts(logs_fts) VALUES ('delete-all')")
+                    conn.execute(FTS_DELETE_TRIGGER)
+                else:
+                    conn.execute("DELETE FROM logs")
+        with self._count_lock:
+            self._count_cache.clear()
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+    
+    def get_database_size_mb(self) -> float:
+        """Size of the pages in use (free pages are excluded)"""
+        with closing(self._get_connection()) as conn:
+            page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+            free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        return (page_count - free_pages) * page_size / 1024 / 1024
+    
+    def get_oldest_day(self) -> Optional[str]:
+        """Day (YYYY-MM-DD) of the oldest stored log"""
+        with closing(self._get_connection()) as conn:
+            row = conn.execute("SELECT substr(timestamp, 1, 10) FROM logs ORDER BY id LIMIT 1").fetchone()
+        return row[0] if row else None
+    
+    def apply_retention(self, max_age_days: Optional[int] = 30, max_size_mb: Optional[float] = None,
+                        batch_size: int = RETENTION_BATCH_SIZE) -> Dict[str, Any]:
+        """
+        Remove whole days of logs past the age or size limit, oldest first
+        
+        Each day is archived first when archive_dir is set, then deleted in
+        batches of batch_size rows and followed by an incremental vacuum.
+        Today's logs are never removed.
+        
+        Args:
+            max_age_days: Keep this many days (None disables the age limit)
+            max_size_mb: Keep the used database size under this (None disables it)
+            batch_size: Rows deleted per transaction
+            
+        Returns:
+            Summary with the removed days and row counts
+        """
+        today = date.today()
+        cutoff = (today - timedelta(days=max_age_days)).isoformat() if max_age_days is not None else None
+        summary = {'days': [], 'rows_deleted': 0, 'rows_archived': 0}
+        
+        while True:
+            day = self.get_oldest_day()
+            if day is None or day >= today.isoformat():
+                break
+            too_old = cutoff is not None and day < cutoff
+            too_big = max_size_mb is not None and self.get_database_size_mb() > max_size_mb
+            if not (too_old or too_big):
+                break
+            
+            try:
+                next_day = (date.fromisoformat(day) + timedelta(days=1)).isoformat()
+            except ValueError:
+                print(f"Log retention stopped at unparseable timestamp day: {day}")
+                break
+            
+            with closing(self._get_connection()) as conn:
+                last_id = conn.execute("SELECT MAX(id) FROM logs WHERE timestamp < ?", (next_day,)).fetchone()[0]
+            if last_id is None:
+                break
+            
+            if self.archive_dir is not None:
+                summary['rows_archived'] += self._archive_through(last_id)
+            summary['rows_deleted'] += self._delete_through(last_id, batch_size)
+            summary['days'].append(day)
+            self.incremental_vacuum()
+        
+        self.retention_stats['runs'] += 1
+        self.retention_stats['days_removed'] += len(summary['days'])
+        self.retention_stats['rows_deleted'] += summary['rows_deleted']
+        self.retention_stats['rows_archived'] += summary['rows_archived']
+        return summary
+    
+    def _archive_through(self, last_id: int) -> int:
+        """Append rows up to last_id to their day's gzip JSON-lines archive"""
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        files = {}
+        archived = 0
+        try:
+            with closing(self._get_connection()) as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.execute(
+                    "SELECT id, timestamp, level, logger_name, message, symbol, level_no "
+                    "FROM logs WHERE id <= ? ORDER BY id", (last_id,)
+                )
+                for row in cursor:
+                    record = dict(row)
+                    day = record['timestamp'][:10]
+                    if day not in files:
+                        # Appending adds a gzip member; readers see one continuous stream
+                        files[day] = gzip.open(self._archive_path(day), 'at', encoding='utf-8')
+                    files[day].write(json.dumps(record) + '\n')
+                    archived += 1
+        finally:
+            for handle in files.values():
+                handle.close()
+        return archived
+    
+    def _delete_through(self, last_id: int, batch_size: int) -> int:
+        """Delete rows up to last_id in short transactions"""
+        deleted = 0
+        while True:
+            with self._write_lock:
+                conn = self._get_write_connection()
+                with conn:
+                    cursor = conn.execute(
+                        "DELETE FROM logs WHERE id IN (SELECT id FROM logs WHERE id <= ? ORDER BY id LIMIT ?)",
+                        (last_id, batch_size)
+                    )
+            deleted += cursor.rowcount
+            if cursor.rowcount < batch_size:
+                return deleted
+            # Release the database lock so writers on other connections
+            # (log handlers, other processes) get in between batches
+            time.sleep(0.01)
+    
+    def enable_incremental_vacuum(self) -> bool:
+        """
+        Switch a database created without incremental auto_vacuum over to it
+        
+        This needs one full VACUUM, which rebuilds the file and holds the
+        database lock for the whole rebuild, so it is a maintenance call
+        (the dashboard runs it once at startup) rather than part of retention.
+        
+        Returns:
+            True if the database was converted
+        """
+        with self._write_lock:
+            conn = self._get_write_connection()
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+                return False
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("VACUUM")
+            return True
+    
+    def incremental_vacuum(self, pages_per_step: int = VACUUM_PAGES_PER_STEP):
+        """
+        Return free pages to the file system a step at a time
+        
+        Databases without incremental auto_vacuum keep their free pages for
+        reuse by new inserts until enable_incremental_vacuum converts them.
+        """
+        while True:
+            with self._write_lock:
+                conn = self._get_write_connection()
+                if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                    return
+                if conn.execute("PRAGMA freelist_count").fetchone()[0] == 0:
+                    return
+                conn.execute(f"PRAGMA incremental_vacuum({int(pages_per_step)})").fetchall()
+    
+    def start_retention(self, interval_seconds: float = 3600, initial_delay: float = 60,
+                        **policy):
+        """
+        Run apply_retention on a daemon thread every interval_seconds
+        
+        Args:
+            interval_seconds: Time between runs
+            initial_delay: Time before the first run
+            **policy: Arguments for apply_retention
+        """
+        if self._retention_thread is not None and self._retention_thread.is_alive():
+            return
+        self._retention_stop.clear()
+        
+        def run():
+            delay = initial_delay
+            while not self._retention_stop.wait(delay):
+                try:
+                    self.apply_retention(**policy)
+                except Exception as e:
+                    print(f"Error applying log retention: {e}")
+                delay = interval_seconds
+        
+        self._retention_thread = threading.Thread(target=run, name="log-retention", daemon=True)
+        self._retention_thread.start()
+    
+    def stop_retention(self, timeout: float = 5.0):
+        """Stop the retention thread"""
+        self._retention_stop.set()
+        if self._retention_thread is not None:
+            self._retention_thread.join(timeout)
+            self._retention_thread = None
+    
+    # ------------------------------------------------------------------
+    # Archives
+    # ------------------------------------------------------------------
+    
+    def _archive_path(self, day: str) -> Path:
+        return self.archive_dir / f"logs-{day}.jsonl.gz"
+    
+    def list_archives(self) -> List[Dict[str, Any]]:
+        """Archived days, newest first"""
+        if self.archive_dir is None or not self.archive_dir.exists():
+            return []
+        archives = []
+        for path in self.archive_dir.iterdir():
+            match = ARCHIVE_NAME_PATTERN.match(path.name)
+            if match:
+                archives.append({'date': match.group(1), 'size_bytes': path.stat().st_size})
+        return sorted(archives, key=lambda a: a['date'], reverse=True)
+    
+    def query_archive(self, day: str, limit: int = 100, offset: int = 0, level: Optional[str] = None,
+                      search: Optional[str] = None, symbol: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Read one archived day with the same filters as get_logs
+        
+        The file is streamed and only the newest offset + limit matches are
+        held in memory.
+        
+        Returns:
+            Dict with 'logs' (newest first) and 'total' matches
+        """
+        if self.archive_dir is None or not ARCHIVE_DAY_PATTERN.match(day or ''):
+            return {'logs': [], 'total': 0}
+        path = self._archive_path(day)
+        if not path.exists():
+            return {'logs': [], 'total': 0}
+        
+        needle = search.lower() if search else None
+        newest = deque(maxlen=offset + limit)
+        total = 0
+        with gzip.open(path, 'rt', encoding='utf-8') as handle:
+            for line in handle:
+                record = json.loads(line)
+                if level and record['level'] != level:
+                    continue
+                if symbol and record['symbol'] != symbol:
+                    continue
+                if needle and needle not in record['message'].lower() and needle not in record['logger_name'].lower():
+                    continue
+                total += 1
+                newest.append(record)
+        
+        logs = list(reversed(newest))[offset:offset + limit]
+        return {'logs': logs, 'total': total}
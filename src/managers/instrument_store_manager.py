@@ -0,0 +1,167 @@
+"""
+Instrument Store Manager
+========================
+On-disk copy of the broker's daily instrument dump.
+
+The bot and the dashboard both read instruments from this SQLite file, so
+the dump is downloaded once per trading day instead of on every connect.
+Lookups are primary-key reads through a memory-mapped connection; nothing
+is parsed up front. Tables: instruments, instrument_meta
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime, date
+from typing import Callable, Dict, Iterable, List, Optional
+
+# Columns kept from kite.instruments(), in table order
+INSTRUMENT_COLUMNS = (
+    "instrument_token", "exchange_token", "tradingsymbol", "name", "exchange",
+    "segment", "instrument_type", "expiry", "strike", "lot_size", "tick_size",
+)
+
+# Read connections map up to this much of the file instead of copying pages
+MMAP_SIZE = 256 * 1024 * 1024
+
+
+class InstrumentStoreManager:
+    """SQLite persistence for the daily instrument dump."""
+
+    def __init__(self, db_path: str = "data/cache/instruments.db"):
+        self.db_path = db_path
+        self._refresh_lock = threading.Lock()
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._init_schema()
+
+    # ------------------------------------------------------------------
+    # Schema
+    # ------------------------------------------------------------------
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def _reader(self):
+        """Per-thread read connection with memory-mapped I/O."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            conn.row_factory = sqlite3.Row
+            conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS instruments (
+                    instrument_token INTEGER NOT NULL,
+                    exchange_token   INTEGER,
+                    tradingsymbol    TEXT NOT NULL,
+                    name             TEXT,
+                    exchange         TEXT NOT NULL,
+                    segment          TEXT,
+                    instrument_type  TEXT,
+                    expiry           TEXT,
+                    strike           REAL,
+                    lot_size         INTEGER,
+                    tick_size        REAL,
+                    PRIMARY KEY (exchange, tradingsymbol)
+                ) WITHOUT ROWID;
+
+                CREATE INDEX IF NOT EXISTS idx_instruments_token ON instruments(instrument_token);
+
+                CREATE TABLE IF NOT EXISTS instrument_meta (
+                    key   TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            """)
+            conn.commit()
+
+    # ------------------------------------------------------------------
+    # Write
+    # ------------------------------------------------------------------
+
+    def replace_all(self, instruments: Iterable[Dict]) -> int:
+        """Replace the stored dump in one transaction. Returns the row count."""
+        rows = [
+            (
+                inst["instrument_token"], inst.get("exchange_token"), inst["tradingsymbol"],
+                inst.get("name") or "", inst["exchange"], inst.get("segment") or "",
+                inst.get("instrument_type") or "",
+                inst["expiry"].isoformat() if hasattr(inst.get("expiry"), "isoformat") else (inst.get("expiry") or ""),
+                inst.get("strike") or 0.0, inst.get("lot_size") or 1, inst.get("tick_size") or 0.05,
+            )
+            for inst in instruments
+        ]
+        with self._connect() as conn:
+            conn.execute("DELETE FROM instruments")
+            conn.executemany(
+                f"INSERT OR REPLACE INTO instruments ({', '.join(INSTRUMENT_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(INSTRUMENT_COLUMNS))})",
+                rows,
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO instrument_meta (key, value) VALUES ('refreshed_at', ?)",
+                (datetime.now().isoformat(),),
+            )
+            conn.commit()
+        return len(rows)
+
+    def ensure_fresh(self, fetch: Callable[[], List[Dict]], force: bool = False) -> bool:
+        """
+        Download the dump with fetch() unless today's copy is already stored.
+
+        Concurrent callers wait for a single download. Returns True if the
+        store was refreshed.
+        """
+        with self._refresh_lock:
+            if not force and self.is_fresh():
+                return False
+            instruments = fetch()
+            if not instruments:
+                return False
+            self.replace_all(instruments)
+            return True
+
+    # ------------------------------------------------------------------
+    # Read
+    # ------------------------------------------------------------------
+
+    def refreshed_at(self) -> Optional[datetime]:
+        row = self._reader().execute(
+            "SELECT value FROM instrument_meta WHERE key='refreshed_at'"
+        ).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def is_fresh(self) -> bool:
+        """True if the dump was stored today."""
+        refreshed = self.refreshed_at()
+        return refreshed is not None and refreshed.date() == date.today()
+
+    def count(self) -> int:
+        return self._reader().execute("SELECT COUNT(*) FROM instruments").fetchone()[0]
+
+    def get(self, exchange: str, tradingsymbol: str) -> Optional[Dict]:
+        row = self._reader().execute(
+            "SELECT * FROM instruments WHERE exchange=? AND tradingsymbol=?",
+            (exchange, tradingsymbol),
+        ).fetchone()
+        return dict(row) if row else None
+
+    def get_by_token(self, instrument_token: int) -> Optional[Dict]:
+        row = self._reader().execute(
+            "SELECT * FROM instruments WHERE instrument_token=?", (instrument_token,)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def get_all(self, exchange: Optional[str] = None) -> List[Dict]:
+        """Every stored instrument (optionally for one exchange), in kite.instruments() form."""
+        query = "SELECT * FROM instruments"
+        params = []
+        if exchange:
+            query += " WHERE exchange=?"
+            params.append(exchange)
+        return [dict(row) for row in self._reader().execute(query, params)]
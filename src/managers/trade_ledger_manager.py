@@ -0,0 +1,240 @@
+"""
+Trade Ledger Manager
+====================
+Persistent record of filled orders for dashboard analytics.
+Tables: ledger_trades, ledger_buckets
+
+Fills are keyed by (source, order_id), so feeding the broker's order book
+in again only writes what changed, and fills from different brokers (paper
+and live) never overwrite or mix with each other. Every write also updates
+ledger_buckets, one row per (source, trade date, hour, symbol) with trade
+counts and P&L sums, so the daily, hourly and per-symbol views read a few
+hundred small rows instead of scanning the fills.
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+BUCKET_COLUMNS = ("trade_date", "hour", "symbol", "trades", "wins", "losses",
+                  "pnl", "gross_profit", "gross_loss")
+
+TRADE_COLUMNS = "order_id, symbol, direction, quantity, price, pnl, timestamp, trade_date, hour"
+
+
+def _fill_pnl(fill: Dict) -> float:
+    return float(fill.get("pnl", 0) or fill.get("profit", 0) or 0)
+
+
+def _fill_timestamp(fill: Dict) -> str:
+    timestamp = fill.get("timestamp") or fill.get("order_timestamp") or fill.get("exit_time")
+    if isinstance(timestamp, datetime):
+        return timestamp.strftime("%Y-%m-%d %H:%M:%S")
+    return str(timestamp) if timestamp else datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _timestamp_hour(timestamp: str) -> int:
+    try:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).hour
+    except ValueError:
+        return 0
+
+
+def normalize_fill(fill: Dict) -> Tuple:
+    """Ledger row for an order/trade dict as returned by the broker adapters."""
+    symbol = fill.get("symbol") or fill.get("tradingsymbol") or "UNKNOWN"
+    timestamp = _fill_timestamp(fill)
+    direction = fill.get("direction") or fill.get("transaction_type") or ""
+    quantity = float(fill.get("filled_quantity") or fill.get("quantity") or 0)
+    price = float(fill.get("average_price") or fill.get("price") or 0)
+    order_id = fill.get("order_id") or f"{symbol}|{timestamp}|{direction}|{quantity:g}|{price:g}"
+    return (str(order_id), symbol, direction, quantity, price, _fill_pnl(fill),
+            timestamp, timestamp[:10], _timestamp_hour(timestamp))
+
+
+class TradeLedgerManager:
+    """SQLite ledger of fills with incrementally maintained aggregates."""
+
+    def __init__(self, db_path: str = "data/trade_ledger.db"):
+        self.db_path = db_path
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._init_schema()
+
+    # ------------------------------------------------------------------
+    # Schema
+    # ------------------------------------------------------------------
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def _reader(self):
+        """Per-thread read connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS ledger_trades (
+                    source     TEXT NOT NULL,
+                    order_id   TEXT NOT NULL,
+                    symbol     TEXT NOT NULL,
+                    direction  TEXT,
+                    quantity   REAL,
+                    price      REAL,
+                    pnl        REAL NOT NULL DEFAULT 0,
+                    timestamp  TEXT NOT NULL,
+                    trade_date TEXT NOT NULL,
+                    hour       INTEGER NOT NULL,
+                    PRIMARY KEY (source, order_id)
+                );
+
+                CREATE INDEX IF NOT EXISTS idx_ledger_trades_date
+                    ON ledger_trades(source, trade_date, timestamp);
+
+                CREATE TABLE IF NOT EXISTS ledger_buckets (
+                    source       TEXT NOT NULL,
+                    trade_date   TEXT NOT NULL,
+                    hour         INTEGER NOT NULL,
+                    symbol       TEXT NOT NULL,
+                    trades       INTEGER NOT NULL DEFAULT 0,
+                    wins         INTEGER NOT NULL DEFAULT 0,
+                    losses       INTEGER NOT NULL DEFAULT 0,
+                    pnl          REAL NOT NULL DEFAULT 0,
+                    gross_profit REAL NOT NULL DEFAULT 0,
+                    gross_loss   REAL NOT NULL DEFAULT 0,
+                    PRIMARY KEY (source, trade_date, hour, symbol)
+                ) WITHOUT ROWID;
+            """)
+            conn.commit()
+
+    # ------------------------------------------------------------------
+    # Write
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _apply_bucket(conn, source: str, row: Tuple, sign: int):
+        """Add (sign=1) or remove (sign=-1) one fill's contribution to its bucket."""
+        pnl, trade_date, hour, symbol = row[5], row[7], row[8], row[1]
+        conn.execute(
+            """INSERT INTO ledger_buckets
+                   (source, trade_date, hour, symbol, trades, wins, losses, pnl, gross_profit, gross_loss)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT (source, trade_date, hour, symbol) DO UPDATE SET
+                   trades = trades + excluded.trades,
+                   wins = wins + excluded.wins,
+                   losses = losses + excluded.losses,
+                   pnl = pnl + excluded.pnl,
+                   gross_profit = gross_profit + excluded.gross_profit,
+                   gross_loss = gross_loss + excluded.gross_loss""",
+            (source, trade_date, hour, symbol, sign, sign * (pnl > 0), sign * (pnl < 0), sign * pnl,
+             sign * max(pnl, 0.0), sign * max(-pnl, 0.0)),
+        )
+
+    def record_fills(self, fills: Iterable[Dict], source: str) -> int:
+        """
+        Add new fills and update changed ones in one transaction.
+
+        source names where the fills come from (e.g. the broker type); order
+        ids only need to be unique within a source.
+
+        Returns the number of fills written; fills already stored unchanged
+        are skipped.
+        """
+        rows = [normalize_fill(fill) for fill in fills]
+        if not rows:
+            return 0
+
+        written = 0
+        with self._write_lock, self._connect() as conn:
+            for row in rows:
+                old = conn.execute(
+                    f"SELECT {TRADE_COLUMNS} FROM ledger_trades WHERE source=? AND order_id=?",
+                    (source, row[0]),
+                ).fetchone()
+                if old == row:
+                    continue
+                if old is not None:
+                    self._apply_bucket(conn, source, old, -1)
+                conn.execute("INSERT OR REPLACE INTO ledger_trades VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                             (source,) + row)
+                self._apply_bucket(conn, source, row, 1)
+                written += 1
+            conn.execute("DELETE FROM ledger_buckets WHERE trades <= 0")
+            conn.commit()
+        return written
+
+    def clear(self):
+        with self._write_lock, self._connect() as conn:
+            conn.execute("DELETE FROM ledger_trades")
+            conn.execute("DELETE FROM ledger_buckets")
+            conn.commit()
+
+    # ------------------------------------------------------------------
+    # Read
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _date_filter(from_date: Optional[str], to_date: Optional[str],
+                     source: Optional[str] = None) -> Tuple[str, List[str]]:
+        clauses, params = [], []
+        if source is not None:
+            clauses.append("source = ?")
+            params.append(source)
+        if from_date:
+            clauses.append("trade_date >= ?")
+            params.append(from_date)
+        if to_date:
+            clauses.append("trade_date <= ?")
+            params.append(to_date)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def count(self, source: Optional[str] = None) -> int:
+        where, params = self._date_filter(None, None, source)
+        return self._reader().execute(f"SELECT COUNT(*) FROM ledger_trades{where}", params).fetchone()[0]
+
+    def get_buckets(self, from_date: Optional[str] = None, to_date: Optional[str] = None,
+                    source: Optional[str] = None) -> List[Dict]:
+        """
+        Aggregate rows per (trade_date, hour, symbol) in the date range.
+
+        Without a source, each source has its own rows for the same bucket.
+        """
+        where, params = self._date_filter(from_date, to_date, source)
+        rows = self._reader().execute(
+            f"SELECT {', '.join(BUCKET_COLUMNS)} FROM ledger_buckets{where} ORDER BY trade_date, hour, symbol",
+            params,
+        ).fetchall()
+        return [dict(zip(BUCKET_COLUMNS, row)) for row in rows]
+
+    def get_pnl_series(self, from_date: Optional[str] = None, to_date: Optional[str] = None,
+                       source: Optional[str] = None) -> Tuple[List[str], np.ndarray]:
+        """Timestamps and P&L of every fill in the date range, oldest first."""
+        where, params = self._date_filter(from_date, to_date, source)
+        rows = self._reader().execute(
+            f"SELECT timestamp, pnl FROM ledger_trades{where} ORDER BY trade_date, timestamp, order_id",
+            params,
+        ).fetchall()
+        if not rows:
+            return [], np.empty(0)
+        timestamps, pnl = zip(*rows)
+        return list(timestamps), np.asarray(pnl, dtype=float)
+
+    def get_trades(self, from_date: Optional[str] = None, to_date: Optional[str] = None,
+                   source: Optional[str] = None) -> List[Dict]:
+        """Stored fills in the date range, oldest first."""
+        where, params = self._date_filter(from_date, to_date, source)
+        conn = self._reader()
+        cursor = conn.execute(f"SELECT * FROM ledger_trades{where} ORDER BY trade_date, timestamp, order_id", params)
+        columns = [col[0] for col in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
@@ -5,47 +5,79 @@ Intercepts log records and stores them in SQLite
 
 import logging
 import threading
-from queue import Queue
-from typing import Optional
+from datetime import datetime
+from queue import Queue, Empty, Full
+from typing import Dict, List, Optional
 from src.managers.database_manager import LogDatabaseManager
 
+# Loggers whose records are never written to the log database
+INTERNAL_LOGGERS = frozenset({
+    "src.database_manager",
+    "src.db_logging_handler",
+    "src.managers.database_manager",
+    "src.utils.db_logging_handler",
+})
+
 
 class DatabaseHandler(logging.Handler):
     """
     Logging handler that sends log records to an SQLite database.
     Uses a background thread to avoid blocking application execution.
+
+    Records are queued by emit() and written by the worker in batches of up
+    to batch_size rows, or whatever has arrived after flush_interval seconds.
+    The queue is bounded; records that do not fit are dropped and counted
+    rather than blocking the caller. A batch that cannot be written (e.g.
+    the database stayed locked past the busy timeout) is retried with
+    backoff before it is counted as failed. close() writes everything
+    still queued.
     """
-    
-    def __init__(self, db_path: str = "data/logs.db", level=logging.NOTSET):
+
+    def __init__(self, db_path: str = "data/logs.db", level=logging.NOTSET,
+                 batch_size: int = 200, flush_interval: float = 0.5,
+                 max_queue_size: int = 10000, max_retries: int = 3,
+                 retry_delay: float = 1.0):
         """
         Initialize the database handler.
-        
+
         Args:
             db_path: Path to the SQLite database
             level: Logging level
+            batch_size: Maximum rows written per transaction
+            flush_interval: Seconds a partial batch may wait before it is written
+            max_queue_size: Records held in memory before new ones are dropped
+            max_retries: Extra attempts for a batch whose write failed
+            retry_delay: Seconds before the first retry, growing linearly
         """
         super().__init__(level)
         self.db_manager = LogDatabaseManager(db_path)
-        self.queue = Queue()
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_retries = max(0, max_retries)
+        self.retry_delay = retry_delay
+        self.queue = Queue(maxsize=max_queue_size)
         self.stop_event = threading.Event()
+        self._batch_ready = threading.Event()
+        self._stats_lock = threading.Lock()
+        self.stats = {'written': 0, 'dropped': 0, 'failed': 0, 'batches': 0, 'retries': 0}
         self.worker_thread = threading.Thread(target=self._worker, daemon=True)
         self.worker_thread.start()
-    
+
     def emit(self, record):
         """
         Queue a log record for insertion into the database.
-        
+
         Args:
             record: The LogRecord to emit
         """
         try:
             # We don't want to log the database operations themselves to the database
-            if record.name == "src.database_manager" or record.name == "src.db_logging_handler":
+            if record.name in INTERNAL_LOGGERS:
                 return
-                
+
             # Extract symbol if present in record attributes (extra)
             symbol = getattr(record, 'symbol', None)
-            
+
             # If not in extra, try to extract from message if it's a known format
             if not symbol and '|' in record.getMessage():
                 parts = record.getMessage().split('|')
@@ -54,44 +86,97 @@ class DatabaseHandler(logging.Handler):
                     # Basic heuristic for symbols (usually uppercase, no spaces, reasonable length)
                     if potential_symbol.isupper() and ' ' not in potential_symbol and 2 <= len(potential_symbol) <= 20:
                         symbol = potential_symbol
-            
-            # Prep the log data
+
+            # Prep the log data (timestamped now, since the batch is written later)
             log_data = {
+                'timestamp': datetime.fromtimestamp(record.created).isoformat(),
                 'level': record.levelname,
                 'level_no': record.levelno,
                 'logger_name': record.name,
                 'message': self.format(record),
                 'symbol': symbol
             }
+
+            try:
+                self.queue.put_nowait(log_data)
+            except Full:
+                with self._stats_lock:
+                    self.stats['dropped'] += 1
+                return
             
-            self.queue.put(log_data)
+            if self.queue.qsize() >= self.batch_size:
+                self._batch_ready.set()
         except Exception:
             self.handleError(record)
-    
+
+    def _next_batch(self) -> List[Dict]:
+        """Collect up to batch_size records, waiting at most flush_interval after the first"""
+        try:
+            batch = [self.queue.get(timeout=self.flush_interval)]
+        except Empty:
+            return []
+
+        # Sleep until a full batch is queued or the interval passes, instead of waking per record
+        if not self.stop_event.is_set() and self.queue.qsize() < self.batch_size - 1:
+            self._batch_ready.wait(self.flush_interval)
+        self._batch_ready.clear()
+
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except Empty:
+                break
+        return batch
+
+    def _write_batch(self, batch: List[Dict]):
+        written = self.db_manager.insert_logs(batch)
+        for attempt in range(self.max_retries):
+            if written:
+                break
+            # Back off (no wait once closing) and try the same batch again
+            self.stop_event.wait(self.retry_delay * (attempt + 1))
+            with self._stats_lock:
+                self.stats['retries'] += 1
+            written = self.db_manager.insert_logs(batch)
+        with self._stats_lock:
+            self.stats['batches'] += 1
+            self.stats['written'] += written
+            self.stats['failed'] += len(batch) - written
+        for _ in batch:
+            self.queue.task_done()
+
     def _worker(self):
-        """Background thread worker that processes the log queue"""
-        while not self.stop_event.is_set():
+        """Background thread worker that writes the log queue in batches"""
+        while not (self.stop_event.is_set() and self.queue.empty()):
             try:
-                # Wait for a log entry with a timeout
-                log_data = self.queue.get(timeout=1.0)
-                
-                # Insert into database
-                self.db_manager.insert_log(
-                    level=log_data['level'],
-                    level_no=log_data['level_no'],
-                    logger_name=log_data['logger_name'],
-                    message=log_data['message'],
-                    symbol=log_data['symbol']
-                )
-                
-                self.queue.task_done()
+                batch = self._next_batch()
+                if batch:
+                    self._write_batch(batch)
             except Exception:
                 # Ignore errors in the worker thread to prevent crashing
                 pass
-                
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Wait until every queued record has been written.
+
+        Returns:
+            True if the queue drained within the timeout
+        """
+        with self.queue.all_tasks_done:
+            return self.queue.all_tasks_done.wait_for(
+                lambda: self.queue.unfinished_tasks == 0, timeout)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Counters for written, dropped, failed and retried records plus the current queue depth"""
+        with self._stats_lock:
+            return {**self.stats, 'queued': self.queue.qsize()}
+
     def close(self):
-        """Shut down the background thread and close the database"""
+        """Write the queued records, shut down the background thread and close the database"""
         self.stop_event.set()
+        self._batch_ready.set()
         if self.worker_thread.is_alive():
-            self.worker_thread.join(timeout=2.0)
+            self.worker_thread.join(timeout=10.0)
+        self.db_manager.close()
         super().close()
@@ -0,0 +1,59 @@
+"""
+Thread-safe rate limiter for broker API calls
+
+Kite Connect allows only a few historical data requests per second, so
+when several symbols are scanned concurrently every worker has to draw
+from one shared budget instead of each keeping its own.
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Token bucket shared between threads"""
+
+    def __init__(self, rate_per_second: float, burst: int = 1):
+        """
+        Initialize the rate limiter
+
+        Args:
+            rate_per_second: Sustained number of calls allowed per second
+                (0 or less disables limiting)
+            burst: Number of calls that may be made back-to-back
+        """
+        self.rate = float(rate_per_second)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    def _refill(self, now: float):
+        elapsed = now - self._last_refill
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._last_refill = now
+
+    def acquire(self) -> float:
+        """
+        Block until a call is allowed
+
+        Returns:
+            Seconds spent waiting
+        """
+        if not self.enabled:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
@@ -0,0 +1,124 @@
+"""
+Tests for the Aroon indicator
+Verifies the vectorized calculation and the incremental stream against the
+original per-bar loop, and benchmarks the speedup on 5,000-bar frames
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.indicators.aroon_indicator import AroonIndicator, AroonStream
+
+
+def create_test_data(bars=500, seed=11, tick=None):
+    """Create a random-walk OHLC frame (optionally rounded to a tick for ties)"""
+    rng = np.random.default_rng(seed)
+    close = 1000 + np.cumsum(rng.normal(0, 2, bars))
+    high = close + np.abs(rng.normal(0, 2, bars))
+    low = close - np.abs(rng.normal(0, 2, bars))
+    if tick:
+        high = np.round(high / tick) * tick
+        low = np.round(low / tick) * tick
+    return pd.DataFrame({'high': high, 'low': low, 'close': close})
+
+
+def loop_aroon(df, period):
+    """Original per-bar implementation, kept as the reference"""
+    aroon_up_values = []
+    aroon_down_values = []
+    for i in range(len(df)):
+        if i < period - 1:
+            aroon_up_values.append(np.nan)
+            aroon_down_values.append(np.nan)
+            continue
+        window_start = i - period + 1
+        window_high = df['high'].iloc[window_start:i+1]
+        window_low = df['low'].iloc[window_start:i+1]
+        high_position = window_high.index.get_loc(window_high.idxmax())
+        low_position = window_low.index.get_loc(window_low.idxmin())
+        periods_since_high = (period - 1) - high_position
+        periods_since_low = (period - 1) - low_position
+        aroon_up_values.append(((period - periods_since_high) / period) * 100)
+        aroon_down_values.append(((period - periods_since_low) / period) * 100)
+    return np.array(aroon_up_values), np.array(aroon_down_values)
+
+
+class TestVectorizedAroon:
+    """calculate_aroon must match the per-bar loop exactly"""
+
+    @pytest.mark.parametrize("period", [1, 5, 14, 25])
+    def test_matches_loop(self, period):
+        df = create_test_data()
+        result = AroonIndicator(period).calculate_aroon(df)
+        expected_up, expected_down = loop_aroon(df, period)
+
+        np.testing.assert_array_equal(result['aroon_up'].to_numpy(), expected_up)
+        np.testing.assert_array_equal(result['aroon_down'].to_numpy(), expected_down)
+        np.testing.assert_array_equal(result['aroon_oscillator'].to_numpy(), expected_up - expected_down)
+
+    def test_ties_use_earliest_bar(self):
+        """Coarse ticks produce equal highs/lows inside a window"""
+        df = create_test_data(tick=5.0)
+        result = AroonIndicator(25).calculate_aroon(df)
+        expected_up, expected_down = loop_aroon(df, 25)
+
+        np.testing.assert_array_equal(result['aroon_up'].to_numpy(), expected_up)
+        np.testing.assert_array_equal(result['aroon_down'].to_numpy(), expected_down)
+
+    def test_non_default_index(self):
+        df = create_test_data(bars=100)
+        df.index = pd.date_range('2025-01-06 09:15', periods=100, freq='5min')
+        result = AroonIndicator(14).calculate_aroon(df)
+        expected_up, _ = loop_aroon(df, 14)
+
+        np.testing.assert_array_equal(result['aroon_up'].to_numpy(), expected_up)
+        assert result.index.equals(df.index)
+
+    def test_nan_prices_are_skipped(self):
+        df = create_test_data(bars=60)
+        df.loc[30, 'high'] = np.nan
+        result = AroonIndicator(10).calculate_aroon(df)
+        expected_up, _ = loop_aroon(df, 10)
+
+        np.testing.assert_array_equal(result['aroon_up'].to_numpy(), expected_up)
+
+    def test_insufficient_data(self):
+        df = create_test_data(bars=10)
+        result = AroonIndicator(25).calculate_aroon(df)
+        assert 'aroon_up' not in result.columns
+
+
+class TestAroonStream:
+    """Incremental updates"""
+
+    @pytest.mark.parametrize("tick", [None, 5.0])
+    def test_stream_matches_batch(self, tick):
+        df = create_test_data(tick=tick)
+        indicator = AroonIndicator(25)
+        batch = indicator.calculate_aroon(df)
+        stream = indicator.create_stream()
+
+        values = [stream.update(h, l) for h, l in zip(df['high'], df['low'])]
+
+        assert all(v is None for v in values[:24])
+        assert [v['aroon_up'] for v in values[24:]] == list(batch['aroon_up'].iloc[24:])
+        assert [v['aroon_down'] for v in values[24:]] == list(batch['aroon_down'].iloc[24:])
+
+    def test_reset(self):
+        stream = AroonStream(3)
+        for price in (10, 11, 12):
+            stream.update(price, price - 1)
+        stream.reset()
+
+        assert stream.update(10, 9) is None
+
+    def test_invalid_period(self):
+        with pytest.raises(ValueError):
+            AroonStream(0)
+
@@ -0,0 +1,139 @@
+"""
+Tests for BacktestDatabaseManager storage
+Verifies the columnar equity curve round-trips, chart downsampling keeps the
+extremes, trades can be paged and runs saved as JSON can still be read
+"""
+
+import pytest
+import json
+import sqlite3
+import sys
+import numpy as np
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.backtest_engine import BacktestResult, BacktestTrade
+from src.managers.backtest_db_manager import BacktestDatabaseManager, downsample_min_max
+
+
+def make_result(run_id="run-1", points=50000, trades=250):
+    rng = np.random.default_rng(3)
+    equity = 100000 + np.cumsum(rng.normal(0, 50, points)).round(2)
+    curve = [{"time": f"2025-01-06 09:{i % 60:02d}:{i % 60:02d}#{i}", "equity": float(v)}
+             for i, v in enumerate(equity)]
+    trade_list = [BacktestTrade(
+        symbol="INFY" if i % 2 else "TCS", direction="buy", entry_time=f"2025-01-06T10:{i // 60:02d}:{i % 60:02d}",
+        entry_price=1500.0 + i, exit_time=None, exit_price=1510.0 + i, quantity=10, pnl=100.0,
+        pnl_pct=0.66, exit_reason="tp", bars_held=3,
+    ) for i in range(trades)]
+    return BacktestResult(
+        run_id=run_id, mode="backtest", name="Test run", symbols=["INFY", "TCS"], config={},
+        from_date="2025-01-01", to_date="2025-01-31", initial_capital=100000, final_capital=float(equity[-1]) if points else 100000.0,
+        total_return_pct=1.0, max_drawdown_pct=2.0, sharpe_ratio=1.1, total_trades=trades, win_rate=55.0,
+        profit_factor=1.4, trades=trade_list, symbol_metrics=[], equity_curve=curve, status="completed",
+        error=None, duration_seconds=3.0, created_at="2025-02-01T10:00:00",
+    )
+
+
+@pytest.fixture
+def db(tmp_path):
+    return BacktestDatabaseManager(str(tmp_path / "backtests.db"))
+
+
+class TestEquityStorage:
+    """Equity curves are stored column-wise"""
+
+    def test_full_round_trip(self, db):
+        result = make_result()
+        db.save_run(result)
+
+        run = db.get_run("run-1")
+
+        assert run["equity_curve"] == result.equity_curve
+        assert run["equity_points"] == 50000
+
+    def test_no_json_column(self, db):
+        db.save_run(make_result(points=1000))
+
+        with sqlite3.connect(db.db_path) as conn:
+            assert conn.execute("SELECT equity_curve FROM backtest_runs").fetchone()[0] is None
+            assert conn.execute("SELECT points FROM backtest_series").fetchone()[0] == 1000
+
+    def test_downsampled_curve_keeps_extremes(self, db):
+        result = make_result()
+        db.save_run(result)
+        values = [p["equity"] for p in result.equity_curve]
+
+        curve = db.get_equity_curve("run-1", max_points=500)
+
+        assert curve["equity_points"] == 50000
+        assert len(curve["equity_curve"]) <= 500
+        charted = [p["equity"] for p in curve["equity_curve"]]
+        assert max(charted) == max(values)
+        assert min(charted) == min(values)
+        assert curve["equity_curve"][0] == result.equity_curve[0]
+        assert curve["equity_curve"][-1] == result.equity_curve[-1]
+
+    def test_legacy_json_runs(self, db):
+        db.save_run(make_result(points=10))
+        legacy = [{"time": "2025-01-06 09:15:00", "equity": 100000.0},
+                  {"time": "2025-01-06 09:20:00", "equity": 100250.5}]
+        with sqlite3.connect(db.db_path) as conn:
+            conn.execute("DELETE FROM backtest_series")
+            conn.execute("UPDATE backtest_runs SET equity_curve=?", (json.dumps(legacy),))
+
+        assert db.get_run("run-1")["equity_curve"] == legacy
+
+    def test_empty_curve(self, db):
+        db.save_run(make_result(points=0, trades=0))
+
+        run = db.get_run("run-1", max_points=100)
+        assert run["equity_curve"] == []
+        assert run["trades_total"] == 0
+
+
+class TestTradePages:
+    """Trades are loaded a page at a time"""
+
+    def test_first_page_with_run(self, db):
+        db.save_run(make_result(points=100))
+
+        run = db.get_run("run-1", trade_limit=100)
+
+        assert len(run["trades"]) == 100
+        assert run["trades_total"] == 250
+
+    def test_pages_cover_all_trades(self, db):
+        db.save_run(make_result(points=100))
+
+        pages = [db.get_trades("run-1", limit=100, offset=offset) for offset in (0, 100, 200)]
+
+        entry_times = [t["entry_time"] for page in pages for t in page["trades"]]
+        assert entry_times == sorted(entry_times)
+        assert len(set(entry_times)) == 250
+        assert pages[-1]["total"] == 250
+
+    def test_delete_removes_series(self, db):
+        db.save_run(make_result(points=100))
+        db.delete_run("run-1")
+
+        assert db.get_run("run-1") is None
+        with sqlite3.connect(db.db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM backtest_series").fetchone()[0] == 0
+
+
+class TestDownsampling:
+    """Min/max bucket selection"""
+
+    def test_short_series_unchanged(self):
+        assert downsample_min_max(np.arange(10.0), 20).tolist() == list(range(10))
+
+    def test_indices_are_ordered_and_unique(self):
+        values = np.sin(np.linspace(0, 50, 10001))
+
+        indices = downsample_min_max(values, 300)
+
+        assert len(indices) <= 300
+        assert np.all(np.diff(indices) > 0)
@@ -0,0 +1,131 @@
+"""
+Tests for the on-disk OHLCV bar store
+Verifies persistence, pruning and KiteAdapter delta fetches
+"""
+
+import pandas as pd
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.managers.bar_store_manager import BarStoreManager
+from src.adapters.kite_adapter import KiteAdapter
+
+
+TOKEN = 738561
+
+
+def kite_bars(start, count, minutes=5):
+    """Build a kite.historical_data style payload"""
+    return [
+        {
+            'date': start + timedelta(minutes=minutes * i),
+            'open': 100.0 + i,
+            'high': 101.0 + i,
+            'low': 99.0 + i,
+            'close': 100.5 + i,
+            'volume': 1000 + i,
+        }
+        for i in range(count)
+    ]
+
+
+def create_adapter(tmp_path, **overrides):
+    """KiteAdapter with a mocked Kite client and a temp bar cache"""
+    config = {'kite_api_key': 'test', 'bar_cache_path': str(tmp_path / 'bars.db')}
+    config.update(overrides)
+    adapter = KiteAdapter(config)
+    adapter.kite = Mock()
+    adapter.instrument_cache['NSE:RELIANCE'] = {
+        'instrument_token': TOKEN, 'lot_size': 1, 'tick_size': 0.05
+    }
+    return adapter
+
+
+class TestBarStoreManager:
+    """SQLite bar store"""
+
+    def test_save_and_read_back(self, tmp_path):
+        store = BarStoreManager(str(tmp_path / 'bars.db'))
+        df = KiteAdapter._to_ohlcv_frame(kite_bars(datetime(2025, 1, 6, 9, 15), 10))
+
+        assert store.save_bars(TOKEN, '5minute', df) == 10
+        result = store.get_bars(TOKEN, '5minute', 4)
+
+        assert list(result.columns) == ['time', 'open', 'high', 'low', 'close', 'volume']
+        assert list(result['close']) == [106.5, 107.5, 108.5, 109.5]
+        assert store.get_last_time(TOKEN, '5minute') == datetime(2025, 1, 6, 10, 0)
+
+    def test_replace_updates_forming_bar(self, tmp_path):
+        store = BarStoreManager(str(tmp_path / 'bars.db'))
+        payload = kite_bars(datetime(2025, 1, 6, 9, 15), 3)
+        store.save_bars(TOKEN, '5minute', KiteAdapter._to_ohlcv_frame(payload))
+
+        payload[-1]['close'] = 250.0
+        store.save_bars(TOKEN, '5minute', KiteAdapter._to_ohlcv_frame(payload[-1:]))
+
+        assert store.count_bars(TOKEN, '5minute') == 3
+        assert store.get_bars(TOKEN, '5minute', 1)['close'].iloc[0] == 250.0
+
+    def test_prune_keeps_newest(self, tmp_path):
+        store = BarStoreManager(str(tmp_path / 'bars.db'), max_bars=5)
+        store.save_bars(TOKEN, '5minute', KiteAdapter._to_ohlcv_frame(
+            kite_bars(datetime(2025, 1, 6, 9, 15), 12)))
+
+        assert store.count_bars(TOKEN, '5minute') == 5
+        assert store.get_bars(TOKEN, '5minute', 10)['close'].iloc[0] == 107.5
+
+    def test_keys_are_isolated(self, tmp_path):
+        store = BarStoreManager(str(tmp_path / 'bars.db'))
+        df = KiteAdapter._to_ohlcv_frame(kite_bars(datetime(2025, 1, 6, 9, 15), 3))
+        store.save_bars(TOKEN, '5minute', df)
+
+        assert store.get_last_time(TOKEN, '15minute') is None
+        assert store.get_bars(1, '5minute', 10).empty
+
+
+class TestKiteDeltaFetch:
+    """KiteAdapter.get_historical_data with the bar cache"""
+
+    def test_second_call_requests_only_new_bars(self, tmp_path):
+        adapter = create_adapter(tmp_path)
+        start = datetime.now().replace(second=0, microsecond=0) - timedelta(hours=5)
+        history = kite_bars(start, 60)
+        adapter.kite.historical_data.side_effect = [history[:50], history[49:]]
+
+        first = adapter.get_historical_data('RELIANCE', '5minute', 50)
+        second = adapter.get_historical_data('RELIANCE', '5minute', 50)
+
+        first_from = adapter.kite.historical_data.call_args_list[0].args[1]
+        second_from = adapter.kite.historical_data.call_args_list[1].args[1]
+        assert len(first) == 50
+        assert second_from == history[49]['date']
+        assert second_from > first_from
+        assert len(second) == 50
+        assert second['time'].iloc[-1] == pd.Timestamp(history[-1]['date'])
+
+    def test_short_cache_fetches_full_window(self, tmp_path):
+        adapter = create_adapter(tmp_path)
+        start = datetime.now().replace(second=0, microsecond=0) - timedelta(hours=5)
+        history = kite_bars(start, 60)
+        adapter.kite.historical_data.side_effect = [history[:20], history]
+
+        adapter.get_historical_data('RELIANCE', '5minute', 20)
+        result = adapter.get_historical_data('RELIANCE', '5minute', 50)
+
+        second_from = adapter.kite.historical_data.call_args_list[1].args[1]
+        assert second_from < history[0]['date']
+        assert len(result) == 50
+
+    def test_cache_disabled(self, tmp_path):
+        adapter = create_adapter(tmp_path, use_bar_cache=False)
+        adapter.kite.historical_data.return_value = kite_bars(datetime(2025, 1, 6, 9, 15), 30)
+
+        result = adapter.get_historical_data('RELIANCE', '5minute', 10)
+
+        assert len(result) == 10
+        assert not (tmp_path / 'bars.db').exists()
@@ -0,0 +1,158 @@
+"""
+Tests for concurrent per-symbol scanning
+Verifies the worker pool covers every symbol, broker calls share one rate
+limit and order placement is serialized
+"""
+
+import pandas as pd
+import threading
+import time
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.indian_trading_bot import IndianTradingBot
+from src.utils.rate_limiter import RateLimiter
+
+
+SYMBOLS = ['RELIANCE', 'TCS', 'INFY', 'HDFCBANK', 'SBIN', 'ITC', 'WIPRO', 'LT']
+
+
+def create_bot(tmp_path, **overrides):
+    """Create a bot with optional components disabled"""
+    config = {
+        'symbols': list(SYMBOLS),
+        'timeframe': 5,
+        'use_adaptive_risk': False,
+        'use_volume_filter': False,
+        'use_trend_detection': False,
+        'scan_workers': 4,
+        'broker_rate_limit': 0,
+        'decision_log_file': str(tmp_path / 'decisions.log'),
+        'config_path': str(tmp_path / 'missing.json'),
+    }
+    config.update(overrides)
+    broker = Mock()
+    broker.convert_timeframe.return_value = '5minute'
+    return IndianTradingBot(config, broker)
+
+
+class TestRateLimiter:
+    """Token bucket shared between threads"""
+
+    def test_disabled_never_waits(self):
+        limiter = RateLimiter(0)
+        assert all(limiter.acquire() == 0.0 for _ in range(100))
+
+    def test_calls_are_spaced(self):
+        limiter = RateLimiter(50)
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        # First call is free, the next five wait 1/50s each
+        assert time.monotonic() - start >= 5 / 50 * 0.9
+
+    def test_limit_is_shared_across_threads(self):
+        limiter = RateLimiter(100)
+        start = time.monotonic()
+        threads = [threading.Thread(target=lambda: [limiter.acquire() for _ in range(5)]) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert time.monotonic() - start >= 19 / 100 * 0.9
+
+
+class TestScanSymbols:
+    """IndianTradingBot.scan_symbols"""
+
+    def test_every_symbol_runs_once(self, tmp_path):
+        bot = create_bot(tmp_path)
+        seen = []
+        lock = threading.Lock()
+
+        def fake_strategy(symbol):
+            time.sleep(0.01)
+            with lock:
+                seen.append(symbol)
+
+        bot.run_strategy = fake_strategy
+        bot.scan_symbols()
+
+        assert sorted(seen) == sorted(SYMBOLS)
+
+    def test_symbols_overlap(self, tmp_path):
+        """Slow broker calls for different symbols run at the same time"""
+        bot = create_bot(tmp_path, scan_workers=8)
+        bot.run_strategy = lambda symbol: time.sleep(0.2)
+
+        start = time.monotonic()
+        bot.scan_symbols()
+
+        assert time.monotonic() - start < 0.2 * len(SYMBOLS) / 2
+
+    def test_single_worker_is_sequential(self, tmp_path):
+        bot = create_bot(tmp_path, scan_workers=1)
+        threads = set()
+        bot.run_strategy = lambda symbol: threads.add(threading.current_thread().name)
+
+        bot.scan_symbols()
+
+        assert threads == {threading.current_thread().name}
+
+    def test_error_in_one_symbol_does_not_stop_scan(self, tmp_path):
+        bot = create_bot(tmp_path)
+        seen = []
+
+        def fake_strategy(symbol):
+            if symbol == 'TCS':
+                raise RuntimeError("broker timeout")
+            seen.append(symbol)
+
+        bot.run_strategy = fake_strategy
+        bot.scan_symbols()
+
+        assert sorted(seen) == sorted(s for s in SYMBOLS if s != 'TCS')
+
+
+class TestSerializedOrders:
+    """Order placement goes through one critical section"""
+
+    def test_order_placement_is_serialized(self, tmp_path):
+        bot = create_bot(tmp_path, scan_workers=8)
+        bot.is_market_open = Mock(return_value=True)
+        bot.broker.get_positions.return_value = []
+        bot.get_historical_data = Mock(return_value=pd.DataFrame({'close': range(200)}))
+        bot.calculate_indicators = Mock(side_effect=lambda df: df)
+        bot.check_entry_signal = Mock(return_value=1)
+
+        active = []
+        overlaps = []
+        placed = []
+
+        def fake_execute(symbol, signal, df):
+            active.append(symbol)
+            if len(active) > 1:
+                overlaps.append(symbol)
+            time.sleep(0.01)
+            placed.append(symbol)
+            active.remove(symbol)
+            return True
+
+        bot._execute_signal = fake_execute
+        bot.scan_symbols()
+
+        assert sorted(placed) == sorted(SYMBOLS)
+        assert overlaps == []
+
+    def test_historical_fetch_uses_shared_limiter(self, tmp_path):
+        bot = create_bot(tmp_path)
+        bot.broker_rate_limiter = Mock()
+        bot.broker.get_historical_data.return_value = None
+
+        bot.get_historical_data('RELIANCE', 5, 200)
+
+        bot.broker_rate_limiter.acquire.assert_called_once()
@@ -0,0 +1,166 @@
+"""
+Tests for batched database logging
+Verifies DatabaseHandler writes in batches over one connection, drops and
+counts records when its queue is full, and flushes the tail on close
+"""
+
+import logging
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.managers.database_manager import LogDatabaseManager
+from src.utils.db_logging_handler import DatabaseHandler
+
+
+def make_logger(handler, name='test.db_logging'):
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    return logger
+
+
+def count_rows(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM logs").fetchone()[0]
+
+
+class TestLogDatabaseManager:
+    """Bulk inserts on a long-lived connection"""
+
+    def test_wal_mode(self, tmp_path):
+        db_path = str(tmp_path / "logs.db")
+        LogDatabaseManager(db_path)
+
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+    def test_insert_logs_batch(self, tmp_path):
+        manager = LogDatabaseManager(str(tmp_path / "logs.db"))
+        records = [{'level': 'INFO', 'level_no': 20, 'logger_name': 'bot', 'message': f'line {i}',
+                    'symbol': 'TCS', 'timestamp': f'2025-01-06T09:15:{i:02d}'} for i in range(50)]
+
+        assert manager.insert_logs(records) == 50
+        logs = manager.get_logs(limit=100)
+        assert len(logs) == 50
+        assert logs[0]['message'] == 'line 49'
+        assert logs[0]['timestamp'] == '2025-01-06T09:15:49'
+        manager.close()
+
+    def test_connections_wait_for_locks(self, tmp_path):
+        manager = LogDatabaseManager(str(tmp_path / "logs.db"), busy_timeout=42)
+        manager.insert_log('INFO', 20, 'bot', 'line')
+
+        assert manager._get_write_connection().execute("PRAGMA busy_timeout").fetchone()[0] == 42000
+        with manager._get_connection() as conn:
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 42000
+        manager.close()
+
+    def test_single_insert_reuses_connection(self, tmp_path):
+        manager = LogDatabaseManager(str(tmp_path / "logs.db"))
+        with patch('src.managers.database_manager.sqlite3.connect', wraps=sqlite3.connect) as connect:
+            for i in range(10):
+                manager.insert_log('INFO', 20, 'bot', f'line {i}')
+
+        assert connect.call_count == 1
+        assert manager.get_log_count() == 10
+        manager.close()
+
+
+class TestDatabaseHandler:
+    """Batching, bounded queue and flush on close"""
+
+    def test_records_are_written_in_batches(self, tmp_path):
+        db_path = str(tmp_path / "logs.db")
+        handler = DatabaseHandler(db_path, batch_size=100, flush_interval=0.2)
+        logger = make_logger(handler)
+
+        for i in range(500):
+            logger.info(f"message {i}")
+        assert handler.flush()
+
+        stats = handler.get_stats()
+        assert count_rows(db_path) == 500
+        assert stats['written'] == 500
+        assert stats['batches'] < 50
+        handler.close()
+
+    def test_close_flushes_tail(self, tmp_path):
+        db_path = str(tmp_path / "logs.db")
+        handler = DatabaseHandler(db_path, flush_interval=5.0)
+        logger = make_logger(handler)
+
+        for i in range(20):
+            logger.warning(f"shutdown {i}")
+        handler.close()
+
+        assert count_rows(db_path) == 20
+
+    def test_full_queue_drops_and_counts(self, tmp_path):
+        handler = DatabaseHandler(str(tmp_path / "logs.db"), batch_size=1, max_queue_size=5)
+        logger = make_logger(handler)
+
+        # Hold the writer so the queue fills up
+        with handler.db_manager._write_lock:
+            for i in range(50):
+                logger.info(f"burst {i}")
+            dropped = handler.get_stats()['dropped']
+
+        # At most one record sits in the blocked batch, five in the queue
+        assert dropped >= 44
+        handler.close()
+
+    def test_timestamp_is_taken_at_emit(self, tmp_path):
+        handler = DatabaseHandler(str(tmp_path / "logs.db"))
+        logger = make_logger(handler)
+
+        before = time.time()
+        logger.error("late write")
+        handler.close()
+
+        log = handler.db_manager.get_logs(limit=1)[0]
+        assert abs(time.mktime(time.strptime(log['timestamp'][:19], '%Y-%m-%dT%H:%M:%S')) - before) < 2
+
+    def test_internal_loggers_are_skipped(self, tmp_path):
+        db_path = str(tmp_path / "logs.db")
+        handler = DatabaseHandler(db_path)
+        make_logger(handler, 'src.managers.database_manager').info("internal")
+        handler.close()
+
+        assert count_rows(db_path) == 0
+
+    def test_failed_batch_is_retried(self, tmp_path):
+        db_path = str(tmp_path / "logs.db")
+        handler = DatabaseHandler(db_path, retry_delay=0.01)
+        insert_logs = handler.db_manager.insert_logs
+        attempts = []
+
+        def locked_once(records):
+            attempts.append(len(records))
+            return 0 if len(attempts) == 1 else insert_logs(records)
+
+        handler.db_manager.insert_logs = locked_once
+        make_logger(handler).info("during vacuum")
+        assert handler.flush()
+
+        stats = handler.get_stats()
+        assert count_rows(db_path) == 1
+        assert stats['retries'] == 1 and stats['failed'] == 0
+        handler.close()
+
+    def test_batch_fails_after_retries(self, tmp_path):
+        handler = DatabaseHandler(str(tmp_path / "logs.db"), max_retries=2, retry_delay=0.01)
+        handler.db_manager.insert_logs = lambda records: 0
+
+        make_logger(handler).info("lost")
+        assert handler.flush()
+
+        stats = handler.get_stats()
+        assert stats['retries'] == 2 and stats['failed'] == 1
+        handler.close()
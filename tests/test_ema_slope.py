@@ -0,0 +1,104 @@
+"""
+Tests for the closed-form EMA slope
+Verifies rolling_slope/RollingSlope against np.polyfit and that the slope
+consumers give the same answers with or without precomputed slope columns
+"""
+
+import pytest
+import logging
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analyzers.ema_momentum_analyzer import EMAMomentumAnalyzer, RollingSlope, rolling_slope
+
+
+@pytest.fixture(autouse=True)
+def quiet_logging():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def create_test_data(bars=300, seed=9):
+    """Create a random-walk close series"""
+    rng = np.random.default_rng(seed)
+    close = 1000 + np.cumsum(rng.normal(0, 2, bars))
+    return pd.DataFrame({'close': close, 'high': close + 1, 'low': close - 1,
+                         'volume': rng.integers(1000, 5000, bars)})
+
+
+def polyfit_slope_pct(series, lookback):
+    """Per-bar np.polyfit implementation the analyzer used before"""
+    slopes = []
+    for i in range(len(series)):
+        if i < lookback:
+            slopes.append(np.nan)
+        else:
+            y_values = series.iloc[i-lookback+1:i+1].values
+            slope = np.polyfit(np.arange(len(y_values)), y_values, 1)[0]
+            slopes.append((slope / y_values[-1]) * 100 if y_values[-1] != 0 else 0)
+    return np.array(slopes)
+
+
+class TestRollingSlope:
+    """Closed-form least squares"""
+
+    @pytest.mark.parametrize("lookback", [2, 5, 14])
+    def test_matches_polyfit(self, lookback):
+        values = create_test_data()['close'].to_numpy()
+        result = rolling_slope(values, lookback)
+
+        expected = [np.polyfit(np.arange(lookback), values[i - lookback + 1:i + 1], 1)[0]
+                    for i in range(lookback - 1, len(values))]
+        assert np.isnan(result[:lookback - 1]).all()
+        np.testing.assert_allclose(result[lookback - 1:], expected, rtol=1e-7, atol=1e-9)
+
+    def test_nan_only_affects_its_windows(self):
+        values = create_test_data(bars=50)['close'].to_numpy()
+        values[20] = np.nan
+        result = rolling_slope(values, 5)
+
+        assert np.isnan(result[20:25]).all()
+        assert not np.isnan(result[25:]).any()
+        assert not np.isnan(result[4:20]).any()
+
+    def test_incremental_matches_batch(self):
+        values = create_test_data(bars=2500)['close'].to_numpy()
+        stream = RollingSlope(5)
+        incremental = np.array([stream.update(v) for v in values])
+
+        # Prefix sums over 2,500 bars round at ~1e-11 of the price level
+        np.testing.assert_allclose(incremental, rolling_slope(values, 5), rtol=1e-7, atol=1e-7)
+
+    def test_invalid_lookback(self):
+        with pytest.raises(ValueError):
+            RollingSlope(1)
+
+
+class TestAnalyzerSlope:
+    """EMAMomentumAnalyzer integration"""
+
+    def test_calculate_slope_matches_polyfit(self):
+        analyzer = EMAMomentumAnalyzer({})
+        ema = create_test_data()['close'].ewm(span=20, adjust=False).mean()
+
+        result = analyzer._calculate_slope(ema, 5)
+
+        np.testing.assert_allclose(result.to_numpy(), polyfit_slope_pct(ema, 5), rtol=1e-6, atol=1e-9)
+        assert result.index.equals(ema.index)
+
+    def test_consumers_work_without_slope_columns(self):
+        """Consistency and magnitude regress only the tail they need"""
+        analyzer = EMAMomentumAnalyzer({})
+        full = analyzer.calculate_emas(create_test_data())
+        without_slopes = full.drop(columns=['ema_fast_slope', 'ema_slow_slope'])
+
+        assert analyzer._calculate_slope_consistency(without_slopes) == pytest.approx(
+            analyzer._calculate_slope_consistency(full), abs=1e-9)
+        assert analyzer._calculate_slope_magnitude_strength(without_slopes) == pytest.approx(
+            analyzer._calculate_slope_magnitude_strength(full), abs=1e-9)
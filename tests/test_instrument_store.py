@@ -0,0 +1,127 @@
+"""
+Tests for the shared instrument store
+Verifies the daily dump is stored once, read on demand and used by
+KiteAdapter instead of re-downloading on every connect
+"""
+
+import sqlite3
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.managers.instrument_store_manager import InstrumentStoreManager
+from src.adapters.kite_adapter import KiteAdapter
+
+
+def kite_dump():
+    """Build a kite.instruments() style payload"""
+    dump = [
+        {'instrument_token': 738561, 'exchange_token': 2885, 'tradingsymbol': 'RELIANCE',
+         'name': 'RELIANCE INDUSTRIES', 'last_price': 0.0, 'expiry': '', 'strike': 0.0,
+         'tick_size': 0.05, 'lot_size': 1, 'instrument_type': 'EQ', 'segment': 'NSE', 'exchange': 'NSE'},
+        {'instrument_token': 256265, 'exchange_token': 1001, 'tradingsymbol': 'NIFTY24JANFUT',
+         'name': 'NIFTY', 'last_price': 0.0, 'expiry': date(2024, 1, 25), 'strike': 0.0,
+         'tick_size': 0.05, 'lot_size': 50, 'instrument_type': 'FUT', 'segment': 'NFO-FUT', 'exchange': 'NFO'},
+    ]
+    for i in range(500):
+        dump.append({'instrument_token': 10000 + i, 'exchange_token': i, 'tradingsymbol': f'STOCK{i}',
+                     'name': f'STOCK {i}', 'last_price': 0.0, 'expiry': '', 'strike': 0.0,
+                     'tick_size': 0.05, 'lot_size': 1, 'instrument_type': 'EQ', 'segment': 'NSE',
+                     'exchange': 'NSE'})
+    return dump
+
+
+def create_adapter(tmp_path, **overrides):
+    """KiteAdapter with a mocked Kite client and a temp instrument store"""
+    config = {'kite_api_key': 'test', 'instrument_store_path': str(tmp_path / 'instruments.db'),
+              'use_bar_cache': False}
+    config.update(overrides)
+    adapter = KiteAdapter(config)
+    adapter.kite = Mock()
+    adapter.kite.instruments.return_value = kite_dump()
+    return adapter
+
+
+class TestInstrumentStoreManager:
+    """SQLite instrument dump"""
+
+    def test_replace_and_lookup(self, tmp_path):
+        store = InstrumentStoreManager(str(tmp_path / 'instruments.db'))
+
+        assert store.replace_all(kite_dump()) == 502
+        assert store.get('NSE', 'RELIANCE')['instrument_token'] == 738561
+        assert store.get('NFO', 'NIFTY24JANFUT')['expiry'] == '2024-01-25'
+        assert store.get_by_token(10007)['tradingsymbol'] == 'STOCK7'
+        assert store.get('BSE', 'RELIANCE') is None
+        assert len(store.get_all('NFO')) == 1
+
+    def test_ensure_fresh_downloads_once_a_day(self, tmp_path):
+        store = InstrumentStoreManager(str(tmp_path / 'instruments.db'))
+        fetch = Mock(return_value=kite_dump())
+
+        assert store.ensure_fresh(fetch) is True
+        assert store.ensure_fresh(fetch) is False
+        assert fetch.call_count == 1
+
+        # Yesterday's dump is replaced
+        with sqlite3.connect(store.db_path) as conn:
+            conn.execute("UPDATE instrument_meta SET value=? WHERE key='refreshed_at'",
+                         ((datetime.now() - timedelta(days=1)).isoformat(),))
+        assert store.ensure_fresh(fetch) is True
+        assert fetch.call_count == 2
+
+    def test_empty_download_keeps_previous_dump(self, tmp_path):
+        store = InstrumentStoreManager(str(tmp_path / 'instruments.db'))
+        store.replace_all(kite_dump())
+
+        assert store.ensure_fresh(Mock(return_value=[]), force=True) is False
+        assert store.count() == 502
+
+
+class TestKiteInstrumentStore:
+    """KiteAdapter reads instruments from the store"""
+
+    def test_reconnect_does_not_download_again(self, tmp_path):
+        first = create_adapter(tmp_path)
+        first._load_instrument_cache()
+        second = create_adapter(tmp_path)
+        second._load_instrument_cache()
+
+        first.kite.instruments.assert_called_once()
+        second.kite.instruments.assert_not_called()
+        assert second._get_instrument_token('RELIANCE') == 738561
+        assert second._get_instrument_token('NIFTY24JANFUT', 'NFO') == 256265
+
+    def test_lookups_are_lazy(self, tmp_path):
+        adapter = create_adapter(tmp_path)
+        adapter._load_instrument_cache()
+
+        assert adapter.instrument_cache == {}
+        info = adapter.get_instrument_info('STOCK42')
+        assert info['instrument_token'] == '10042'
+        assert list(adapter.instrument_cache) == ['NSE:STOCK42']
+
+    def test_miss_does_not_call_api(self, tmp_path):
+        adapter = create_adapter(tmp_path)
+        adapter._load_instrument_cache()
+
+        assert adapter.get_instrument_info('UNKNOWN') is None
+        adapter.kite.instruments.assert_called_once_with()
+
+    def test_get_instruments_uses_store(self, tmp_path):
+        adapter = create_adapter(tmp_path)
+        adapter._load_instrument_cache()
+
+        assert len(adapter.get_instruments()) == 502
+        adapter.kite.instruments.assert_called_once()
+
+    def test_store_disabled_keeps_memory_cache(self, tmp_path):
+        adapter = create_adapter(tmp_path, use_instrument_store=False)
+        adapter._load_instrument_cache()
+
+        assert len(adapter.instrument_cache) == 502
+        assert not (tmp_path / 'instruments.db').exists()
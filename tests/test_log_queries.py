@@ -0,0 +1,139 @@
+"""
+Tests for log queries in LogDatabaseManager
+Verifies keyset pagination, FTS5 search with the LIKE fallback and the
+incrementally maintained counts
+"""
+
+import pytest
+import sqlite3
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.managers.database_manager import LogDatabaseManager
+
+
+def make_records(count, start=0):
+    levels = ['INFO', 'WARNING', 'ERROR']
+    return [{
+        'level': levels[i % 3],
+        'level_no': 20 + 10 * (i % 3),
+        'logger_name': 'src.core.bot' if i % 2 else 'src.adapters.kite',
+        'message': f"Signal for {'RELIANCE' if i % 5 == 0 else 'TCS'} number {i}",
+        'symbol': 'RELIANCE' if i % 5 == 0 else 'TCS',
+    } for i in range(start, start + count)]
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = LogDatabaseManager(str(tmp_path / "logs.db"))
+    manager.insert_logs(make_records(1000))
+    yield manager
+    manager.close()
+
+
+class TestKeysetPagination:
+    """before_id pages match offset pages"""
+
+    def test_pages_match_offset(self, manager):
+        before_id = None
+        for page in range(5):
+            by_offset = manager.get_logs(limit=50, offset=page * 50, level='ERROR')
+            by_cursor = manager.get_logs(limit=50, level='ERROR', before_id=before_id)
+            assert by_cursor == by_offset
+            before_id = by_cursor[-1]['id']
+
+    def test_last_page(self, manager):
+        logs = manager.get_logs(limit=50, before_id=11)
+        assert [log['id'] for log in logs] == list(range(10, 0, -1))
+
+
+class TestFullTextSearch:
+    """FTS5 keeps the substring semantics of LIKE"""
+
+    def like_ids(self, manager, term):
+        with sqlite3.connect(manager.db_path) as conn:
+            rows = conn.execute("SELECT id FROM logs WHERE message LIKE ? OR logger_name LIKE ? ORDER BY id DESC",
+                                (f"%{term}%", f"%{term}%")).fetchall()
+        return [row[0] for row in rows]
+
+    @pytest.mark.parametrize("term", ["RELIANCE", "lianc", "adapters.kite", "number 99"])
+    def test_matches_like(self, manager, term):
+        assert manager.fts_tokenizer == 'trigram'
+        ids = [log['id'] for log in manager.get_logs(limit=2000, search=term)]
+        assert ids == self.like_ids(manager, term)
+
+    def test_short_term_falls_back_to_like(self, manager):
+        ids = [log['id'] for log in manager.get_logs(limit=2000, search='99')]
+        assert ids == self.like_ids(manager, '99')
+
+    def test_quotes_in_search(self, manager):
+        assert manager.get_logs(search='say "hi"') == []
+
+    def test_existing_rows_are_indexed(self, tmp_path):
+        db_path = str(tmp_path / "old.db")
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("CREATE TABLE logs (id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL, "
+                         "level TEXT NOT NULL, logger_name TEXT NOT NULL, message TEXT NOT NULL, "
+                         "symbol TEXT, level_no INTEGER NOT NULL)")
+            conn.execute("INSERT INTO logs (timestamp, level, logger_name, message, level_no) "
+                         "VALUES ('2025-01-06', 'INFO', 'bot', 'legacy entry', 20)")
+
+        assert len(LogDatabaseManager(db_path).get_logs(search='legacy')) == 1
+
+    def test_clear_empties_index(self, manager):
+        manager.clear_logs()
+        manager.insert_logs(make_records(3))
+
+        assert manager.count_logs(search='number') == {'total': 3, 'capped': False}
+
+
+class TestExport:
+    """iter_logs streams every matching row"""
+
+    def test_iter_matches_get_logs(self, manager):
+        rows = list(manager.iter_logs(level='ERROR', search='RELIANCE', fetch_size=7))
+        logs = manager.get_logs(limit=2000, level='ERROR', search='RELIANCE')
+
+        assert [row[0] for row in rows] == [log['id'] for log in logs]
+        assert rows[0][4] == logs[0]['message']
+
+    def test_closing_early_releases_connection(self, manager):
+        rows = manager.iter_logs()
+        next(rows)
+        rows.close()
+
+        manager.clear_logs()
+        assert manager.get_log_count() == 0
+
+
+class TestCounts:
+    """Counts are cached and extended with new rows"""
+
+    def test_count_matches_filters(self, manager):
+        assert manager.get_log_count() == 1000
+        assert manager.get_log_count(level='ERROR') == 333
+        assert manager.get_log_count(symbol='RELIANCE', search='Signal') == 200
+
+    def test_new_rows_are_counted_incrementally(self, manager):
+        manager.count_logs(level='INFO')
+        manager.insert_logs(make_records(30, start=1000))
+
+        with patch.object(manager, '_get_connection', wraps=manager._get_connection) as get_connection:
+            result = manager.count_logs(level='INFO')
+
+        assert result == {'total': 344, 'capped': False}
+        assert get_connection.call_count == 1
+
+    def test_deleted_rows_force_recount(self, manager):
+        manager.count_logs()
+        with sqlite3.connect(manager.db_path) as conn:
+            conn.execute("DELETE FROM logs WHERE id <= 100")
+
+        assert manager.count_logs()['total'] == 900
+
+    def test_large_counts_are_capped(self, manager):
+        assert manager.count_logs(max_count=100) == {'total': 100, 'capped': True}
@@ -0,0 +1,165 @@
+"""
+Tests for log retention in LogDatabaseManager
+Verifies whole days are removed past the age and size limits, archived to
+gzip files that can still be queried, and that freed pages are vacuumed
+"""
+
+import pytest
+import gzip
+import json
+import sqlite3
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.managers.database_manager import LogDatabaseManager
+
+
+def day(days_ago):
+    return (date.today() - timedelta(days=days_ago)).isoformat()
+
+
+def make_day(days_ago, count=100, padding=0):
+    return [{
+        'timestamp': f"{day(days_ago)}T09:{15 + i // 60:02d}:{i % 60:02d}",
+        'level': 'ERROR' if i % 4 == 0 else 'INFO',
+        'level_no': 40 if i % 4 == 0 else 20,
+        'logger_name': 'src.core.bot',
+        'message': f"Order {i} for {'INFY' if i % 2 else 'TCS'}" + ' ' * padding,
+        'symbol': 'INFY' if i % 2 else 'TCS',
+    } for i in range(count)]
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = LogDatabaseManager(str(tmp_path / "logs.db"), archive_dir=str(tmp_path / "archive"))
+    for days_ago in (40, 35, 31, 10, 0):
+        manager.insert_logs(make_day(days_ago))
+    yield manager
+    manager.close()
+
+
+class TestRetention:
+    """Old and oversized days are removed oldest first"""
+
+    def test_age_limit(self, manager):
+        summary = manager.apply_retention(max_age_days=30, batch_size=30)
+
+        assert summary['days'] == [day(40), day(35), day(31)]
+        assert summary['rows_deleted'] == 300
+        assert manager.get_oldest_day() == day(10)
+        assert manager.get_log_count() == 200
+
+    def test_size_limit_keeps_today(self, tmp_path):
+        manager = LogDatabaseManager(str(tmp_path / "logs.db"))
+        for days_ago in (3, 2, 1, 0):
+            manager.insert_logs(make_day(days_ago, count=500, padding=500))
+        size = manager.get_database_size_mb()
+
+        summary = manager.apply_retention(max_age_days=None, max_size_mb=size * 0.8)
+        assert summary['days'][0] == day(3)
+        assert day(1) not in summary['days']
+        assert manager.get_database_size_mb() <= size * 0.8
+
+        summary = manager.apply_retention(max_age_days=None, max_size_mb=0.001)
+        assert manager.get_oldest_day() == day(0)
+        assert manager.get_log_count() == 500
+        manager.close()
+
+    def test_nothing_to_remove(self, manager):
+        assert manager.apply_retention(max_age_days=60)['days'] == []
+        assert manager.get_log_count() == 500
+
+    def test_vacuum_releases_pages(self, tmp_path):
+        db_path = str(tmp_path / "logs.db")
+        manager = LogDatabaseManager(db_path)
+        manager.insert_logs(make_day(5, count=2000, padding=300))
+        manager.insert_logs(make_day(0, count=10))
+        with sqlite3.connect(db_path) as conn:
+            pages_before = conn.execute("PRAGMA page_count").fetchone()[0]
+
+        manager.apply_retention(max_age_days=1)
+
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+            assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+            assert conn.execute("PRAGMA page_count").fetchone()[0] < pages_before / 2
+        manager.close()
+
+    def test_existing_database_is_converted(self, tmp_path):
+        db_path = str(tmp_path / "old.db")
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("CREATE TABLE logs (id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL, "
+                         "level TEXT NOT NULL, logger_name TEXT NOT NULL, message TEXT NOT NULL, "
+                         "symbol TEXT, level_no INTEGER NOT NULL)")
+        manager = LogDatabaseManager(db_path)
+        manager.insert_logs(make_day(50, count=2000, padding=300))
+
+        # Retention never rebuilds the file; freed pages wait for reuse
+        assert manager.apply_retention(max_age_days=30)['rows_deleted'] == 2000
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+            assert conn.execute("PRAGMA freelist_count").fetchone()[0] > 0
+
+        assert manager.enable_incremental_vacuum() is True
+        assert manager.enable_incremental_vacuum() is False
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+            assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+        manager.close()
+
+
+class TestArchives:
+    """Removed days are kept as queryable gzip files"""
+
+    def test_removed_days_are_archived(self, manager):
+        summary = manager.apply_retention(max_age_days=30)
+
+        assert summary['rows_archived'] == 300
+        assert [a['date'] for a in manager.list_archives()] == [day(31), day(35), day(40)]
+        with gzip.open(manager.archive_dir / f"logs-{day(40)}.jsonl.gz", 'rt') as handle:
+            rows = [json.loads(line) for line in handle]
+        assert len(rows) == 100
+        assert rows[0]['message'] == 'Order 0 for TCS'
+
+    def test_query_archive_filters_and_pages(self, manager):
+        manager.apply_retention(max_age_days=30)
+
+        result = manager.query_archive(day(35), limit=10, offset=5, level='ERROR', symbol='TCS')
+
+        assert result['total'] == 25
+        assert len(result['logs']) == 10
+        assert result['logs'][0]['message'] == 'Order 76 for TCS'
+        assert manager.query_archive(day(35), search='order 99')['total'] == 1
+
+    def test_invalid_or_missing_day(self, manager):
+        assert manager.query_archive('../logs')['total'] == 0
+        assert manager.query_archive(day(99))['total'] == 0
+
+    def test_archiving_disabled(self, tmp_path):
+        manager = LogDatabaseManager(str(tmp_path / "logs.db"))
+        manager.insert_logs(make_day(40))
+
+        assert manager.apply_retention(max_age_days=30)['rows_archived'] == 0
+        assert manager.list_archives() == []
+        manager.close()
+
+
+class TestRetentionThread:
+    """Retention runs on a daemon thread"""
+
+    def test_start_and_stop(self, manager):
+        manager.start_retention(interval_seconds=60, initial_delay=0, max_age_days=30)
+        try:
+            for _ in range(200):
+                if manager.retention_stats['runs']:
+                    break
+                manager._retention_stop.wait(0.01)
+        finally:
+            manager.stop_retention()
+
+        assert manager.retention_stats['days_removed'] == 3
+        assert manager._retention_thread is None
@@ -0,0 +1,138 @@
+"""
+Tests for the per-iteration market data context
+Verifies position management reuses the frames computed by run_strategy
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.indian_trading_bot import IndianTradingBot
+from src.core.market_data_context import MarketDataContext
+
+
+def create_test_data(bars=200, seed=3):
+    """Create a random-walk OHLCV frame"""
+    rng = np.random.default_rng(seed)
+    close = 1000 + np.cumsum(rng.normal(0, 2, bars))
+    return pd.DataFrame({
+        'time': pd.date_range('2025-01-06 09:15', periods=bars, freq='5min'),
+        'open': close + rng.normal(0, 0.5, bars),
+        'high': close + np.abs(rng.normal(0, 2, bars)),
+        'low': close - np.abs(rng.normal(0, 2, bars)),
+        'close': close,
+        'volume': rng.integers(1000, 5000, bars),
+    })
+
+
+def create_bot(tmp_path, **overrides):
+    """Create a bot with optional components disabled"""
+    config = {
+        'symbols': ['RELIANCE'],
+        'timeframe': 5,
+        'use_adaptive_risk': False,
+        'use_volume_filter': False,
+        'use_trend_detection': False,
+        'broker_rate_limit': 0,
+        'decision_log_file': str(tmp_path / 'decisions.log'),
+        'config_path': str(tmp_path / 'missing.json'),
+    }
+    config.update(overrides)
+    broker = Mock()
+    broker.convert_timeframe.return_value = '5minute'
+    broker.get_historical_data.return_value = create_test_data()
+    broker.get_instrument_info.return_value = {'tick_size': 0.05, 'lot_size': 1}
+    return IndianTradingBot(config, broker)
+
+
+class TestMarketDataContext:
+    """Cache behaviour"""
+
+    def test_inactive_context_does_not_cache(self):
+        context = MarketDataContext()
+        loader = Mock(return_value=create_test_data(bars=10))
+
+        context.get_or_load('TCS', 5, loader)
+        context.get_or_load('TCS', 5, loader)
+
+        assert loader.call_count == 2
+
+    def test_active_context_loads_once_per_key(self):
+        context = MarketDataContext()
+        context.begin()
+        loader = Mock(return_value=create_test_data(bars=10))
+
+        context.get_or_load('TCS', 5, loader)
+        context.get_or_load('TCS', 5, loader)
+        context.get_or_load('TCS', 15, loader)
+
+        assert loader.call_count == 2
+        assert context.hits == 1
+
+    def test_failed_load_is_not_cached(self):
+        context = MarketDataContext()
+        context.begin()
+        loader = Mock(return_value=None)
+
+        assert context.get_or_load('TCS', 5, loader) is None
+        context.get_or_load('TCS', 5, loader)
+
+        assert loader.call_count == 2
+
+    def test_end_releases_frames(self):
+        context = MarketDataContext()
+        context.begin()
+        context.put('TCS', 5, create_test_data(bars=10))
+        context.end()
+
+        assert context.get('TCS', 5) is None
+
+
+class TestBotReuse:
+    """Position management inside a loop iteration"""
+
+    def test_trailing_stop_reuses_strategy_frame(self, tmp_path):
+        bot = create_bot(tmp_path)
+        bot.market_data.begin()
+        bot.market_data.put('RELIANCE', 5, bot.calculate_indicators(create_test_data()))
+
+        position = {'current_price': 900.0, 'entry_price': 1000.0, 'stop_loss': 1010.0}
+        bot.update_trailing_stop(position, 'RELIANCE', 1)
+        bot.update_trailing_stop(position, 'RELIANCE', 1)
+
+        bot.broker.get_historical_data.assert_not_called()
+
+    def test_first_position_fetch_is_shared(self, tmp_path):
+        bot = create_bot(tmp_path)
+        bot.market_data.begin()
+
+        position = {'current_price': 900.0, 'entry_price': 1000.0, 'stop_loss': 1010.0}
+        bot.update_trailing_stop(position, 'RELIANCE', 1)
+        bot.update_trailing_stop(position, 'RELIANCE', 1)
+
+        assert bot.broker.get_historical_data.call_count == 1
+
+    def test_outside_iteration_fetches_every_time(self, tmp_path):
+        bot = create_bot(tmp_path)
+
+        position = {'current_price': 900.0, 'entry_price': 1000.0, 'stop_loss': 1010.0}
+        bot.update_trailing_stop(position, 'RELIANCE', 1)
+        bot.update_trailing_stop(position, 'RELIANCE', 1)
+
+        assert bot.broker.get_historical_data.call_count == 2
+
+    def test_latest_atr_independent_of_window(self, tmp_path):
+        """Reusing the longer strategy frame gives the ATR a 20-bar fetch would"""
+        bot = create_bot(tmp_path)
+        df = create_test_data()
+
+        full = bot.calculate_indicators(df.copy())
+        short = bot.calculate_indicators(df.tail(20).reset_index(drop=True))
+
+        assert full['atr'].iloc[-1] == pytest.approx(short['atr'].iloc[-1], rel=1e-12)
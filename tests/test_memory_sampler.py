@@ -0,0 +1,167 @@
+"""
+Tests for the background memory sampler
+Verifies the analysis path reads a cached RSS sample and that memory-triggered
+cleanups run on the sampler thread instead of the caller
+"""
+
+import pytest
+import gc
+import logging
+import threading
+import time
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analyzers.trend_detection_engine import MemoryManager, TrendDetectionEngine
+
+
+@pytest.fixture(autouse=True)
+def quiet_logging():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def create_test_data(bars=300, seed=5):
+    """Create a random-walk OHLCV frame"""
+    rng = np.random.default_rng(seed)
+    close = 1000 + np.cumsum(rng.normal(0, 2, bars))
+    return pd.DataFrame({
+        'time': pd.date_range('2025-01-06 09:15', periods=bars, freq='5min'),
+        'open': close + rng.normal(0, 0.5, bars),
+        'high': close + np.abs(rng.normal(0, 2, bars)),
+        'low': close - np.abs(rng.normal(0, 2, bars)),
+        'close': close,
+        'tick_volume': rng.integers(1000, 5000, bars),
+    })
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestSampling:
+    """RSS is read from a cached sample"""
+
+    def test_reads_are_served_from_sample(self):
+        manager = MemoryManager(sample_interval_seconds=60)
+        with patch.object(manager, '_read_rss_mb', return_value=120.0) as read:
+            for _ in range(5):
+                assert manager.get_memory_usage_mb() == 120.0
+                manager.check_memory_limit()
+
+        assert read.call_count == 1
+
+    def test_stale_sample_is_refreshed(self):
+        manager = MemoryManager(sample_interval_seconds=0.01)
+        with patch.object(manager, '_read_rss_mb', side_effect=[100.0, 150.0]):
+            manager.get_memory_usage_mb()
+            time.sleep(0.02)
+            assert manager.get_memory_usage_mb() == 150.0
+
+    def test_background_sampler_refreshes(self):
+        manager = MemoryManager(sample_interval_seconds=0.02)
+        manager.start_sampler()
+        try:
+            assert wait_for(lambda: manager.stats['samples'] >= 3)
+        finally:
+            manager.stop_sampler()
+        assert not manager.is_sampler_running()
+
+    def test_sampler_exits_when_manager_is_collected(self):
+        manager = MemoryManager(sample_interval_seconds=0.02)
+        manager.start_sampler()
+        thread = manager._sampler
+
+        del manager
+        gc.collect()
+        thread.join(1.0)
+        assert not thread.is_alive()
+
+
+class TestCleanup:
+    """Cleanups leave the caller's thread"""
+
+    def test_requested_cleanup_runs_on_sampler_thread(self):
+        manager = MemoryManager(sample_interval_seconds=30)
+        manager.start_sampler()
+        threads = []
+        try:
+            with patch('src.analyzers.trend_detection_engine.gc.collect',
+                       side_effect=lambda: threads.append(threading.current_thread().name)):
+                manager.request_cleanup()
+                assert wait_for(lambda: manager.stats['cleanups'] == 1)
+        finally:
+            manager.stop_sampler()
+
+        assert threads == ['trend-memory-sampler']
+
+    def test_cleanup_is_inline_without_sampler(self):
+        manager = MemoryManager(max_memory_mb=50)
+        with patch.object(manager, '_read_rss_mb', return_value=80.0):
+            manager.request_cleanup()
+
+        assert manager.stats['cleanups'] == 1
+        assert manager.cleanup_ineffective
+
+    def test_sample_under_limit_clears_flag(self):
+        manager = MemoryManager(max_memory_mb=50)
+        manager.cleanup_ineffective = True
+        with patch.object(manager, '_read_rss_mb', return_value=40.0):
+            manager.sample()
+
+        assert not manager.cleanup_ineffective
+
+
+class TestEngineIntegration:
+    """The analysis path stays free of RSS reads and GC"""
+
+    def test_analysis_reads_cached_sample(self):
+        engine = TrendDetectionEngine({'use_trend_components': True, 'memory_sample_interval_seconds': 60,
+                                      'max_analysis_time_ms': 1000})
+        assert engine.memory_manager.is_sampler_running()
+
+        with patch.object(engine.memory_manager, '_read_rss_mb') as read:
+            for end in range(250, 255):
+                engine.analyze_trend_change(create_test_data().iloc[:end], 'TCS')
+
+        read.assert_not_called()
+        assert engine.get_performance_stats()['memory_sampler']['running']
+        engine.memory_manager.stop_sampler()
+
+    def test_over_limit_requests_background_cleanup(self):
+        engine = TrendDetectionEngine({'use_trend_components': True, 'memory_sample_interval_seconds': 60,
+                                      'max_analysis_time_ms': 1000})
+        manager = engine.memory_manager
+        manager.max_memory_mb = 1
+
+        with patch('src.analyzers.trend_detection_engine.gc.collect') as collect:
+            result = engine._run_trend_analysis(create_test_data(), 'TCS')
+            assert wait_for(lambda: manager.cleanup_ineffective)
+
+        collect.assert_called_once()
+        assert result.aroon_signal is not None
+        assert engine.performance_stats['memory_cleanups'] == 1
+
+        # The finished cleanup did not help, so the next analysis is refused
+        assert engine._run_trend_analysis(create_test_data(), 'TCS').aroon_signal is None
+        manager.stop_sampler()
+
+    def test_sampler_can_be_disabled(self):
+        engine = TrendDetectionEngine({'background_memory_sampler': False})
+        assert not engine.memory_manager.is_sampler_running()
+
+        engine.update_config({'background_memory_sampler': True})
+        assert engine.memory_manager.is_sampler_running()
+        engine.memory_manager.stop_sampler()
@@ -0,0 +1,223 @@
+"""
+Tests for multi-timeframe resampling
+Verifies session-aligned higher-timeframe bars, incremental updates of completed
+bins and that the broker is only asked when local history is too short
+"""
+
+import pytest
+import logging
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analyzers.multi_timeframe_analyzer import (
+    MultiTimeframeAnalyzer, resample_to_session_bars, session_bar_close
+)
+from src.analyzers.trend_detection_engine import TrendDetectionEngine
+
+
+@pytest.fixture(autouse=True)
+def quiet_logging():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def create_session_data(days=5, minutes=5, seed=3):
+    """Create OHLCV bars covering full NSE sessions"""
+    times = []
+    for day in pd.date_range('2025-01-06', periods=days, freq='B'):
+        times.extend(pd.date_range(day + pd.Timedelta('9h15min'), day + pd.Timedelta('15h30min'),
+                                   freq=f'{minutes}min', inclusive='left'))
+    rng = np.random.default_rng(seed)
+    close = 1000 + np.cumsum(rng.normal(0, 2, len(times)))
+    return pd.DataFrame({
+        'time': times,
+        'open': close + rng.normal(0, 0.5, len(times)),
+        'high': close + np.abs(rng.normal(0, 2, len(times))),
+        'low': close - np.abs(rng.normal(0, 2, len(times))),
+        'close': close,
+        'volume': rng.integers(1000, 5000, len(times)),
+    })
+
+
+class TestSessionResampling:
+    """Bins are anchored at the session open"""
+
+    def test_fifteen_minute_bins(self):
+        df = create_session_data(days=1)
+        bars = resample_to_session_bars(df, 15)
+
+        assert len(bars) == 25
+        assert bars.index[0] == pd.Timestamp('2025-01-06 09:15')
+        assert bars.index[-1] == pd.Timestamp('2025-01-06 15:15')
+
+        first = df.iloc[:3]
+        assert bars.iloc[0]['open'] == first['open'].iloc[0]
+        assert bars.iloc[0]['high'] == first['high'].max()
+        assert bars.iloc[0]['low'] == first['low'].min()
+        assert bars.iloc[0]['close'] == first['close'].iloc[-1]
+        assert bars.iloc[0]['volume'] == first['volume'].sum()
+
+    def test_hourly_bins_end_with_partial_bar(self):
+        df = create_session_data(days=2)
+        bars = resample_to_session_bars(df, 60)
+
+        day = bars.loc['2025-01-06']
+        assert [t.strftime('%H:%M') for t in day.index] == \
+            ['09:15', '10:15', '11:15', '12:15', '13:15', '14:15', '15:15']
+        # 15:15-15:30 holds three 5-minute bars
+        assert day['volume'].iloc[-1] == df['volume'].iloc[72:75].sum()
+
+    def test_daily_bars(self):
+        df = create_session_data(days=3)
+        bars = resample_to_session_bars(df, 1440)
+
+        assert len(bars) == 3
+        assert bars['volume'].sum() == df['volume'].sum()
+
+    def test_datetime_index_and_out_of_session_rows(self):
+        df = create_session_data(days=1).set_index('time')
+        pre_open = df.iloc[[0]].copy()
+        pre_open.index = [pd.Timestamp('2025-01-06 09:05')]
+
+        bars = resample_to_session_bars(pd.concat([pre_open, df]), 15)
+        assert bars.index[0] == pd.Timestamp('2025-01-06 09:15')
+        assert bars['volume'].sum() == df['volume'].sum()
+
+
+class TestIncrementalUpdate:
+    """Completed bins are reused, the forming bin is rebuilt"""
+
+    def test_matches_full_resample(self):
+        df = create_session_data()
+        analyzer = MultiTimeframeAnalyzer({'mtf_confirmation_bars': 500})
+
+        for end in range(200, len(df) + 1, 7):
+            incremental = analyzer._update_resampled_bars('TCS', 5, 15, df.iloc[:end])
+
+        full = resample_to_session_bars(df, 15)
+        pd.testing.assert_frame_equal(incremental, full, check_freq=False)
+
+    def test_forming_bar_is_not_stored(self):
+        df = create_session_data(days=1)
+        analyzer = MultiTimeframeAnalyzer({})
+
+        bars = analyzer._update_resampled_bars('TCS', 5, 15, df.iloc[:10])
+
+        # 10 five-minute bars: three complete 15-minute bins and one forming
+        assert len(bars) == 4
+        assert len(analyzer._resample_state[('TCS', 15)].bars) == 3
+        assert bars['close'].iloc[-1] == df['close'].iloc[9]
+
+    def test_partial_leading_bin_is_dropped(self):
+        df = create_session_data(days=1)
+        bars = MultiTimeframeAnalyzer({})._update_resampled_bars('TCS', 5, 15, df.iloc[1:])
+
+        assert bars.index[0] == pd.Timestamp('2025-01-06 09:30')
+
+    def test_rewound_history_resets_state(self):
+        df = create_session_data()
+        analyzer = MultiTimeframeAnalyzer({})
+        analyzer._update_resampled_bars('TCS', 5, 15, df)
+
+        bars = analyzer._update_resampled_bars('TCS', 5, 15, df.iloc[:120])
+
+        assert analyzer.resample_stats['resets'] == 1
+        assert bars.index[-1] < pd.Timestamp('2025-01-08')
+
+
+class TestBrokerFallback:
+    """The broker is only used when local history is too short"""
+
+    def create_broker(self):
+        broker = Mock()
+        broker.convert_timeframe.side_effect = lambda minutes: f"{minutes}minute"
+        broker.get_historical_data.return_value = resample_to_session_bars(
+            create_session_data(days=20), 60).reset_index()
+        return broker
+
+    def test_sufficient_history_stays_local(self):
+        analyzer = MultiTimeframeAnalyzer({})
+        broker = self.create_broker()
+        analyzer.set_broker_adapter(broker)
+
+        higher = analyzer.get_higher_timeframe_data('TCS', 5, create_session_data())
+
+        broker.get_historical_data.assert_not_called()
+        assert len(higher) >= 50
+        assert 'ema_20' in higher.columns
+
+    def test_short_history_fetches_once(self):
+        analyzer = MultiTimeframeAnalyzer({'mtf_primary_to_higher': {5: 60}})
+        broker = self.create_broker()
+        limiter = Mock()
+        analyzer.set_broker_adapter(broker, limiter)
+        df = create_session_data(days=20)
+
+        analyzer.get_higher_timeframe_data('TCS', 5, df.iloc[-200:-1])
+        higher = analyzer.get_higher_timeframe_data('TCS', 5, df.iloc[-199:])
+
+        broker.get_historical_data.assert_called_once_with('TCS', '60minute', 100)
+        limiter.acquire.assert_called_once()
+        assert len(higher) == 100
+        assert higher.index[-1] == pd.Timestamp(df['time'].iloc[-1]).floor('D') + pd.Timedelta('15h15min')
+
+    def test_without_broker_returns_local_bars(self):
+        analyzer = MultiTimeframeAnalyzer({'mtf_primary_to_higher': {5: 60}})
+        higher = analyzer.get_higher_timeframe_data('TCS', 5, create_session_data(days=2))
+
+        assert len(higher) == 14
+
+
+class TestSessionBarClose:
+    """Bar close times on the session grid"""
+
+    @pytest.mark.parametrize('when, minutes, expected', [
+        ('2025-01-06 09:20', 15, '2025-01-06 09:30'),
+        ('2025-01-06 10:20', 60, '2025-01-06 11:15'),
+        ('2025-01-06 15:20', 60, '2025-01-06 15:30'),
+        ('2025-01-06 12:00', 1440, '2025-01-06 15:30'),
+        ('2025-01-06 08:00', 15, '2025-01-06 09:15'),
+        ('2025-01-06 15:30', 60, '2025-01-07 09:15'),
+    ])
+    def test_close(self, when, minutes, expected):
+        assert session_bar_close(pd.Timestamp(when), minutes) == pd.Timestamp(expected)
+
+
+class TestEngineIntegration:
+    """The engine resamples the frame it analyses"""
+
+    def test_component_loads_and_aligns(self):
+        engine = TrendDetectionEngine({'timeframe': 5, 'use_trend_components': True, 'max_analysis_time_ms': 1000})
+        assert engine.get_component_status()['multi_timeframe'] == 'available'
+
+        result = engine.analyze_trend_change(create_session_data().iloc[:250], 'TCS')
+
+        assert result.timeframe_alignment is not None
+        assert result.timeframe_alignment.higher_timeframe == 'M15'
+
+    def test_set_broker_adapter_reaches_analyzer(self):
+        engine = TrendDetectionEngine({'timeframe': 5, 'use_trend_components': True})
+        broker = Mock()
+        engine.set_broker_adapter(broker)
+
+        assert engine.multi_timeframe_analyzer.broker is broker
+
+    def test_set_broker_adapter_without_component(self):
+        engine = TrendDetectionEngine({'timeframe': 5, 'use_trend_components': True})
+        engine.multi_timeframe_analyzer = None
+        engine.components_status['multi_timeframe'] = 'import_failed'
+
+        engine.set_broker_adapter(Mock())
+
+    def test_set_broker_adapter_with_components_off(self):
+        engine = TrendDetectionEngine({'timeframe': 5})
+
+        engine.set_broker_adapter(Mock())
+        assert engine.multi_timeframe_analyzer is None
@@ -0,0 +1,144 @@
+"""
+Tests for the per-loop position snapshot
+Verifies that one broker call serves every position lookup in an iteration
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.indian_trading_bot import IndianTradingBot
+from src.core.position_snapshot import PositionSnapshot
+
+
+POSITIONS = [
+    {'symbol': 'RELIANCE', 'direction': 1, 'quantity': 10, 'entry_price': 2500.0,
+     'current_price': 2510.0, 'pnl': 100.0, 'pnl_percent': 0.4, 'order_id': 'A1'},
+    {'symbol': 'RELIANCE', 'direction': 1, 'quantity': 5, 'entry_price': 2490.0,
+     'current_price': 2510.0, 'pnl': 100.0, 'pnl_percent': 0.8, 'order_id': 'A2'},
+    {'symbol': 'TCS', 'direction': -1, 'quantity': 3, 'entry_price': 3600.0,
+     'current_price': 3590.0, 'pnl': 30.0, 'pnl_percent': 0.3, 'order_id': 'B1'},
+    {'symbol': 'SBIN', 'direction': 1, 'quantity': 20, 'entry_price': 600.0,
+     'current_price': 601.0, 'pnl': 20.0, 'pnl_percent': 0.2, 'order_id': 'C1'},
+]
+
+
+def create_bot(tmp_path, **overrides):
+    """Create a bot with optional components disabled"""
+    config = {
+        'symbols': ['RELIANCE', 'TCS', 'INFY'],
+        'timeframe': 5,
+        'use_adaptive_risk': False,
+        'use_volume_filter': False,
+        'use_trend_detection': False,
+        'broker_rate_limit': 0,
+        'decision_log_file': str(tmp_path / 'decisions.log'),
+        'config_path': str(tmp_path / 'missing.json'),
+    }
+    config.update(overrides)
+    broker = Mock()
+    broker.convert_timeframe.return_value = '5minute'
+    broker.get_positions.return_value = [dict(p) for p in POSITIONS]
+    return IndianTradingBot(config, broker)
+
+
+class TestPositionSnapshot:
+    """Indexing"""
+
+    def test_indexes_by_symbol(self):
+        snapshot = PositionSnapshot(POSITIONS)
+
+        assert [p['order_id'] for p in snapshot.get_positions('RELIANCE')] == ['A1', 'A2']
+        assert snapshot.get_positions('INFY') == []
+        assert len(snapshot.get_positions()) == 4
+
+    def test_symbol_subset(self):
+        snapshot = PositionSnapshot(POSITIONS)
+        result = snapshot.get_positions(symbols=['TCS', 'SBIN'])
+        assert [p['order_id'] for p in result] == ['B1', 'C1']
+
+
+class TestBotSnapshotCycle:
+    """IndianTradingBot position lookups"""
+
+    def test_lookups_share_one_broker_call(self, tmp_path):
+        bot = create_bot(tmp_path)
+        bot.begin_position_snapshot()
+
+        for symbol in bot.symbols:
+            bot._get_positions(symbol)
+        bot._get_positions()
+        bot.cleanup_closed_positions()
+        bot.cleanup_closed_groups()
+
+        bot.broker.get_positions.assert_called_once_with()
+
+    def test_all_positions_limited_to_configured_symbols(self, tmp_path):
+        bot = create_bot(tmp_path)
+        bot.begin_position_snapshot()
+
+        assert {p['symbol'] for p in bot._get_positions()} == {'RELIANCE', 'TCS'}
+
+    def test_order_placement_refreshes_snapshot(self, tmp_path):
+        bot = create_bot(tmp_path, use_split_orders=False)
+        bot.broker.place_order.return_value = 'N1'
+        bot.begin_position_snapshot()
+
+        bot._get_positions('RELIANCE')
+        bot.open_position('INFY', 1, 1500.0, 1490.0, 1520.0, 1)
+        bot._get_positions('INFY')
+
+        assert bot.broker.get_positions.call_count == 2
+
+    def test_snapshot_dropped_after_cycle(self, tmp_path):
+        bot = create_bot(tmp_path)
+        bot.begin_position_snapshot()
+        bot._get_positions('TCS')
+        bot.end_position_snapshot()
+
+        bot._get_positions('TCS')
+        bot._get_positions('TCS')
+
+        assert bot.broker.get_positions.call_count == 3
+        assert bot.broker.get_positions.call_args.args == ('TCS',)
+
+    def test_without_cycle_all_positions_is_one_call(self, tmp_path):
+        bot = create_bot(tmp_path)
+
+        positions = bot._get_positions()
+
+        bot.broker.get_positions.assert_called_once_with(None)
+        assert len(positions) == 3
+
+
+class TestLiveStatePublish:
+    """Dashboard push uses the same positions and account source"""
+
+    def test_live_mode_uses_cycle_snapshot(self, tmp_path):
+        bot = create_bot(tmp_path)
+        bot.set_live_updates(Mock())
+        bot.begin_position_snapshot()
+
+        bot._get_positions('TCS')
+        bot._publish_live_state()
+
+        positions = bot.live_updates.publish_positions.call_args.args[0]
+        assert {p['symbol'] for p in positions} == {'RELIANCE', 'TCS'}
+        bot.broker.get_positions.assert_called_once_with()
+
+    def test_paper_mode_uses_paper_engine(self, tmp_path):
+        bot = create_bot(tmp_path)
+        bot.set_live_updates(Mock())
+        bot.paper_trading = True
+        bot.paper_trading_engine = Mock()
+        bot.paper_trading_engine.get_positions.return_value = [dict(POSITIONS[2])]
+        bot.paper_trading_engine.get_account_info.return_value = {'balance': 100000}
+
+        bot._publish_live_state()
+
+        bot.live_updates.publish_positions.assert_called_once_with([POSITIONS[2]])
+        bot.live_updates.publish_account.assert_called_once_with({'balance': 100000})
+        bot.broker.get_positions.assert_not_called()
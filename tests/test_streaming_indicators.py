@@ -0,0 +1,160 @@
+"""
+Tests for the streaming indicator engine
+Verifies that incremental updates reproduce calculate_indicators() and that
+the bot only fetches the latest bars once a stream is seeded
+"""
+
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.indian_trading_bot import IndianTradingBot
+from src.indicators.streaming_indicators import StreamingIndicators, INDICATOR_COLUMNS
+
+
+def create_test_data(bars=300, seed=7):
+    """Create a random-walk OHLCV frame"""
+    rng = np.random.default_rng(seed)
+    close = 1000 + np.cumsum(rng.normal(0, 2, bars))
+    return pd.DataFrame({
+        'time': pd.date_range('2025-01-06 09:15', periods=bars, freq='5min'),
+        'open': close + rng.normal(0, 0.5, bars),
+        'high': close + np.abs(rng.normal(0, 2, bars)),
+        'low': close - np.abs(rng.normal(0, 2, bars)),
+        'close': close,
+        'volume': rng.integers(1000, 5000, bars),
+    })
+
+
+def create_bot(tmp_path, broker=None, **overrides):
+    """Create a bot with optional components disabled"""
+    config = {
+        'symbols': ['RELIANCE'],
+        'timeframe': 5,
+        'use_adaptive_risk': False,
+        'use_volume_filter': False,
+        'use_trend_detection': False,
+        'use_streaming_indicators': True,
+        'analysis_bars': 200,
+        'decision_log_file': str(tmp_path / 'decisions.log'),
+        'config_path': str(tmp_path / 'missing.json'),
+    }
+    config.update(overrides)
+    if broker is None:
+        broker = Mock()
+        broker.convert_timeframe.return_value = '5minute'
+    return IndianTradingBot(config, broker)
+
+
+def assert_frames_match(actual, expected):
+    """Indicator columns must be identical (NaN positions included)"""
+    assert list(actual.columns) == list(expected.columns)
+    assert len(actual) == len(expected)
+    for column in INDICATOR_COLUMNS:
+        np.testing.assert_array_equal(
+            actual[column].to_numpy(dtype=float),
+            expected[column].to_numpy(dtype=float),
+            err_msg=column,
+        )
+
+
+class TestStreamingIndicators:
+    """StreamingIndicators must match the batch calculation"""
+
+    def test_seed_matches_batch(self, tmp_path):
+        """Seeding with a full frame reproduces calculate_indicators()"""
+        bot = create_bot(tmp_path)
+        df = create_test_data()
+        stream = StreamingIndicators(max_bars=len(df))
+        stream.seed(df)
+
+        assert_frames_match(stream.to_frame(), bot.calculate_indicators(df.copy()))
+
+    def test_incremental_updates_match_batch(self, tmp_path):
+        """Overlapping small updates give the same result as one batch"""
+        bot = create_bot(tmp_path)
+        df = create_test_data()
+        stream = StreamingIndicators(max_bars=len(df))
+        stream.seed(df.iloc[:60])
+        for end in range(61, len(df) + 1):
+            stream.update(df.iloc[max(0, end - 4):end])
+
+        assert stream.bar_count == len(df) - 1  # last bar is still forming
+        assert_frames_match(stream.to_frame(), bot.calculate_indicators(df.copy()))
+
+    def test_forming_bar_is_revised(self):
+        """The provisional bar is replaced, not committed, when re-fetched"""
+        df = create_test_data(bars=80)
+        stream = StreamingIndicators()
+        stream.seed(df)
+
+        revised = df.copy()
+        revised.loc[revised.index[-1], 'close'] += 25
+        stream.update(revised.tail(3))
+
+        assert stream.bar_count == 79
+        assert stream.latest()['close'] == revised['close'].iloc[-1]
+        assert len(stream.to_frame()) == 80
+
+    def test_max_bars_bounds_frame(self):
+        """Only max_bars committed bars are kept"""
+        df = create_test_data(bars=150)
+        stream = StreamingIndicators(max_bars=50)
+        stream.seed(df)
+
+        frame = stream.to_frame()
+        assert len(frame) == 51
+        assert frame['time'].iloc[-1] == df['time'].iloc[-1]
+
+    def test_covers_detects_gap(self):
+        """A frame starting after the last committed bar is a gap"""
+        df = create_test_data(bars=100)
+        stream = StreamingIndicators()
+        stream.seed(df.iloc[:50])
+
+        assert stream.covers(df.iloc[45:55])
+        assert not stream.covers(df.iloc[60:70])
+
+
+class TestBotStreaming:
+    """IndianTradingBot integration"""
+
+    def test_refresh_fetches_only_latest_bars(self, tmp_path):
+        """After seeding, each loop requests streaming_refresh_bars bars"""
+        df = create_test_data()
+        bot = create_bot(tmp_path, streaming_refresh_bars=5)
+        bot.get_historical_data = Mock(side_effect=[df.iloc[:250], df.iloc[246:251]])
+
+        bot.get_streaming_indicators('RELIANCE')
+        frame = bot.get_streaming_indicators('RELIANCE')
+
+        requested = [c.args[2] for c in bot.get_historical_data.call_args_list]
+        assert requested == [200, 5]
+        assert frame['time'].iloc[-1] == df['time'].iloc[250]
+
+    def test_gap_triggers_reseed(self, tmp_path):
+        """Missing bars between loops re-seed the stream"""
+        df = create_test_data()
+        bot = create_bot(tmp_path, streaming_refresh_bars=5)
+        bot.get_historical_data = Mock(side_effect=[df.iloc[:100], df.iloc[150:155], df.iloc[:155]])
+
+        bot.get_streaming_indicators('RELIANCE')
+        frame = bot.get_streaming_indicators('RELIANCE')
+
+        assert bot.get_historical_data.call_count == 3
+        assert_frames_match(frame, bot.calculate_indicators(df.iloc[:155].copy()))
+
+    def test_streams_are_per_symbol(self, tmp_path):
+        """Each symbol keeps its own state"""
+        bot = create_bot(tmp_path)
+        bot.get_historical_data = Mock(return_value=create_test_data(bars=120))
+
+        bot.get_streaming_indicators('RELIANCE')
+        bot.get_streaming_indicators('TCS')
+
+        assert set(bot.indicator_streams) == {'RELIANCE', 'TCS'}
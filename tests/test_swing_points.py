@@ -0,0 +1,152 @@
+"""
+Tests for the shared swing point detection
+Verifies the vectorized pivots against the per-bar loops the analyzers
+used before, and that repeated requests are served from the memo
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.indicators.swing_points import find_swing_indices, clear_swing_cache, get_swing_cache_stats
+from src.analyzers.market_structure_analyzer import MarketStructureAnalyzer
+from src.analyzers.trendline_analyzer import TrendlineAnalyzer
+from src.indicators.divergence_detector import DivergenceDetector
+
+
+def create_test_data(bars=300, seed=5, tick=None):
+    """Create a random-walk OHLCV frame (optionally rounded to a tick for ties)"""
+    rng = np.random.default_rng(seed)
+    close = 1000 + np.cumsum(rng.normal(0, 2, bars))
+    high = close + np.abs(rng.normal(0, 2, bars))
+    low = close - np.abs(rng.normal(0, 2, bars))
+    if tick:
+        high = np.round(high / tick) * tick
+        low = np.round(low / tick) * tick
+    return pd.DataFrame({
+        'open': close, 'high': high, 'low': low, 'close': close,
+        'volume': rng.integers(1000, 5000, bars),
+        'rsi': rng.uniform(20, 80, bars),
+    }, index=pd.date_range('2025-01-06 09:15', periods=bars, freq='5min'))
+
+
+def loop_strict(values, strength, swing_type):
+    """Per-bar loop from DivergenceDetector/MarketStructureAnalyzer"""
+    result = []
+    for i in range(strength, len(values) - strength):
+        if pd.isna(values[i]):
+            continue
+        is_swing = True
+        for j in range(i - strength, i + strength + 1):
+            if j == i or pd.isna(values[j]):
+                continue
+            if (values[j] >= values[i]) if swing_type == 'high' else (values[j] <= values[i]):
+                is_swing = False
+                break
+        if is_swing:
+            result.append(i)
+    return result
+
+
+def loop_key_levels(series, swing_type):
+    """Per-bar loop from TrendDetectionEngine._identify_key_levels"""
+    result = []
+    for i in range(5, len(series) - 5):
+        current = series.iloc[i]
+        if swing_type == 'high':
+            if current >= series.iloc[i-5:i].max() and current >= series.iloc[i+1:i+6].max():
+                result.append(i)
+        else:
+            if current <= series.iloc[i-5:i].min() and current <= series.iloc[i+1:i+6].min():
+                result.append(i)
+    return result
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_swing_cache()
+    yield
+    clear_swing_cache()
+
+
+class TestFindSwingIndices:
+    """Vectorized pivots match the loops"""
+
+    @pytest.mark.parametrize("strength", [1, 3, 5])
+    @pytest.mark.parametrize("tick", [None, 1.0])
+    @pytest.mark.parametrize("swing_type", ['high', 'low'])
+    def test_strict_matches_loop(self, strength, tick, swing_type):
+        values = create_test_data(tick=tick)[swing_type].values
+        assert list(find_swing_indices(values, strength, swing_type)) == loop_strict(values, strength, swing_type)
+
+    @pytest.mark.parametrize("tick", [None, 1.0])
+    @pytest.mark.parametrize("swing_type", ['high', 'low'])
+    def test_non_strict_matches_key_level_loop(self, tick, swing_type):
+        series = create_test_data(tick=tick)[swing_type]
+        result = find_swing_indices(series.values, 5, swing_type, strict=False)
+        assert list(result) == loop_key_levels(series, swing_type)
+
+    def test_nan_values(self):
+        values = create_test_data()['rsi'].values.copy()
+        values[[10, 11, 50, 120]] = np.nan
+        assert list(find_swing_indices(values, 5, 'high')) == loop_strict(values, 5, 'high')
+        assert list(find_swing_indices(values, 5, 'low')) == loop_strict(values, 5, 'low')
+
+    def test_short_series(self):
+        assert len(find_swing_indices([1.0, 3.0, 2.0], 2, 'high')) == 0
+        assert list(find_swing_indices([1.0, 3.0, 2.0], 1, 'high')) == [1]
+
+    def test_invalid_swing_type(self):
+        with pytest.raises(ValueError):
+            find_swing_indices([1.0, 2.0, 1.0], 1, 'peak')
+
+    def test_result_is_read_only(self):
+        result = find_swing_indices([1.0, 3.0, 2.0, 4.0, 1.0], 1, 'high')
+        with pytest.raises(ValueError):
+            result[0] = 0
+
+
+class TestMemoization:
+    """One computation per (values, strength, type) across analyzers"""
+
+    def test_copies_hit_the_cache(self):
+        df = create_test_data()
+        find_swing_indices(df['high'].values, 5, 'high')
+        find_swing_indices(df.copy()['high'].values, 5, 'high')
+
+        assert get_swing_cache_stats()['hits'] == 1
+
+    def test_different_strength_is_separate(self):
+        values = create_test_data()['high'].values
+        find_swing_indices(values, 5, 'high')
+        find_swing_indices(values, 3, 'high')
+
+        assert get_swing_cache_stats() == {'entries': 2, 'hits': 0, 'misses': 2}
+
+    def test_analyzers_share_pivots(self):
+        df = create_test_data()
+        structure = MarketStructureAnalyzer({'swing_strength': 5})
+        divergence = DivergenceDetector({'divergence_swing_strength': 5})
+
+        structure_highs = structure._find_swing_points(df, 'high')
+        divergence_highs = divergence._find_swing_points(df, 'high', 'high')
+
+        assert [p.index for p in structure_highs] == loop_strict(df['high'].values, 5, 'high')
+        assert [p.index for p in divergence_highs] == [p.index for p in structure_highs]
+        assert get_swing_cache_stats()['hits'] == 1
+
+    def test_trendline_respects_lookback(self):
+        df = create_test_data()
+        analyzer = TrendlineAnalyzer({'swing_strength': 5, 'trendline_lookback_bars': 100,
+                                      'min_swing_significance': 0.0})
+
+        points = analyzer._find_swing_points(df, 'high')
+
+        expected = [i for i in loop_strict(df['high'].values, 5, 'high') if i >= len(df) - 100 + 5]
+        assert points
+        assert {p.index for p in points} <= set(expected)
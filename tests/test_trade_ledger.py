@@ -0,0 +1,129 @@
+"""
+Tests for TradeLedgerManager
+Verifies fills are deduplicated by order_id and that the per date/hour/symbol
+aggregates stay equal to a full recount as fills are added and corrected
+"""
+
+import pytest
+import sqlite3
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from datetime import datetime
+
+from src.core.paper_trading import PaperTradingEngine
+from src.managers.trade_ledger_manager import TradeLedgerManager
+
+
+def make_fills(count, start=0):
+    return [{
+        'order_id': f'ORD{i}',
+        'symbol': ['RELIANCE', 'TCS', 'INFY'][i % 3],
+        'status': 'COMPLETE',
+        'direction': 'BUY' if i % 2 else 'SELL',
+        'filled_quantity': 10,
+        'average_price': 100 + i,
+        'pnl': (i % 7) - 3,
+        'order_timestamp': f'2025-01-{6 + i % 4:02d} {9 + i % 6:02d}:{i % 60:02d}:00',
+    } for i in range(start, start + count)]
+
+
+def recount(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("""
+            SELECT trade_date, hour, symbol, COUNT(*), SUM(pnl > 0), SUM(pnl < 0), SUM(pnl)
+            FROM ledger_trades GROUP BY trade_date, hour, symbol ORDER BY trade_date, hour, symbol
+        """).fetchall()
+
+
+def bucket_rows(ledger, **kwargs):
+    return [(b['trade_date'], b['hour'], b['symbol'], b['trades'], b['wins'], b['losses'], b['pnl'])
+            for b in ledger.get_buckets(**kwargs)]
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    return TradeLedgerManager(str(tmp_path / "ledger.db"))
+
+
+class TestRecordFills:
+    """Fills are written once and aggregates follow them"""
+
+    def test_aggregates_match_recount(self, ledger):
+        assert ledger.record_fills(make_fills(200), 'kite') == 200
+        assert bucket_rows(ledger) == recount(ledger.db_path)
+
+    def test_same_fills_are_skipped(self, ledger):
+        ledger.record_fills(make_fills(100), 'kite')
+
+        assert ledger.record_fills(make_fills(120), 'kite') == 20
+        assert ledger.count() == 120
+        assert bucket_rows(ledger) == recount(ledger.db_path)
+
+    def test_changed_fill_moves_between_buckets(self, ledger):
+        fills = make_fills(30)
+        ledger.record_fills(fills, 'kite')
+        fills[0] = dict(fills[0], pnl=50.0, order_timestamp='2025-02-03 14:00:00')
+
+        assert ledger.record_fills(fills, 'kite') == 1
+        assert bucket_rows(ledger) == recount(ledger.db_path)
+        assert ledger.get_buckets(from_date='2025-02-03')[0]['pnl'] == 50.0
+
+    def test_fills_without_order_id(self, ledger):
+        fill = {'symbol': 'TCS', 'pnl': 5, 'timestamp': '2025-01-06T10:15:00'}
+
+        ledger.record_fills([fill, fill], 'kite')
+        assert ledger.record_fills([fill], 'kite') == 0
+        assert ledger.count() == 1
+
+
+class TestReads:
+    """Date filters apply to buckets and the P&L series"""
+
+    def test_date_range(self, ledger):
+        ledger.record_fills(make_fills(200), 'kite')
+
+        buckets = ledger.get_buckets(from_date='2025-01-07', to_date='2025-01-08')
+        assert {b['trade_date'] for b in buckets} == {'2025-01-07', '2025-01-08'}
+
+        timestamps, pnl = ledger.get_pnl_series(from_date='2025-01-07', to_date='2025-01-08')
+        assert len(pnl) == sum(b['trades'] for b in buckets)
+        assert timestamps == sorted(timestamps)
+        assert pnl.sum() == pytest.approx(sum(b['pnl'] for b in buckets))
+
+    def test_empty_ledger(self, ledger):
+        timestamps, pnl = ledger.get_pnl_series()
+
+        assert timestamps == [] and len(pnl) == 0
+        assert ledger.get_buckets() == []
+
+
+class TestSources:
+    """Fills are keyed per source so brokers never overwrite each other"""
+
+    def test_sources_are_kept_apart(self, ledger):
+        ledger.record_fills(make_fills(30), 'kite')
+        ledger.record_fills(make_fills(10), 'paper')
+
+        assert ledger.count() == 40
+        assert ledger.count('paper') == 10
+        assert sum(b['trades'] for b in ledger.get_buckets(source='kite')) == 30
+        assert len(ledger.get_pnl_series(source='paper')[1]) == 10
+
+    def test_paper_exits_at_same_clock_time_on_different_days(self, ledger):
+        engine = PaperTradingEngine()
+        for day in (6, 7):
+            engine.trades.append({
+                'order_id': f'PAPER_202501{day:02d}091500_000001', 'symbol': 'TCS', 'direction': 1,
+                'quantity': 1, 'entry_price': 100.0, 'exit_price': 101.0,
+                'entry_time': datetime(2025, 1, day, 9, 15), 'exit_time': datetime(2025, 1, day, 10, 30),
+                'pnl': 1.0, 'pnl_percent': 1.0,
+            })
+
+        orders = engine.get_orders()
+        assert len({o['order_id'] for o in orders}) == 2
+        assert ledger.record_fills(orders, 'paper') == 2
+        assert [b['trade_date'] for b in ledger.get_buckets(source='paper')] == ['2025-01-06', '2025-01-07']
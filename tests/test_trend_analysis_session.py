@@ -0,0 +1,126 @@
+"""
+Tests for trend analysis sessions
+Verifies analyze_trend_change, get_trend_signals and should_trade_trend share
+one analysis per bar and that a new or still-forming bar is re-analysed
+"""
+
+import pytest
+import logging
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analyzers.trend_detection_engine import TrendDetectionEngine
+
+
+@pytest.fixture(autouse=True)
+def quiet_logging():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def create_test_data(bars=300, seed=4):
+    """Create a random-walk OHLCV frame"""
+    rng = np.random.default_rng(seed)
+    close = 1000 + np.cumsum(rng.normal(0, 2, bars))
+    return pd.DataFrame({
+        'time': pd.date_range('2025-01-06 09:15', periods=bars, freq='5min'),
+        'open': close + rng.normal(0, 0.5, bars),
+        'high': close + np.abs(rng.normal(0, 2, bars)),
+        'low': close - np.abs(rng.normal(0, 2, bars)),
+        'close': close,
+        'tick_volume': rng.integers(1000, 5000, bars),
+    })
+
+
+def create_engine():
+    return TrendDetectionEngine({'use_trend_components': True, 'max_analysis_time_ms': 1000})
+
+
+class TestAnalysisSession:
+    """One analysis per bar"""
+
+    def test_entry_points_share_one_analysis(self):
+        engine = create_engine()
+        df = create_test_data()
+
+        with patch.object(engine, '_perform_analysis_with_error_handling',
+                          wraps=engine._perform_analysis_with_error_handling) as perform:
+            result = engine.analyze_trend_change(df, 'TCS')
+            engine.should_trade_trend(df, 'buy', 'TCS')
+            engine.get_trend_signals(df, 'sell', 'TCS')
+
+        assert perform.call_count == 1
+        assert engine.get_session_stats() == {'sessions': 1, 'analyses': 1, 'reuses': 2, 'refreshes': 0}
+        assert engine.analyze_trend_change(df.copy(), 'TCS') is result
+
+    def test_each_bar_is_analysed_once(self):
+        engine = create_engine()
+        df = create_test_data()
+
+        for end in range(250, 260):
+            frame = df.iloc[:end]
+            engine.analyze_trend_change(frame, 'TCS')
+            engine.should_trade_trend(frame, 'buy', 'TCS')
+
+        stats = engine.get_session_stats()
+        assert stats['analyses'] == 10
+        assert stats['reuses'] == 10
+
+    def test_forming_bar_refreshes_session(self):
+        engine = create_engine()
+        df = create_test_data()
+        engine.analyze_trend_change(df, 'TCS')
+
+        updated = df.copy()
+        updated.loc[updated.index[-1], 'close'] += 5
+        engine.analyze_trend_change(updated, 'TCS')
+
+        assert engine.get_session_stats()['refreshes'] == 1
+
+    def test_symbols_have_separate_sessions(self):
+        engine = create_engine()
+        df = create_test_data()
+        engine.analyze_trend_change(df, 'TCS')
+        engine.analyze_trend_change(df, 'INFY')
+
+        assert engine.get_session_stats()['analyses'] == 2
+
+    def test_directional_confidence_is_memoized(self):
+        engine = create_engine()
+        df = create_test_data()
+
+        first = engine.should_trade_trend(df, 'buy', 'TCS')
+        with patch.object(engine, '_compute_directional_confidence') as compute:
+            second = engine.should_trade_trend(df, 'buy', 'TCS')
+
+        compute.assert_not_called()
+        assert first == second
+
+    def test_config_update_clears_sessions(self):
+        engine = create_engine()
+        df = create_test_data()
+        engine.analyze_trend_change(df, 'TCS')
+
+        engine.update_config({'min_trend_confidence': 0.7})
+        engine.analyze_trend_change(df, 'TCS')
+
+        assert engine.get_session_stats()['analyses'] == 2
+
+    def test_frame_without_timestamps(self):
+        engine = create_engine()
+        df = create_test_data().drop(columns=['time'])
+
+        engine.analyze_trend_change(df, 'TCS')
+        engine.analyze_trend_change(df, 'TCS')
+        engine.analyze_trend_change(df.iloc[:-1], 'TCS')
+
+        stats = engine.get_session_stats()
+        assert stats['analyses'] == 2
+        assert stats['reuses'] == 1
@@ -0,0 +1,144 @@
+"""
+Tests for the trend detection DataCache
+Verifies LRU ordering, wall-clock TTL per entry type, the byte budget and
+the statistics surfaced through TrendDetectionEngine.get_performance_stats
+"""
+
+import pytest
+import logging
+import time
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analyzers.trend_detection_engine import DataCache, TrendDetectionEngine
+
+
+@pytest.fixture(autouse=True)
+def quiet_logging():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def create_frame(rows=1000):
+    return pd.DataFrame({'close': np.arange(rows, dtype=float), 'high': np.arange(rows, dtype=float)})
+
+
+class TestLRU:
+    """Recency ordering and entry limit"""
+
+    def test_evicts_least_recently_used(self):
+        cache = DataCache(max_size=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get_stats()['evictions'] == 1
+
+    def test_overwrite_does_not_evict(self):
+        cache = DataCache(max_size=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.set('a', 10)
+
+        assert cache.get('a') == 10
+        assert cache.get('b') == 2
+        assert cache.get_stats()['evictions'] == 0
+
+    def test_insert_at_capacity_is_constant_time(self):
+        small, large = DataCache(max_size=100), DataCache(max_size=50000)
+        for cache in (small, large):
+            for i in range(cache.max_size):
+                cache.set(f'k{i}', i)
+
+        def time_inserts(cache):
+            start = time.perf_counter()
+            for i in range(2000):
+                cache.set(f'new{i}', i)
+            return time.perf_counter() - start
+
+        # O(n) eviction would make the 500x larger cache far slower
+        assert time_inserts(large) < time_inserts(small) * 5
+
+
+class TestTTL:
+    """Wall-clock expiry per entry type"""
+
+    def test_entry_expires(self):
+        cache = DataCache(ttl_seconds={'mtf': 0.05})
+        cache.set('frame', create_frame(), entry_type='mtf')
+        assert cache.get('frame') is not None
+
+        time.sleep(0.06)
+        assert cache.get('frame') is None
+        assert cache.get_stats()['expirations'] == 1
+
+    def test_types_have_separate_ttls(self):
+        cache = DataCache(ttl_seconds={'trendlines': 0.05, 'analysis': 60})
+        cache.set('lines', [1, 2], entry_type='trendlines')
+        cache.set('result', {'confidence': 0.7}, entry_type='analysis')
+        time.sleep(0.06)
+
+        cache.cleanup_expired()
+        assert cache.size() == 1
+        assert cache.get('result') == {'confidence': 0.7}
+
+    def test_cleanup_max_age(self):
+        cache = DataCache()
+        cache.set('a', 1)
+        time.sleep(0.02)
+
+        cache.cleanup_expired(max_age_seconds=0.01)
+        assert cache.size() == 0
+
+
+class TestMemoryBudget:
+    """Byte-based eviction"""
+
+    def test_evicts_to_stay_under_budget(self):
+        frame_bytes = int(create_frame().memory_usage(index=True).sum())
+        cache = DataCache(max_bytes=int(frame_bytes * 2.5))
+        for i in range(4):
+            cache.set(f'f{i}', create_frame(), entry_type='mtf')
+
+        assert cache.size() == 2
+        assert cache.size_bytes() <= cache.max_bytes
+        assert cache.get('f3') is not None
+
+    def test_oversized_value_is_not_cached(self):
+        cache = DataCache(max_bytes=1024)
+        cache.set('small', 1)
+        cache.set('big', create_frame())
+
+        assert cache.get('big') is None
+        assert cache.get('small') == 1
+
+    def test_bytes_released_on_clear(self):
+        cache = DataCache()
+        cache.set('f', create_frame())
+        cache.clear()
+        assert cache.size_bytes() == 0
+
+
+class TestEngineStats:
+    """Statistics reach the engine's performance stats"""
+
+    def test_performance_stats_include_cache(self):
+        engine = TrendDetectionEngine({'trend_cache_max_mb': 8, 'trend_cache_ttl_seconds': {'mtf': 30}})
+        engine.data_cache.set('x', 1)
+        engine.data_cache.get('x')
+        engine.data_cache.get('missing')
+
+        stats = engine.get_performance_stats()['cache_stats']
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['max_bytes'] == 8 * 1024 * 1024
+        assert engine.data_cache.ttl_seconds['mtf'] == 30
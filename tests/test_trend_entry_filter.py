@@ -0,0 +1,143 @@
+"""
+Tests for the trend detection entry filter
+Verifies the engine loads its components from their current modules when
+use_trend_components is on, runs the volume step, and that
+check_entry_signal only takes a signal the engine supports
+"""
+
+import logging
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analyzers.trend_detection_engine import TrendDetectionEngine
+from src.core.indian_trading_bot import IndianTradingBot
+
+
+COMPONENTS = ('market_structure', 'aroon', 'ema', 'divergence', 'multi_timeframe', 'trendline')
+
+
+def create_test_data(bars=300, seed=0):
+    """Downtrend followed by a rally"""
+    rng = np.random.default_rng(seed)
+    close = 1000 + np.cumsum(np.r_[rng.normal(-1, 2, 200), rng.normal(2, 2, bars - 200)])
+    return pd.DataFrame({
+        'time': pd.date_range('2025-01-06 09:15', periods=bars, freq='5min'),
+        'open': close - 0.5,
+        'high': close + 2,
+        'low': close - 2,
+        'close': close,
+        'tick_volume': rng.integers(1000, 5000, bars),
+    })
+
+
+def create_bot(tmp_path, **overrides):
+    """Bot whose only active entry filter is trend detection"""
+    config = {
+        'symbols': ['TCS'],
+        'timeframe': 5,
+        'use_adaptive_risk': False,
+        'use_volume_filter': False,
+        'use_trend_detection': True,
+        'use_trend_components': True,
+        'rsi_overbought': 100,
+        'use_macd': False,
+        'use_adx': False,
+        'dead_hours': [],
+        'max_analysis_time_ms': 2000,
+        'broker_rate_limit': 0,
+        'decision_log_file': str(tmp_path / 'decisions.log'),
+        'config_path': str(tmp_path / 'missing.json'),
+    }
+    config.update(overrides)
+    broker = Mock()
+    broker.convert_timeframe.return_value = '5minute'
+    return IndianTradingBot(config, broker)
+
+
+def signal_frame(bot):
+    """Frame on which the bot's own rules give a BUY"""
+    return bot.calculate_indicators(create_test_data()).iloc[:230].copy()
+
+
+class TestComponentLoading:
+    """Every analyzer is importable and the volume step runs"""
+
+    def test_components_off_by_default(self):
+        engine = TrendDetectionEngine({'timeframe': 5, 'max_analysis_time_ms': 2000})
+
+        assert set(engine.get_component_status().values()) == {'disabled'}
+        result = engine._perform_analysis_with_error_handling(create_test_data().iloc[:260], 'TCS')
+        assert result.signals == []
+        assert result.volume_confirmation is None
+
+    def test_all_components_available(self):
+        status = TrendDetectionEngine({'timeframe': 5, 'use_trend_components': True}).get_component_status()
+
+        assert all(status[name] == 'available' for name in COMPONENTS)
+
+    def test_volume_step_runs(self):
+        engine = TrendDetectionEngine({'timeframe': 5, 'use_trend_components': True, 'max_analysis_time_ms': 2000})
+
+        result = engine._perform_analysis_with_error_handling(create_test_data().iloc[:260], 'TCS')
+
+        assert result.volume_confirmation is not None
+        assert result.volume_confirmation.volume_ratio > 0
+
+
+class TestEntryFilter:
+    """check_entry_signal defers to should_trade_trend"""
+
+    def setup_method(self):
+        logging.disable(logging.CRITICAL)
+
+    def teardown_method(self):
+        logging.disable(logging.NOTSET)
+
+    def test_signal_without_trend_filter(self, tmp_path):
+        bot = create_bot(tmp_path, use_trend_detection=False)
+
+        assert bot.check_entry_signal(signal_frame(bot), 'TCS') == 1
+
+    def test_supported_signal_is_taken(self, tmp_path):
+        bot = create_bot(tmp_path)
+        engine = bot.trend_detection_engine
+
+        with patch.object(engine, 'should_trade_trend', return_value=(True, 0.9)) as should_trade:
+            assert bot.check_entry_signal(signal_frame(bot), 'TCS') == 1
+        assert should_trade.call_args.args[1] == 'buy'
+
+    def test_unsupported_signal_is_rejected(self, tmp_path):
+        bot = create_bot(tmp_path)
+
+        with patch.object(bot.trend_detection_engine, 'should_trade_trend', return_value=(False, 0.3)):
+            assert bot.check_entry_signal(signal_frame(bot), 'TCS') == 0
+
+    def test_real_engine_decides(self, tmp_path):
+        bot = create_bot(tmp_path)
+        df = signal_frame(bot)
+
+        should_trade, confidence = bot.trend_detection_engine.should_trade_trend(df, 'buy', 'TCS')
+
+        assert 0.0 <= confidence <= 1.0
+        assert bot.check_entry_signal(df, 'TCS') == (1 if should_trade else 0)
+
+    def test_fallback_gate_without_components(self, tmp_path):
+        bot = create_bot(tmp_path, use_trend_components=False)
+        df = signal_frame(bot)
+
+        should_trade, confidence = bot.trend_detection_engine.should_trade_trend(df, 'buy', 'TCS')
+
+        assert bot.trend_detection_engine.is_component_available('ema') is False
+        assert bot.check_entry_signal(df, 'TCS') == (1 if should_trade else 0)
+
+    def test_engine_error_lets_signal_through(self, tmp_path):
+        bot = create_bot(tmp_path)
+
+        with patch.object(bot.trend_detection_engine, 'analyze_trend_change', side_effect=RuntimeError("boom")):
+            assert bot.check_entry_signal(signal_frame(bot), 'TCS') == 1
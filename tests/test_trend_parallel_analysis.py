@@ -0,0 +1,158 @@
+"""
+Tests for parallel component execution in TrendDetectionEngine
+Verifies the parallel mode matches the sequential one, enforces per-component
+deadlines without dropping the other components, and honours circuit breakers
+"""
+
+import pytest
+import logging
+import time
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analyzers.trend_detection_engine import TrendDetectionEngine, CircuitBreaker
+from src.indicators.swing_points import clear_swing_cache, get_swing_cache_stats
+
+
+@pytest.fixture(autouse=True)
+def quiet_logging():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def create_test_data(bars=300, seed=1):
+    """Create a random-walk OHLCV frame"""
+    rng = np.random.default_rng(seed)
+    close = 1000 + np.cumsum(rng.normal(0, 2, bars))
+    return pd.DataFrame({
+        'time': pd.date_range('2025-01-06 09:15', periods=bars, freq='5min'),
+        'open': close + rng.normal(0, 0.5, bars),
+        'high': close + np.abs(rng.normal(0, 2, bars)),
+        'low': close - np.abs(rng.normal(0, 2, bars)),
+        'close': close,
+        'tick_volume': rng.integers(1000, 5000, bars),
+    })
+
+
+def create_engine(**overrides):
+    config = {
+        'use_trend_components': True,
+        'parallel_component_analysis': True,
+        'max_analysis_time_ms': 1000,
+        'cache_analysis_results': False,
+    }
+    config.update(overrides)
+    return TrendDetectionEngine(config)
+
+
+def summarize(result):
+    return {
+        'signals': [(s.signal_type, s.source) for s in result.signals],
+        'market_structure': (result.market_structure.break_type, result.market_structure.break_level)
+                            if result.market_structure else None,
+        'aroon': result.aroon_signal.signal_type if result.aroon_signal else None,
+        'ema': result.ema_signal.signal_type if result.ema_signal else None,
+        'volume': result.volume_confirmation,
+    }
+
+
+class TestParallelAnalysis:
+    """Parallel mode produces the sequential result"""
+
+    def test_components_are_loaded(self):
+        status = create_engine().get_component_status()
+        for name in ('market_structure', 'aroon', 'ema', 'divergence', 'trendline'):
+            assert status[name] == 'available'
+
+    def test_matches_sequential(self):
+        df = create_test_data()
+        sequential = create_engine(parallel_component_analysis=False)._perform_analysis_with_error_handling(df, 'TCS')
+        parallel = create_engine()._perform_analysis_with_error_handling(df, 'TCS')
+
+        assert summarize(parallel) == summarize(sequential)
+        # Strengths carry a small time-dependent term
+        assert parallel.confidence == pytest.approx(sequential.confidence, rel=1e-6)
+        assert parallel.aroon_signal is not None
+
+    def test_shared_inputs_are_prepared_once(self):
+        clear_swing_cache()
+        create_engine()._perform_analysis_with_error_handling(create_test_data(), 'TCS')
+
+        # Structure, trendline and divergence reuse the pre-computed pivots
+        assert get_swing_cache_stats()['hits'] >= 2
+
+
+class TestDeadlines:
+    """A slow component is cut off, the others are kept"""
+
+    def test_slow_component_does_not_drop_others(self):
+        engine = create_engine(max_analysis_time_ms=100)
+
+        def slow_trendline(df, symbol):
+            time.sleep(0.5)
+            return []
+        engine._analyze_trendline_safe = slow_trendline
+
+        result = engine._perform_analysis_with_error_handling(create_test_data(), 'TCS')
+
+        assert result.aroon_signal is not None
+        assert result.volume_confirmation is not None
+        assert engine.performance_stats['component_timeouts'] == 1
+        assert engine.circuit_breakers['trendline'].failure_count == 1
+
+    def test_per_component_deadline(self):
+        engine = create_engine(component_deadlines_ms={'ema': 20})
+
+        def slow_ema(df, symbol):
+            time.sleep(0.2)
+            return None
+        engine._analyze_ema_safe = slow_ema
+
+        result = engine._perform_analysis_with_error_handling(create_test_data(), 'TCS')
+
+        assert result.ema_signal is None
+        assert result.aroon_signal is not None
+        assert engine.performance_stats['component_timeouts'] == 1
+
+    def test_invalid_deadlines_are_reset(self):
+        engine = create_engine(component_deadlines_ms={'ema': -5})
+        assert engine.component_deadlines_ms == {}
+
+
+class TestCircuitBreakers:
+    """Failing components stop being scheduled"""
+
+    def test_open_breaker_skips_component(self):
+        engine = create_engine()
+        calls = []
+
+        def failing_aroon(df, symbol):
+            calls.append(symbol)
+            raise ValueError("boom")
+        engine._analyze_aroon_safe = failing_aroon
+
+        df = create_test_data()
+        for _ in range(4):
+            result = engine._perform_analysis_with_error_handling(df, 'TCS')
+
+        assert len(calls) == 3  # failure_threshold
+        assert engine.circuit_breakers['aroon'].state == 'open'
+        assert result.ema_signal is not None
+
+    def test_breaker_recovers_after_success(self):
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0)
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == 'open'
+
+        breaker.last_failure_time -= pd.Timedelta(seconds=2)
+        assert breaker.allow_request()
+        assert breaker.state == 'half_open'
+        breaker.record_success()
+        assert breaker.state == 'closed'
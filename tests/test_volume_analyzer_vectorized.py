@@ -0,0 +1,175 @@
+"""
+Tests for the vectorized volume features
+Verifies OBV and the volume profile against the original loops and that the
+confirmation steps share one feature bundle per frame
+"""
+
+import pytest
+import logging
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analyzers.volume_analyzer import VolumeAnalyzer
+
+
+@pytest.fixture(autouse=True)
+def quiet_logging():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def create_test_data(bars=300, seed=21, tick=None):
+    """Create a random-walk OHLCV frame (optionally rounded to a tick for flat closes)"""
+    rng = np.random.default_rng(seed)
+    close = 1000 + np.cumsum(rng.normal(0, 2, bars))
+    if tick:
+        close = np.round(close / tick) * tick
+    return pd.DataFrame({
+        'open': close + rng.normal(0, 0.5, bars),
+        'high': close + np.abs(rng.normal(0, 2, bars)),
+        'low': close - np.abs(rng.normal(0, 2, bars)),
+        'close': close,
+        'tick_volume': rng.integers(1000, 5000, bars),
+    }, index=pd.date_range('2025-01-06 09:15', periods=bars, freq='5min'))
+
+
+def loop_obv(df):
+    """Original element-by-element implementation, kept as the reference"""
+    price_change = df['close'].diff()
+    obv = pd.Series(index=df.index, dtype=float)
+    obv.iloc[0] = df['tick_volume'].iloc[0]
+    for i in range(1, len(df)):
+        if price_change.iloc[i] > 0:
+            obv.iloc[i] = obv.iloc[i-1] + df['tick_volume'].iloc[i]
+        elif price_change.iloc[i] < 0:
+            obv.iloc[i] = obv.iloc[i-1] - df['tick_volume'].iloc[i]
+        else:
+            obv.iloc[i] = obv.iloc[i-1]
+    return obv
+
+
+def loop_volume_profile(df, num_bins=20):
+    """Original per-bin masking implementation, kept as the reference"""
+    bins = np.linspace(df['low'].min(), df['high'].max(), num_bins + 1)
+    volume_profile = {}
+    for i in range(len(bins) - 1):
+        mask = (df['low'] <= bins[i + 1]) & (df['high'] >= bins[i])
+        volume_profile[(bins[i] + bins[i + 1]) / 2] = df.loc[mask, 'tick_volume'].sum()
+    return volume_profile
+
+
+class TestVectorizedOBV:
+    """calculate_obv must match the loop exactly"""
+
+    @pytest.mark.parametrize("tick", [None, 5.0])
+    def test_matches_loop(self, tick):
+        df = create_test_data(tick=tick)
+        result = VolumeAnalyzer({}).calculate_obv(df)
+
+        pd.testing.assert_series_equal(result, loop_obv(df))
+
+    def test_nan_close_and_volume(self):
+        df = create_test_data(bars=50, tick=5.0)
+        df['tick_volume'] = df['tick_volume'].astype(float)
+        df.iloc[10, df.columns.get_loc('close')] = np.nan
+        df.iloc[30, df.columns.get_loc('tick_volume')] = np.nan
+
+        pd.testing.assert_series_equal(VolumeAnalyzer({}).calculate_obv(df), loop_obv(df))
+
+    def test_short_frame(self):
+        df = create_test_data(bars=1)
+        assert list(VolumeAnalyzer({}).calculate_obv(df)) == [0]
+
+
+class TestVectorizedVolumeProfile:
+    """calculate_volume_profile must match the per-bin masks"""
+
+    @pytest.mark.parametrize("num_bins", [5, 20, 50])
+    def test_matches_loop(self, num_bins):
+        df = create_test_data()
+        result = VolumeAnalyzer({}).calculate_volume_profile(df, num_bins)
+        expected = loop_volume_profile(df, num_bins)
+
+        assert list(result['profile']) == list(expected)
+        assert list(result['profile'].values()) == list(expected.values())
+        assert result['poc_price'] == max(expected, key=expected.get)
+        assert result['poc_volume'] == max(expected.values())
+
+    def test_float_volume_and_nan_rows(self):
+        df = create_test_data(bars=100)
+        df['tick_volume'] = df['tick_volume'] * 0.5
+        df.iloc[40, df.columns.get_loc('low')] = np.nan
+        df.iloc[60, df.columns.get_loc('tick_volume')] = np.nan
+
+        result = VolumeAnalyzer({}).calculate_volume_profile(df)
+        expected = loop_volume_profile(df)
+
+        np.testing.assert_allclose(list(result['profile'].values()), list(expected.values()), rtol=1e-12)
+
+    def test_returned_profile_is_a_copy(self):
+        analyzer = VolumeAnalyzer({})
+        df = create_test_data()
+        analyzer.calculate_volume_profile(df)['profile'].clear()
+
+        assert len(analyzer.calculate_volume_profile(df)['profile']) == 20
+
+    def test_insufficient_data(self):
+        assert VolumeAnalyzer({}).calculate_volume_profile(create_test_data(bars=5)) is None
+
+
+class TestFeatureBundle:
+    """Confirmation steps share per-frame intermediates"""
+
+    def test_confirmation_reuses_volume_ma(self):
+        analyzer = VolumeAnalyzer({'volume_ma_period': 20})
+        df = create_test_data()
+
+        analyzer.get_volume_confirmation(df, 'buy')
+
+        # get_volume_ratio computes MA20, get_candle_pressure reuses it
+        assert analyzer.get_feature_cache_stats()['hits'] >= 1
+
+    def test_repeated_confirmation_is_served_from_cache(self):
+        analyzer = VolumeAnalyzer({})
+        df = create_test_data()
+
+        first = analyzer.get_volume_confirmation(df, 'sell')
+        misses = analyzer.get_feature_cache_stats()['misses']
+        second = analyzer.get_volume_confirmation(df.copy(), 'sell')
+
+        assert analyzer.get_feature_cache_stats()['misses'] == misses
+        assert first['score'] == second['score']
+
+    def test_changed_frame_is_recomputed(self):
+        analyzer = VolumeAnalyzer({})
+        df = create_test_data()
+        before = analyzer.get_volume_ratio(df)
+
+        df.iloc[-1, df.columns.get_loc('tick_volume')] *= 3
+
+        assert analyzer.get_volume_ratio(df) > before
+        assert analyzer.get_feature_cache_stats()['frames'] == 2
+
+    def test_cached_series_follow_the_callers_index(self):
+        analyzer = VolumeAnalyzer({})
+        df = create_test_data()
+        analyzer.calculate_obv(df)
+
+        reindexed = df.reset_index(drop=True)
+        assert analyzer.calculate_obv(reindexed).index.equals(reindexed.index)
+
+    def test_ratio_matches_rolling_mean(self):
+        analyzer = VolumeAnalyzer({'volume_ma_period': 20})
+        df = create_test_data()
+        expected = df['tick_volume'].iloc[-1] / df['tick_volume'].rolling(20).mean().iloc[-1]
+
+        assert analyzer.get_volume_ratio(df) == expected
+        pd.testing.assert_series_equal(analyzer.calculate_volume_ma(df),
+                                       df['tick_volume'].rolling(window=20).mean())
+